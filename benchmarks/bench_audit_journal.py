@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""Proof-of-Flip audit journal vs in-memory audit log.
+
+Runs N tri-cycle audits with and without the JSONL journal, exporting
+every `export_every` audits, and reports audits/s, total export time,
+the cost of a live summary (running aggregates) and the peak traced
+memory of each mode, then the time to reopen the journal from its
+checkpoint and with a full replay.
+
+Usage:
+    python benchmarks/bench_audit_journal.py [audits] [export_every]
+"""
+from __future__ import annotations
+
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Tuple
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.append(str(ROOT))
+
+from src.proof_of_flip_audit import ProofOfFlipAuditPipeline
+
+
+def _audit(tmp: str, audits: int, export_every: int, journal: bool) -> Tuple[float, float]:
+    """Run the audits; returns seconds spent exporting and per summary."""
+    pipeline = ProofOfFlipAuditPipeline(output_dir=tmp, journal=journal)
+    exporting = 0.0
+    for i in range(audits):
+        pipeline.run_tri_cycle_audit(2.1 + (i % 7 - 3) * 0.05)
+        if (i + 1) % export_every == 0:
+            began = time.perf_counter()
+            pipeline.export_audit_log(f"export_{i}.json")
+            exporting += time.perf_counter() - began
+    began = time.perf_counter()
+    for _ in range(1000):
+        pipeline.get_summary()
+    summary = (time.perf_counter() - began) / 1000
+    pipeline.close()
+    return exporting, summary
+
+
+def _run(audits: int, export_every: int, journal: bool) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        start = time.perf_counter()
+        exporting, summary = _audit(tmp, audits, export_every, journal)
+        elapsed = time.perf_counter() - start
+    # Separate pass: tracing allocations slows everything down
+    with tempfile.TemporaryDirectory() as tmp:
+        tracemalloc.start()
+        _audit(tmp, audits, export_every, journal)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    name = "journal" if journal else "in-memory"
+    print(
+        f"{name:9s}: {audits / elapsed:10,.0f} audits/s, "
+        f"exports {exporting:6.2f}s, summary {summary * 1e6:5.1f}us, "
+        f"peak memory {peak / 1e6:7.1f} MB"
+    )
+
+
+def _reopen(audits: int) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        pipeline = ProofOfFlipAuditPipeline(output_dir=tmp, journal=True)
+        for i in range(audits):
+            pipeline.run_tri_cycle_audit(2.1 + (i % 7 - 3) * 0.05)
+        pipeline.close()
+        began = time.perf_counter()
+        ProofOfFlipAuditPipeline(output_dir=tmp, journal=True).close()
+        checkpointed = time.perf_counter() - began
+        (Path(tmp) / "journal" / "checkpoint.json").unlink()
+        began = time.perf_counter()
+        ProofOfFlipAuditPipeline(output_dir=tmp, journal=True).close()
+        replayed = time.perf_counter() - began
+    print(
+        f"reopen   : checkpoint {checkpointed * 1e3:8.1f} ms, "
+        f"full replay {replayed * 1e3:8.1f} ms"
+    )
+
+
+def main() -> None:
+    audits = int(sys.argv[1]) if len(sys.argv) > 1 else 50_000
+    export_every = int(sys.argv[2]) if len(sys.argv) > 2 else 10_000
+    _run(audits, export_every, journal=False)
+    _run(audits, export_every, journal=True)
+    _reopen(audits)
+
+
+if __name__ == "__main__":
+    main()
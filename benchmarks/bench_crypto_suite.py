@@ -0,0 +1,314 @@
+#!/usr/bin/env python3
+"""aes256_layer benchmark and self-test suite.
+
+Runs randomized round-trip self-tests, then measures:
+
+- aes256_encrypt / aes256_decrypt throughput from 32 B upward (payloads of
+  64 MiB and more go through encrypt_stream / decrypt_stream and a
+  temporary file so memory stays bounded)
+- PBKDF2 cost at several iteration counts
+- encrypt_token and encrypt_tokens_batch throughput
+
+Every metric is a rate (higher is better) and results are emitted as
+JSON. With a baseline file, the run fails when any metric drops more
+than --threshold below its baseline value, or when a self-test fails.
+
+Usage:
+    python benchmarks/bench_crypto_suite.py [--max-size 16M] [--output run.json]
+        [--baseline base.json] [--save-baseline base.json] [--threshold 0.2]
+"""
+from __future__ import annotations
+
+import argparse
+import io
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, Dict, List
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.append(str(ROOT))
+
+from src import aes256_layer
+from src.aes256_layer import (
+    STREAM_CHUNK_SIZE,
+    aes256_decrypt,
+    aes256_encrypt,
+    decrypt_stream,
+    decrypt_token,
+    encrypt_stream,
+    encrypt_token,
+    encrypt_tokens_batch,
+)
+
+SUITE_VERSION = 1
+PAYLOAD_SIZES = [32, 1 << 10, 64 << 10, 1 << 20, 16 << 20, 256 << 20, 1 << 30]
+STREAMED_SIZE = 64 << 20
+PBKDF2_ITERATIONS = [1000, 10000, 100000]
+# Keep key derivation out of the payload throughput numbers
+THROUGHPUT_ITERATIONS = 1
+
+
+class _PatternReader(io.RawIOBase):
+    """Readable stream of a repeated random block, without holding it all."""
+
+    def __init__(self, size: int, block: bytes):
+        self._remaining = size
+        self._block = block
+
+    def readable(self) -> bool:
+        return True
+
+    def read(self, size: int = -1) -> bytes:
+        if size < 0:
+            size = self._remaining
+        size = min(size, self._remaining)
+        self._remaining -= size
+        reps = -(-size // len(self._block))
+        return (self._block * reps)[:size]
+
+
+class _NullWriter(io.RawIOBase):
+    """Writable stream that only counts bytes."""
+
+    def __init__(self) -> None:
+        self.count = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data: bytes) -> int:
+        self.count += len(data)
+        return len(data)
+
+
+def _parse_size(text: str) -> int:
+    units = {"K": 1 << 10, "M": 1 << 20, "G": 1 << 30}
+    text = text.strip().upper().rstrip("B")
+    if text and text[-1] in units:
+        return int(float(text[:-1]) * units[text[-1]])
+    return int(text)
+
+
+def _timed(func: Callable[[], object], min_time: float) -> float:
+    """Run func repeatedly for at least min_time; return calls per second."""
+    calls = 0
+    start = time.perf_counter()
+    while True:
+        func()
+        calls += 1
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time:
+            return calls / elapsed
+
+
+def run_selftest(rounds: int, seed: int) -> Dict[str, object]:
+    """Randomized round-trip checks across the one-shot and stream APIs.
+
+    Args:
+        rounds: Number of random payloads
+        seed: Random seed (failures are reproducible with it)
+
+    Returns:
+        Summary with pass/fail counts and the first failures
+    """
+    rng = random.Random(seed)
+    edge = [0, 1, 31, 32, 33, STREAM_CHUNK_SIZE - 1, STREAM_CHUNK_SIZE + 1]
+    sizes = edge + [rng.randrange(0, 3 * STREAM_CHUNK_SIZE) for _ in range(rounds)]
+    failures: List[str] = []
+
+    for size in sizes:
+        payload = rng.randbytes(size)
+        password = rng.randbytes(rng.randrange(1, 24)).hex()
+        chunk = rng.choice([32, 4096, STREAM_CHUNK_SIZE])
+        try:
+            ciphertext, salt, nonce = aes256_encrypt(payload, password, 1)
+            if aes256_decrypt(ciphertext, password, salt, nonce, 1) != payload:
+                failures.append(f"one-shot mismatch at {size} B")
+
+            restored = io.BytesIO()
+            decrypt_stream(
+                io.BytesIO(ciphertext), restored, password, salt, nonce, 1, chunk
+            )
+            if restored.getvalue() != payload:
+                failures.append(f"decrypt_stream mismatch at {size} B")
+
+            sink = io.BytesIO()
+            stream_salt, stream_nonce = encrypt_stream(
+                io.BytesIO(payload), sink, password, 1, chunk
+            )
+            if aes256_decrypt(sink.getvalue(), password, stream_salt, stream_nonce, 1) != payload:
+                failures.append(f"encrypt_stream mismatch at {size} B")
+
+            # Decrypt the untampered ciphertext again so a tamper failure can
+            # only come from the flipped bit
+            if aes256_decrypt(ciphertext, password, salt, nonce, 1) != payload:
+                failures.append(f"one-shot re-decrypt mismatch at {size} B")
+                continue
+            if not ciphertext:
+                continue
+            tampered = bytearray(ciphertext)
+            tampered[rng.randrange(len(tampered))] ^= 1 << rng.randrange(8)
+            try:
+                aes256_decrypt(bytes(tampered), password, salt, nonce, 1)
+                failures.append(f"tampering undetected at {size} B")
+            except ValueError:
+                pass
+        except Exception as exc:  # report, do not abort the suite
+            failures.append(f"{type(exc).__name__} at {size} B: {exc}")
+
+    tokens = [(f"selftest-{i}", rng.randbytes(rng.randrange(64))) for i in range(32)]
+    encrypted = encrypt_tokens_batch(tokens, "selftest", True, 1)
+    for token, (_, data) in zip(encrypted, tokens):
+        if decrypt_token(token, "selftest", use_key_cache=True, iterations=1) != data:
+            failures.append(f"batch token mismatch for {token.token_id}")
+
+    return {
+        "seed": seed,
+        "cases": len(sizes) + len(tokens),
+        "failed": len(failures),
+        "failures": failures[:20],
+    }
+
+
+def bench_payloads(max_size: int, min_time: float) -> Dict[str, float]:
+    """Encrypt/decrypt throughput in MiB/s per payload size."""
+    n = THROUGHPUT_ITERATIONS
+    results: Dict[str, float] = {}
+    for size in (s for s in PAYLOAD_SIZES if s <= max_size):
+        if size < STREAMED_SIZE:
+            payload = os.urandom(size)
+            ciphertext, salt, nonce = aes256_encrypt(payload, "bench", n)
+            enc = _timed(lambda: aes256_encrypt(payload, "bench", n), min_time)
+            dec = _timed(
+                lambda: aes256_decrypt(ciphertext, "bench", salt, nonce, n), min_time
+            )
+        else:
+            block = os.urandom(STREAM_CHUNK_SIZE + 7)
+            with tempfile.TemporaryFile() as handle:
+                start = time.perf_counter()
+                salt, nonce = encrypt_stream(
+                    _PatternReader(size, block), handle, "bench", n
+                )
+                enc = 1 / (time.perf_counter() - start)
+                handle.seek(0)
+                start = time.perf_counter()
+                decrypt_stream(handle, _NullWriter(), "bench", salt, nonce, n)
+                dec = 1 / (time.perf_counter() - start)
+        results[f"encrypt_{size}B_mib_s"] = enc * size / (1 << 20)
+        results[f"decrypt_{size}B_mib_s"] = dec * size / (1 << 20)
+    return results
+
+
+def bench_pbkdf2(min_time: float) -> Dict[str, float]:
+    """Key derivations per second at each iteration count."""
+    salt = os.urandom(32)
+    return {
+        f"pbkdf2_{n}_per_s": _timed(
+            lambda n=n: aes256_layer._derive_key(b"bench", salt, n), min_time
+        )
+        for n in PBKDF2_ITERATIONS
+    }
+
+
+def bench_tokens(min_time: float) -> Dict[str, float]:
+    """Token encryption throughput at the default iteration count."""
+    data = os.urandom(64)
+    batch = [(f"bench-{i}", data) for i in range(256)]
+    batch_rate = _timed(lambda: encrypt_tokens_batch(batch, "bench"), min_time)
+    return {
+        "encrypt_token_per_s": _timed(
+            lambda: encrypt_token("bench", data, "bench"), min_time
+        ),
+        "encrypt_tokens_batch_per_s": batch_rate * len(batch),
+    }
+
+
+def _git_commit() -> str | None:
+    try:
+        out = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return out.stdout.strip()
+
+
+def compare(
+    metrics: Dict[str, float], baseline: Dict[str, float], threshold: float
+) -> List[Dict[str, float | str]]:
+    """List metrics that fell more than threshold below the baseline."""
+    regressions = []
+    for name, base in baseline.items():
+        current = metrics.get(name)
+        if current is None or base <= 0:
+            continue
+        change = current / base - 1
+        if change < -threshold:
+            regressions.append(
+                {"metric": name, "baseline": base, "current": current, "change": change}
+            )
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--max-size", default="16M", help="largest payload (1G max)")
+    parser.add_argument("--min-time", type=float, default=0.2)
+    parser.add_argument("--rounds", type=int, default=50)
+    parser.add_argument("--seed", type=int, default=1337)
+    parser.add_argument("--threshold", type=float, default=0.2)
+    parser.add_argument("--baseline", type=Path)
+    parser.add_argument("--save-baseline", type=Path)
+    parser.add_argument("--output", type=Path)
+    args = parser.parse_args()
+    if args.baseline is not None and not args.baseline.is_file():
+        parser.error(f"baseline file not found: {args.baseline}")
+
+    selftest = run_selftest(args.rounds, args.seed)
+    metrics: Dict[str, float] = {}
+    metrics.update(bench_payloads(_parse_size(args.max_size), args.min_time))
+    metrics.update(bench_pbkdf2(args.min_time))
+    metrics.update(bench_tokens(args.min_time))
+
+    regressions = []
+    if args.baseline is not None:
+        baseline = json.loads(args.baseline.read_text())["metrics"]
+        regressions = compare(metrics, baseline, args.threshold)
+
+    report = {
+        "suite": "aes256_layer",
+        "suite_version": SUITE_VERSION,
+        "commit": _git_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "timestamp": time.time(),
+        "threshold": args.threshold,
+        "selftest": selftest,
+        "metrics": metrics,
+        "regressions": regressions,
+    }
+    text = json.dumps(report, indent=2)
+    print(text)
+    if args.output is not None:
+        args.output.write_text(text + "\n")
+    if args.save_baseline is not None:
+        args.save_baseline.write_text(text + "\n")
+
+    failed = selftest["failed"] or regressions
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""GoatFilter mimic-pattern matching benchmark.
+
+Compares the original per-pattern substring loop with the compiled
+Aho-Corasick automaton as the number of registered patterns grows.
+
+Usage:
+    python benchmarks/bench_goat_filter.py
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import secrets
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.append(str(ROOT))
+
+from src.goat_filter import BaseGoatFilter, GoatFilterRegistry
+
+PATTERN_COUNTS = [10, 100, 1_000, 10_000, 50_000]
+PAYLOADS = 200
+
+
+def _payloads() -> list[tuple[str, str]]:
+    records = []
+    for i in range(PAYLOADS):
+        data = {
+            "id": i,
+            "owner": "0x" + secrets.token_hex(20),
+            "sovereignty": "sovereign",
+            "memo": secrets.token_hex(32),
+        }
+        data_str = json.dumps(data, sort_keys=True)
+        records.append((data_str, hashlib.sha256(data_str.encode()).hexdigest()))
+    return records
+
+
+def _loop_check(patterns: list[str], data_str: str, data_hash: str) -> bool:
+    for pattern in patterns:
+        if pattern in data_str or pattern in data_hash:
+            return True
+    return False
+
+
+def main() -> None:
+    payloads = _payloads()
+    print(f"{'patterns':>10} {'loop us/payload':>16} {'automaton us/payload':>21}")
+    for count in PATTERN_COUNTS:
+        goat = BaseGoatFilter(registry=GoatFilterRegistry())
+        goat.add_mimic_patterns("mimic-" + secrets.token_hex(6) for _ in range(count))
+        goat.registry.snapshot.compile()  # compile outside the timed region
+
+        start = time.perf_counter()
+        for data_str, data_hash in payloads:
+            _loop_check(goat.mimic_patterns, data_str, data_hash)
+        loop_us = (time.perf_counter() - start) / len(payloads) * 1e6
+
+        start = time.perf_counter()
+        for data_str, data_hash in payloads:
+            goat._check_mimic_patterns(data_str, data_hash)
+        automaton_us = (time.perf_counter() - start) / len(payloads) * 1e6
+
+        print(f"{count:>10} {loop_us:>16.1f} {automaton_us:>21.1f}")
+
+
+if __name__ == "__main__":
+    main()
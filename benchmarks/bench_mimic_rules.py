@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""Glob/regex mimic rule benchmark.
+
+Compares checking 10k glob rules one compiled regex at a time against the
+merged single-regex rule set used by BaseGoatFilter, and measures cold
+versus cached compilation.
+
+Usage:
+    python benchmarks/bench_mimic_rules.py
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import re
+import secrets
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.append(str(ROOT))
+
+from src.mimic_rules import MimicRule, compile_rules
+
+RULE_COUNT = 10_000
+PAYLOADS = 200
+
+
+def _rules() -> list[MimicRule]:
+    rules = []
+    for _ in range(RULE_COUNT):
+        stem = secrets.token_hex(3)
+        rules.append(MimicRule("glob", f"0x{stem}????"))
+    rules.append(MimicRule("glob", "0xdead????"))
+    return rules
+
+
+def _payloads() -> list[tuple[str, str]]:
+    records = []
+    for i in range(PAYLOADS):
+        data = {"id": i, "owner": "0x" + secrets.token_hex(20), "memo": "transfer"}
+        data_str = json.dumps(data, sort_keys=True)
+        records.append((data_str, hashlib.sha256(data_str.encode()).hexdigest()))
+    return records
+
+
+def main() -> None:
+    rules = _rules()
+    payloads = _payloads()
+
+    per_rule = [re.compile(rule.to_regex()) for rule in rules]
+    start = time.perf_counter()
+    for data_str, data_hash in payloads:
+        any(r.search(data_str) or r.search(data_hash) for r in per_rule)
+    loop_us = (time.perf_counter() - start) / len(payloads) * 1e6
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        start = time.perf_counter()
+        compiled = compile_rules(rules, cache_dir)
+        cold_ms = (time.perf_counter() - start) * 1e3
+
+        re.purge()
+        start = time.perf_counter()
+        compile_rules(rules, cache_dir)
+        cached_ms = (time.perf_counter() - start) * 1e3
+
+    start = time.perf_counter()
+    for data_str, data_hash in payloads:
+        compiled.search(data_str) or compiled.search(data_hash)
+    merged_us = (time.perf_counter() - start) / len(payloads) * 1e6
+
+    print(f"rules:                     {len(rules)}")
+    print(f"per-rule loop:             {loop_us:10.1f} us/payload")
+    print(f"merged regex:              {merged_us:10.1f} us/payload")
+    print(f"compile (cold):            {cold_ms:10.1f} ms")
+    print(f"compile (cached source):   {cached_ms:10.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""RippleEffectEngine throughput with concurrent producer threads.
+
+Each thread repeatedly generates a ripple, analyzes it for theft and
+exports it (JSON and Watchtower CSV). Results are reported per phase for
+one thread and for N threads, and every run checks that all event ids are
+unique, that every event reached the store and that concurrent analyses
+of shared events lost no updates.
+
+Usage:
+    python benchmarks/bench_ripple_concurrency.py [events_per_thread] [threads]
+"""
+from __future__ import annotations
+
+import sys
+import threading
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.append(str(ROOT))
+
+from runtime.ripple_effect import RippleEffectEngine
+
+THEFT_LOG = [
+    {"type": "transfer", "authorized": False, "from": "0xbad", "timestamp": "t0"},
+    {"type": "transfer", "authorized": True, "from": "0xok", "timestamp": "t1"},
+]
+
+
+def _run(threads: int, per_thread: int) -> None:
+    engine = RippleEffectEngine()
+    shared = engine.generate_ripple("Shared Shard", "0xshared", "SORA")
+    ids = [[] for _ in range(threads)]
+    barrier = threading.Barrier(threads)
+    timings = {"generate": 0.0, "analyze": 0.0, "export": 0.0}
+    timing_lock = threading.Lock()
+
+    def worker(slot: int) -> None:
+        mine = ids[slot]
+        # All threads start each phase together; a phase lasts until its
+        # slowest thread finishes
+        elapsed = {}
+        barrier.wait()
+        start = time.perf_counter()
+        for _ in range(per_thread):
+            ripple = engine.generate_ripple(f"Shard {slot}", f"0x{slot:040x}", "SORA")
+            mine.append(ripple.event_id)
+        elapsed["generate"] = time.perf_counter() - start
+        barrier.wait()
+        start = time.perf_counter()
+        for event_id in mine:
+            engine.analyze_for_theft(event_id, "0xa", "0xa", THEFT_LOG)
+            engine.analyze_for_theft(shared.event_id, "0xa", "0xa", THEFT_LOG)
+        elapsed["analyze"] = time.perf_counter() - start
+        barrier.wait()
+        start = time.perf_counter()
+        for event_id in mine:
+            engine.export_ripple(event_id)
+            engine.export_watchtower_csv(event_id)
+        elapsed["export"] = time.perf_counter() - start
+        with timing_lock:
+            for phase, seconds in elapsed.items():
+                timings[phase] = max(timings[phase], seconds)
+
+    pool = [threading.Thread(target=worker, args=(slot,)) for slot in range(threads)]
+    for thread in pool:
+        thread.start()
+    for thread in pool:
+        thread.join()
+
+    total = threads * per_thread
+    all_ids = [event_id for mine in ids for event_id in mine]
+    assert len(set(all_ids)) == total, "duplicate event ids"
+    assert len(engine.events) == total + 1, "events missing from the store"
+    bad_actor = engine.events[shared.event_id].XX.actors[0]
+    assert bad_actor["count"] == total, "lost concurrent updates"
+
+    print(f"{threads:2d} thread(s), {total} events:")
+    for phase, ops in (("generate", total), ("analyze", 2 * total), ("export", 2 * total)):
+        print(f"  {phase:9s}: {ops / timings[phase]:12,.0f} ops/s")
+
+
+def main() -> None:
+    per_thread = int(sys.argv[1]) if len(sys.argv) > 1 else 5_000
+    threads = int(sys.argv[2]) if len(sys.argv) > 2 else 16
+    _run(1, per_thread * threads)
+    _run(threads, per_thread)
+
+
+if __name__ == "__main__":
+    main()
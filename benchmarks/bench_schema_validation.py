@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""Compiled schema validation throughput.
+
+Compiles every schema in schemas/, then validates synthetic RIPPLE_EFFECT.v1
+documents (from the engine) and PROOF_OF_FLIP_AUDIT.v1 entries, reporting
+documents/s for valid documents, for invalid ones (which are re-run to
+collect error paths), for a JSON Lines stream and for files, serially and
+across a process pool.
+
+Usage:
+    python benchmarks/bench_schema_validation.py [documents] [workers]
+"""
+from __future__ import annotations
+
+import io
+import json
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.append(str(ROOT))
+
+from runtime.ripple_effect import RippleEffectEngine
+from src.proof_of_flip_audit import ProofOfFlipAuditPipeline
+from src.schema_validator import SchemaValidator, available_schemas, get_validator, load_schema
+
+THEFT_LOG = [
+    {"type": "transfer", "authorized": False, "from": "0xbad",
+     "timestamp": "2025-01-01T00:00:00Z"},
+]
+
+
+def _report(name: str, report) -> None:
+    print(
+        f"{name:28s}: {report.documents_per_second:12,.0f} docs/s "
+        f"({report.documents} docs, {report.invalid} invalid)"
+    )
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 50_000
+    workers = int(sys.argv[2]) if len(sys.argv) > 2 else 4
+
+    start = time.perf_counter()
+    for name in available_schemas():
+        SchemaValidator(load_schema(name), name=name)
+    print(f"compiled {len(available_schemas())} schemas in "
+          f"{(time.perf_counter() - start) * 1000:.1f} ms")
+
+    engine = RippleEffectEngine()
+    documents = []
+    for i in range(count):
+        ripple = engine.generate_ripple(f"Shard {i % 97}", f"0x{i % 1024:040x}", "SORA")
+        if i % 10 == 0:
+            engine.analyze_for_theft(ripple.event_id, "0xa", "0xa", THEFT_LOG)
+            ripple = engine.events.get(ripple.event_id)
+        documents.append(ripple.to_document())
+
+    ripple = get_validator("RIPPLE_EFFECT.v1")
+    _report("ripple valid", ripple.validate_many(documents))
+    broken = [dict(document, umbrella="NONE") for document in documents[: count // 10]]
+    _report("ripple invalid", ripple.validate_many(broken))
+
+    lines = "".join(json.dumps(document) + "\n" for document in documents)
+    _report("ripple stream", ripple.validate_stream(io.StringIO(lines)))
+    _report(f"ripple stream x{workers}", ripple.validate_stream(io.StringIO(lines), workers))
+
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = []
+        for i in range(0, count, 100):
+            path = Path(tmp) / f"ripples_{i}.json"
+            path.write_text(json.dumps(documents[i:i + 100]))
+            paths.append(path)
+        _report("ripple files", ripple.validate_files(paths))
+        _report(f"ripple files x{workers}", ripple.validate_files(paths, workers))
+
+        pipeline = ProofOfFlipAuditPipeline(output_dir=tmp)
+        for i in range(count // 10):
+            pipeline.run_tri_cycle_audit(2.1 + (i % 7 - 3) * 0.05)
+        entries = [entry.to_document() for entry in pipeline.audit_log]
+        _report("audit entries", get_validator("PROOF_OF_FLIP_AUDIT.v1").validate_many(entries))
+        start = time.perf_counter()
+        pipeline.export_audit_log("plain.json")
+        plain = time.perf_counter() - start
+        start = time.perf_counter()
+        pipeline.export_audit_log("validated.json", validate=True)
+        validated = time.perf_counter() - start
+        print(f"audit export ({len(entries)} entries): {plain:.3f}s, "
+              f"{validated:.3f}s validated")
+
+
+if __name__ == "__main__":
+    main()
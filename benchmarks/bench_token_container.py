@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""EncryptedToken storage benchmark: JSON vs the binary token container.
+
+Reports file size, write time, full load time and random access time for
+both formats, and checks that the container round-trips every token.
+
+Usage:
+    python benchmarks/bench_token_container.py [token_count]
+"""
+from __future__ import annotations
+
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.append(str(ROOT))
+
+from src.aes256_layer import EncryptedToken, MythicTimestamp, encrypt_tokens_batch
+from src.token_container import TokenContainerReader, read_tokens, write_tokens
+
+PAYLOAD_BYTES = 48
+
+
+def _from_dict(data: dict) -> EncryptedToken:
+    mythic = data["mythic_timestamp"]
+    return EncryptedToken(
+        token_id=data["token_id"],
+        ciphertext=bytes.fromhex(data["ciphertext"]),
+        salt=bytes.fromhex(data["salt"]),
+        nonce=bytes.fromhex(data["nonce"]),
+        mythic_timestamp=MythicTimestamp(**mythic) if mythic else None,
+        created_at=data["created_at"],
+        algorithm=data["algorithm"],
+    )
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    tokens = encrypt_tokens_batch(
+        ((f"token-{i}", os.urandom(PAYLOAD_BYTES)) for i in range(count)),
+        "bench",
+        iterations=1,
+    )
+
+    with tempfile.TemporaryDirectory() as tmp:
+        json_path = Path(tmp) / "tokens.json"
+        bin_path = Path(tmp) / "tokens.etok"
+
+        start = time.perf_counter()
+        json_path.write_text(json.dumps([t.to_dict() for t in tokens]))
+        json_write = time.perf_counter() - start
+        start = time.perf_counter()
+        loaded = [_from_dict(d) for d in json.loads(json_path.read_text())]
+        json_load = time.perf_counter() - start
+        assert loaded == tokens
+
+        start = time.perf_counter()
+        write_tokens(bin_path, tokens)
+        bin_write = time.perf_counter() - start
+        start = time.perf_counter()
+        loaded = read_tokens(bin_path)
+        bin_load = time.perf_counter() - start
+        assert loaded == tokens
+
+        probes = random.sample(range(count), min(count, 1000))
+        start = time.perf_counter()
+        with TokenContainerReader(bin_path) as reader:
+            opened = time.perf_counter() - start
+            for index in probes:
+                assert reader[index] == tokens[index]
+        random_access = (time.perf_counter() - start - opened) / len(probes)
+
+        json_size = json_path.stat().st_size
+        bin_size = bin_path.stat().st_size
+
+    print(f"tokens:            {count}")
+    print(f"json size:         {json_size / (1 << 20):8.2f} MiB")
+    print(
+        f"container size:    {bin_size / (1 << 20):8.2f} MiB "
+        f"({bin_size / json_size:.0%} of JSON)"
+    )
+    print(f"json write/load:   {json_write:8.3f} s / {json_load:.3f} s")
+    print(f"container w/load:  {bin_write:8.3f} s / {bin_load:.3f} s")
+    print(f"container open:    {opened * 1e3:8.3f} ms")
+    print(f"random read:       {random_access * 1e6:8.2f} us/token")
+
+
+if __name__ == "__main__":
+    main()
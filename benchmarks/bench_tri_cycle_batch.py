@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""Batch tri-cycle audits vs one run_tri_cycle_audit call per yield.
+
+Audits N synthetic yields one at a time and as a single batch, and
+reports yields/s for each, the time to build every batch entry and the
+time to export the batch. The batch path uses NumPy when it is installed
+(pass --no-numpy to force the pure-Python fallback).
+
+Usage:
+    python benchmarks/bench_tri_cycle_batch.py [yields] [--no-numpy]
+"""
+from __future__ import annotations
+
+import math
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.append(str(ROOT))
+
+import src.proof_of_flip_audit as audit
+from src.proof_of_flip_audit import ProofOfFlipAuditPipeline
+
+
+def _rate(name: str, count: int, elapsed: float) -> None:
+    print(f"{name:18s}: {count / elapsed:12,.0f} yields/s ({elapsed:.3f}s)")
+
+
+def main() -> None:
+    args = [arg for arg in sys.argv[1:] if not arg.startswith("--")]
+    count = int(args[0]) if args else 200_000
+    if "--no-numpy" in sys.argv:
+        audit.NUMPY_AVAILABLE = False
+    print(f"numpy: {audit.NUMPY_AVAILABLE}")
+    rng = random.Random(7)
+    yields = [2.1 + rng.gauss(0.0, 0.1) for _ in range(count)]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        pipeline = ProofOfFlipAuditPipeline(output_dir=tmp)
+        start = time.perf_counter()
+        for value in yields:
+            pipeline.run_tri_cycle_audit(value)
+        _rate("per-yield", count, time.perf_counter() - start)
+        per_yield = pipeline.get_summary()
+
+        pipeline = ProofOfFlipAuditPipeline(output_dir=tmp)
+        start = time.perf_counter()
+        batch = pipeline.run_tri_cycle_audit_batch(yields)
+        _rate("batch", count, time.perf_counter() - start)
+        batched = pipeline.get_summary()
+
+        start = time.perf_counter()
+        for _ in batch:
+            pass
+        _rate("build entries", count, time.perf_counter() - start)
+        start = time.perf_counter()
+        pipeline.export_audit_log("batch.json")
+        _rate("export", count, time.perf_counter() - start)
+
+    # Batch moments are computed in one pass, so allow float round-off
+    for key in ("verified_count", "discrepancy_count"):
+        if per_yield[key] != batched[key]:
+            print(f"summary mismatch in {key}: {per_yield[key]} != {batched[key]}")
+    expected, actual = per_yield["yield_differential_pct"], batched["yield_differential_pct"]
+    for key in ("mean", "variance", "min", "max"):
+        if not math.isclose(expected[key], actual[key], rel_tol=1e-9, abs_tol=1e-12):
+            print(f"summary mismatch in {key}: {expected[key]} != {actual[key]}")
+    if expected["quantiles"] != actual["quantiles"]:
+        print(f"quantile mismatch: {expected['quantiles']} != {actual['quantiles']}")
+
+
+if __name__ == "__main__":
+    main()
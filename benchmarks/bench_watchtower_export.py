@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""Watchtower CSV export throughput.
+
+Fills an event store with synthetic ripple events and streams them to
+plain and gzip-compressed CSV, reporting rows/s and MB/s for each, plus
+the per-event export_watchtower_csv loop for comparison.
+
+Usage:
+    python benchmarks/bench_watchtower_export.py [event_count] [memory|sqlite]
+"""
+from __future__ import annotations
+
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.append(str(ROOT))
+
+from runtime.ripple_effect import RippleEffectEngine, RippleEvent
+from runtime.ripple_store import SQLiteEventStore
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    backend = sys.argv[2] if len(sys.argv) > 2 else "memory"
+
+    with tempfile.TemporaryDirectory() as tmp:
+        store = None
+        if backend == "sqlite":
+            store = SQLiteEventStore(str(Path(tmp) / "events.db"), RippleEvent.from_dict)
+        engine = RippleEffectEngine(store=store)
+        start = time.perf_counter()
+        for i in range(count):
+            ripple = engine.generate_ripple(
+                f"Shard {i % 97}, Zone {i % 13}", f"0x{i % 1024:040x}", "SORA"
+            )
+            if i % 10 == 0:
+                ripple.XX.detected_alteration = True
+                ripple.XX.alteration_type = ["theft", "altered_signature"]
+                engine.events.put(ripple)
+        print(f"{count} events generated in {time.perf_counter() - start:.2f}s ({backend})")
+
+        ids = list(engine.events)[: min(count, 20_000)]
+        start = time.perf_counter()
+        lines = [engine.export_watchtower_csv(event_id) for event_id in ids]
+        elapsed = time.perf_counter() - start
+        print(f"per-event loop: {len(lines) / elapsed:12,.0f} rows/s ({len(lines)} rows)")
+
+        for name in ("watchtower.csv", "watchtower.csv.gz"):
+            stats = engine.export_watchtower(Path(tmp) / name)
+            print(
+                f"{name:18s}: {stats.rows_per_second:12,.0f} rows/s "
+                f"{stats.megabytes_per_second:8.2f} MB/s "
+                f"({stats.rows} rows, {stats.bytes_written / 1e6:.1f} MB)"
+            )
+
+        stats = engine.export_watchtower(Path(tmp) / "red.csv", severity="red")
+        print(f"severity=red     : {stats.rows_per_second:12,.0f} rows/s ({stats.rows} rows)")
+        engine.events.close()
+
+
+if __name__ == "__main__":
+    main()
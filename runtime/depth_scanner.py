@@ -0,0 +1,252 @@
+"""
+Depth Scan Executor
+===================
+
+Concurrent, cached contract analysis for ZZ-vector depth scans.
+
+Contract analyzers run on a bounded thread pool, which suits analyzers
+that read a local chain snapshot, a bytecode dump or an RPC endpoint.
+Results are cached by content: when a bytecode loader is configured the
+key is the SHA-256 of the contract bytecode, so identical contracts
+deployed at different addresses are analyzed once; otherwise the key is
+derived from the address. The cache can be persisted to SQLite and is
+shared by every event scanned through the same executor, and concurrent
+requests for the same key wait on a single in-flight analysis.
+
+Results stream back as analyses complete (scan_iter), or can be collected
+in input order (scan).
+"""
+
+import hashlib
+import json
+import sqlite3
+import threading
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+# analyzer(contract_address, bytecode) -> finding details, or None if clean
+Analyzer = Callable[[str, Optional[bytes]], Optional[Dict[str, Any]]]
+BytecodeLoader = Callable[[str], bytes]
+
+
+@dataclass
+class ScanResult:
+    """Outcome of analyzing one contract"""
+    contract: str
+    code_hash: str
+    hidden: bool
+    details: Dict[str, Any] = field(default_factory=dict)
+    cached: bool = False
+
+
+class ScanCache:
+    """
+    Content-addressed store of analyzer results
+
+    Results are held in memory and, when a path is given, written through
+    to SQLite so they survive restarts.
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        """
+        Open the cache
+
+        Args:
+            path: SQLite file for persistence (memory only if None)
+        """
+        self._memory: Dict[str, Optional[Dict[str, Any]]] = {}
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        if path is not None:
+            self._conn = sqlite3.connect(path, check_same_thread=False)
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS depth_scan_cache "
+                "(key TEXT PRIMARY KEY, result TEXT)"
+            )
+            self._conn.commit()
+
+    def __len__(self) -> int:
+        with self._lock:
+            if self._conn is None:
+                return len(self._memory)
+            row = self._conn.execute("SELECT COUNT(*) FROM depth_scan_cache").fetchone()
+            return row[0]
+
+    def get(self, key: str) -> Tuple[bool, Optional[Dict[str, Any]]]:
+        """
+        Look up a result
+
+        Returns:
+            (found, details) where details is None for a clean contract
+        """
+        with self._lock:
+            if key in self._memory:
+                return True, self._memory[key]
+            if self._conn is None:
+                return False, None
+            row = self._conn.execute(
+                "SELECT result FROM depth_scan_cache WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return False, None
+            details = json.loads(row[0])
+            self._memory[key] = details
+            return True, details
+
+    def put(self, key: str, details: Optional[Dict[str, Any]]) -> None:
+        """Store a result (details None for a clean contract)"""
+        with self._lock:
+            self._memory[key] = details
+            if self._conn is not None:
+                with self._conn:
+                    self._conn.execute(
+                        "INSERT OR REPLACE INTO depth_scan_cache VALUES (?, ?)",
+                        (key, json.dumps(details)),
+                    )
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+class DepthScanExecutor:
+    """Runs a contract analyzer concurrently with a shared result cache"""
+
+    def __init__(
+        self,
+        analyzer: Analyzer,
+        bytecode_loader: Optional[BytecodeLoader] = None,
+        max_workers: int = 8,
+        cache: Optional[ScanCache] = None,
+        analyzer_version: str = "1"
+    ):
+        """
+        Initialize the executor
+
+        Args:
+            analyzer: Returns finding details for a hidden contract, or None.
+                With a bytecode_loader it must depend only on the bytecode,
+                since results are shared between identical bytecode.
+            bytecode_loader: Loads contract bytecode (e.g. from a snapshot)
+            max_workers: Maximum concurrent analyses
+            cache: Result cache (a fresh in-memory cache if None)
+            analyzer_version: Part of every cache key; bump it when the
+                analyzer changes so stale results are not reused
+        """
+        self.analyzer = analyzer
+        self.bytecode_loader = bytecode_loader
+        self.max_workers = max(1, max_workers)
+        self.cache = cache if cache is not None else ScanCache()
+        self.analyzer_version = analyzer_version
+        self._pool = ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="depth-scan"
+        )
+        self._inflight: Dict[str, Future] = {}
+        self._lock = threading.Lock()
+
+    def close(self) -> None:
+        """Wait for running analyses and stop the worker threads"""
+        self._pool.shutdown(wait=True)
+
+    def _load(self, contract: str) -> Tuple[str, Optional[bytes]]:
+        """Get (cache key, bytecode) for a contract"""
+        if self.bytecode_loader is None:
+            digest = hashlib.sha256(b"address:" + contract.lower().encode()).hexdigest()
+            return digest, None
+        bytecode = self.bytecode_loader(contract)
+        return hashlib.sha256(bytecode).hexdigest(), bytecode
+
+    def _key(self, code_hash: str) -> str:
+        return f"{self.analyzer_version}:{code_hash}"
+
+    def _analyze(self, contract: str) -> ScanResult:
+        """Load, look up and (on a miss) analyze one contract"""
+        code_hash, bytecode = self._load(contract)
+        key = self._key(code_hash)
+        found, details = self.cache.get(key)
+        if found:
+            return self._result(contract, code_hash, details, True)
+
+        with self._lock:
+            future = self._inflight.get(key)
+            owner = future is None
+            if owner:
+                # The previous owner may have finished since the lookup above
+                found, details = self.cache.get(key)
+                if found:
+                    return self._result(contract, code_hash, details, True)
+                future = Future()
+                self._inflight[key] = future
+        if not owner:
+            # Another scan is analyzing identical bytecode right now
+            details = future.result()
+            return self._result(contract, code_hash, details, True)
+
+        try:
+            details = self.analyzer(contract, bytecode)
+            self.cache.put(key, details)
+            future.set_result(details)
+        except BaseException as exc:
+            future.set_exception(exc)
+            raise
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+        return self._result(contract, code_hash, details, False)
+
+    @staticmethod
+    def _result(
+        contract: str,
+        code_hash: str,
+        details: Optional[Dict[str, Any]],
+        cached: bool
+    ) -> ScanResult:
+        return ScanResult(contract, code_hash, details is not None, details or {}, cached)
+
+    def scan_iter(self, contracts: Iterable[str]) -> Iterator[ScanResult]:
+        """
+        Analyze contracts, yielding results as they complete
+
+        Duplicate addresses in one call are analyzed once. At most
+        4 * max_workers analyses are queued at a time, so very large
+        contract lists are consumed lazily.
+
+        Args:
+            contracts: Contract addresses
+
+        Yields:
+            ScanResult per distinct contract, in completion order
+        """
+        seen = set()
+        pending = set()
+        limit = self.max_workers * 4
+        for contract in contracts:
+            if contract in seen:
+                continue
+            seen.add(contract)
+            pending.add(self._pool.submit(self._analyze, contract))
+            if len(pending) >= limit:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield future.result()
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield future.result()
+
+    def scan(self, contracts: Iterable[str]) -> List[ScanResult]:
+        """
+        Analyze contracts and return results in input order
+
+        Args:
+            contracts: Contract addresses
+
+        Returns:
+            ScanResult per distinct contract
+        """
+        contracts = list(dict.fromkeys(contracts))
+        results = {result.contract: result for result in self.scan_iter(contracts)}
+        return [results[contract] for contract in contracts]
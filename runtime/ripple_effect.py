@@ -15,13 +15,55 @@ This module provides Python runtime support for:
 - Tribunal-ready proof generation
 """
 
+import copy
 import json
 import hashlib
+import re
+import sys
+import threading
 import time
+from contextlib import contextmanager
 from datetime import datetime
-from typing import Dict, List, Optional, Any
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Optional, Any
 from dataclasses import dataclass, asdict, field
 
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.append(str(ROOT))
+
+from runtime.depth_scanner import DepthScanExecutor, ScanResult
+from runtime.ripple_store import EventStore, ShardedEventStore, TimeBound
+from runtime.shard_propagation import PropagationResult, ShardGraph, propagate
+from runtime.temporal_patterns import TemporalIndex, format_timestamp, parse_timestamp
+from runtime.tribunal_proof import (
+    VECTORS,
+    VectorDigestCache,
+    header_digest,
+    merkle_root,
+    proof_leaves,
+)
+from runtime.transaction_graph import TransactionGraph
+from runtime.theft_analysis import (
+    ALTERED_SIGNATURE,
+    THEFT,
+    Source,
+    TheftAggregate,
+    TransactionColumns,
+    analyze_transaction_log,
+)
+from runtime.watchtower_export import (
+    ExportStats,
+    Target,
+    export_watchtower,
+    format_watchtower_row,
+)
+from src.schema_validator import get_validator
+
+RIPPLE_SCHEMA = "RIPPLE_EFFECT.v1"
+# RIPPLE_EFFECT.v1 event ids carry 8 hex digits; engine ids carry more
+_DOCUMENT_ID = re.compile(r"RIPPLE-([0-9]{4})-[0-9A-F]{8}")
+
 
 @dataclass
 class RippleVectorXX:
@@ -93,19 +135,288 @@ class RippleEvent:
     pulse_archive_ref: str = ""
     tribunal_proof: Dict[str, Any] = field(default_factory=dict)
 
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "RippleEvent":
+        """Rebuild an event from its asdict() / export_ripple form"""
+        data = dict(data)
+        for name, vector in _VECTOR_TYPES.items():
+            data[name] = vector(**data.get(name, {}))
+        return cls(**data)
 
-class RippleEffectEngine:
-    """Main engine for Ripple Effect operations"""
+    def document_id(self) -> str:
+        """
+        The event id in the RIPPLE_EFFECT.v1 format
+        
+        Ids that already match are kept; engine ids (more hex digits) map to
+        RIPPLE-<year>-<first 8 hex digits of their SHA-256>.
+        """
+        if _DOCUMENT_ID.fullmatch(self.event_id):
+            return self.event_id
+        year = self.event_id.split("-")[1] if self.event_id.count("-") >= 2 else ""
+        if not (len(year) == 4 and year.isdigit()):
+            year = self.timestamp[:4] if self.timestamp[:4].isdigit() else "0000"
+        digest = hashlib.sha256(self.event_id.encode()).hexdigest()[:8].upper()
+        return f"RIPPLE-{year}-{digest}"
+
+    def to_document(self) -> Dict[str, Any]:
+        """
+        The event in the RIPPLE_EFFECT.v1 schema layout
+        
+        event_id is document_id(); when that differs from the engine id, the
+        engine id is kept under engine_event_id so from_document round-trips.
+        """
+        xx, yy, zz, tt, ww = self.XX, self.YY, self.ZZ, self.TT, self.WW
+        document_id = self.document_id()
+        document = {
+            "event_id": document_id,
+            "timestamp": self.timestamp,
+            "origin_shard": self.origin_shard,
+            "contract_address": self.contract_address,
+            "umbrella": self.umbrella,
+            "ripple_vectors": {
+                "XX": asdict(xx),
+                "YY": {
+                    "return_vector": {
+                        "ownership": yy.ownership,
+                        "original_owner": yy.original_owner,
+                        "return_path": list(yy.return_path),
+                    },
+                    "ownership_chain": copy.deepcopy(yy.ownership_chain),
+                    "restitution_status": yy.restitution_status,
+                    "stolen_cycles_returned": yy.stolen_cycles_returned,
+                },
+                "ZZ": {
+                    "depth_scan": {
+                        "scan_depth": zz.scan_depth,
+                        "hidden_contracts_found": zz.hidden_contracts_found,
+                        "ghost_nodes_found": zz.ghost_nodes_found,
+                    },
+                    "hidden_layers": copy.deepcopy(zz.hidden_layers),
+                    "chain_theft_detected": zz.chain_theft_detected,
+                },
+                "TT": {
+                    "temporal_log": copy.deepcopy(tt.temporal_log),
+                    "cycle_prediction": copy.deepcopy(tt.cycle_prediction),
+                    "memory_weave": {
+                        "ancestral_memory": tt.memory_weave,
+                        "memory_hash": tt.memory_hash,
+                    },
+                },
+                "WW": {
+                    "intent_analysis": {
+                        "real_motive": ww.real_motive,
+                        "stated_reason": ww.stated_reason,
+                        "motive_match": ww.motive_match,
+                        "hidden_agenda": ww.hidden_agenda,
+                    },
+                    "authority_chain": copy.deepcopy(ww.authority_chain),
+                    "psychological_pattern": ww.psychological_pattern,
+                    "order_behind_action": ww.order_behind_action,
+                },
+            },
+            "effect": list(self.effect),
+            "density_score": self.density_score,
+            "watchtower_entry": self.watchtower_entry,
+            "pulse_archive_ref": self.pulse_archive_ref,
+            "tribunal_proof": copy.deepcopy(self.tribunal_proof),
+        }
+        if document_id != self.event_id:
+            document["engine_event_id"] = self.event_id
+        return document
+
+    @classmethod
+    def from_document(cls, document: Dict[str, Any]) -> "RippleEvent":
+        """Rebuild an event from a RIPPLE_EFFECT.v1 document (e.g. data/ripple_examples)"""
+        vectors = document.get("ripple_vectors", {})
+        xx, yy, zz = vectors.get("XX", {}), vectors.get("YY", {}), vectors.get("ZZ", {})
+        tt, ww = vectors.get("TT", {}), vectors.get("WW", {})
+        returned = yy.get("return_vector", {})
+        scan = zz.get("depth_scan", {})
+        weave = tt.get("memory_weave", {})
+        intent = ww.get("intent_analysis", {})
+        return cls(
+            event_id=document.get("engine_event_id", document["event_id"]),
+            timestamp=document["timestamp"],
+            origin_shard=document["origin_shard"],
+            contract_address=document["contract_address"],
+            umbrella=document["umbrella"],
+            XX=RippleVectorXX(
+                detected_alteration=xx.get("detected_alteration", False),
+                alteration_type=list(xx.get("alteration_type", [])),
+                signature=xx.get("signature", ""),
+                actors=list(xx.get("actors", [])),
+            ),
+            YY=RippleVectorYY(
+                ownership=returned.get("ownership", ""),
+                original_owner=returned.get("original_owner", ""),
+                return_path=list(returned.get("return_path", [])),
+                ownership_chain=list(yy.get("ownership_chain", [])),
+                restitution_status=yy.get("restitution_status", "pending"),
+                stolen_cycles_returned=yy.get("stolen_cycles_returned", 0),
+            ),
+            ZZ=RippleVectorZZ(
+                scan_depth=scan.get("scan_depth", 0),
+                hidden_contracts_found=scan.get("hidden_contracts_found", 0),
+                ghost_nodes_found=scan.get("ghost_nodes_found", 0),
+                hidden_layers=list(zz.get("hidden_layers", [])),
+                chain_theft_detected=zz.get("chain_theft_detected", False),
+            ),
+            TT=RippleVectorTT(
+                temporal_log=list(tt.get("temporal_log", [])),
+                cycle_prediction=dict(tt.get("cycle_prediction", {})),
+                memory_weave=weave.get("ancestral_memory", ""),
+                memory_hash=weave.get("memory_hash", ""),
+            ),
+            WW=RippleVectorWW(
+                real_motive=intent.get("real_motive", ""),
+                stated_reason=intent.get("stated_reason", ""),
+                motive_match=intent.get("motive_match", True),
+                hidden_agenda=intent.get("hidden_agenda", ""),
+                authority_chain=list(ww.get("authority_chain", [])),
+                psychological_pattern=ww.get("psychological_pattern", ""),
+                order_behind_action=ww.get("order_behind_action", ""),
+            ),
+            effect=list(document.get("effect", [])),
+            density_score=document.get("density_score", 0.0),
+            watchtower_entry=document.get("watchtower_entry", ""),
+            pulse_archive_ref=document.get("pulse_archive_ref", ""),
+            tribunal_proof=dict(document.get("tribunal_proof", {})),
+        )
+
+
+_VECTOR_TYPES = {
+    "XX": RippleVectorXX,
+    "YY": RippleVectorYY,
+    "ZZ": RippleVectorZZ,
+    "TT": RippleVectorTT,
+    "WW": RippleVectorWW,
+}
+
+
+class EventIdGenerator:
+    """
+    Thread-safe, monotonic ripple event ids
+    
+    Ids keep the RIPPLE-<year>-<epoch seconds hex><counter hex> format. The
+    counter advances under a lock, so concurrent callers never share an id,
+    and the seconds part never goes backwards if the wall clock does.
+    """
     
     def __init__(self):
-        self.events: Dict[str, RippleEvent] = {}
-        self.event_count = 0
+        self._lock = threading.Lock()
+        self._count = 0
+        self._second = 0
+    
+    @property
+    def count(self) -> int:
+        """Number of ids issued"""
+        return self._count
+    
+    def next_id(self) -> str:
+        """Issue the next event id"""
+        with self._lock:
+            self._count += 1
+            self._second = max(self._second, int(time.time()))
+            count, second = self._count, self._second
+        year = datetime.fromtimestamp(second).year
+        return f"RIPPLE-{year}-{second:X}{count:04X}"
+
+
+class RippleEffectEngine:
+    """
+    Main engine for Ripple Effect operations
+    
+    Safe to share between producer threads: ids come from an atomic
+    generator, events live in a store sharded by id with per-shard locks,
+    and each operation holds its event's lock while modifying it.
+    """
+    
+    def __init__(
+        self,
+        store: Optional[EventStore] = None,
+        scanner: Optional[DepthScanExecutor] = None
+    ):
+        """
+        Initialize the engine
+        
+        Args:
+            store: Event store backend (a ShardedEventStore if not given),
+                e.g. SQLiteEventStore(path, RippleEvent.from_dict) to keep
+                only hot events in memory
+            scanner: Depth scan executor; by default one running
+                _is_hidden_contract with an in-memory result cache
+        """
+        self.events: EventStore = store if store is not None else ShardedEventStore()
+        self.ids = EventIdGenerator()
+        self.transaction_graph = TransactionGraph()
+        self._graph_lock = threading.RLock()
+        self.temporal = TemporalIndex()
+        self.digests = VectorDigestCache()
+        self.scanner = scanner if scanner is not None else DepthScanExecutor(
+            self._analyze_contract
+        )
+    
+    def query_events(
+        self,
+        origin_shard: Optional[str] = None,
+        contract_address: Optional[str] = None,
+        umbrella: Optional[str] = None,
+        severity: Optional[str] = None,
+        alteration_type: Optional[str] = None,
+        since: TimeBound = None,
+        until: TimeBound = None,
+        limit: Optional[int] = None
+    ) -> List[RippleEvent]:
+        """
+        Find events through the store's secondary indexes
+        
+        Args:
+            origin_shard: Exact origin shard
+            contract_address: Exact contract address
+            umbrella: Exact umbrella
+            severity: "red" or "green" (as in the Watchtower CSV)
+            alteration_type: XX alteration type the event must include
+            since: Inclusive lower time bound (epoch seconds, ISO string or datetime)
+            until: Inclusive upper time bound
+            limit: Maximum number of events returned
+            
+        Returns:
+            Matching events ordered by timestamp
+        """
+        return self.events.query(
+            origin_shard=origin_shard,
+            contract_address=contract_address,
+            umbrella=umbrella,
+            severity=severity,
+            alteration_type=alteration_type,
+            since=since,
+            until=until,
+            limit=limit
+        )
         
+    @property
+    def event_count(self) -> int:
+        """Number of event ids generated"""
+        return self.ids.count
+    
     def generate_event_id(self) -> str:
         """Generate unique event ID"""
-        self.event_count += 1
-        timestamp_hex = hex(int(time.time()))[2:].upper()
-        return f"RIPPLE-{datetime.now().year}-{timestamp_hex}{self.event_count:04X}"
+        return self.ids.next_id()
+    
+    @contextmanager
+    def _editing(self, event_id: str) -> Iterator[RippleEvent]:
+        """
+        Hold an event's store lock while it is modified
+        
+        Yields the event and puts it back into the store on a normal exit.
+        Raises ValueError if the event does not exist.
+        """
+        with self.events.lock(event_id):
+            ripple = self.events.get(event_id)
+            if ripple is None:
+                raise ValueError(f"Event {event_id} not found")
+            yield ripple
+            self.events.put(ripple)
     
     def generate_ripple(
         self,
@@ -127,7 +438,9 @@ class RippleEffectEngine:
             Complete RippleEvent object
         """
         event_id = self.generate_event_id()
-        timestamp = datetime.utcnow().isoformat() + "Z"
+        epoch = time.time()
+        timestamp = format_timestamp(epoch)
+        self.temporal.record(event_id, contract_address, epoch)
         
         # Initialize TT vector with first event
         tt = RippleVectorTT(
@@ -163,6 +476,7 @@ class RippleEffectEngine:
             ]
         )
         
+        self.digests.invalidate(event_id)
         self.events[event_id] = ripple
         return ripple
     
@@ -188,97 +502,205 @@ class RippleEffectEngine:
         if event_id not in self.events:
             raise ValueError(f"Event {event_id} not found")
         
-        ripple = self.events[event_id]
+        aggregate = TransactionColumns.from_records(transaction_log).evaluate()
+        with self._editing(event_id) as ripple:
+            return self._apply_theft_aggregate(
+                ripple, current_owner, expected_owner, aggregate
+            )
+    
+    def analyze_theft_stream(
+        self,
+        event_id: str,
+        current_owner: str,
+        expected_owner: str,
+        source: Source,
+        fmt: Optional[str] = None,
+        workers: int = 1,
+        chunk_size: int = 50000
+    ) -> Dict[str, Any]:
+        """
+        Analyze XX vector for theft over a large transaction log
+        
+        Same checks as analyze_for_theft, but the log is streamed from an
+        NDJSON or CSV file (or any iterable of dicts) in chunks, so memory
+        stays bounded for logs with tens of millions of transfers.
+        
+        Args:
+            event_id: ID of the ripple event
+            current_owner: Current ownership address
+            expected_owner: Expected/original ownership address
+            source: NDJSON/CSV path or iterable of transaction dicts
+            fmt: "ndjson" or "csv" (from the file suffix if not given)
+            workers: Worker processes for chunk analysis
+            chunk_size: Transactions per chunk
+            
+        Returns:
+            Analysis results with detected issues and counts
+        """
+        if event_id not in self.events:
+            raise ValueError(f"Event {event_id} not found")
+        
+        # The log is analyzed without holding the event's lock
+        aggregate = analyze_transaction_log(source, fmt, chunk_size, workers)
+        with self._editing(event_id) as ripple:
+            return self._apply_theft_aggregate(
+                ripple, current_owner, expected_owner, aggregate
+            )
+    
+    def _apply_theft_aggregate(
+        self,
+        ripple: RippleEvent,
+        current_owner: str,
+        expected_owner: str,
+        aggregate: TheftAggregate
+    ) -> Dict[str, Any]:
+        """Record theft findings on the XX vector and build the analysis"""
         analysis = {
             "theft_detected": False,
             "alterations": [],
-            "actors": [],
-            "severity": "green"
+            "actors": list(aggregate.actors),
+            "severity": "green",
+            "transactions_analyzed": aggregate.transactions,
+            "unauthorized_transfers": aggregate.unauthorized_transfers,
+            "tampered_signatures": aggregate.tampered_signatures
         }
+        alteration_types = []
         
         # Check ownership mismatch
         if current_owner != expected_owner:
-            ripple.XX.detected_alteration = True
-            ripple.XX.alteration_type.append("forged_ownership")
+            alteration_types.append("forged_ownership")
             analysis["theft_detected"] = True
             analysis["alterations"].append("ownership_mismatch")
             analysis["severity"] = "red"
         
-        # Analyze transaction log for suspicious patterns
-        for tx in transaction_log:
-            # Check for unauthorized transfers
-            if tx.get("type") == "transfer" and tx.get("authorized") == False:
-                ripple.XX.detected_alteration = True
-                ripple.XX.alteration_type.append("theft")
-                ripple.XX.actors.append({
-                    "address": tx.get("from"),
+        # Unauthorized transfers and tampering found in the transaction log
+        if aggregate.unauthorized_transfers:
+            alteration_types.append(THEFT)
+            analysis["severity"] = "red"
+        if aggregate.tampered_signatures:
+            alteration_types.append(ALTERED_SIGNATURE)
+            analysis["alterations"].append("signature_tampering")
+            analysis["severity"] = "red"
+        
+        # Alteration types and actors are kept distinct, with per-actor counts
+        xx = ripple.XX
+        if alteration_types:
+            xx.detected_alteration = True
+        for alteration in alteration_types:
+            if alteration not in xx.alteration_type:
+                xx.alteration_type.append(alteration)
+        known = {actor.get("address"): actor for actor in xx.actors}
+        for address, count in aggregate.actors.items():
+            actor = known.get(address)
+            if actor is None:
+                xx.actors.append({
+                    "address": address,
                     "action": "unauthorized_transfer",
-                    "timestamp": tx.get("timestamp")
+                    "timestamp": aggregate.actor_first_seen.get(address),
+                    "count": count
                 })
-                analysis["actors"].append(tx.get("from"))
-                analysis["severity"] = "red"
-            
-            # Check for tampering
-            if tx.get("signature_valid") == False:
-                ripple.XX.detected_alteration = True
-                ripple.XX.alteration_type.append("altered_signature")
-                analysis["alterations"].append("signature_tampering")
-                analysis["severity"] = "red"
+            else:
+                actor["count"] = actor.get("count", 1) + count
         
         # Generate signature
-        ripple.XX.signature = self._generate_hash(json.dumps(asdict(ripple.XX)))
+        xx.signature = self._generate_hash(json.dumps(vars(xx)))
+        self.digests.invalidate(ripple.event_id, "XX")
         
         return analysis
     
+    def record_transfers(self, transaction_log: Any) -> int:
+        """
+        Add transfers to the ownership graph used for return paths
+        
+        Args:
+            transaction_log: Transaction dicts, or an NDJSON/CSV log path
+            
+        Returns:
+            Number of transfer edges added
+        """
+        with self._graph_lock:
+            if isinstance(transaction_log, (str, Path)):
+                return self.transaction_graph.add_transaction_log(transaction_log)
+            return self.transaction_graph.add_transactions(transaction_log)
+    
     def trigger_return(
         self,
         event_id: str,
-        return_path: List[str]
+        return_path: Optional[List[str]] = None,
+        current_owner: Optional[str] = None
     ) -> Dict[str, Any]:
         """
         Trigger YY vector return-to-source
         
         Args:
             event_id: ID of the ripple event
-            return_path: Addresses in the return path
+            return_path: Addresses in the return path; computed from the
+                transaction graph (fewest hops) if not given
+            current_owner: Address holding the asset now (defaults to
+                YY.ownership); used when the path is computed
             
         Returns:
             Return operation results
         """
-        if event_id not in self.events:
-            raise ValueError(f"Event {event_id} not found")
-        
-        ripple = self.events[event_id]
-        
-        ripple.YY.return_path = return_path
-        ripple.YY.restitution_status = "in_progress"
-        
-        # Add to temporal log
-        ripple.TT.temporal_log.append({
-            "timestamp": datetime.utcnow().isoformat() + "Z",
-            "event_type": "return_initiated",
-            "interval_from_previous": self._calculate_interval(ripple.TT.temporal_log)
-        })
-        
-        return {
-            "status": "in_progress",
-            "return_path": return_path,
-            "original_owner": ripple.YY.original_owner
-        }
+        with self._editing(event_id) as ripple:
+            if return_path is None:
+                current_owner = current_owner or ripple.YY.ownership
+                with self._graph_lock:
+                    return_path = self.transaction_graph.shortest_return_path(
+                        current_owner, ripple.YY.original_owner
+                    )
+                    chain = self.transaction_graph.ownership_chain(
+                        ripple.YY.original_owner, current_owner
+                    )
+                ripple.YY.ownership = current_owner
+                ripple.YY.ownership_chain = chain
+                if not return_path:
+                    self.digests.invalidate(event_id, "YY")
+                    return {
+                        "status": "no_path",
+                        "return_path": [],
+                        "original_owner": ripple.YY.original_owner
+                    }
+            
+            ripple.YY.return_path = return_path
+            ripple.YY.restitution_status = "in_progress"
+            
+            # Add to temporal log
+            self.temporal.index_event(ripple)
+            epoch = time.time()
+            ripple.TT.temporal_log.append({
+                "timestamp": format_timestamp(epoch),
+                "event_type": "return_initiated",
+                "interval_from_previous": self.temporal.record(
+                    event_id, ripple.contract_address, epoch
+                )
+            })
+            self.digests.invalidate(event_id, "YY", "TT")
+            
+            return {
+                "status": "in_progress",
+                "return_path": return_path,
+                "original_owner": ripple.YY.original_owner
+            }
     
     def depth_scan(
         self,
         event_id: str,
         scan_depth: int = 7,
-        contracts_to_scan: List[str] = None
+        contracts_to_scan: List[str] = None,
+        on_result: Optional[Callable[[ScanResult], None]] = None
     ) -> Dict[str, Any]:
         """
         Perform ZZ vector depth scan for hidden layers
         
+        Contracts are analyzed concurrently by self.scanner; results are
+        cached by content and shared across events.
+        
         Args:
             event_id: ID of the ripple event
             scan_depth: Number of layers to scan
             contracts_to_scan: List of contract addresses to analyze
+            on_result: Called with each ScanResult as it completes
             
         Returns:
             Depth scan results
@@ -286,34 +708,80 @@ class RippleEffectEngine:
         if event_id not in self.events:
             raise ValueError(f"Event {event_id} not found")
         
-        ripple = self.events[event_id]
+        # Contracts are scanned without holding the event's lock
+        contract_address = self.events[event_id].contract_address
         contracts_to_scan = contracts_to_scan or []
-        
-        ripple.ZZ.scan_depth = scan_depth
         hidden_layers = []
         
-        # Simulate depth scanning (in production, this would analyze blockchain data)
-        for contract in contracts_to_scan:
-            # Check for hidden contracts
-            if self._is_hidden_contract(contract):
-                hidden_layers.append({
-                    "layer_type": "concealed_extraction_system",
-                    "layer_address": contract,
+        found: Dict[str, Dict[str, Any]] = {}
+        for result in self.scanner.scan_iter(contracts_to_scan):
+            if result.hidden:
+                found[result.contract] = {
+                    "layer_type": result.details.get(
+                        "layer_type", "concealed_extraction_system"
+                    ),
+                    "layer_address": result.contract,
                     "discovered_at": datetime.utcnow().isoformat() + "Z",
-                    "extraction_route": [contract, ripple.contract_address]
-                })
+                    "extraction_route": [result.contract, contract_address]
+                }
+            if on_result is not None:
+                on_result(result)
         
-        ripple.ZZ.hidden_contracts_found = len(hidden_layers)
-        ripple.ZZ.hidden_layers = hidden_layers
-        ripple.ZZ.chain_theft_detected = len(hidden_layers) > 0
+        # Report layers in scan order, not completion order
+        for contract in dict.fromkeys(contracts_to_scan):
+            if contract in found:
+                hidden_layers.append(found[contract])
+        
+        with self._editing(event_id) as ripple:
+            ripple.ZZ.scan_depth = scan_depth
+            ripple.ZZ.hidden_contracts_found = len(hidden_layers)
+            ripple.ZZ.hidden_layers = hidden_layers
+            ripple.ZZ.chain_theft_detected = len(hidden_layers) > 0
+            self.digests.invalidate(event_id, "ZZ")
         
         return {
             "scan_depth": scan_depth,
             "hidden_contracts_found": len(hidden_layers),
             "hidden_layers": hidden_layers,
-            "chain_theft_detected": ripple.ZZ.chain_theft_detected
+            "chain_theft_detected": len(hidden_layers) > 0
         }
     
+    def predict_cycles(
+        self,
+        event_id: Optional[str] = None,
+        horizon: int = 1
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Populate TT cycle predictions from per-contract event timing
+        
+        Args:
+            event_id: Only update this event (all events if None)
+            horizon: Number of future occurrences to predict
+            
+        Returns:
+            cycle_prediction by event id
+        """
+        if event_id is not None:
+            if event_id not in self.events:
+                raise ValueError(f"Event {event_id} not found")
+            events = [self.events[event_id]]
+        else:
+            events = list(self.events.values())
+        self.temporal.index_events(events)
+        
+        # One prediction per contract, shared by all of its events
+        predictions: Dict[str, Dict[str, Any]] = {}
+        updated = {}
+        for ripple in events:
+            contract = ripple.contract_address
+            if contract not in predictions:
+                predictions[contract] = self.temporal.predict(contract, horizon)
+            with self._editing(ripple.event_id) as current:
+                current.TT.cycle_prediction = copy.deepcopy(predictions[contract])
+                self.digests.invalidate(ripple.event_id, "TT")
+            updated[ripple.event_id] = predictions[contract]
+        return updated
+    
     def analyze_intent(
         self,
         event_id: str,
@@ -331,31 +799,73 @@ class RippleEffectEngine:
         Returns:
             Intent analysis results
         """
-        if event_id not in self.events:
-            raise ValueError(f"Event {event_id} not found")
-        
-        ripple = self.events[event_id]
-        
         # Analyze real motive vs stated reason
         real_motive = self._infer_motive(transaction_context)
-        ripple.WW.real_motive = real_motive
-        ripple.WW.stated_reason = stated_reason
-        ripple.WW.motive_match = real_motive == stated_reason
         
-        # Detect hidden agenda
-        if not ripple.WW.motive_match:
-            ripple.WW.hidden_agenda = "Mismatch detected: investigate further"
+        with self._editing(event_id) as ripple:
+            ripple.WW.real_motive = real_motive
+            ripple.WW.stated_reason = stated_reason
+            ripple.WW.motive_match = real_motive == stated_reason
+            
+            # Detect hidden agenda
+            if not ripple.WW.motive_match:
+                ripple.WW.hidden_agenda = "Mismatch detected: investigate further"
+            
+            # Build authority chain
+            if "authority_chain" in transaction_context:
+                ripple.WW.authority_chain = transaction_context["authority_chain"]
+            self.digests.invalidate(event_id, "WW")
+            
+            return {
+                "real_motive": real_motive,
+                "stated_reason": stated_reason,
+                "motive_match": ripple.WW.motive_match,
+                "hidden_agenda": ripple.WW.hidden_agenda
+            }
+    
+    def simulate_propagation(
+        self,
+        event_id: str,
+        graph: ShardGraph,
+        record_density: bool = False,
+        **options: Any
+    ) -> PropagationResult:
+        """
+        Propagate a ripple from its origin shard through connected shards
+        
+        Arrival times are absolute (counted from the event timestamp). The
+        event is left unchanged unless record_density is set.
         
-        # Build authority chain
-        if "authority_chain" in transaction_context:
-            ripple.WW.authority_chain = transaction_context["authority_chain"]
+        Args:
+            event_id: ID of the ripple event
+            graph: Shard graph, e.g. ShardGraph.from_ripple_examples()
+            record_density: Store the mean density score of the shards
+                reached as the event's density_score (replacing it)
+            options: Options of runtime.shard_propagation.propagate
+                (horizon, min_amplitude, relays, time_resolution, ...)
+            
+        Returns:
+            Arrival times and density per shard
+            
+        Raises:
+            ValueError: If the event is unknown or its origin shard is not
+                in the graph
+        """
+        ripple = self.events.get(event_id)
+        if ripple is None:
+            raise ValueError(f"Event {event_id} not found")
+        if ripple.origin_shard not in graph:
+            raise ValueError(
+                f"Origin shard {ripple.origin_shard!r} of event {event_id} "
+                "is not in the shard graph"
+            )
         
-        return {
-            "real_motive": real_motive,
-            "stated_reason": stated_reason,
-            "motive_match": ripple.WW.motive_match,
-            "hidden_agenda": ripple.WW.hidden_agenda
-        }
+        options.setdefault("start", parse_timestamp(ripple.timestamp))
+        result = propagate(graph, [ripple.origin_shard], **options)
+        if record_density:
+            with self._editing(event_id) as current:
+                current.density_score = round(result.mean_density(), 2)
+        return result
     
     def generate_tribunal_proof(
         self,
@@ -365,6 +875,10 @@ class RippleEffectEngine:
         """
         Generate tribunal-ready proof package
         
+        The proof hash is a Merkle root over the event header and the five
+        vector digests (see runtime.tribunal_proof). Vector digests are
+        cached, so only vectors changed since the last proof are rehashed.
+        
         Args:
             event_id: ID of the ripple event
             witnesses: List of witness addresses
@@ -372,17 +886,63 @@ class RippleEffectEngine:
         Returns:
             Tribunal proof package
         """
-        if event_id not in self.events:
-            raise ValueError(f"Event {event_id} not found")
+        with self._editing(event_id) as ripple:
+            return self._seal_proof(ripple, self.digests.digests(ripple), witnesses)
+    
+    def generate_tribunal_proofs(
+        self,
+        event_ids: Optional[List[str]] = None,
+        witnesses: Optional[List[str]] = None,
+        workers: int = 1
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Generate tribunal proofs for many events
+        
+        Stale vector digests are computed in one pass, optionally on a
+        process pool, before the per-event Merkle roots are built.
         
-        ripple = self.events[event_id]
+        Args:
+            event_ids: Events to prove (all events if None)
+            witnesses: Witness addresses recorded in every proof
+            workers: Worker processes for vector hashing
+            
+        Returns:
+            Tribunal proof package by event id
+        """
+        if event_ids is None:
+            events = list(self.events.values())
+        else:
+            missing = [event_id for event_id in event_ids if event_id not in self.events]
+            if missing:
+                raise ValueError(f"Event {missing[0]} not found")
+            events = [self.events[event_id] for event_id in event_ids]
+        witnesses = witnesses or []
         
-        # Generate proof hash
-        proof_data = json.dumps(asdict(ripple), sort_keys=True)
-        proof_hash = self._generate_hash(proof_data)
+        # Hashing runs unlocked; a vector modified meanwhile is invalidated
+        # and rehashed below under the event's lock
+        self.digests.refresh_many(events, workers=workers)
+        proofs = {}
+        for event in events:
+            with self._editing(event.event_id) as ripple:
+                proofs[ripple.event_id] = self._seal_proof(
+                    ripple, self.digests.digests(ripple), witnesses
+                )
+        return proofs
+    
+    def _seal_proof(
+        self,
+        ripple: RippleEvent,
+        digests: Dict[str, str],
+        witnesses: List[str]
+    ) -> Dict[str, Any]:
+        """Build the Merkle proof for one event and attach it (caller holds the lock)"""
+        header = header_digest(ripple)
+        proof_hash = merkle_root(proof_leaves(header, digests))
         
         ripple.tribunal_proof = {
             "proof_hash": proof_hash,
+            "header_digest": header,
+            "vector_digests": {name: digests[name] for name in VECTORS},
             "signature": self._generate_hash(proof_hash + str(witnesses)),
             "witnesses": witnesses,
             "generated_at": datetime.utcnow().isoformat() + "Z"
@@ -390,30 +950,82 @@ class RippleEffectEngine:
         
         return ripple.tribunal_proof
     
-    def export_ripple(self, event_id: str) -> str:
-        """Export ripple event as JSON"""
-        if event_id not in self.events:
-            raise ValueError(f"Event {event_id} not found")
+    def export_ripple(self, event_id: str, validate: bool = False) -> str:
+        """
+        Export ripple event as JSON
         
-        ripple = self.events[event_id]
-        return json.dumps(asdict(ripple), indent=2)
+        Args:
+            event_id: Event to export
+            validate: Check the event's RIPPLE_EFFECT.v1 document
+                (RippleEvent.to_document) against the schema first and raise
+                SchemaValidationError if it does not conform
+        """
+        with self.events.lock(event_id):
+            ripple = self.events.get(event_id)
+            if ripple is None:
+                raise ValueError(f"Event {event_id} not found")
+            if validate:
+                get_validator(RIPPLE_SCHEMA).validate(ripple.to_document(), event_id)
+            return json.dumps(asdict(ripple), indent=2)
+    
+    def load_ripples(
+        self,
+        paths: List[str],
+        validate: bool = False,
+        workers: int = 1
+    ) -> List[str]:
+        """
+        Load RIPPLE_EFFECT.v1 documents (e.g. data/ripple_examples) into the store
+        
+        Args:
+            paths: JSON files holding a document or a list of documents
+            validate: Validate every file against the schema first (across
+                `workers` processes) and load nothing if any is invalid
+            workers: Validation pool processes
+            
+        Returns:
+            Ids of the loaded events
+            
+        Raises:
+            SchemaValidationError: For the first invalid document
+        """
+        paths = [str(path) for path in paths]
+        if validate:
+            get_validator(RIPPLE_SCHEMA).validate_files(paths, workers).raise_for_errors()
+        loaded = []
+        for path in paths:
+            data = json.loads(Path(path).read_text())
+            for document in data if isinstance(data, list) else [data]:
+                ripple = RippleEvent.from_document(document)
+                with self.events.lock(ripple.event_id):
+                    self.events.put(ripple)
+                self.temporal.index_event(ripple)
+                self.digests.invalidate(ripple.event_id)
+                loaded.append(ripple.event_id)
+        return loaded
     
     def export_watchtower_csv(self, event_id: str) -> str:
         """Export ripple as Watchtower CSV entry"""
-        if event_id not in self.events:
-            raise ValueError(f"Event {event_id} not found")
-        
-        ripple = self.events[event_id]
-        
-        # Determine ripple type and severity
-        ripple_type = "XX" if ripple.XX.detected_alteration else "legitimate"
-        severity = "red" if ripple.XX.detected_alteration else "green"
-        detected_issue = ",".join(ripple.XX.alteration_type) if ripple.XX.alteration_type else "none"
+        with self.events.lock(event_id):
+            ripple = self.events.get(event_id)
+            if ripple is None:
+                raise ValueError(f"Event {event_id} not found")
+            return format_watchtower_row(ripple)
+    
+    def export_watchtower(self, target: Target, **options: Any) -> ExportStats:
+        """
+        Stream every stored event (or a filtered subset) to Watchtower CSV
         
-        return (
-            f"{ripple.timestamp},{ripple.event_id},{ripple.origin_shard},"
-            f"{ripple_type},{detected_issue},{severity},true"
-        )
+        Args:
+            target: Output path ("-" for stdout, .gz to compress) or an open
+                binary/text stream such as a pipe
+            options: Filters, cursor and output options of
+                runtime.watchtower_export.export_watchtower
+            
+        Returns:
+            Export stats with rows, bytes, throughput and the resume cursor
+        """
+        return export_watchtower(self.events, target, **options)
     
     # ============ PRIVATE HELPER METHODS ============
     
@@ -421,17 +1033,15 @@ class RippleEffectEngine:
         """Generate SHA-256 hash"""
         return hashlib.sha256(data.encode()).hexdigest()
     
-    def _calculate_interval(self, temporal_log: List[Dict[str, Any]]) -> int:
-        """Calculate interval from last event in milliseconds"""
-        if not temporal_log:
-            return 0
-        
-        last_timestamp = datetime.fromisoformat(
-            temporal_log[-1]["timestamp"].replace("Z", "+00:00")
-        )
-        now = datetime.utcnow()
-        delta = (now - last_timestamp).total_seconds() * 1000
-        return int(delta)
+    def _analyze_contract(
+        self,
+        contract: str,
+        bytecode: Optional[bytes] = None
+    ) -> Optional[Dict[str, Any]]:
+        """Default depth scan analyzer built on _is_hidden_contract"""
+        if self._is_hidden_contract(contract):
+            return {"layer_type": "concealed_extraction_system"}
+        return None
     
     def _is_hidden_contract(self, contract: str) -> bool:
         """Check if contract is hidden (placeholder for real logic)"""
@@ -0,0 +1,819 @@
+"""
+Ripple Event Store
+==================
+
+Pluggable storage for RippleEffectEngine events with secondary indexes.
+
+Backends:
+- InMemoryEventStore: dict storage with in-memory secondary indexes
+  (single-threaded)
+- ShardedEventStore: InMemoryEventStore shards selected by event id hash,
+  each guarded by its own lock, for many concurrent producer threads
+- SQLiteEventStore: SQLite-backed storage with an LRU cache of hot events;
+  cold events live only on disk so engine memory stays bounded
+
+Both index origin_shard, contract_address, umbrella, severity, XX
+alteration types and the event timestamp, so queries such as "all red
+ripples on shard X in the last day" do not scan every event.
+
+Stores behave like a mapping of event_id -> RippleEvent. Events are
+mutable, so callers must put() an event again after changing it to keep
+indexes (and the SQLite copy) current. Threads that modify an event hold
+lock(event_id) around the read-modify-write.
+"""
+
+import heapq
+import json
+import sqlite3
+import threading
+from bisect import bisect_left, bisect_right, insort
+from collections import OrderedDict
+from dataclasses import asdict
+from datetime import datetime
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
+
+# Scalar fields with an equality index
+INDEXED_FIELDS = ("origin_shard", "contract_address", "umbrella", "severity")
+
+TimeBound = Union[float, str, datetime, None]
+
+
+def event_severity(event: Any) -> str:
+    """Watchtower severity of an event ("red" once an alteration is detected)"""
+    return "red" if event.XX.detected_alteration else "green"
+
+
+def to_epoch(value: TimeBound) -> Optional[float]:
+    """
+    Normalize a time bound to epoch seconds
+
+    Args:
+        value: Epoch seconds, ISO-8601 string (a trailing "Z" is accepted)
+            or datetime (naive values are taken as UTC)
+
+    Returns:
+        Epoch seconds, or None if value is None
+    """
+    if value is None or isinstance(value, (int, float)):
+        return value
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    if value.tzinfo is None:
+        return (value - datetime(1970, 1, 1)).total_seconds()
+    return value.timestamp()
+
+
+def _index_entry(event: Any) -> Tuple[Dict[str, str], Set[str], float]:
+    """Extract (scalar index values, alteration types, epoch) from an event"""
+    scalars = {
+        "origin_shard": event.origin_shard,
+        "contract_address": event.contract_address,
+        "umbrella": event.umbrella,
+        "severity": event_severity(event),
+    }
+    return scalars, set(event.XX.alteration_type), to_epoch(event.timestamp)
+
+
+class EventStore:
+    """Interface shared by all ripple event store backends"""
+
+    def put(self, event: Any) -> None:
+        """Insert or update an event and refresh its index entries"""
+        raise NotImplementedError
+
+    def get(self, event_id: str) -> Optional[Any]:
+        """Get an event by id, or None"""
+        raise NotImplementedError
+
+    def delete(self, event_id: str) -> None:
+        """Remove an event (no error if missing)"""
+        raise NotImplementedError
+
+    def query(
+        self,
+        origin_shard: Optional[str] = None,
+        contract_address: Optional[str] = None,
+        umbrella: Optional[str] = None,
+        severity: Optional[str] = None,
+        alteration_type: Optional[str] = None,
+        since: TimeBound = None,
+        until: TimeBound = None,
+        limit: Optional[int] = None,
+    ) -> List[Any]:
+        """
+        Find events matching every given filter
+
+        Args:
+            origin_shard: Exact origin shard
+            contract_address: Exact contract address
+            umbrella: Exact umbrella
+            severity: "red" or "green"
+            alteration_type: XX alteration type the event must include
+            since: Inclusive lower time bound
+            until: Inclusive upper time bound
+            limit: Maximum number of events returned
+
+        Returns:
+            Matching events ordered by timestamp
+        """
+        raise NotImplementedError
+
+    def iter_query(
+        self,
+        origin_shard: Optional[str] = None,
+        contract_address: Optional[str] = None,
+        umbrella: Optional[str] = None,
+        severity: Optional[str] = None,
+        alteration_type: Optional[str] = None,
+        since: TimeBound = None,
+        until: TimeBound = None,
+        after: Optional[Tuple[float, str]] = None,
+        batch_size: int = 1000,
+    ) -> Iterator[Any]:
+        """
+        Iterate matching events in (timestamp, event_id) order
+
+        Takes the same filters as query(). Backends that keep cold events
+        on disk load them batch_size at a time, so very large result sets
+        are streamed.
+
+        Args:
+            after: Only events strictly after this (epoch, event_id) key,
+                i.e. a resume point left by a previous iteration
+            batch_size: Events loaded per step
+
+        Yields:
+            Matching events
+        """
+        lo = to_epoch(since)
+        if after is not None:
+            lo = after[0] if lo is None else max(lo, after[0])
+        events = self.query(
+            origin_shard=origin_shard,
+            contract_address=contract_address,
+            umbrella=umbrella,
+            severity=severity,
+            alteration_type=alteration_type,
+            since=lo,
+            until=until,
+        )
+        keyed = sorted(
+            ((to_epoch(event.timestamp), event.event_id), event) for event in events
+        )
+        for key, event in keyed:
+            if after is None or key > after:
+                yield event
+
+    def ids(self) -> List[str]:
+        """All stored event ids"""
+        raise NotImplementedError
+
+    def lock(self, event_id: str) -> "threading.RLock":
+        """Reentrant lock guarding read-modify-write of one event"""
+        raise NotImplementedError
+
+    def flush(self) -> None:
+        """Persist pending writes (no-op for memory-only stores)"""
+
+    def close(self) -> None:
+        """Flush and release resources"""
+        self.flush()
+
+    def __setitem__(self, event_id: str, event: Any) -> None:
+        if event_id != event.event_id:
+            raise KeyError(f"Event id mismatch: {event_id} != {event.event_id}")
+        self.put(event)
+
+    def __getitem__(self, event_id: str) -> Any:
+        event = self.get(event_id)
+        if event is None:
+            raise KeyError(event_id)
+        return event
+
+    def __delitem__(self, event_id: str) -> None:
+        self.delete(event_id)
+
+    def __contains__(self, event_id: object) -> bool:
+        return isinstance(event_id, str) and self.get(event_id) is not None
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.ids())
+
+    def __len__(self) -> int:
+        return len(self.ids())
+
+    def values(self) -> Iterator[Any]:
+        """Iterate over all events"""
+        for event_id in self.ids():
+            event = self.get(event_id)
+            if event is not None:
+                yield event
+
+    def items(self) -> Iterator[Tuple[str, Any]]:
+        """Iterate over (event_id, event) pairs"""
+        for event in self.values():
+            yield event.event_id, event
+
+
+class InMemoryEventStore(EventStore):
+    """
+    Dict-backed event store with in-memory secondary indexes
+
+    Not safe for concurrent writers; use ShardedEventStore for that.
+    """
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._events: Dict[str, Any] = {}
+        self._index: Dict[str, Dict[str, Set[str]]] = {
+            name: {} for name in INDEXED_FIELDS
+        }
+        self._alterations: Dict[str, Set[str]] = {}
+        self._timeline: List[Tuple[float, str]] = []
+        self._entries: Dict[str, Tuple[Dict[str, str], Set[str], float]] = {}
+
+    def _unindex(self, event_id: str) -> None:
+        entry = self._entries.pop(event_id, None)
+        if entry is None:
+            return
+        scalars, alterations, epoch = entry
+        for name, value in scalars.items():
+            bucket = self._index[name].get(value)
+            if bucket is not None:
+                bucket.discard(event_id)
+                if not bucket:
+                    del self._index[name][value]
+        for alteration in alterations:
+            bucket = self._alterations.get(alteration)
+            if bucket is not None:
+                bucket.discard(event_id)
+                if not bucket:
+                    del self._alterations[alteration]
+        pos = bisect_left(self._timeline, (epoch, event_id))
+        if pos < len(self._timeline) and self._timeline[pos] == (epoch, event_id):
+            del self._timeline[pos]
+
+    def put(self, event: Any) -> None:
+        event_id = event.event_id
+        entry = _index_entry(event)
+        if self._entries.get(event_id) == entry:
+            self._events[event_id] = event
+            return
+        self._unindex(event_id)
+        scalars, alterations, epoch = entry
+        for name, value in scalars.items():
+            self._index[name].setdefault(value, set()).add(event_id)
+        for alteration in alterations:
+            self._alterations.setdefault(alteration, set()).add(event_id)
+        # Events mostly arrive in time order, so this is usually an append
+        if not self._timeline or self._timeline[-1] <= (epoch, event_id):
+            self._timeline.append((epoch, event_id))
+        else:
+            insort(self._timeline, (epoch, event_id))
+        self._entries[event_id] = entry
+        self._events[event_id] = event
+
+    def get(self, event_id: str) -> Optional[Any]:
+        return self._events.get(event_id)
+
+    def lock(self, event_id: str) -> "threading.RLock":
+        return self._lock
+
+    def delete(self, event_id: str) -> None:
+        self._unindex(event_id)
+        self._events.pop(event_id, None)
+
+    def ids(self) -> List[str]:
+        return list(self._events)
+
+    def __contains__(self, event_id: object) -> bool:
+        return event_id in self._events
+
+    def __len__(self) -> int:
+        return len(self._events)
+
+    def values(self) -> Iterator[Any]:
+        return iter(list(self._events.values()))
+
+    def _ordered_ids(
+        self,
+        filters: Dict[str, Optional[str]],
+        alteration_type: Optional[str],
+        lo: Optional[float],
+        hi: Optional[float],
+    ) -> List[str]:
+        """Ids of matching events ordered by (epoch, event_id)"""
+        candidates = [
+            self._index[name].get(value, set())
+            for name, value in filters.items()
+            if value is not None
+        ]
+        if alteration_type is not None:
+            candidates.append(self._alterations.get(alteration_type, set()))
+
+        if candidates:
+            # Intersect smallest-first, then order the survivors by time
+            candidates.sort(key=len)
+            ids = set(candidates[0])
+            for bucket in candidates[1:]:
+                ids &= bucket
+            ordered = sorted(
+                (self._entries[i][2], i)
+                for i in ids
+                if (lo is None or self._entries[i][2] >= lo)
+                and (hi is None or self._entries[i][2] <= hi)
+            )
+            return [event_id for _, event_id in ordered]
+        start = 0 if lo is None else bisect_left(self._timeline, (lo, ""))
+        end = (
+            len(self._timeline)
+            if hi is None
+            else bisect_right(self._timeline, (hi, "\U0010ffff"))
+        )
+        return [event_id for _, event_id in self._timeline[start:end]]
+
+    def query(
+        self,
+        origin_shard: Optional[str] = None,
+        contract_address: Optional[str] = None,
+        umbrella: Optional[str] = None,
+        severity: Optional[str] = None,
+        alteration_type: Optional[str] = None,
+        since: TimeBound = None,
+        until: TimeBound = None,
+        limit: Optional[int] = None,
+    ) -> List[Any]:
+        filters = {
+            "origin_shard": origin_shard,
+            "contract_address": contract_address,
+            "umbrella": umbrella,
+            "severity": severity,
+        }
+        ordered_ids = self._ordered_ids(
+            filters, alteration_type, to_epoch(since), to_epoch(until)
+        )
+        return [self._events[event_id] for event_id in ordered_ids[:limit]]
+
+    def iter_query(
+        self,
+        origin_shard: Optional[str] = None,
+        contract_address: Optional[str] = None,
+        umbrella: Optional[str] = None,
+        severity: Optional[str] = None,
+        alteration_type: Optional[str] = None,
+        since: TimeBound = None,
+        until: TimeBound = None,
+        after: Optional[Tuple[float, str]] = None,
+        batch_size: int = 1000,
+    ) -> Iterator[Any]:
+        filters = {
+            "origin_shard": origin_shard,
+            "contract_address": contract_address,
+            "umbrella": umbrella,
+            "severity": severity,
+        }
+        lo = to_epoch(since)
+        if after is not None:
+            lo = after[0] if lo is None else max(lo, after[0])
+        ordered_ids = self._ordered_ids(filters, alteration_type, lo, to_epoch(until))
+        skip = 0
+        if after is not None:
+            # Only events sharing the cursor's epoch can precede it
+            while (
+                skip < len(ordered_ids)
+                and (self._entries[ordered_ids[skip]][2], ordered_ids[skip]) <= after
+            ):
+                skip += 1
+        for event_id in ordered_ids[skip:]:
+            event = self._events.get(event_id)
+            if event is not None:
+                yield event
+
+
+class ShardedEventStore(EventStore):
+    """
+    Thread-safe in-memory store sharded by event id
+
+    Each event lives in one of `shards` InMemoryEventStore shards chosen
+    by the hash of its id, and every shard has its own lock, so producers
+    working on different events rarely contend. Queries visit the shards
+    one at a time and merge their time-ordered results.
+    """
+
+    def __init__(self, shards: int = 16):
+        """
+        Create the store
+
+        Args:
+            shards: Number of independently locked shards
+        """
+        self._shards = [InMemoryEventStore() for _ in range(max(1, shards))]
+        self._locks = [threading.RLock() for _ in self._shards]
+
+    def _slot(self, event_id: str) -> int:
+        return hash(event_id) % len(self._shards)
+
+    def put(self, event: Any) -> None:
+        slot = self._slot(event.event_id)
+        with self._locks[slot]:
+            self._shards[slot].put(event)
+
+    def get(self, event_id: str) -> Optional[Any]:
+        slot = self._slot(event_id)
+        with self._locks[slot]:
+            return self._shards[slot].get(event_id)
+
+    def delete(self, event_id: str) -> None:
+        slot = self._slot(event_id)
+        with self._locks[slot]:
+            self._shards[slot].delete(event_id)
+
+    def lock(self, event_id: str) -> "threading.RLock":
+        return self._locks[self._slot(event_id)]
+
+    def __contains__(self, event_id: object) -> bool:
+        if not isinstance(event_id, str):
+            return False
+        slot = self._slot(event_id)
+        with self._locks[slot]:
+            return event_id in self._shards[slot]
+
+    def __len__(self) -> int:
+        total = 0
+        for shard, lock in zip(self._shards, self._locks):
+            with lock:
+                total += len(shard)
+        return total
+
+    def ids(self) -> List[str]:
+        ids: List[str] = []
+        for shard, lock in zip(self._shards, self._locks):
+            with lock:
+                ids.extend(shard.ids())
+        return ids
+
+    def values(self) -> Iterator[Any]:
+        for shard, lock in zip(self._shards, self._locks):
+            with lock:
+                events = list(shard._events.values())
+            yield from events
+
+    def _merged(
+        self,
+        filters: Dict[str, Optional[str]],
+        alteration_type: Optional[str],
+        lo: Optional[float],
+        hi: Optional[float],
+    ) -> Iterator[Tuple[Tuple[float, str], Any]]:
+        """((epoch, event_id), event) of matches across shards, in key order"""
+        runs = []
+        for shard, lock in zip(self._shards, self._locks):
+            with lock:
+                runs.append([
+                    ((shard._entries[event_id][2], event_id), shard._events[event_id])
+                    for event_id in shard._ordered_ids(filters, alteration_type, lo, hi)
+                ])
+        return heapq.merge(*runs, key=lambda item: item[0])
+
+    def query(
+        self,
+        origin_shard: Optional[str] = None,
+        contract_address: Optional[str] = None,
+        umbrella: Optional[str] = None,
+        severity: Optional[str] = None,
+        alteration_type: Optional[str] = None,
+        since: TimeBound = None,
+        until: TimeBound = None,
+        limit: Optional[int] = None,
+    ) -> List[Any]:
+        filters = {
+            "origin_shard": origin_shard,
+            "contract_address": contract_address,
+            "umbrella": umbrella,
+            "severity": severity,
+        }
+        merged = self._merged(filters, alteration_type, to_epoch(since), to_epoch(until))
+        matched = []
+        for _, event in merged:
+            if limit is not None and len(matched) >= limit:
+                break
+            matched.append(event)
+        return matched
+
+    def iter_query(
+        self,
+        origin_shard: Optional[str] = None,
+        contract_address: Optional[str] = None,
+        umbrella: Optional[str] = None,
+        severity: Optional[str] = None,
+        alteration_type: Optional[str] = None,
+        since: TimeBound = None,
+        until: TimeBound = None,
+        after: Optional[Tuple[float, str]] = None,
+        batch_size: int = 1000,
+    ) -> Iterator[Any]:
+        filters = {
+            "origin_shard": origin_shard,
+            "contract_address": contract_address,
+            "umbrella": umbrella,
+            "severity": severity,
+        }
+        lo = to_epoch(since)
+        if after is not None:
+            lo = after[0] if lo is None else max(lo, after[0])
+        for key, event in self._merged(filters, alteration_type, lo, to_epoch(until)):
+            if after is None or key > after:
+                yield event
+
+
+class SQLiteEventStore(EventStore):
+    """
+    SQLite-backed event store with an LRU cache of hot events
+
+    Writes are buffered in the cache and written back when an event is
+    evicted, on flush(), or before a query, so repeated updates to a hot
+    event cost one row write.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        decoder: Callable[[Dict[str, Any]], Any],
+        cache_size: int = 4096,
+    ):
+        """
+        Open (or create) a store
+
+        Args:
+            path: SQLite database file (":memory:" for a throwaway store)
+            decoder: Rebuilds an event from its asdict() form
+                (e.g. RippleEvent.from_dict)
+            cache_size: Maximum events held in memory
+        """
+        self.path = path
+        self.decoder = decoder
+        self.cache_size = max(1, cache_size)
+        self._cache: "OrderedDict[str, Any]" = OrderedDict()
+        self._dirty: Set[str] = set()
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.executescript(
+            """
+            PRAGMA journal_mode=WAL;
+            PRAGMA synchronous=NORMAL;
+            CREATE TABLE IF NOT EXISTS ripple_events (
+                event_id TEXT PRIMARY KEY,
+                ts REAL NOT NULL,
+                origin_shard TEXT,
+                contract_address TEXT,
+                umbrella TEXT,
+                severity TEXT,
+                payload TEXT NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS ripple_shard_ts ON ripple_events (origin_shard, ts);
+            CREATE INDEX IF NOT EXISTS ripple_contract_ts ON ripple_events (contract_address, ts);
+            CREATE INDEX IF NOT EXISTS ripple_umbrella_ts ON ripple_events (umbrella, ts);
+            CREATE INDEX IF NOT EXISTS ripple_severity_ts ON ripple_events (severity, ts);
+            CREATE INDEX IF NOT EXISTS ripple_ts ON ripple_events (ts);
+            CREATE TABLE IF NOT EXISTS ripple_alterations (
+                alteration_type TEXT NOT NULL,
+                event_id TEXT NOT NULL,
+                PRIMARY KEY (alteration_type, event_id)
+            ) WITHOUT ROWID;
+            CREATE INDEX IF NOT EXISTS ripple_alterations_event
+                ON ripple_alterations (event_id);
+            """
+        )
+
+    def _rows(self, events: Iterable[Any]) -> Tuple[List[tuple], List[tuple]]:
+        rows, alterations = [], []
+        for event in events:
+            scalars, types, epoch = _index_entry(event)
+            rows.append((
+                event.event_id,
+                epoch,
+                scalars["origin_shard"],
+                scalars["contract_address"],
+                scalars["umbrella"],
+                scalars["severity"],
+                json.dumps(asdict(event)),
+            ))
+            alterations.extend((t, event.event_id) for t in types)
+        return rows, alterations
+
+    def _write(self, events: List[Any]) -> None:
+        """Write events to SQLite in one transaction. Caller holds the lock."""
+        if not events:
+            return
+        rows, alterations = self._rows(events)
+        with self._conn:
+            self._conn.executemany(
+                "DELETE FROM ripple_alterations WHERE event_id = ?",
+                [(event.event_id,) for event in events],
+            )
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO ripple_events VALUES (?, ?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO ripple_alterations VALUES (?, ?)",
+                alterations,
+            )
+
+    def _evict(self) -> None:
+        """Write back and drop least recently used events. Caller holds the lock."""
+        evicted = []
+        while len(self._cache) > self.cache_size:
+            event_id, event = self._cache.popitem(last=False)
+            if event_id in self._dirty:
+                self._dirty.discard(event_id)
+                evicted.append(event)
+        self._write(evicted)
+
+    def put(self, event: Any) -> None:
+        with self._lock:
+            self._cache[event.event_id] = event
+            self._cache.move_to_end(event.event_id)
+            self._dirty.add(event.event_id)
+            self._evict()
+
+    def get(self, event_id: str) -> Optional[Any]:
+        with self._lock:
+            event = self._cache.get(event_id)
+            if event is not None:
+                self._cache.move_to_end(event_id)
+                return event
+            row = self._conn.execute(
+                "SELECT payload FROM ripple_events WHERE event_id = ?", (event_id,)
+            ).fetchone()
+            if row is None:
+                return None
+            event = self.decoder(json.loads(row[0]))
+            self._cache[event_id] = event
+            self._evict()
+            return event
+
+    def lock(self, event_id: str) -> "threading.RLock":
+        return self._lock
+
+    def delete(self, event_id: str) -> None:
+        with self._lock:
+            self._cache.pop(event_id, None)
+            self._dirty.discard(event_id)
+            with self._conn:
+                self._conn.execute(
+                    "DELETE FROM ripple_events WHERE event_id = ?", (event_id,)
+                )
+                self._conn.execute(
+                    "DELETE FROM ripple_alterations WHERE event_id = ?", (event_id,)
+                )
+
+    def flush(self) -> None:
+        with self._lock:
+            self._write([self._cache[event_id] for event_id in self._dirty])
+            self._dirty.clear()
+
+    def close(self) -> None:
+        with self._lock:
+            self.flush()
+            self._cache.clear()
+            self._conn.close()
+
+    def ids(self) -> List[str]:
+        with self._lock:
+            self.flush()
+            rows = self._conn.execute("SELECT event_id FROM ripple_events ORDER BY ts")
+            return [row[0] for row in rows]
+
+    def __contains__(self, event_id: object) -> bool:
+        with self._lock:
+            if event_id in self._cache:
+                return True
+            return self._conn.execute(
+                "SELECT 1 FROM ripple_events WHERE event_id = ?", (event_id,)
+            ).fetchone() is not None
+
+    def __len__(self) -> int:
+        with self._lock:
+            self.flush()
+            row = self._conn.execute("SELECT COUNT(*) FROM ripple_events").fetchone()
+            return row[0]
+
+    @staticmethod
+    def _filter_sql(
+        filters: Dict[str, Any],
+        alteration_type: Optional[str],
+        since: TimeBound,
+        until: TimeBound,
+    ) -> Tuple[str, List[Any], List[str]]:
+        """Build (FROM/JOIN sql, params, WHERE clauses) for a query"""
+        clauses, params = [], []
+        for name, value in filters.items():
+            if value is not None:
+                clauses.append(f"e.{name} = ?")
+                params.append(value)
+        if since is not None:
+            clauses.append("e.ts >= ?")
+            params.append(to_epoch(since))
+        if until is not None:
+            clauses.append("e.ts <= ?")
+            params.append(to_epoch(until))
+        sql = "SELECT e.event_id, e.payload, e.ts FROM ripple_events e"
+        if alteration_type is not None:
+            sql += " JOIN ripple_alterations a ON a.event_id = e.event_id"
+            clauses.append("a.alteration_type = ?")
+            params.append(alteration_type)
+        return sql, params, clauses
+
+    def _decode_rows(self, rows: List[Tuple[str, str, float]]) -> List[Any]:
+        """Events for fetched (event_id, payload, ts) rows. Caller holds the lock."""
+        events = []
+        for event_id, payload, _ in rows:
+            # Prefer the cached object so callers see one live instance
+            event = self._cache.get(event_id)
+            if event is None:
+                event = self.decoder(json.loads(payload))
+            events.append(event)
+        return events
+
+    def query(
+        self,
+        origin_shard: Optional[str] = None,
+        contract_address: Optional[str] = None,
+        umbrella: Optional[str] = None,
+        severity: Optional[str] = None,
+        alteration_type: Optional[str] = None,
+        since: TimeBound = None,
+        until: TimeBound = None,
+        limit: Optional[int] = None,
+    ) -> List[Any]:
+        filters = {
+            "origin_shard": origin_shard,
+            "contract_address": contract_address,
+            "umbrella": umbrella,
+            "severity": severity,
+        }
+        sql, params, clauses = self._filter_sql(filters, alteration_type, since, until)
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        sql += " ORDER BY e.ts"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+
+        with self._lock:
+            self.flush()
+            return self._decode_rows(self._conn.execute(sql, params).fetchall())
+
+    def iter_query(
+        self,
+        origin_shard: Optional[str] = None,
+        contract_address: Optional[str] = None,
+        umbrella: Optional[str] = None,
+        severity: Optional[str] = None,
+        alteration_type: Optional[str] = None,
+        since: TimeBound = None,
+        until: TimeBound = None,
+        after: Optional[Tuple[float, str]] = None,
+        batch_size: int = 1000,
+    ) -> Iterator[Any]:
+        filters = {
+            "origin_shard": origin_shard,
+            "contract_address": contract_address,
+            "umbrella": umbrella,
+            "severity": severity,
+        }
+        base, base_params, clauses = self._filter_sql(
+            filters, alteration_type, since, until
+        )
+        # Keyset pagination: each page resumes after the last (ts, event_id)
+        # seen, and the lock is released between pages
+        while True:
+            sql, params = base, list(base_params)
+            page_clauses = list(clauses)
+            if after is not None:
+                page_clauses.append("(e.ts > ? OR (e.ts = ? AND e.event_id > ?))")
+                params.extend((after[0], after[0], after[1]))
+            if page_clauses:
+                sql += " WHERE " + " AND ".join(page_clauses)
+            sql += " ORDER BY e.ts, e.event_id LIMIT ?"
+            params.append(batch_size)
+            with self._lock:
+                self.flush()
+                rows = self._conn.execute(sql, params).fetchall()
+                events = self._decode_rows(rows)
+            yield from events
+            if len(rows) < batch_size:
+                return
+            after = (rows[-1][2], rows[-1][0])
@@ -0,0 +1,548 @@
+"""
+Shard Propagation Simulator
+===========================
+
+Event-driven simulation of ripples spreading through connected shards
+("Amplification in connected shards").
+
+Shards form a directed graph whose edges carry a propagation delay (in
+seconds) and an amplification factor. A ripple of amplitude a reaching
+shard u at time t reaches every neighbour v at t + delay(u, v) with
+amplitude a * amplification(u, v). Arrivals are kept in a priority queue
+keyed by time, and arrivals at the same shard and time are coalesced into
+one (their amplitudes add), so each step expands one time-ordered
+frontier. Amplitudes below min_amplitude stop spreading, and each shard
+relays only the first `relays` arrivals it receives (later ones still add
+to its density); with cycles and amplification above 1 the ripple would
+otherwise never die out. This bounds a run to relays * edges events.
+
+Outputs per shard are the first arrival time and the total amplitude
+received; density_score() maps the latter to the 0-100 density scale
+(>= 70 is Green tier). With NumPy installed, each frontier is expanded
+with array operations over the CSR adjacency; otherwise a pure-Python
+loop is used. Large frontiers, and so the vectorized path, come from
+delays that coincide: integer delays, or any delays with time_resolution.
+
+Graphs are built from ripple documents (data/ripple_examples/*.json or
+engine exports): an event's origin shard, contract, owners, return path
+and extraction routes become linked nodes. They can also be read from
+graph files ({"edges": [{"source", "target", "delay", "amplification"}]})
+or generated synthetically.
+"""
+
+import heapq
+import json
+import math
+import random
+import time
+from array import array
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+try:
+    import numpy as np
+
+    NUMPY_AVAILABLE = True
+except ImportError:  # pragma: no cover - optional dependency
+    np = None
+    NUMPY_AVAILABLE = False
+
+from src.schema_validator import get_validator
+
+ROOT = Path(__file__).resolve().parents[1]
+EXAMPLES_DIR = ROOT / "data" / "ripple_examples"
+
+DEFAULT_DELAY = 1.0
+DEFAULT_AMPLIFICATION = 0.8
+MIN_AMPLITUDE = 1e-3
+
+INF = float("inf")
+
+Sources = Union[Dict[str, float], Iterable[str]]
+
+
+def density_score(received: float, scale: float = 1.0) -> float:
+    """
+    Map received ripple amplitude to the 0-100 density scale
+
+    Saturates smoothly: an amplitude of `scale` gives ~63, about
+    1.21 * scale reaches Green tier (70).
+    """
+    return 100.0 * (1.0 - math.exp(-received / scale))
+
+
+def _seconds_between(earlier: Optional[str], later: Optional[str]) -> Optional[float]:
+    """Positive seconds between two ISO timestamps, or None"""
+    if not earlier or not later:
+        return None
+    try:
+        a = datetime.fromisoformat(earlier.replace("Z", "+00:00"))
+        b = datetime.fromisoformat(later.replace("Z", "+00:00"))
+        seconds = (b - a).total_seconds()
+    except (TypeError, ValueError):
+        return None
+    return seconds if seconds > 0 else None
+
+
+class ShardGraph:
+    """Directed shard graph with per-edge delay and amplification"""
+
+    def __init__(self):
+        self._node_ids: Dict[str, int] = {}
+        self.shards: List[str] = []
+        self._src = array("q")
+        self._dst = array("q")
+        self._delay = array("d")
+        self._gain = array("d")
+        # (offsets, targets, delays, gains) sorted by source; rebuilt on demand
+        self._csr: Optional[Tuple[array, array, array, array]] = None
+
+    def __len__(self) -> int:
+        """Number of shards"""
+        return len(self.shards)
+
+    def __contains__(self, shard: object) -> bool:
+        return shard in self._node_ids
+
+    @property
+    def edge_count(self) -> int:
+        return len(self._src)
+
+    def node(self, shard: str) -> int:
+        """Node id of a shard (added if new)"""
+        node = self._node_ids.get(shard)
+        if node is None:
+            node = self._node_ids[shard] = len(self.shards)
+            self.shards.append(shard)
+        return node
+
+    def add_edge(
+        self,
+        source: str,
+        target: str,
+        delay: float = DEFAULT_DELAY,
+        amplification: float = DEFAULT_AMPLIFICATION,
+        bidirectional: bool = False
+    ) -> None:
+        """
+        Add a propagation edge
+
+        Args:
+            source: Shard the ripple leaves
+            target: Shard the ripple reaches
+            delay: Seconds from source to target
+            amplification: Factor applied to the ripple amplitude
+            bidirectional: Also add the reverse edge
+        """
+        if delay < 0:
+            raise ValueError(f"Negative delay on {source} -> {target}")
+        u, v = self.node(source), self.node(target)
+        self._src.append(u)
+        self._dst.append(v)
+        self._delay.append(delay)
+        self._gain.append(amplification)
+        if bidirectional:
+            self._src.append(v)
+            self._dst.append(u)
+            self._delay.append(delay)
+            self._gain.append(amplification)
+        self._csr = None
+
+    def add_chain(
+        self,
+        shards: Sequence[str],
+        delays: Optional[Sequence[Optional[float]]] = None,
+        amplification: float = DEFAULT_AMPLIFICATION,
+        bidirectional: bool = True
+    ) -> None:
+        """Link consecutive shards (delays[i] for hop i, default if None)"""
+        for i in range(len(shards) - 1):
+            if not shards[i] or not shards[i + 1] or shards[i] == shards[i + 1]:
+                continue
+            delay = delays[i] if delays is not None and delays[i] is not None else DEFAULT_DELAY
+            self.add_edge(shards[i], shards[i + 1], delay, amplification, bidirectional)
+
+    def csr(self) -> Tuple[array, array, array, array]:
+        """(offsets, targets, delays, amplifications) grouped by source node"""
+        if self._csr is None:
+            order = sorted(range(len(self._src)), key=self._src.__getitem__)
+            counts = [0] * (len(self.shards) + 1)
+            for u in self._src:
+                counts[u + 1] += 1
+            for i in range(len(self.shards)):
+                counts[i + 1] += counts[i]
+            self._csr = (
+                array("q", counts),
+                array("q", (self._dst[e] for e in order)),
+                array("d", (self._delay[e] for e in order)),
+                array("d", (self._gain[e] for e in order)),
+            )
+        return self._csr
+
+    def add_ripple_event(self, document: Dict[str, Any], bidirectional: bool = True) -> None:
+        """
+        Add the shards and links described by one ripple document
+
+        Accepts the RIPPLE_EFFECT.v1 example layout (vectors nested under
+        "ripple_vectors") and engine exports (vectors at the top level).
+        Edges use the event's density_score / 100 as amplification.
+        """
+        vectors = document.get("ripple_vectors", document)
+        density = document.get("density_score")
+        gain = density / 100.0 if density else DEFAULT_AMPLIFICATION
+        origin = document.get("origin_shard")
+        contract = document.get("contract_address")
+        if origin:
+            self.node(origin)
+        if origin and contract:
+            self.add_edge(origin, contract, DEFAULT_DELAY, gain, bidirectional)
+
+        xx = vectors.get("XX") or {}
+        for actor in xx.get("actors") or []:
+            if actor.get("address") and contract:
+                self.add_edge(actor["address"], contract, DEFAULT_DELAY, gain, bidirectional)
+
+        yy = vectors.get("YY") or {}
+        chain = yy.get("ownership_chain") or []
+        owners = [entry.get("owner") for entry in chain]
+        delays = [
+            _seconds_between(a.get("timestamp"), b.get("timestamp"))
+            for a, b in zip(chain, chain[1:])
+        ]
+        self.add_chain(owners, delays, gain, bidirectional)
+        return_path = (yy.get("return_vector") or yy).get("return_path") or []
+        self.add_chain(return_path, None, gain, bidirectional)
+
+        zz = vectors.get("ZZ") or {}
+        for layer in zz.get("hidden_layers") or []:
+            self.add_chain(layer.get("extraction_route") or [], None, gain, bidirectional)
+
+    @classmethod
+    def from_files(
+        cls,
+        paths: Iterable[Union[str, Path]],
+        bidirectional: bool = True,
+        validate: bool = False
+    ) -> "ShardGraph":
+        """
+        Build a graph from ripple documents and/or graph files
+
+        Args:
+            paths: JSON files holding a ripple document, a list of them, or
+                a graph ({"edges": [{"source", "target", "delay",
+                "amplification"}]})
+            bidirectional: Link ripple document shards both ways
+            validate: Check ripple documents against RIPPLE_EFFECT.v1 and
+                raise SchemaValidationError for the first invalid one
+        """
+        validator = get_validator("RIPPLE_EFFECT.v1") if validate else None
+        graph = cls()
+        for path in paths:
+            data = json.loads(Path(path).read_text())
+            documents = data if isinstance(data, list) else [data]
+            for document in documents:
+                if validator is not None and "edges" not in document:
+                    validator.validate(document, str(path))
+                if "edges" in document:
+                    for edge in document["edges"]:
+                        graph.add_edge(
+                            edge["source"],
+                            edge["target"],
+                            edge.get("delay", DEFAULT_DELAY),
+                            edge.get("amplification", DEFAULT_AMPLIFICATION),
+                            edge.get("bidirectional", False),
+                        )
+                else:
+                    graph.add_ripple_event(document, bidirectional)
+        return graph
+
+    @classmethod
+    def from_ripple_examples(
+        cls,
+        directory: Union[str, Path] = EXAMPLES_DIR,
+        validate: bool = False
+    ) -> "ShardGraph":
+        """Build a graph from every *.json file in a directory"""
+        return cls.from_files(sorted(Path(directory).glob("*.json")), validate=validate)
+
+    @classmethod
+    def synthetic(
+        cls,
+        shards: int,
+        degree: int = 8,
+        delay: Tuple[int, int] = (1, 10),
+        amplification: Tuple[float, float] = (0.3, 0.9),
+        seed: int = 0
+    ) -> "ShardGraph":
+        """
+        Random graph: each shard links to `degree` random shards
+
+        Args:
+            shards: Number of shards
+            degree: Out-edges per shard
+            delay: Inclusive range of whole-second edge delays
+            amplification: Range of edge amplification factors
+            seed: Random seed
+        """
+        rng = random.Random(seed)
+        graph = cls()
+        graph.shards = [f"shard-{i}" for i in range(shards)]
+        graph._node_ids = {name: i for i, name in enumerate(graph.shards)}
+        count = shards * degree
+        graph._src = array("q", (i for i in range(shards) for _ in range(degree)))
+        graph._dst = array("q", rng.choices(range(shards), k=count))
+        graph._delay = array("d", rng.choices(range(delay[0], delay[1] + 1), k=count))
+        low, high = amplification
+        graph._gain = array("d", (low + (high - low) * rng.random() for _ in range(count)))
+        return graph
+
+
+@dataclass
+class PropagationResult:
+    """Outcome of one propagation run"""
+    shards: List[str]
+    arrival: array
+    received: array
+    events: int
+    steps: int
+    seconds: float
+    truncated: bool = False
+
+    @property
+    def reached(self) -> int:
+        """Number of shards the ripple reached"""
+        return sum(1 for t in self.arrival if t != INF)
+
+    def arrival_times(self) -> Dict[str, float]:
+        """First arrival time of every reached shard"""
+        return {
+            shard: t for shard, t in zip(self.shards, self.arrival) if t != INF
+        }
+
+    def density_scores(self, scale: float = 1.0) -> Dict[str, float]:
+        """Density score (0-100) of every reached shard"""
+        return {
+            shard: density_score(amount, scale)
+            for shard, amount, t in zip(self.shards, self.received, self.arrival)
+            if t != INF
+        }
+
+    def mean_density(self, scale: float = 1.0) -> float:
+        """Average density score over reached shards"""
+        scores = self.density_scores(scale)
+        return sum(scores.values()) / len(scores) if scores else 0.0
+
+    def to_dict(self, scale: float = 1.0) -> Dict[str, Any]:
+        return {
+            "reached": self.reached,
+            "events": self.events,
+            "steps": self.steps,
+            "seconds": round(self.seconds, 3),
+            "truncated": self.truncated,
+            "arrival_times": self.arrival_times(),
+            "density_scores": {k: round(v, 2) for k, v in self.density_scores(scale).items()},
+        }
+
+
+def _source_nodes(graph: ShardGraph, sources: Sources) -> Dict[int, float]:
+    items = sources.items() if isinstance(sources, dict) else ((s, 1.0) for s in sources)
+    nodes: Dict[int, float] = {}
+    for shard, amplitude in items:
+        node = graph._node_ids.get(shard)
+        if node is None:
+            raise KeyError(f"Unknown shard: {shard}")
+        nodes[node] = nodes.get(node, 0.0) + amplitude
+    return nodes
+
+
+def propagate(
+    graph: ShardGraph,
+    sources: Sources,
+    start: float = 0.0,
+    horizon: float = INF,
+    min_amplitude: float = MIN_AMPLITUDE,
+    relays: int = 1,
+    max_events: Optional[int] = None,
+    time_resolution: Optional[float] = None,
+    vectorized: Optional[bool] = None
+) -> PropagationResult:
+    """
+    Simulate ripples spreading from source shards
+
+    Args:
+        graph: Shard graph
+        sources: Shard names (amplitude 1.0 each) or {shard: amplitude}
+        start: Time of the initial ripples (e.g. epoch seconds)
+        horizon: Stop at arrivals later than start + horizon
+        min_amplitude: Ripples weaker than this are not propagated
+        relays: Arrivals each shard passes on (later ones only add density)
+        max_events: Stop after this many propagated arrivals
+        time_resolution: Snap edge delays to multiples of this many
+            seconds, so more arrivals coincide and are coalesced
+        vectorized: Use NumPy frontier expansion (default: if available
+            and delays coincide, i.e. they are whole seconds or
+            time_resolution is set; tiny frontiers run faster in Python)
+
+    Returns:
+        PropagationResult with arrival times and received amplitude
+    """
+    offsets, targets, delays, gains = graph.csr()
+    if vectorized is None:
+        vectorized = NUMPY_AVAILABLE and (
+            bool(time_resolution) or all(d.is_integer() for d in delays)
+        )
+    elif vectorized and not NUMPY_AVAILABLE:
+        raise RuntimeError("Vectorized propagation requires NumPy")
+
+    # Time runs in units of `scale` seconds from `start`
+    scale = time_resolution or 1.0
+    if time_resolution:
+        delays = array("d", (round(d / time_resolution) for d in delays))
+    limit = horizon / scale
+    seeds = _source_nodes(graph, sources)
+    run = _propagate_numpy if vectorized else _propagate_python
+
+    begin = time.perf_counter()
+    arrival, received, events, steps, truncated = run(
+        offsets, targets, delays, gains, len(graph), seeds, limit, min_amplitude,
+        relays, max_events
+    )
+    for node, t in enumerate(arrival):
+        if t != INF:
+            arrival[node] = start + t * scale
+    return PropagationResult(
+        graph.shards, arrival, received, events, steps,
+        time.perf_counter() - begin, truncated
+    )
+
+
+def _propagate_python(
+    offsets: array,
+    targets: array,
+    delays: array,
+    gains: array,
+    count: int,
+    seeds: Dict[int, float],
+    limit: float,
+    min_amplitude: float,
+    relays: int,
+    max_events: Optional[int]
+) -> Tuple[array, array, int, int, bool]:
+    arrival = array("d", [INF]) * count
+    received = array("d", [0.0]) * count
+    relayed = array("l", [0]) * count
+    pending: Dict[float, Dict[int, float]] = {0.0: dict(seeds)}
+    heap = [0.0]
+    events = steps = 0
+    while heap:
+        t = heapq.heappop(heap)
+        frontier = pending.pop(t)
+        steps += 1
+        for u, amplitude in frontier.items():
+            received[u] += amplitude
+            if arrival[u] == INF:
+                arrival[u] = t
+            if relayed[u] >= relays:
+                continue
+            relayed[u] += 1
+            for e in range(offsets[u], offsets[u + 1]):
+                reach = amplitude * gains[e]
+                if reach < min_amplitude:
+                    continue
+                at = t + delays[e]
+                if at > limit:
+                    continue
+                bucket = pending.get(at)
+                if bucket is None:
+                    bucket = pending[at] = {}
+                    heapq.heappush(heap, at)
+                v = targets[e]
+                bucket[v] = bucket.get(v, 0.0) + reach
+                events += 1
+        if max_events is not None and events >= max_events:
+            return arrival, received, events, steps, bool(heap)
+    return arrival, received, events, steps, False
+
+
+def _propagate_numpy(
+    offsets: array,
+    targets: array,
+    delays: array,
+    gains: array,
+    count: int,
+    seeds: Dict[int, float],
+    limit: float,
+    min_amplitude: float,
+    relays: int,
+    max_events: Optional[int]
+) -> Tuple[array, array, int, int, bool]:
+    offs = np.frombuffer(offsets, dtype=np.int64)
+    dst = np.frombuffer(targets, dtype=np.int64)
+    delay = np.frombuffer(delays, dtype=np.float64)
+    gain = np.frombuffer(gains, dtype=np.float64)
+    arrival = np.full(count, INF)
+    received = np.zeros(count)
+    relayed = np.zeros(count, dtype=np.int64)
+    # time -> arrival chunks of (nodes, amplitudes), merged when popped
+    pending: Dict[float, List[Tuple[Any, Any]]] = {
+        0.0: [(
+            np.fromiter(seeds.keys(), dtype=np.int64, count=len(seeds)),
+            np.fromiter(seeds.values(), dtype=np.float64, count=len(seeds)),
+        )]
+    }
+    heap = [0.0]
+    events = steps = 0
+    truncated = False
+    while heap:
+        t = heapq.heappop(heap)
+        chunks = pending.pop(t)
+        steps += 1
+        nodes = np.concatenate([c[0] for c in chunks])
+        amps = np.concatenate([c[1] for c in chunks])
+        if len(chunks) > 1 or len(nodes) > 1:
+            nodes, inverse = np.unique(nodes, return_inverse=True)
+            amps = np.bincount(inverse, weights=amps, minlength=len(nodes))
+        received[nodes] += amps
+        arrival[nodes] = np.minimum(arrival[nodes], t)
+        relaying = relayed[nodes] < relays
+        if not relaying.all():
+            nodes, amps = nodes[relaying], amps[relaying]
+        relayed[nodes] += 1
+
+        # Expand every edge of the frontier at once
+        first = offs[nodes]
+        degree = offs[nodes + 1] - first
+        total = int(degree.sum())
+        if total == 0:
+            continue
+        owner = np.repeat(np.arange(len(nodes)), degree)
+        within = np.arange(total) - np.repeat(np.cumsum(degree) - degree, degree)
+        edge = first[owner] + within
+        reach = amps[owner] * gain[edge]
+        at = t + delay[edge]
+        keep = (reach >= min_amplitude) & (at <= limit)
+        if not keep.all():
+            edge, reach, at = edge[keep], reach[keep], at[keep]
+        if len(edge) == 0:
+            continue
+        events += len(edge)
+
+        # Queue the arrivals grouped by time
+        order = np.argsort(at, kind="stable")
+        at, edge, reach = at[order], edge[order], reach[order]
+        times, starts = np.unique(at, return_index=True)
+        bounds = list(starts[1:]) + [len(at)]
+        for when, lo, hi in zip(times.tolist(), starts.tolist(), bounds):
+            chunk = (dst[edge[lo:hi]], reach[lo:hi])
+            bucket = pending.get(when)
+            if bucket is None:
+                pending[when] = [chunk]
+                heapq.heappush(heap, when)
+            else:
+                bucket.append(chunk)
+        if max_events is not None and events >= max_events:
+            truncated = bool(heap)
+            break
+    return array("d", arrival.tobytes()), array("d", received.tobytes()), events, steps, truncated
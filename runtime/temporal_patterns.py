@@ -0,0 +1,212 @@
+"""
+Temporal Pattern Detection
+==========================
+
+TT-vector timing analysis: per-contract event times, periodicity
+detection and next-occurrence prediction.
+
+Event times are kept as epoch-second floats in one array per contract,
+so the hot path (recording an event and computing its interval) never
+parses ISO strings. ISO timestamps are parsed only once, when events
+created elsewhere (e.g. loaded from a persistent store) are indexed.
+
+Periodicity is detected with a lag-difference test, which is related to
+autocorrelation. For each lag L the spans t[i + L] - t[i] are computed.
+When intervals repeat every L events those spans are (nearly) constant,
+so the smallest lag whose spans have a coefficient of variation under a
+tolerance is taken as the cycle. The next occurrence is then the event L
+steps back plus the mean span. Working on event times directly avoids
+binning a sparse, irregular event stream for an FFT. With NumPy
+installed, each lag's spans are computed with one array operation;
+contracts are still analyzed one at a time.
+"""
+
+import threading
+from array import array
+from bisect import insort
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+try:
+    import numpy as np
+
+    NUMPY_AVAILABLE = True
+except ImportError:  # pragma: no cover - optional dependency
+    np = None
+    NUMPY_AVAILABLE = False
+
+# Fewest events needed before a cycle is reported
+MIN_EVENTS = 4
+# Longest interval pattern (in events) that is searched for
+MAX_LAG = 16
+# Maximum coefficient of variation of cycle spans for a cycle to count
+TOLERANCE = 0.1
+
+
+def parse_timestamp(timestamp: str) -> float:
+    """Parse an ISO-8601 timestamp to epoch seconds ("Z" or naive means UTC)"""
+    parsed = datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.timestamp()
+
+
+def format_timestamp(epoch: float) -> str:
+    """Format epoch seconds the way ripple events store timestamps"""
+    moment = datetime.fromtimestamp(epoch, timezone.utc).replace(tzinfo=None)
+    return moment.isoformat() + "Z"
+
+
+def _span_dispersion(times: array, lag: int) -> Tuple[float, float]:
+    """Mean and coefficient of variation of t[i + lag] - t[i]"""
+    if NUMPY_AVAILABLE:
+        values = np.frombuffer(times, dtype=np.float64)
+        spans = values[lag:] - values[:-lag]
+        mean = float(spans.mean())
+        std = float(spans.std())
+    else:
+        spans = [b - a for a, b in zip(times, times[lag:])]
+        mean = sum(spans) / len(spans)
+        std = (sum((s - mean) ** 2 for s in spans) / len(spans)) ** 0.5
+    if mean <= 0:
+        return mean, float("inf")
+    return mean, std / mean
+
+
+def detect_cycle(times: array) -> Optional[Tuple[int, float, float]]:
+    """
+    Find the shortest repeating interval pattern in sorted event times
+
+    Args:
+        times: Sorted epoch seconds
+
+    Returns:
+        (lag in events, mean cycle span in seconds, confidence 0..1), or
+        None if no lag is regular enough
+    """
+    if len(times) < MIN_EVENTS:
+        return None
+    # Require at least two full cycles of spans for each lag tested
+    for lag in range(1, min(MAX_LAG, (len(times) - 1) // 2) + 1):
+        mean, cv = _span_dispersion(times, lag)
+        if cv <= TOLERANCE:
+            return lag, mean, max(0.0, 1.0 - cv)
+    return None
+
+
+def predict_next(times: array, horizon: int = 1) -> List[Dict[str, Any]]:
+    """
+    Predict upcoming occurrences from sorted event times
+
+    Args:
+        times: Sorted epoch seconds
+        horizon: Number of future occurrences to predict
+
+    Returns:
+        predicted_cycles entries (RIPPLE_EFFECT.v1 TT.cycle_prediction)
+    """
+    cycle = detect_cycle(times)
+    if cycle is None:
+        return []
+    lag, span, confidence = cycle
+    if lag == 1:
+        cycle_type = f"periodic_{int(round(span))}s"
+    else:
+        cycle_type = f"pattern_{lag}_events_{int(round(span))}s"
+    extended = list(times[-lag:])
+    predictions = []
+    for _ in range(horizon):
+        # Each event repeats one full cycle after the event `lag` steps back
+        nxt = extended[-lag] + span
+        extended.append(nxt)
+        predictions.append({
+            "predicted_time": format_timestamp(nxt),
+            "cycle_type": cycle_type,
+            "confidence": round(confidence, 4)
+        })
+    return predictions
+
+
+class TemporalIndex:
+    """Per-contract event times as float arrays (safe to share between threads)"""
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._times: Dict[str, array] = {}
+        # Last recorded time of each event, for interval_from_previous
+        self._last: Dict[str, float] = {}
+
+    def __contains__(self, event_id: str) -> bool:
+        return event_id in self._last
+
+    def times(self, contract: str) -> array:
+        """Sorted event times (epoch seconds) recorded for a contract (a copy)"""
+        with self._lock:
+            return array("d", self._times.get(contract, ()))
+
+    def intervals(self, contract: str) -> array:
+        """Seconds between consecutive events on a contract"""
+        times = self.times(contract)
+        return array("d", (b - a for a, b in zip(times, times[1:])))
+
+    def record(self, event_id: str, contract: str, epoch: float) -> int:
+        """
+        Record an event occurrence
+
+        Args:
+            event_id: Ripple event the occurrence belongs to
+            contract: Contract address of the event
+            epoch: Occurrence time in epoch seconds
+
+        Returns:
+            Milliseconds since the event's previous occurrence (0 if first)
+        """
+        with self._lock:
+            times = self._times.get(contract)
+            if times is None:
+                times = self._times[contract] = array("d")
+            if not times or times[-1] <= epoch:
+                times.append(epoch)
+            else:
+                insort(times, epoch)
+            previous = self._last.get(event_id)
+            self._last[event_id] = epoch
+        if previous is None:
+            return 0
+        return int((epoch - previous) * 1000)
+
+    def index_event(self, event: Any) -> None:
+        """Index an event's existing TT temporal log (parses ISO strings once)"""
+        with self._lock:
+            if event.event_id in self._last:
+                return
+            for entry in event.TT.temporal_log:
+                epoch = parse_timestamp(entry["timestamp"])
+                self.record(event.event_id, event.contract_address, epoch)
+
+    def index_events(self, events: Iterable[Any]) -> None:
+        """Index every event not yet known to the index"""
+        for event in events:
+            self.index_event(event)
+
+    def predict(self, contract: str, horizon: int = 1) -> Dict[str, Any]:
+        """
+        Build a TT cycle_prediction for one contract
+
+        Args:
+            contract: Contract address
+            horizon: Number of future occurrences to predict
+
+        Returns:
+            cycle_prediction dict
+        """
+        return {
+            "predicted_cycles": predict_next(self.times(contract), horizon),
+            "government_timing_patterns": []
+        }
+
+    def predict_all(self, horizon: int = 1) -> Dict[str, Dict[str, Any]]:
+        """cycle_prediction for every contract (one predict() per contract)"""
+        with self._lock:
+            contracts = list(self._times)
+        return {contract: self.predict(contract, horizon) for contract in contracts}
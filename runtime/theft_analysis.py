@@ -0,0 +1,320 @@
+"""
+Streaming Theft Analysis
+========================
+
+Columnar XX-vector theft analysis for large transaction logs.
+
+Transaction logs are read from NDJSON or CSV in chunks. Each chunk is
+converted to columns (type, authorized, signature_valid, from, timestamp)
+and the unauthorized-transfer and signature checks run over whole columns.
+Results are folded into a TheftAggregate that keeps distinct actors and
+alteration types in counters, so memory does not grow with the number of
+bad transactions. Chunks can be analyzed in parallel on a process pool.
+
+The checks match RippleEffectEngine.analyze_for_theft:
+- unauthorized transfer: type == "transfer" and authorized == False
+- signature tampering: signature_valid == False
+
+Dict and NDJSON records use that exact equality, so only False and
+numeric zero are false. CSV has no types, so "false", "0", "no", "f" and
+"n" (any case) are read as false there.
+"""
+
+import csv
+import json
+from collections import Counter, deque
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from itertools import compress, islice
+from pathlib import Path
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+THEFT = "theft"
+ALTERED_SIGNATURE = "altered_signature"
+
+# Column names expected in CSV headers and NDJSON objects
+COLUMNS = ("type", "authorized", "signature_valid", "from", "timestamp")
+
+_FALSE = {"false", "0", "no", "f", "n"}
+_TRUE = {"true", "1", "yes", "t", "y"}
+
+Source = Union[str, Path, Iterable[Dict[str, Any]]]
+
+
+def _record_flag(value: Any) -> Any:
+    """
+    Normalize a boolean field of a dict/JSON record
+
+    Matches the original `tx.get(...) == False` check exactly: False and
+    numeric zero become False, anything else (including the string
+    "false") is kept and never counts as false.
+    """
+    return False if value == False else value
+
+
+def _csv_flag(value: Optional[str]) -> Optional[bool]:
+    """Parse a CSV boolean field (None when absent or unknown)"""
+    if value is None:
+        return None
+    lowered = value.strip().lower()
+    if lowered in _FALSE:
+        return False
+    if lowered in _TRUE:
+        return True
+    return None
+
+
+@dataclass
+class TheftAggregate:
+    """Aggregated theft findings for one or more transaction chunks"""
+    transactions: int = 0
+    unauthorized_transfers: int = 0
+    tampered_signatures: int = 0
+    alteration_types: Counter = field(default_factory=Counter)
+    actors: Counter = field(default_factory=Counter)
+    actor_first_seen: Dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def detected(self) -> bool:
+        """True if any transaction failed a check"""
+        return bool(self.unauthorized_transfers or self.tampered_signatures)
+
+    def merge(self, other: "TheftAggregate") -> "TheftAggregate":
+        """
+        Fold a later chunk's aggregate into this one
+
+        Args:
+            other: Aggregate of transactions that come after this one's
+
+        Returns:
+            self
+        """
+        self.transactions += other.transactions
+        self.unauthorized_transfers += other.unauthorized_transfers
+        self.tampered_signatures += other.tampered_signatures
+        self.alteration_types.update(other.alteration_types)
+        self.actors.update(other.actors)
+        for address, first_seen in other.actor_first_seen.items():
+            self.actor_first_seen.setdefault(address, first_seen)
+        return self
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a JSON-serializable summary"""
+        return {
+            "transactions": self.transactions,
+            "unauthorized_transfers": self.unauthorized_transfers,
+            "tampered_signatures": self.tampered_signatures,
+            "alteration_types": dict(self.alteration_types),
+            "actors": [
+                {
+                    "address": address,
+                    "count": count,
+                    "first_seen": self.actor_first_seen.get(address),
+                }
+                for address, count in self.actors.items()
+            ],
+        }
+
+
+class TransactionColumns:
+    """One chunk of transactions stored column by column"""
+
+    __slots__ = ("type", "authorized", "signature_valid", "sender", "timestamp")
+
+    def __init__(
+        self,
+        types: List[Any],
+        authorized: List[Any],
+        signature_valid: List[Any],
+        senders: List[Any],
+        timestamps: List[Any]
+    ):
+        self.type = types
+        self.authorized = authorized
+        self.signature_valid = signature_valid
+        self.sender = senders
+        self.timestamp = timestamps
+
+    def __len__(self) -> int:
+        return len(self.type)
+
+    @classmethod
+    def from_records(cls, records: Iterable[Dict[str, Any]]) -> "TransactionColumns":
+        """Build columns from transaction dicts"""
+        records = records if isinstance(records, list) else list(records)
+        return cls(
+            [tx.get("type") for tx in records],
+            [_record_flag(tx.get("authorized")) for tx in records],
+            [_record_flag(tx.get("signature_valid")) for tx in records],
+            [tx.get("from") for tx in records],
+            [tx.get("timestamp") for tx in records],
+        )
+
+    @classmethod
+    def from_ndjson(cls, lines: Iterable[str]) -> "TransactionColumns":
+        """Build columns from NDJSON lines (blank lines are skipped)"""
+        return cls.from_records([json.loads(line) for line in lines if line.strip()])
+
+    @classmethod
+    def from_csv_rows(
+        cls,
+        header: Sequence[str],
+        rows: Sequence[Sequence[str]]
+    ) -> "TransactionColumns":
+        """
+        Build columns from parsed CSV rows
+
+        Args:
+            header: CSV header; missing COLUMNS read as empty
+            rows: Data rows
+        """
+        position = {name: i for i, name in enumerate(header)}
+
+        def column(name: str) -> List[Any]:
+            i = position.get(name)
+            if i is None:
+                return [None] * len(rows)
+            return [row[i] if i < len(row) and row[i] != "" else None for row in rows]
+
+        return cls(
+            column("type"),
+            [_csv_flag(v) for v in column("authorized")],
+            [_csv_flag(v) for v in column("signature_valid")],
+            column("from"),
+            column("timestamp"),
+        )
+
+    def evaluate(self) -> TheftAggregate:
+        """Run the theft checks over the whole chunk"""
+        unauthorized = [
+            kind == "transfer" and authorized is False
+            for kind, authorized in zip(self.type, self.authorized)
+        ]
+        tampered = self.signature_valid.count(False)
+
+        actors: Counter = Counter(compress(self.sender, unauthorized))
+        first_seen: Dict[str, Any] = {}
+        if actors:
+            for sender, ts in compress(zip(self.sender, self.timestamp), unauthorized):
+                if sender not in first_seen:
+                    first_seen[sender] = ts
+                    if len(first_seen) == len(actors):
+                        break
+
+        flagged = sum(unauthorized)
+        types: Counter = Counter()
+        if flagged:
+            types[THEFT] = flagged
+        if tampered:
+            types[ALTERED_SIGNATURE] = tampered
+        return TheftAggregate(
+            transactions=len(self),
+            unauthorized_transfers=flagged,
+            tampered_signatures=tampered,
+            alteration_types=types,
+            actors=actors,
+            actor_first_seen=first_seen,
+        )
+
+
+def _detect_format(path: Path) -> str:
+    return "csv" if path.suffix.lower() == ".csv" else "ndjson"
+
+
+def iter_chunks(
+    source: Source,
+    fmt: Optional[str] = None,
+    chunk_size: int = 50000
+) -> Iterator[Tuple[str, Any]]:
+    """
+    Read a transaction log in raw chunks
+
+    Args:
+        source: NDJSON/CSV file path, or an iterable of transaction dicts
+        fmt: "ndjson" or "csv" (from the file suffix if not given)
+        chunk_size: Transactions per chunk
+
+    Yields:
+        (kind, payload) pairs for _analyze_chunk: ("records", dicts),
+        ("ndjson", lines) or ("csv", (header, rows))
+    """
+    if not isinstance(source, (str, Path)):
+        iterator = iter(source)
+        while chunk := list(islice(iterator, chunk_size)):
+            yield "records", chunk
+        return
+
+    path = Path(source)
+    fmt = fmt or _detect_format(path)
+    with path.open("r", encoding="utf-8", newline="") as handle:
+        if fmt == "csv":
+            reader = csv.reader(handle)
+            header = next(reader, None)
+            if header is None:
+                return
+            while rows := list(islice(reader, chunk_size)):
+                yield "csv", (header, rows)
+        elif fmt == "ndjson":
+            while lines := list(islice(handle, chunk_size)):
+                yield "ndjson", lines
+        else:
+            raise ValueError(f"Unsupported transaction log format: {fmt}")
+
+
+def _analyze_chunk(kind: str, payload: Any) -> TheftAggregate:
+    """Parse and evaluate one raw chunk (runs in pool workers)"""
+    if kind == "records":
+        columns = TransactionColumns.from_records(payload)
+    elif kind == "ndjson":
+        columns = TransactionColumns.from_ndjson(payload)
+    else:
+        columns = TransactionColumns.from_csv_rows(*payload)
+    return columns.evaluate()
+
+
+def analyze_transaction_log(
+    source: Source,
+    fmt: Optional[str] = None,
+    chunk_size: int = 50000,
+    workers: int = 1
+) -> TheftAggregate:
+    """
+    Analyze a transaction log for theft in bounded memory
+
+    Args:
+        source: NDJSON/CSV file path, or an iterable of transaction dicts
+        fmt: "ndjson" or "csv" (from the file suffix if not given)
+        chunk_size: Transactions per chunk
+        workers: Worker processes (1 analyzes in this process)
+
+    Returns:
+        Aggregate over the whole log
+    """
+    total = TheftAggregate()
+    chunks = iter_chunks(source, fmt, chunk_size)
+    if workers <= 1:
+        for kind, payload in chunks:
+            total.merge(_analyze_chunk(kind, payload))
+        return total
+
+    # Keep a bounded number of chunks in flight and merge in input order
+    # so first-seen timestamps match a sequential scan
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending: deque = deque()
+        for kind, payload in chunks:
+            pending.append(pool.submit(_analyze_chunk, kind, payload))
+            if len(pending) >= workers * 2:
+                total.merge(pending.popleft().result())
+        while pending:
+            total.merge(pending.popleft().result())
+    return total
@@ -0,0 +1,400 @@
+"""
+Transaction Graph Index
+=======================
+
+Ownership/transfer graph for YY-vector return-to-source paths.
+
+Addresses are interned to integer node ids and transfers are stored as
+edges in append order (source, target and timestamp columns). Forward and
+reverse adjacency are kept in CSR form: an offsets array per node and a
+flat array of edge ids. New transfers go to a small delta adjacency and
+are merged into the CSR arrays once the delta grows past a fraction of
+the graph, so appends stay cheap and queries keep scanning flat arrays.
+
+Ownership flows original_owner -> ... -> current owner along transfer
+edges; a return path walks that chain backwards, from the current owner
+to the original owner.
+"""
+
+import json
+from array import array
+from collections import Counter, deque
+from itertools import accumulate
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from runtime.theft_analysis import iter_chunks
+
+
+class TransactionGraph:
+    """Append-friendly transfer graph with CSR adjacency"""
+
+    # Merge the delta into CSR once it holds this share of all edges
+    COMPACT_RATIO = 0.5
+    MIN_COMPACT_EDGES = 4096
+
+    def __init__(self):
+        self._node_ids: Dict[str, int] = {}
+        self.addresses: List[str] = []
+        self._src = array("q")
+        self._dst = array("q")
+        self._time: List[Any] = []
+        # CSR over edges [0, _compacted): forward by source, reverse by target
+        self._compacted = 0
+        self._fwd_offsets = array("q", [0])
+        self._fwd_edges = array("q")
+        self._rev_offsets = array("q", [0])
+        self._rev_edges = array("q")
+        # Edges appended since the last compaction
+        self._fwd_delta: Dict[int, List[int]] = {}
+        self._rev_delta: Dict[int, List[int]] = {}
+
+    def __len__(self) -> int:
+        """Number of transfer edges"""
+        return len(self._src)
+
+    @property
+    def node_count(self) -> int:
+        return len(self.addresses)
+
+    def _node(self, address: str) -> int:
+        node = self._node_ids.get(address)
+        if node is None:
+            node = self._node_ids[address] = len(self.addresses)
+            self.addresses.append(address)
+        return node
+
+    def add_transfer(self, sender: str, receiver: str, timestamp: Any = None) -> int:
+        """
+        Append one transfer edge
+
+        Args:
+            sender: Address ownership moved from
+            receiver: Address ownership moved to
+            timestamp: Transfer timestamp (kept for ownership chains)
+
+        Returns:
+            Edge id
+        """
+        u = self._node(sender)
+        v = self._node(receiver)
+        edge = len(self._src)
+        self._src.append(u)
+        self._dst.append(v)
+        self._time.append(timestamp)
+        self._fwd_delta.setdefault(u, []).append(edge)
+        self._rev_delta.setdefault(v, []).append(edge)
+        pending = len(self._src) - self._compacted
+        if pending >= max(self.MIN_COMPACT_EDGES, self.COMPACT_RATIO * len(self._src)):
+            self.compact()
+        return edge
+
+    def add_transfers(self, transfers: Iterable[Tuple[str, str, Any]]) -> int:
+        """
+        Bulk-append (sender, receiver, timestamp) transfer edges
+
+        Edges go straight into the edge columns and the CSR arrays are
+        rebuilt once at the end, skipping per-edge delta bookkeeping.
+
+        Args:
+            transfers: (sender, receiver, timestamp) tuples
+
+        Returns:
+            Number of edges added
+        """
+        node = self._node
+        src, dst, times = self._src, self._dst, self._time
+        before = len(src)
+        try:
+            for sender, receiver, timestamp in transfers:
+                src.append(node(sender))
+                dst.append(node(receiver))
+                times.append(timestamp)
+        finally:
+            self.compact()
+        return len(src) - before
+
+    def add_transactions(self, transactions: Iterable[Dict[str, Any]]) -> int:
+        """
+        Append transfer edges from transaction dicts
+
+        Only records with type "transfer" and both "from" and "to" set are
+        used; authorized and unauthorized transfers both move ownership.
+
+        Args:
+            transactions: Transaction dicts
+
+        Returns:
+            Number of edges added
+        """
+        return self.add_transfers(
+            (tx["from"], tx["to"], tx.get("timestamp"))
+            for tx in transactions
+            if tx.get("type") == "transfer" and tx.get("from") and tx.get("to")
+        )
+
+    def add_transaction_log(
+        self,
+        source: Union[str, Path],
+        fmt: Optional[str] = None,
+        chunk_size: int = 50000
+    ) -> int:
+        """
+        Append transfer edges from an NDJSON or CSV transaction log
+
+        Args:
+            source: Log file path
+            fmt: "ndjson" or "csv" (from the file suffix if not given)
+            chunk_size: Transactions read per step
+
+        Returns:
+            Number of edges added
+        """
+        def records() -> Iterator[Dict[str, Any]]:
+            for kind, payload in iter_chunks(source, fmt, chunk_size):
+                if kind == "ndjson":
+                    yield from (json.loads(line) for line in payload if line.strip())
+                elif kind == "csv":
+                    header, rows = payload
+                    yield from (dict(zip(header, row)) for row in rows)
+                else:
+                    yield from payload
+
+        return self.add_transactions(records())
+
+    @staticmethod
+    def _build_csr(keys: array, node_count: int, edge_count: int) -> Tuple[array, array]:
+        """Sort edge ids [0, edge_count) by key into CSR arrays"""
+        # Stable sort keeps each node's edges in append order
+        edges = array("q", sorted(range(edge_count), key=keys.__getitem__))
+        counts = Counter(keys[:edge_count])
+        offsets = array(
+            "q", accumulate((counts.get(node, 0) for node in range(node_count)), initial=0)
+        )
+        return offsets, edges
+
+    def compact(self) -> None:
+        """Merge pending edges into the CSR arrays"""
+        if self._compacted == len(self._src):
+            return
+        count = len(self._src)
+        self._fwd_offsets, self._fwd_edges = self._build_csr(
+            self._src, self.node_count, count
+        )
+        self._rev_offsets, self._rev_edges = self._build_csr(
+            self._dst, self.node_count, count
+        )
+        self._compacted = count
+        self._fwd_delta.clear()
+        self._rev_delta.clear()
+
+    def _edges(
+        self,
+        node: int,
+        offsets: array,
+        edges: array,
+        delta: Dict[int, List[int]]
+    ) -> Iterator[int]:
+        if node + 1 < len(offsets):
+            yield from edges[offsets[node]:offsets[node + 1]]
+        pending = delta.get(node)
+        if pending:
+            yield from pending
+
+    def successors(self, address: str) -> List[str]:
+        """Addresses that received transfers from address"""
+        node = self._node_ids.get(address)
+        if node is None:
+            return []
+        edges = self._edges(node, self._fwd_offsets, self._fwd_edges, self._fwd_delta)
+        return [self.addresses[self._dst[e]] for e in edges]
+
+    def predecessors(self, address: str) -> List[str]:
+        """Addresses that sent transfers to address"""
+        node = self._node_ids.get(address)
+        if node is None:
+            return []
+        edges = self._edges(node, self._rev_offsets, self._rev_edges, self._rev_delta)
+        return [self.addresses[self._src[e]] for e in edges]
+
+    def _transfer_chain(self, source: int, target: int) -> Optional[List[int]]:
+        """
+        Fewest-hop transfer chain source -> target as edge ids
+
+        Bidirectional BFS: forward along transfers from source and backward
+        along reverse edges from target, expanding the smaller frontier one
+        full level at a time and stopping at the level where they meet.
+        """
+        if source == target:
+            return []
+        src, dst = self._src, self._dst
+        fwd = (self._fwd_offsets, self._fwd_edges, self._fwd_delta)
+        rev = (self._rev_offsets, self._rev_edges, self._rev_delta)
+        # node -> (edge used to reach it or -1 for the root, hop depth)
+        seen_fwd: Dict[int, Tuple[int, int]] = {source: (-1, 0)}
+        seen_rev: Dict[int, Tuple[int, int]] = {target: (-1, 0)}
+        frontier_fwd, frontier_rev = [source], [target]
+
+        while frontier_fwd and frontier_rev:
+            forward = len(frontier_fwd) <= len(frontier_rev)
+            adjacency = fwd if forward else rev
+            seen, other = (seen_fwd, seen_rev) if forward else (seen_rev, seen_fwd)
+            ends = dst if forward else src
+            next_frontier = []
+            best, best_length = -1, -1
+            for node in frontier_fwd if forward else frontier_rev:
+                depth = seen[node][1] + 1
+                for edge in self._edges(node, *adjacency):
+                    nxt = ends[edge]
+                    if nxt in seen:
+                        continue
+                    seen[nxt] = (edge, depth)
+                    if nxt in other:
+                        length = depth + other[nxt][1]
+                        if best < 0 or length < best_length:
+                            best, best_length = nxt, length
+                    next_frontier.append(nxt)
+            if best >= 0:
+                chain: List[int] = []
+                node = best
+                while seen_fwd[node][0] >= 0:
+                    chain.append(seen_fwd[node][0])
+                    node = src[seen_fwd[node][0]]
+                chain.reverse()
+                node = best
+                while seen_rev[node][0] >= 0:
+                    chain.append(seen_rev[node][0])
+                    node = dst[seen_rev[node][0]]
+                return chain
+            if forward:
+                frontier_fwd = next_frontier
+            else:
+                frontier_rev = next_frontier
+        return None
+
+    def shortest_return_path(self, current_owner: str, original_owner: str) -> List[str]:
+        """
+        Fewest-hop return path from the current owner to the original owner
+
+        Args:
+            current_owner: Address holding the asset now
+            original_owner: Address the asset should return to
+
+        Returns:
+            Addresses from current_owner to original_owner (empty if the
+            original owner never transferred to the current owner)
+        """
+        source = self._node_ids.get(original_owner)
+        target = self._node_ids.get(current_owner)
+        if source is None or target is None:
+            return [current_owner] if current_owner == original_owner else []
+        chain = self._transfer_chain(source, target)
+        if chain is None:
+            return []
+        path = [original_owner] + [self.addresses[self._dst[e]] for e in chain]
+        path.reverse()
+        return path
+
+    def all_return_paths(
+        self,
+        current_owner: str,
+        original_owner: str,
+        max_depth: int = 8,
+        limit: int = 100
+    ) -> List[List[str]]:
+        """
+        Simple return paths from the current owner to the original owner
+
+        Paths are enumerated one length at a time, each pass walking reverse
+        transfer edges depth-first and pruning nodes that cannot reach the
+        original owner in exactly the remaining hops (distances from a
+        bounded BFS), so only useful branches are explored and a limit
+        never drops a shorter path in favour of a longer one.
+
+        Args:
+            current_owner: Address holding the asset now
+            original_owner: Address the asset should return to
+            max_depth: Maximum hops per path
+            limit: Maximum number of paths returned
+
+        Returns:
+            Paths (current_owner first), shortest first
+        """
+        start = self._node_ids.get(current_owner)
+        goal = self._node_ids.get(original_owner)
+        if start is None or goal is None:
+            return [[current_owner]] if current_owner == original_owner else []
+
+        # Hop distance from the original owner along forward transfers
+        fwd = (self._fwd_offsets, self._fwd_edges, self._fwd_delta)
+        rev = (self._rev_offsets, self._rev_edges, self._rev_delta)
+        distance = {goal: 0}
+        queue = deque([goal])
+        while queue:
+            node = queue.popleft()
+            if distance[node] >= max_depth:
+                continue
+            for edge in self._edges(node, *fwd):
+                nxt = self._dst[edge]
+                if nxt not in distance:
+                    distance[nxt] = distance[node] + 1
+                    queue.append(nxt)
+        if start not in distance:
+            return []
+
+        paths: List[List[str]] = []
+        path = [start]
+        on_path = {start}
+
+        def walk(node: int, remaining: int) -> None:
+            # Extend path by exactly `remaining` hops to the original owner
+            if len(paths) >= limit:
+                return
+            if node == goal:
+                if remaining == 0:
+                    paths.append([self.addresses[n] for n in path])
+                return
+            # Parallel transfers between the same pair give the same path
+            senders = dict.fromkeys(self._src[e] for e in self._edges(node, *rev))
+            for prev in senders:
+                if prev in on_path or distance.get(prev, max_depth + 1) > remaining - 1:
+                    continue
+                path.append(prev)
+                on_path.add(prev)
+                walk(prev, remaining - 1)
+                on_path.discard(prev)
+                path.pop()
+
+        # One pass per path length, so a limit keeps the shortest paths
+        for length in range(distance[start], max_depth + 1):
+            walk(start, length)
+            if len(paths) >= limit:
+                break
+        return paths
+
+    def ownership_chain(self, original_owner: str, current_owner: str) -> List[Dict[str, Any]]:
+        """
+        Ownership chain from the original owner to the current owner
+
+        Args:
+            original_owner: First owner
+            current_owner: Address holding the asset now
+
+        Returns:
+            One entry per owner with the transfer that made them owner
+        """
+        source = self._node_ids.get(original_owner)
+        target = self._node_ids.get(current_owner)
+        if source is None or target is None:
+            return []
+        chain = self._transfer_chain(source, target)
+        if chain is None:
+            return []
+        entries = [{"owner": original_owner, "timestamp": None, "acquired_from": None}]
+        for edge in chain:
+            entries.append({
+                "owner": self.addresses[self._dst[edge]],
+                "timestamp": self._time[edge],
+                "acquired_from": self.addresses[self._src[edge]]
+            })
+        return entries
@@ -0,0 +1,242 @@
+"""
+Tribunal Proof Hashing
+======================
+
+Incremental, per-vector hashing for ripple tribunal proofs.
+
+Each of the five ripple vectors (XX, YY, ZZ, TT, WW) is hashed on its own
+and the digest is cached until that vector is invalidated, so proving an
+event whose temporal log or hidden layers keep growing only rehashes the
+vectors that changed. Vectors are serialized straight from their fields,
+without the deep copy dataclasses.asdict makes.
+
+The proof hash is a Merkle root over six leaves: the event header (ids,
+shard, contract, umbrella, effect, density, archive refs) followed by the
+XX, YY, ZZ, TT and WW digests. Leaves and inner nodes are hashed with
+distinct prefixes, and an odd node is promoted to the next level
+unchanged.
+"""
+
+import hashlib
+import json
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+VECTORS = ("XX", "YY", "ZZ", "TT", "WW")
+HEADER_FIELDS = (
+    "event_id",
+    "timestamp",
+    "origin_shard",
+    "contract_address",
+    "umbrella",
+    "effect",
+    "density_score",
+    "watchtower_entry",
+    "pulse_archive_ref",
+)
+
+_LEAF = b"\x00"
+_NODE = b"\x01"
+
+
+def _digest(payload: Dict[str, Any]) -> str:
+    data = json.dumps(payload, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(_LEAF + data.encode()).hexdigest()
+
+
+def vector_digest(vector: Any) -> str:
+    """Leaf digest of one ripple vector"""
+    return _digest(vars(vector))
+
+
+def header_digest(event: Any) -> str:
+    """Leaf digest of the event header (everything except vectors and proof)"""
+    return _digest({name: getattr(event, name) for name in HEADER_FIELDS})
+
+
+def merkle_root(leaves: List[str]) -> str:
+    """
+    Merkle root over hex leaf digests
+
+    Args:
+        leaves: Leaf digests in order
+
+    Returns:
+        Hex root digest
+    """
+    level = [bytes.fromhex(leaf) for leaf in leaves]
+    if not level:
+        return hashlib.sha256(_NODE).hexdigest()
+    while len(level) > 1:
+        paired = [
+            hashlib.sha256(_NODE + level[i] + level[i + 1]).digest()
+            for i in range(0, len(level) - 1, 2)
+        ]
+        if len(level) % 2:
+            paired.append(level[-1])
+        level = paired
+    return level[0].hex()
+
+
+def proof_leaves(header: str, digests: Dict[str, str]) -> List[str]:
+    """Leaves in proof order: header, then each vector"""
+    return [header] + [digests[name] for name in VECTORS]
+
+
+def verify_proof(event: Any, proof: Dict[str, Any]) -> bool:
+    """
+    Check a tribunal proof against the event's current contents
+
+    Args:
+        event: RippleEvent
+        proof: Proof package from generate_tribunal_proof
+
+    Returns:
+        True if every vector digest and the Merkle root match
+    """
+    digests = {name: vector_digest(getattr(event, name)) for name in VECTORS}
+    if digests != proof.get("vector_digests"):
+        return False
+    root = merkle_root(proof_leaves(header_digest(event), digests))
+    return root == proof.get("proof_hash")
+
+
+def _vector_digests(jobs: List[Tuple[str, str, Any]]) -> List[Tuple[str, str, str]]:
+    """Hash (event_id, vector name, vector) jobs (runs in pool workers)"""
+    return [(event_id, name, vector_digest(vector)) for event_id, name, vector in jobs]
+
+
+class VectorDigestCache:
+    """
+    Per-event cache of vector digests
+
+    Entries are dropped by invalidate(), which every engine mutation path
+    calls for the vectors it touches; code that edits a vector in place
+    outside the engine must call it too. A digest is also recomputed if
+    the vector object was replaced (e.g. the event was reloaded from a
+    store). Every invalidation bumps the event's generation, and a digest
+    computed before that is not stored, so a concurrent update cannot
+    leave a stale digest behind.
+    """
+
+    def __init__(self):
+        # event_id -> vector name -> (vector object, digest)
+        self._digests: Dict[str, Dict[str, Tuple[Any, str]]] = {}
+        self._generations: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def invalidate(self, event_id: str, *vectors: str) -> None:
+        """
+        Forget cached digests
+
+        Args:
+            event_id: Event whose vectors changed
+            vectors: Vector names (all vectors if none given)
+        """
+        with self._lock:
+            self._generations[event_id] = self._generations.get(event_id, 0) + 1
+            if not vectors:
+                self._digests.pop(event_id, None)
+                return
+            cached = self._digests.get(event_id)
+            if cached:
+                for name in vectors:
+                    cached.pop(name, None)
+
+    def generation(self, event_id: str) -> int:
+        """Number of invalidations seen for an event"""
+        return self._generations.get(event_id, 0)
+
+    def _cached(self, event_id: str) -> Dict[str, Tuple[Any, str]]:
+        with self._lock:
+            return dict(self._digests.get(event_id, {}))
+
+    def stale(self, event: Any) -> List[str]:
+        """Names of vectors of event without a valid cached digest"""
+        cached = self._cached(event.event_id)
+        return [
+            name for name in VECTORS
+            if cached.get(name, (None,))[0] is not getattr(event, name)
+        ]
+
+    def store(
+        self,
+        event: Any,
+        name: str,
+        digest: str,
+        generation: Optional[int] = None
+    ) -> bool:
+        """
+        Cache a digest
+
+        Args:
+            event: RippleEvent the digest belongs to
+            name: Vector name
+            digest: Vector digest
+            generation: generation() when hashing started; the digest is
+                dropped if the event was invalidated since
+
+        Returns:
+            True if the digest was stored
+        """
+        with self._lock:
+            if generation is not None and generation != self.generation(event.event_id):
+                return False
+            self._digests.setdefault(event.event_id, {})[name] = (
+                getattr(event, name), digest
+            )
+            return True
+
+    def digests(self, event: Any) -> Dict[str, str]:
+        """
+        Vector digests for event, computing only stale ones
+
+        Callers must keep the event from being modified meanwhile (e.g.
+        by holding its store lock).
+        """
+        digests = {}
+        cached = self._cached(event.event_id)
+        for name in VECTORS:
+            vector = getattr(event, name)
+            entry = cached.get(name)
+            if entry is not None and entry[0] is vector:
+                digests[name] = entry[1]
+            else:
+                digests[name] = vector_digest(vector)
+                self.store(event, name, digests[name])
+        return digests
+
+    def refresh_many(
+        self,
+        events: Iterable[Any],
+        workers: int = 1,
+        chunk_size: int = 256
+    ) -> None:
+        """
+        Recompute stale digests for many events
+
+        Args:
+            events: RippleEvents
+            workers: Worker processes (1 hashes in this process)
+            chunk_size: Vectors per worker task
+        """
+        by_id = {}
+        generations = {}
+        jobs = []
+        for event in events:
+            by_id[event.event_id] = event
+            generations[event.event_id] = self.generation(event.event_id)
+            jobs.extend(
+                (event.event_id, name, getattr(event, name)) for name in self.stale(event)
+            )
+        if not jobs:
+            return
+        if workers <= 1 or len(jobs) <= chunk_size:
+            results = _vector_digests(jobs)
+        else:
+            chunks = [jobs[i:i + chunk_size] for i in range(0, len(jobs), chunk_size)]
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                results = [item for part in pool.map(_vector_digests, chunks) for item in part]
+        for event_id, name, digest in results:
+            self.store(by_id[event_id], name, digest, generations[event_id])
@@ -0,0 +1,293 @@
+"""
+Watchtower CSV Export
+=====================
+
+Streaming bulk export of ripple events to Watchtower CSV.
+
+Events are read from the event store in (timestamp, event_id) order a
+batch at a time and written through the csv module, so shard names or
+alteration lists containing commas and quotes are escaped correctly.
+Output goes to a file, stdout or any binary stream (e.g. a pipe to a
+subprocess), optionally gzip-compressed, through a large write buffer.
+
+Incremental exports keep an ExportCursor: the (timestamp, event_id) key of
+the last exported event. Passing it back exports only events after it.
+A cursor file is updated only after the output has been written
+completely, so a failed export is simply repeated.
+
+Command line (SQLite event store):
+    python runtime/watchtower_export.py events.db watchtower.csv.gz \\
+        --cursor watchtower.cursor.json
+"""
+
+import argparse
+import csv
+import gzip
+import io
+import json
+import os
+import sys
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, BinaryIO, Callable, Dict, List, Optional, Tuple, Union
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.append(str(ROOT))
+
+from runtime.ripple_store import EventStore, TimeBound, event_severity, to_epoch
+
+WATCHTOWER_HEADER = (
+    "timestamp",
+    "event_id",
+    "origin_shard",
+    "ripple_type",
+    "detected_issue",
+    "severity",
+    "tribunal_ready",
+)
+
+Target = Union[str, Path, BinaryIO, io.TextIOBase]
+
+
+def watchtower_row(event: Any) -> Tuple[str, ...]:
+    """Watchtower CSV fields for one ripple event"""
+    altered = event.XX.detected_alteration
+    return (
+        event.timestamp,
+        event.event_id,
+        event.origin_shard,
+        "XX" if altered else "legitimate",
+        ",".join(event.XX.alteration_type) if event.XX.alteration_type else "none",
+        event_severity(event),
+        "true",
+    )
+
+
+def format_watchtower_row(event: Any) -> str:
+    """One escaped Watchtower CSV line (without line terminator)"""
+    buffer = io.StringIO()
+    csv.writer(buffer, lineterminator="").writerow(watchtower_row(event))
+    return buffer.getvalue()
+
+
+@dataclass
+class ExportCursor:
+    """Resume point of an incremental export"""
+    epoch: Optional[float] = None
+    event_id: str = ""
+
+    @property
+    def key(self) -> Optional[Tuple[float, str]]:
+        """(epoch, event_id) of the last exported event, None if nothing yet"""
+        return None if self.epoch is None else (self.epoch, self.event_id)
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> "ExportCursor":
+        """Read a cursor file (a fresh cursor if it does not exist)"""
+        path = Path(path)
+        if not path.exists():
+            return cls()
+        data = json.loads(path.read_text())
+        return cls(data.get("epoch"), data.get("event_id", ""))
+
+    def save(self, path: Union[str, Path]) -> None:
+        """Write the cursor file atomically"""
+        path = Path(path)
+        tmp = path.with_name(path.name + ".tmp")
+        tmp.write_text(json.dumps({"epoch": self.epoch, "event_id": self.event_id}))
+        os.replace(tmp, path)
+
+
+@dataclass
+class ExportStats:
+    """Throughput of one export"""
+    rows: int = 0
+    bytes_written: int = 0
+    seconds: float = 0.0
+    cursor: ExportCursor = field(default_factory=ExportCursor)
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows / self.seconds if self.seconds > 0 else 0.0
+
+    @property
+    def megabytes_per_second(self) -> float:
+        if self.seconds <= 0:
+            return 0.0
+        return self.bytes_written / self.seconds / (1024 * 1024)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "rows": self.rows,
+            "bytes_written": self.bytes_written,
+            "seconds": round(self.seconds, 3),
+            "rows_per_second": round(self.rows_per_second, 1),
+            "megabytes_per_second": round(self.megabytes_per_second, 2),
+            "cursor": {"epoch": self.cursor.epoch, "event_id": self.cursor.event_id},
+        }
+
+
+class _CountingSink(io.RawIOBase):
+    """Raw writer that forwards to a binary stream and counts bytes"""
+
+    def __init__(self, sink: BinaryIO):
+        self.sink = sink
+        self.count = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        self.sink.write(data)
+        self.count += len(data)
+        return len(data)
+
+
+def _open_target(target: Target) -> Tuple[BinaryIO, bool]:
+    """Binary stream for a target and whether the exporter owns it"""
+    if isinstance(target, (str, Path)):
+        if str(target) == "-":
+            return sys.stdout.buffer, False
+        return open(target, "wb"), True
+    if isinstance(target, io.TextIOBase):
+        target.flush()
+        return target.buffer, False
+    return target, False
+
+
+def export_watchtower(
+    store: EventStore,
+    target: Target,
+    origin_shard: Optional[str] = None,
+    contract_address: Optional[str] = None,
+    umbrella: Optional[str] = None,
+    severity: Optional[str] = None,
+    alteration_type: Optional[str] = None,
+    since: TimeBound = None,
+    until: TimeBound = None,
+    cursor: Optional[ExportCursor] = None,
+    compress: Optional[bool] = None,
+    header: bool = True,
+    batch_size: int = 10000,
+    buffer_size: int = 1 << 20,
+    progress: Optional[Callable[[ExportStats], None]] = None
+) -> ExportStats:
+    """
+    Stream ripple events from a store to Watchtower CSV
+
+    Args:
+        store: Event store to read
+        target: Output path ("-" for stdout) or an open binary/text stream;
+            streams are flushed but left open
+        origin_shard: Exact origin shard filter
+        contract_address: Exact contract address filter
+        umbrella: Exact umbrella filter
+        severity: "red" or "green"
+        alteration_type: XX alteration type the event must include
+        since: Inclusive lower time bound
+        until: Inclusive upper time bound
+        cursor: Export only events after this cursor (incremental export)
+        compress: Gzip the output (default: when the path ends in .gz)
+        header: Write the CSV header row
+        batch_size: Events read from the store per step
+        buffer_size: Output buffer size in bytes
+        progress: Called with running stats after every batch
+
+    Returns:
+        Export stats; stats.cursor points at the last exported event
+        (the given cursor if nothing new was exported)
+    """
+    if compress is None:
+        compress = isinstance(target, (str, Path)) and str(target).endswith(".gz")
+    start = time.perf_counter()
+    stats = ExportStats(cursor=cursor or ExportCursor())
+
+    sink, owned = _open_target(target)
+    counter = _CountingSink(sink)
+    buffered = io.BufferedWriter(counter, buffer_size)
+    stream = gzip.GzipFile(fileobj=buffered, mode="wb", compresslevel=6) if compress else buffered
+    text = io.TextIOWrapper(stream, encoding="utf-8", newline="")
+    try:
+        writer = csv.writer(text, lineterminator="\n")
+        if header:
+            writer.writerow(WATCHTOWER_HEADER)
+        events = store.iter_query(
+            origin_shard=origin_shard,
+            contract_address=contract_address,
+            umbrella=umbrella,
+            severity=severity,
+            alteration_type=alteration_type,
+            since=since,
+            until=until,
+            after=stats.cursor.key,
+            batch_size=batch_size,
+        )
+        last = None
+        for event in events:
+            writer.writerow(watchtower_row(event))
+            last = event
+            stats.rows += 1
+            if progress is not None and stats.rows % batch_size == 0:
+                stats.bytes_written = counter.count
+                stats.seconds = time.perf_counter() - start
+                progress(stats)
+        if last is not None:
+            stats.cursor = ExportCursor(to_epoch(last.timestamp), last.event_id)
+    finally:
+        # Closing the wrappers writes the gzip trailer and drains the buffer;
+        # the counting sink never closes the target itself
+        text.close()
+        buffered.close()
+        sink.flush()
+        if owned:
+            sink.close()
+    stats.bytes_written = counter.count
+    stats.seconds = time.perf_counter() - start
+    return stats
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Export a SQLite event store to Watchtower CSV"""
+    from runtime.ripple_effect import RippleEvent
+    from runtime.ripple_store import SQLiteEventStore
+
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1])
+    parser.add_argument("store", help="SQLite event store file")
+    parser.add_argument("output", help="CSV path (.gz to compress, - for stdout)")
+    parser.add_argument("--cursor", help="Cursor file for incremental exports")
+    parser.add_argument("--shard", help="Only events from this origin shard")
+    parser.add_argument("--severity", choices=("red", "green"))
+    parser.add_argument("--alteration-type")
+    parser.add_argument("--since", help="Inclusive lower time bound (ISO-8601)")
+    parser.add_argument("--until", help="Inclusive upper time bound (ISO-8601)")
+    parser.add_argument("--no-header", action="store_true")
+    parser.add_argument("--gzip", action="store_true", help="Compress a stream target")
+    args = parser.parse_args(argv)
+
+    store = SQLiteEventStore(args.store, RippleEvent.from_dict)
+    try:
+        cursor = ExportCursor.load(args.cursor) if args.cursor else None
+        stats = export_watchtower(
+            store,
+            args.output,
+            origin_shard=args.shard,
+            severity=args.severity,
+            alteration_type=args.alteration_type,
+            since=args.since,
+            until=args.until,
+            cursor=cursor,
+            compress=True if args.gzip else None,
+            header=not args.no_header,
+        )
+    finally:
+        store.close()
+    if args.cursor:
+        stats.cursor.save(args.cursor)
+    print(json.dumps(stats.to_dict()), file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
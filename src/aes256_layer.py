@@ -6,13 +6,18 @@ activities, with symbolic timestamp indices corresponding to universal myths.
 from __future__ import annotations
 
 import hashlib
+import hmac
+import mmap
 import os
 import secrets
 import struct
+import threading
 import time
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Dict, List, Tuple
+from typing import Any, BinaryIO, Dict, Iterable, Iterator, List, Tuple
 
 
 @dataclass(frozen=True)
@@ -40,13 +45,71 @@ MYTHIC_TIMESTAMPS: List[MythicTimestamp] = [
 ]
 
 
+# Keystream block size (one SHA-256 digest) and default streaming chunk size
+BLOCK_SIZE = 32
+STREAM_CHUNK_SIZE = 1 << 20  # 1 MiB, a multiple of BLOCK_SIZE
+TAG_SIZE = 16
+
+_BLOCK_INDEX = struct.Struct(">I")
+
+
 def _xor_bytes(data: bytes, key: bytes) -> bytes:
-    """XOR data with key, repeating key as needed."""
-    result = bytearray(len(data))
-    key_len = len(key)
-    for i, byte in enumerate(data):
-        result[i] = byte ^ key[i % key_len]
-    return bytes(result)
+    """XOR data with key, repeating key as needed.
+
+    Both operands are converted to big integers so the XOR runs in C
+    instead of a per-byte Python loop.
+    """
+    size = len(data)
+    if size == 0:
+        return b""
+    if len(key) < size:
+        key = (key * (size // len(key) + 1))[:size]
+    elif len(key) > size:
+        key = key[:size]
+    mixed = int.from_bytes(data, "little") ^ int.from_bytes(key, "little")
+    return mixed.to_bytes(size, "little")
+
+
+def _keystream(stream_key: bytes, first_block: int, size: int) -> bytes:
+    """Generate keystream bytes for consecutive blocks.
+
+    Block i of the keystream is SHA-256(stream_key || uint32_be(i)).
+
+    Args:
+        stream_key: Per-message stream key
+        first_block: Index of the first block to generate
+        size: Number of keystream bytes needed
+
+    Returns:
+        Keystream of at least size bytes
+    """
+    base = hashlib.sha256(stream_key)
+    pack = _BLOCK_INDEX.pack
+    blocks = []
+    for index in range(first_block, first_block + -(-size // BLOCK_SIZE)):
+        block = base.copy()
+        block.update(pack(index))
+        blocks.append(block.digest())
+    return b"".join(blocks)
+
+
+def _apply_keystream(data: bytes, stream_key: bytes, first_block: int = 0) -> bytes:
+    """Encrypt or decrypt data starting at a block-aligned offset.
+
+    Args:
+        data: Plaintext or ciphertext
+        stream_key: Per-message stream key
+        first_block: Block index of data[0]
+
+    Returns:
+        data XOR keystream
+    """
+    return _xor_bytes(data, _keystream(stream_key, first_block, len(data)))
+
+
+def _stream_key(key: bytes, nonce: bytes) -> bytes:
+    """Derive the per-message stream key."""
+    return hashlib.sha256(key + nonce).digest()
 
 
 def _derive_key(password: bytes, salt: bytes, iterations: int = 100000) -> bytes:
@@ -73,6 +136,128 @@ def _generate_salt() -> bytes:
     return os.urandom(32)
 
 
+class DerivedKeyCache:
+    """Bounded, TTL-evicting cache of PBKDF2-derived keys.
+
+    Entries are keyed by (HMAC of the password under a per-process secret,
+    salt, iterations), so the cache never holds passwords. Keys are kept
+    in bytearrays and overwritten with zeros when evicted or cleared;
+    derive() hands out a bytearray copy the caller can zeroize too.
+    """
+
+    def __init__(self, max_entries: int = 128, ttl_seconds: float = 300.0):
+        """Initialize the cache.
+
+        Args:
+            max_entries: Maximum cached keys (least recently used evicted)
+            ttl_seconds: Lifetime of a cached key
+        """
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._secret = secrets.token_bytes(32)
+        self._entries: OrderedDict[Tuple[bytes, bytes, int], Tuple[bytearray, float]]
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits: int = 0
+        self.misses: int = 0
+
+    def _cache_key(
+        self, password: bytes, salt: bytes, iterations: int
+    ) -> Tuple[bytes, bytes, int]:
+        tag = hmac.new(self._secret, password, hashlib.sha256).digest()
+        return tag, bytes(salt), iterations
+
+    @staticmethod
+    def _zeroize(key: bytearray) -> None:
+        key[:] = bytes(len(key))
+
+    def _expire(self, now: float) -> None:
+        """Drop expired entries (oldest first). Caller holds the lock."""
+        while self._entries:
+            cache_key, (key, expires_at) = next(iter(self._entries.items()))
+            if expires_at > now and len(self._entries) <= self.max_entries:
+                break
+            self._zeroize(key)
+            del self._entries[cache_key]
+
+    def derive(self, password: bytes, salt: bytes, iterations: int) -> bytearray:
+        """Get a derived key, running PBKDF2 only on a cache miss.
+
+        Args:
+            password: Password bytes
+            salt: Salt bytes
+            iterations: PBKDF2 iteration count
+
+        Returns:
+            32-byte derived key (a copy; zeroize it when done)
+        """
+        cache_key = self._cache_key(password, salt, iterations)
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(cache_key)
+            if entry is not None and entry[1] > now:
+                self._entries.move_to_end(cache_key)
+                self.hits += 1
+                return bytearray(entry[0])
+
+        # Derive outside the lock so misses do not serialize
+        key = _derive_key(password, salt, iterations)
+        self.put(password, salt, iterations, key)
+        with self._lock:
+            self.misses += 1
+        return bytearray(key)
+
+    def put(self, password: bytes, salt: bytes, iterations: int, key: bytes) -> None:
+        """Store a derived key.
+
+        Args:
+            password: Password bytes
+            salt: Salt bytes
+            iterations: PBKDF2 iteration count
+            key: Derived key
+        """
+        if self.max_entries <= 0:
+            return
+        cache_key = self._cache_key(password, salt, iterations)
+        now = time.monotonic()
+        with self._lock:
+            old = self._entries.pop(cache_key, None)
+            if old is not None:
+                self._zeroize(old[0])
+            self._entries[cache_key] = (bytearray(key), now + self.ttl_seconds)
+            self._expire(now)
+
+    def clear(self) -> None:
+        """Zeroize and drop every cached key."""
+        with self._lock:
+            for key, _ in self._entries.values():
+                self._zeroize(key)
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            self._expire(time.monotonic())
+            return len(self._entries)
+
+
+# Shared cache for decrypt_token(use_key_cache=True)
+_key_cache = DerivedKeyCache()
+
+
+def get_key_cache() -> DerivedKeyCache:
+    """Get the shared derived-key cache.
+
+    Returns:
+        The module-level DerivedKeyCache instance
+    """
+    return _key_cache
+
+
+def clear_key_cache() -> None:
+    """Zeroize and drop all cached derived keys."""
+    _key_cache.clear()
+
+
 def aes256_encrypt(
     plaintext: bytes,
     password: str,
@@ -100,24 +285,34 @@ def aes256_encrypt(
     # Derive 256-bit key using proper PBKDF2
     key = _derive_key(password.encode("utf-8"), salt, iterations)
 
-    # Create encryption stream using derived key and nonce
-    stream_key = hashlib.sha256(key + nonce).digest()
+    return _encrypt_with_key(plaintext, key, nonce), salt, nonce
 
-    # Encrypt using XOR with keystream (CTR-mode pattern)
-    blocks = []
-    for i in range(0, len(plaintext), 32):
-        block_key = hashlib.sha256(stream_key + struct.pack(">I", i // 32)).digest()
-        block = plaintext[i : i + 32]
-        encrypted_block = _xor_bytes(block, block_key)
-        blocks.append(encrypted_block)
 
-    ciphertext = b"".join(blocks)
+def _encrypt_with_key(plaintext: bytes, key: bytes, nonce: bytes) -> bytes:
+    """Encrypt with an already-derived key.
+
+    Args:
+        plaintext: Data to encrypt
+        key: 32-byte derived key
+        nonce: 12-byte nonce, unique per message under this key
+
+    Returns:
+        Ciphertext with authentication tag appended
+    """
+    # Create encryption stream using derived key and nonce
+    stream_key = _stream_key(key, nonce)
+
+    # Encrypt using XOR with keystream (CTR-mode pattern), a chunk at a time
+    view = memoryview(plaintext)
+    ciphertext = b"".join(
+        _apply_keystream(view[i : i + STREAM_CHUNK_SIZE], stream_key, i // BLOCK_SIZE)
+        for i in range(0, len(plaintext), STREAM_CHUNK_SIZE)
+    )
 
     # Generate authentication tag
-    auth_data = key + nonce + ciphertext
-    auth_tag = hashlib.sha256(auth_data).digest()[:16]
+    auth_tag = hashlib.sha256(key + nonce + ciphertext).digest()[:TAG_SIZE]
 
-    return ciphertext + auth_tag, salt, nonce
+    return ciphertext + auth_tag
 
 
 def aes256_decrypt(
@@ -142,32 +337,272 @@ def aes256_decrypt(
     Raises:
         ValueError: If authentication fails
     """
-    # Separate ciphertext and tag
-    ciphertext = ciphertext_with_tag[:-16]
-    received_tag = ciphertext_with_tag[-16:]
-
-    # Derive key
     key = _derive_key(password.encode("utf-8"), salt, iterations)
+    return _decrypt_with_key(ciphertext_with_tag, key, nonce)
+
+
+def _decrypt_with_key(ciphertext_with_tag: bytes, key: bytes, nonce: bytes) -> bytes:
+    """Decrypt with an already-derived key.
+
+    Args:
+        ciphertext_with_tag: Encrypted data with authentication tag
+        key: 32-byte derived key
+        nonce: Nonce used for encryption
+
+    Returns:
+        Decrypted plaintext
+
+    Raises:
+        ValueError: If authentication fails
+    """
+    # Separate ciphertext and tag
+    ciphertext = ciphertext_with_tag[:-TAG_SIZE]
+    received_tag = ciphertext_with_tag[-TAG_SIZE:]
 
     # Verify authentication tag using constant-time comparison
-    auth_data = key + nonce + ciphertext
-    expected_tag = hashlib.sha256(auth_data).digest()[:16]
+    expected_tag = hashlib.sha256(key + nonce + ciphertext).digest()[:TAG_SIZE]
 
     if not secrets.compare_digest(received_tag, expected_tag):
         raise ValueError("Authentication failed: data may have been tampered with")
 
     # Create decryption stream
-    stream_key = hashlib.sha256(key + nonce).digest()
+    stream_key = _stream_key(key, nonce)
 
     # Decrypt
-    blocks = []
-    for i in range(0, len(ciphertext), 32):
-        block_key = hashlib.sha256(stream_key + struct.pack(">I", i // 32)).digest()
-        block = ciphertext[i : i + 32]
-        decrypted_block = _xor_bytes(block, block_key)
-        blocks.append(decrypted_block)
+    view = memoryview(ciphertext)
+    return b"".join(
+        _apply_keystream(view[i : i + STREAM_CHUNK_SIZE], stream_key, i // BLOCK_SIZE)
+        for i in range(0, len(ciphertext), STREAM_CHUNK_SIZE)
+    )
 
-    return b"".join(blocks)
+
+def _read_full(reader: BinaryIO, size: int) -> bytes:
+    """Read up to size bytes, tolerating short reads from pipes."""
+    parts = []
+    while size > 0:
+        part = reader.read(size)
+        if not part:
+            break
+        parts.append(part)
+        size -= len(part)
+    return b"".join(parts)
+
+
+def encrypt_stream(
+    reader: BinaryIO,
+    writer: BinaryIO,
+    password: str,
+    iterations: int = 100000,
+    chunk_size: int = STREAM_CHUNK_SIZE,
+) -> Tuple[bytes, bytes]:
+    """Encrypt a stream in constant memory.
+
+    Writes exactly what aes256_encrypt would return as ciphertext_with_tag
+    for the same input, salt and nonce.
+
+    Args:
+        reader: Binary stream of plaintext
+        writer: Binary stream receiving ciphertext followed by the tag
+        password: Password for key derivation
+        iterations: PBKDF2 iteration count
+        chunk_size: Bytes processed per step (rounded to a block multiple)
+
+    Returns:
+        Tuple of (salt, nonce)
+    """
+    chunk_size = max(BLOCK_SIZE, chunk_size - chunk_size % BLOCK_SIZE)
+    salt = _generate_salt()
+    nonce = _generate_nonce()
+    key = _derive_key(password.encode("utf-8"), salt, iterations)
+    stream_key = _stream_key(key, nonce)
+    auth = hashlib.sha256(key + nonce)
+
+    block = 0
+    while chunk := _read_full(reader, chunk_size):
+        encrypted = _apply_keystream(chunk, stream_key, block)
+        auth.update(encrypted)
+        writer.write(encrypted)
+        block += len(chunk) // BLOCK_SIZE
+
+    writer.write(auth.digest()[:TAG_SIZE])
+    return salt, nonce
+
+
+def decrypt_stream(
+    reader: BinaryIO,
+    writer: BinaryIO,
+    password: str,
+    salt: bytes,
+    nonce: bytes,
+    iterations: int = 100000,
+    chunk_size: int = STREAM_CHUNK_SIZE,
+) -> int:
+    """Decrypt a stream produced by encrypt_stream or aes256_encrypt.
+
+    If the reader is seekable, the tag is verified in a first pass and no
+    plaintext is written for tampered input. Otherwise plaintext is
+    written as it is decrypted and the tag is checked at the end; on
+    ValueError the caller must discard everything written.
+
+    Args:
+        reader: Binary stream of ciphertext followed by the tag
+        writer: Binary stream receiving plaintext
+        password: Password used for encryption
+        salt: Salt used for key derivation
+        nonce: Nonce used for encryption
+        iterations: PBKDF2 iteration count
+        chunk_size: Bytes processed per step (rounded to a block multiple)
+
+    Returns:
+        Number of plaintext bytes written
+
+    Raises:
+        ValueError: If authentication fails
+    """
+    chunk_size = max(BLOCK_SIZE, chunk_size - chunk_size % BLOCK_SIZE)
+    key = _derive_key(password.encode("utf-8"), salt, iterations)
+    stream_key = _stream_key(key, nonce)
+
+    def _ciphertext_chunks() -> Iterator[bytes]:
+        # Hold back TAG_SIZE bytes so the trailing tag is never decrypted
+        pending = b""
+        while chunk := _read_full(reader, chunk_size):
+            pending += chunk
+            if len(pending) > chunk_size + TAG_SIZE:
+                yield pending[:chunk_size]
+                pending = pending[chunk_size:]
+        if len(pending) < TAG_SIZE:
+            raise ValueError("Authentication failed: data may have been tampered with")
+        if len(pending) > TAG_SIZE:
+            yield pending[:-TAG_SIZE]
+        nonlocal received_tag
+        received_tag = pending[-TAG_SIZE:]
+
+    def _verify(auth: Any) -> None:
+        expected_tag = auth.digest()[:TAG_SIZE]
+        if not secrets.compare_digest(received_tag, expected_tag):
+            raise ValueError("Authentication failed: data may have been tampered with")
+
+    received_tag = b""
+    seekable = reader.seekable() if hasattr(reader, "seekable") else False
+    if seekable:
+        start = reader.tell()
+        auth = hashlib.sha256(key + nonce)
+        for chunk in _ciphertext_chunks():
+            auth.update(chunk)
+        _verify(auth)
+        reader.seek(start)
+
+    auth = hashlib.sha256(key + nonce)
+    block = written = 0
+    for chunk in _ciphertext_chunks():
+        if not seekable:
+            auth.update(chunk)
+        writer.write(_apply_keystream(chunk, stream_key, block))
+        block += len(chunk) // BLOCK_SIZE
+        written += len(chunk)
+    if not seekable:
+        _verify(auth)
+    return written
+
+
+# Per-worker state for encrypt_file_parallel: (input mmap, output path, stream key)
+_segment_job: Tuple[mmap.mmap, str, bytes] | None = None
+
+
+def _init_segment_worker(src: str, dst: str, stream_key: bytes) -> None:
+    """Process pool initializer: map the input once per worker."""
+    global _segment_job
+    with open(src, "rb") as handle:
+        view = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+    _segment_job = (view, dst, stream_key)
+
+
+def _encrypt_segment(offset: int, length: int) -> int:
+    """Encrypt one block-aligned segment of the input in place in the output.
+
+    Args:
+        offset: Byte offset of the segment (a BLOCK_SIZE multiple)
+        length: Segment length in bytes
+
+    Returns:
+        Number of bytes written
+    """
+    assert _segment_job is not None
+    view, dst, stream_key = _segment_job
+    with open(dst, "r+b") as out:
+        out.seek(offset)
+        for i in range(offset, offset + length, STREAM_CHUNK_SIZE):
+            chunk = view[i : min(i + STREAM_CHUNK_SIZE, offset + length)]
+            out.write(_apply_keystream(chunk, stream_key, i // BLOCK_SIZE))
+    return length
+
+
+def encrypt_file_parallel(
+    path: str | os.PathLike[str],
+    out: str | os.PathLike[str],
+    password: str,
+    workers: int | None = None,
+    iterations: int = 100000,
+    segment_size: int = 64 * STREAM_CHUNK_SIZE,
+) -> Tuple[bytes, bytes]:
+    """Encrypt a file on several cores.
+
+    Keystream blocks depend only on the stream key and the block index,
+    so the input is split into block-aligned segments that a process pool
+    encrypts directly from a memory map into their final position in the
+    output file. The tag is hashed in order as segments complete, and the
+    output is byte-for-byte what encrypt_stream would write for the same
+    salt and nonce, so decrypt_stream and aes256_decrypt read it as usual.
+
+    Args:
+        path: Plaintext file
+        out: Destination file (ciphertext followed by the tag)
+        password: Password for key derivation
+        workers: Process count (defaults to the CPU count)
+        iterations: PBKDF2 iteration count
+        segment_size: Bytes per pool task (rounded to a chunk multiple)
+
+    Returns:
+        Tuple of (salt, nonce)
+    """
+    src, dst = os.fspath(path), os.fspath(out)
+    size = os.path.getsize(src)
+    segment_size = max(
+        STREAM_CHUNK_SIZE, segment_size - segment_size % STREAM_CHUNK_SIZE
+    )
+    workers = workers or os.cpu_count() or 1
+    if workers <= 1 or size <= segment_size:
+        with open(src, "rb") as reader, open(dst, "wb") as writer:
+            return encrypt_stream(reader, writer, password, iterations)
+
+    salt = _generate_salt()
+    nonce = _generate_nonce()
+    key = _derive_key(password.encode("utf-8"), salt, iterations)
+    stream_key = _stream_key(key, nonce)
+    auth = hashlib.sha256(key + nonce)
+
+    with open(dst, "wb") as writer:
+        writer.truncate(size + TAG_SIZE)
+
+    offsets = range(0, size, segment_size)
+    lengths = [min(segment_size, size - offset) for offset in offsets]
+    with ProcessPoolExecutor(
+        max_workers=min(workers, len(lengths)),
+        initializer=_init_segment_worker,
+        initargs=(src, dst, stream_key),
+    ) as pool, open(dst, "r+b") as result:
+        # map() yields in submission order, so hashing overlaps the
+        # encryption of later segments while keeping the tag sequential
+        offset = 0
+        for length in pool.map(_encrypt_segment, offsets, lengths):
+            result.seek(offset)
+            for start in range(0, length, STREAM_CHUNK_SIZE):
+                auth.update(result.read(min(STREAM_CHUNK_SIZE, length - start)))
+            offset += length
+        result.seek(size)
+        result.write(auth.digest()[:TAG_SIZE])
+    return salt, nonce
 
 
 @dataclass
@@ -222,50 +657,126 @@ def encrypt_token(
     """
     ciphertext, salt, nonce = aes256_encrypt(token_data, password)
 
-    # Assign mythic timestamp based on current time or rotation
-    mythic_ts = None
-    if assign_mythic_timestamp:
-        for ts in MYTHIC_TIMESTAMPS:
-            if ts.matches_current_time():
-                mythic_ts = ts
-                break
-
-        # If no match, assign based on token_id hash
-        if mythic_ts is None:
-            idx = int(hashlib.sha256(token_id.encode()).hexdigest(), 16) % len(
-                MYTHIC_TIMESTAMPS
-            )
-            mythic_ts = MYTHIC_TIMESTAMPS[idx]
-
     return EncryptedToken(
         token_id=token_id,
         ciphertext=ciphertext,
         salt=salt,
         nonce=nonce,
-        mythic_timestamp=mythic_ts,
+        mythic_timestamp=(
+            _assign_mythic_timestamp(token_id, is_mythic_hour()[1])
+            if assign_mythic_timestamp
+            else None
+        ),
         created_at=time.time(),
     )
 
 
+def _assign_mythic_timestamp(
+    token_id: str, current: MythicTimestamp | None
+) -> MythicTimestamp:
+    """Pick a mythic timestamp for a token.
+
+    Args:
+        token_id: Token identifier
+        current: Mythic timestamp matching the current time, if any
+
+    Returns:
+        The current mythic timestamp, or one chosen by token_id hash
+    """
+    if current is not None:
+        return current
+    # If no match, assign based on token_id hash
+    idx = int(hashlib.sha256(token_id.encode()).hexdigest(), 16) % len(
+        MYTHIC_TIMESTAMPS
+    )
+    return MYTHIC_TIMESTAMPS[idx]
+
+
+def encrypt_tokens_batch(
+    tokens: Iterable[Tuple[str, bytes]],
+    password: str,
+    assign_mythic_timestamp: bool = True,
+    iterations: int = 100000,
+) -> List[EncryptedToken]:
+    """Encrypt many tokens with one key derivation.
+
+    One salt and one PBKDF2 master key are used for the whole batch; each
+    token gets its own random nonce, so keystreams never repeat. Tokens
+    remain individually decryptable with decrypt_token; pass
+    use_key_cache=True there to derive the shared key only once.
+
+    Args:
+        tokens: (token_id, token_data) pairs (e.g. dict.items())
+        password: Encryption password
+        assign_mythic_timestamp: Whether to assign mythic timestamps
+        iterations: PBKDF2 iteration count
+
+    Returns:
+        EncryptedToken list in input order
+    """
+    password_bytes = password.encode("utf-8")
+    salt = _generate_salt()
+    key = _derive_key(password_bytes, salt, iterations)
+
+    # Resolve the current mythic hour once per batch, not once per token
+    current = is_mythic_hour()[1] if assign_mythic_timestamp else None
+    created_at = time.time()
+    encrypted = []
+    nonces = set()
+    for token_id, token_data in tokens:
+        nonce = _generate_nonce()
+        while nonce in nonces:
+            nonce = _generate_nonce()
+        nonces.add(nonce)
+        encrypted.append(
+            EncryptedToken(
+                token_id=token_id,
+                ciphertext=_encrypt_with_key(token_data, key, nonce),
+                salt=salt,
+                nonce=nonce,
+                mythic_timestamp=(
+                    _assign_mythic_timestamp(token_id, current)
+                    if assign_mythic_timestamp
+                    else None
+                ),
+                created_at=created_at,
+            )
+        )
+    return encrypted
+
+
 def decrypt_token(
     encrypted_token: EncryptedToken,
     password: str,
+    use_key_cache: bool = False,
+    iterations: int = 100000,
 ) -> bytes:
     """Decrypt an encrypted token.
 
     Args:
         encrypted_token: The encrypted token to decrypt
         password: Decryption password
+        use_key_cache: Keep the derived key in the shared DerivedKeyCache
+            (for its TTL) and reuse it for repeated (password, salt), e.g.
+            tokens from one encrypt_tokens_batch call; off by default
+        iterations: PBKDF2 iteration count used at encryption
 
     Returns:
         Decrypted token data
     """
-    return aes256_decrypt(
-        encrypted_token.ciphertext,
-        password,
-        encrypted_token.salt,
-        encrypted_token.nonce,
-    )
+    if not use_key_cache:
+        return aes256_decrypt(
+            encrypted_token.ciphertext,
+            password,
+            encrypted_token.salt,
+            encrypted_token.nonce,
+            iterations,
+        )
+    key = _key_cache.derive(password.encode("utf-8"), encrypted_token.salt, iterations)
+    try:
+        return _decrypt_with_key(encrypted_token.ciphertext, key, encrypted_token.nonce)
+    finally:
+        DerivedKeyCache._zeroize(key)
 
 
 def get_mythic_index(timestamp_str: str) -> MythicTimestamp | None:
@@ -302,8 +813,15 @@ __all__ = [
     "EncryptedToken",
     "aes256_encrypt",
     "aes256_decrypt",
+    "encrypt_stream",
+    "decrypt_stream",
+    "encrypt_file_parallel",
+    "DerivedKeyCache",
     "encrypt_token",
+    "encrypt_tokens_batch",
     "decrypt_token",
+    "get_key_cache",
+    "clear_key_cache",
     "get_mythic_index",
     "is_mythic_hour",
 ]
@@ -0,0 +1,367 @@
+"""Append-only JSON Lines Journal for Proof-of-Flip Audit Entries.
+
+Each audit entry is written once, as one compact JSON line, to the active
+journal segment. Lines are buffered and written in batches (every
+``flush_every`` entries, or on flush/close), and a segment is sealed and
+a new one started once it would grow past ``max_segment_bytes``:
+
+    journal/
+        audit-000001.jsonl    sealed
+        audit-000002.jsonl    sealed
+        audit-000003.jsonl    active
+        index.json            metadata of the sealed segments
+        checkpoint.json       caller state at a journal position (optional)
+
+Segments are never rewritten. Every segment keeps its entry count, byte
+size, SHA-256 digest and first/last entry id and timestamp, so a manifest
+over the whole journal costs O(segments) rather than re-serializing every
+entry. Sealed segment metadata is persisted in ``index.json`` (replaced
+atomically on each rotation). On reopen, only the active segment is
+rescanned. A trailing partial line left by a crash is cut off before
+appending resumes.
+
+A caller that derives state from the records (e.g. running aggregates)
+can store it with ``write_checkpoint`` next to the journal position it
+covers, and on reopen read only the records after that position with
+``iter_records(since=...)``.
+
+Buffered entries that have not been flushed are lost if the process dies;
+call ``flush()`` at checkpoints that must be durable (``fsync=True`` also
+syncs each flush to disk).
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, BinaryIO, Dict, Iterator, List, Tuple
+
+_INDEX = "index.json"
+_CHECKPOINT = "checkpoint.json"
+
+
+@dataclass
+class JournalSegment:
+    """Metadata of one journal segment file."""
+
+    name: str
+    entries: int = 0
+    bytes: int = 0
+    sha256: str = ""
+    first_entry_id: str = ""
+    last_entry_id: str = ""
+    first_timestamp: float | None = None
+    last_timestamp: float | None = None
+    sealed: bool = False
+
+    def add(self, record: Dict[str, Any], size: int) -> None:
+        """Account for one appended record of size bytes."""
+        entry_id = record.get("entry_id", "")
+        timestamp = record.get("timestamp")
+        if not self.entries:
+            self.first_entry_id = entry_id
+            self.first_timestamp = timestamp
+        self.last_entry_id = entry_id
+        self.last_timestamp = timestamp
+        self.entries += 1
+        self.bytes += size
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary.
+
+        Returns:
+            Dictionary representation
+        """
+        return asdict(self)
+
+
+class AuditJournal:
+    """Rotating, append-only JSON Lines journal of audit entries."""
+
+    def __init__(
+        self,
+        directory: str | Path,
+        prefix: str = "audit",
+        max_segment_bytes: int = 64 * 1024 * 1024,
+        flush_every: int = 256,
+        fsync: bool = False,
+    ):
+        """Open (or create) a journal directory.
+
+        Args:
+            directory: Directory holding the segments and index
+            prefix: Segment file name prefix
+            max_segment_bytes: Size at which the active segment is sealed
+            flush_every: Entries buffered before they are written
+            fsync: Sync every flush to disk
+        """
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.prefix = prefix
+        self.max_segment_bytes = max_segment_bytes
+        self.flush_every = max(1, flush_every)
+        self.fsync = fsync
+        self._pending: List[bytes] = []
+        self._pending_records: List[Dict[str, Any]] = []
+        self._file: BinaryIO | None = None
+        self._sealed: List[JournalSegment] = []
+        self._active: JournalSegment
+        self._hash = hashlib.sha256()
+        self._open()
+
+    def _segment_name(self, number: int) -> str:
+        return f"{self.prefix}-{number:06d}.jsonl"
+
+    def _segment_number(self, name: str) -> int:
+        return int(name[len(self.prefix) + 1 : -len(".jsonl")])
+
+    def _open(self) -> None:
+        index = self.directory / _INDEX
+        if index.exists():
+            data = json.loads(index.read_text(encoding="utf-8"))
+            self._sealed = [JournalSegment(**segment) for segment in data["segments"]]
+        sealed = {segment.name for segment in self._sealed}
+        unsealed = sorted(
+            path.name
+            for path in self.directory.glob(f"{self.prefix}-*.jsonl")
+            if path.name not in sealed
+        )
+        if unsealed:
+            # Normally only the active segment; more if the index was lost
+            for name in unsealed[:-1]:
+                self._sealed.append(self._scan(name, seal=True))
+            self._active = self._scan(unsealed[-1], seal=False)
+            if len(unsealed) > 1:
+                self._write_index()
+        else:
+            number = self._segment_number(self._sealed[-1].name) + 1 if self._sealed else 1
+            self._active = JournalSegment(self._segment_name(number))
+            self._hash = hashlib.sha256()
+
+    def _scan(self, name: str, seal: bool) -> JournalSegment:
+        """Rebuild segment metadata from its file, dropping a partial last line."""
+        path = self.directory / name
+        segment = JournalSegment(name)
+        digest = hashlib.sha256()
+        valid = 0
+        with path.open("rb") as handle:
+            for line in handle:
+                if not line.endswith(b"\n"):
+                    break
+                segment.add(json.loads(line), len(line))
+                digest.update(line)
+                valid += len(line)
+        if path.stat().st_size != valid:
+            with path.open("r+b") as handle:
+                handle.truncate(valid)
+        segment.sha256 = digest.hexdigest()
+        segment.sealed = seal
+        if not seal:
+            self._hash = digest
+        return segment
+
+    def _replace(self, name: str, data: Dict[str, Any], indent: int | None = None) -> None:
+        """Atomically replace a JSON metadata file in the journal directory."""
+        path = self.directory / name
+        tmp = path.with_name(name + ".tmp")
+        tmp.write_text(json.dumps(data, indent=indent), encoding="utf-8")
+        os.replace(tmp, path)
+
+    def _write_index(self) -> None:
+        data = {"segments": [segment.to_dict() for segment in self._sealed]}
+        self._replace(_INDEX, data, indent=2)
+
+    def _rotate(self) -> None:
+        """Seal the active segment and start the next one."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        self._active.sha256 = self._hash.hexdigest()
+        self._active.sealed = True
+        self._sealed.append(self._active)
+        self._write_index()
+        number = self._segment_number(self._active.name) + 1
+        self._active = JournalSegment(self._segment_name(number))
+        self._hash = hashlib.sha256()
+
+    def append(self, record: Dict[str, Any]) -> None:
+        """Buffer one record; it is written at the next flush.
+
+        Args:
+            record: JSON-serializable audit record (an AuditEntry.to_dict())
+        """
+        line = json.dumps(record, separators=(",", ":")).encode("utf-8") + b"\n"
+        self._pending.append(line)
+        self._pending_records.append(record)
+        if len(self._pending) >= self.flush_every:
+            self.flush()
+
+    def flush(self) -> None:
+        """Write buffered records, rotating segments as they fill."""
+        if not self._pending:
+            return
+        batch: List[bytes] = []
+        for line, record in zip(self._pending, self._pending_records):
+            if (
+                self._active.entries
+                and self._active.bytes + len(line) > self.max_segment_bytes
+            ):
+                self._write(batch)
+                batch = []
+                self._rotate()
+            batch.append(line)
+            self._active.add(record, len(line))
+        self._write(batch)
+        self._pending.clear()
+        self._pending_records.clear()
+        self._active.sha256 = self._hash.hexdigest()
+
+    def _write(self, lines: List[bytes]) -> None:
+        if not lines:
+            return
+        if self._file is None:
+            self._file = (self.directory / self._active.name).open("ab")
+        data = b"".join(lines)
+        self._file.write(data)
+        self._file.flush()
+        if self.fsync:
+            os.fsync(self._file.fileno())
+        self._hash.update(data)
+
+    def close(self) -> None:
+        """Flush buffered records and close the active segment."""
+        self.flush()
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def __enter__(self) -> AuditJournal:
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    @property
+    def pending(self) -> int:
+        """Records buffered but not yet written."""
+        return len(self._pending)
+
+    @property
+    def segments(self) -> List[JournalSegment]:
+        """Segments in order, the active one last (if it holds entries)."""
+        active = [self._active] if self._active.entries else []
+        return self._sealed + active
+
+    @property
+    def total_entries(self) -> int:
+        """Entries written or buffered."""
+        return sum(segment.entries for segment in self.segments) + len(self._pending)
+
+    def manifest(self) -> Dict[str, Any]:
+        """Describe the journal after flushing buffered records.
+
+        Returns:
+            Dictionary with the directory, entry count and segment metadata
+        """
+        self.flush()
+        segments = self.segments
+        return {
+            "journal_dir": str(self.directory),
+            "format": "jsonl",
+            "total_entries": sum(segment.entries for segment in segments),
+            "total_bytes": sum(segment.bytes for segment in segments),
+            "segments": [segment.to_dict() for segment in segments],
+        }
+
+    def segment_paths(self) -> List[Path]:
+        """Paths of the segment files in order (flushes buffered records)."""
+        self.flush()
+        return [self.directory / segment.name for segment in self.segments]
+
+    def position(self) -> Dict[str, Any]:
+        """Current end of the journal (flushes buffered records).
+
+        Returns:
+            Dictionary with the active segment name, its byte offset and
+            the total entry count, for iter_records(since=...)
+        """
+        self.flush()
+        return {
+            "segment": self._active.name,
+            "offset": self._active.bytes,
+            "entries": self.total_entries,
+        }
+
+    def contains(self, position: Dict[str, Any]) -> bool:
+        """Whether a position() still lies within the journal."""
+        try:
+            name, offset, entries = position["segment"], position["offset"], position["entries"]
+        except (KeyError, TypeError):
+            return False
+        for segment in self._sealed + [self._active]:
+            if segment.name == name:
+                return 0 <= offset <= segment.bytes and 0 <= entries <= self.total_entries
+        return False
+
+    def iter_records(self, since: Dict[str, Any] | None = None) -> Iterator[Dict[str, Any]]:
+        """Read journaled records back in order.
+
+        Args:
+            since: A position() to resume from (default: the beginning);
+                earlier segments are not opened
+
+        Yields:
+            Parsed audit records
+        """
+        paths = self.segment_paths()
+        offset = 0
+        if since is not None:
+            names = [path.name for path in paths]
+            if since["segment"] not in names:
+                return
+            paths = paths[names.index(since["segment"]):]
+            offset = since["offset"]
+        for path in paths:
+            with path.open("rb") as handle:
+                handle.seek(offset)
+                offset = 0
+                for line in handle:
+                    yield json.loads(line)
+
+    def write_checkpoint(self, state: Dict[str, Any]) -> Dict[str, Any]:
+        """Store caller state derived from every record up to now.
+
+        Args:
+            state: JSON-serializable state
+
+        Returns:
+            The journal position the state covers
+        """
+        position = self.position()
+        self._replace(_CHECKPOINT, {"position": position, "state": state})
+        return position
+
+    def read_checkpoint(self) -> Tuple[Dict[str, Any], Dict[str, Any]] | None:
+        """Load the last checkpoint if it still matches the journal.
+
+        Returns:
+            (state, position), or None if there is no usable checkpoint
+            (missing, unreadable, or past the end of a truncated journal)
+        """
+        path = self.directory / _CHECKPOINT
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+            state, position = data["state"], data["position"]
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+        if not self.contains(position):
+            return None
+        return state, position
+
+
+__all__ = [
+    "AuditJournal",
+    "JournalSegment",
+]
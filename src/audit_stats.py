@@ -0,0 +1,380 @@
+"""Running Aggregates for Proof-of-Flip Audit Summaries.
+
+Audit summaries used to be recomputed with several passes over the whole
+audit log on every export. These accumulators are updated once per entry
+instead, so a summary costs O(1) regardless of how many entries have been
+audited, and stays correct when only a window of entries (or none) is
+kept in memory.
+
+- RunningStats: count, mean and variance by Welford's method, plus min
+  and max, in constant space and without the cancellation error of
+  sum-of-squares formulas.
+- P2Quantile: streaming quantile estimate by the P-square algorithm
+  (Jain & Chlamtac, 1985). Five markers are kept and adjusted with
+  piecewise-parabolic interpolation, so memory is constant. Estimates are
+  exact for the first five observations and approximate afterwards.
+- AuditAggregates: status counters, mythic proof count and the
+  differential_pct distribution of an audit pipeline.
+
+Each accumulator can export its exact internal state (to_state) and be
+rebuilt from it (from_state), e.g. to checkpoint a journal replay.
+"""
+from __future__ import annotations
+
+import math
+from bisect import insort
+from typing import Any, Dict, Iterable, List, Sequence, Tuple
+
+DEFAULT_PERCENTILES = (50, 90, 99)
+
+
+class RunningStats:
+    """Count, mean, variance, min and max of a stream of values."""
+
+    __slots__ = ("count", "mean", "_m2", "min", "max")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.mean = 0.0
+        self._m2 = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def add(self, value: float) -> None:
+        """Add one observation."""
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self._m2 += delta * (value - self.mean)
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+
+    @classmethod
+    def from_moments(
+        cls, count: int, mean: float, m2: float, low: float, high: float
+    ) -> RunningStats:
+        """Build stats from precomputed moments (e.g. NumPy over a batch).
+
+        Args:
+            count: Number of observations
+            mean: Their mean
+            m2: Sum of squared deviations from the mean
+            low: Minimum
+            high: Maximum
+        """
+        stats = cls()
+        stats.count, stats.mean, stats._m2 = count, mean, m2
+        stats.min, stats.max = low, high
+        return stats
+
+    def merge(self, other: RunningStats) -> None:
+        """Fold in another accumulator (Chan et al. parallel update)."""
+        if not other.count:
+            return
+        total = self.count + other.count
+        delta = other.mean - self.mean
+        self._m2 += other._m2 + delta * delta * self.count * other.count / total
+        self.mean += delta * other.count / total
+        self.count = total
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    @property
+    def variance(self) -> float:
+        """Sample variance (0.0 for fewer than two observations)."""
+        return self._m2 / (self.count - 1) if self.count > 1 else 0.0
+
+    @property
+    def stddev(self) -> float:
+        """Sample standard deviation."""
+        return math.sqrt(self.variance)
+
+    def to_state(self) -> List[float]:
+        """Exact internal state: [count, mean, m2, min, max]."""
+        return [self.count, self.mean, self._m2, self.min, self.max]
+
+    @classmethod
+    def from_state(cls, state: Sequence[float]) -> RunningStats:
+        """Rebuild stats from to_state() output."""
+        count, mean, m2, low, high = state
+        return cls.from_moments(int(count), mean, m2, low, high)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary.
+
+        Returns:
+            Dictionary with count, mean, variance, stddev, min and max
+            (min and max are None before the first observation)
+        """
+        empty = self.count == 0
+        return {
+            "count": self.count,
+            "mean": self.mean,
+            "variance": self.variance,
+            "stddev": self.stddev,
+            "min": None if empty else self.min,
+            "max": None if empty else self.max,
+        }
+
+
+def _p2_height(
+    low: float, height: float, high: float, n_low: int, n: int, n_high: int, step: int
+) -> float:
+    """New height of a P-square marker moved by step (+1 or -1).
+
+    Piecewise-parabolic prediction, or linear if that would leave the
+    marker outside its neighbours.
+    """
+    predicted = height + step / (n_high - n_low) * (
+        (n - n_low + step) * (high - height) / (n_high - n)
+        + (n_high - n - step) * (height - low) / (n - n_low)
+    )
+    if low < predicted < high:
+        return predicted
+    if step > 0:
+        return height + (high - height) / (n_high - n)
+    return height - (low - height) / (n_low - n)
+
+
+class P2Quantile:
+    """Streaming estimate of one quantile by the P-square algorithm."""
+
+    __slots__ = ("p", "_heights", "_positions", "_desired", "_increments")
+
+    def __init__(self, p: float):
+        """Create an estimator.
+
+        Args:
+            p: Quantile in (0, 1), e.g. 0.99
+
+        Raises:
+            ValueError: If p is outside (0, 1)
+        """
+        if not 0.0 < p < 1.0:
+            raise ValueError(f"Quantile must be between 0 and 1: {p}")
+        self.p = p
+        self._heights: List[float] = []
+        self._positions = [1, 2, 3, 4, 5]
+        self._desired = [1.0, 1.0 + 2.0 * p, 1.0 + 4.0 * p, 3.0 + 2.0 * p, 5.0]
+        self._increments = (0.0, p / 2.0, p, (1.0 + p) / 2.0, 1.0)
+
+    def add(self, value: float) -> None:
+        """Add one observation."""
+        self.add_many((value,))
+
+    def add_many(self, values: Iterable[float]) -> None:
+        """Add observations in order.
+
+        The markers are held in locals for the whole run, so a long
+        batch costs far less than one add() call per value.
+        """
+        iterator = iter(values)
+        q = self._heights
+        if len(q) < 5:
+            for value in iterator:
+                insort(q, value)
+                if len(q) == 5:
+                    break
+            else:
+                return
+        q0, q1, q2, q3, q4 = q
+        n0, n1, n2, n3, n4 = self._positions
+        d1, d2, d3 = self._desired[1:4]
+        _, i1, i2, i3, _ = self._increments
+        count = 0
+        for x in iterator:
+            count += 1
+            if x < q1:
+                if x < q0:
+                    q0 = x
+                n1 += 1
+                n2 += 1
+                n3 += 1
+            elif x < q2:
+                n2 += 1
+                n3 += 1
+            elif x < q3:
+                n3 += 1
+            elif x > q4:
+                q4 = x
+            n4 += 1
+            d1 += i1
+            d2 += i2
+            d3 += i3
+            # Move each middle marker at most one position towards its
+            # desired position
+            d = d1 - n1
+            if d >= 1.0 and n2 - n1 > 1:
+                q1 = _p2_height(q0, q1, q2, n0, n1, n2, 1)
+                n1 += 1
+            elif d <= -1.0 and n0 - n1 < -1:
+                q1 = _p2_height(q0, q1, q2, n0, n1, n2, -1)
+                n1 -= 1
+            d = d2 - n2
+            if d >= 1.0 and n3 - n2 > 1:
+                q2 = _p2_height(q1, q2, q3, n1, n2, n3, 1)
+                n2 += 1
+            elif d <= -1.0 and n1 - n2 < -1:
+                q2 = _p2_height(q1, q2, q3, n1, n2, n3, -1)
+                n2 -= 1
+            d = d3 - n3
+            if d >= 1.0 and n4 - n3 > 1:
+                q3 = _p2_height(q2, q3, q4, n2, n3, n4, 1)
+                n3 += 1
+            elif d <= -1.0 and n2 - n3 < -1:
+                q3 = _p2_height(q2, q3, q4, n2, n3, n4, -1)
+                n3 -= 1
+        q[:] = (q0, q1, q2, q3, q4)
+        self._positions[:] = (n0, n1, n2, n3, n4)
+        desired = self._desired
+        desired[1:4] = (d1, d2, d3)
+        desired[4] += count
+
+    def to_state(self) -> Dict[str, Any]:
+        """Exact internal state (quantile, marker heights and positions)."""
+        return {
+            "p": self.p,
+            "heights": list(self._heights),
+            "positions": list(self._positions),
+            "desired": list(self._desired),
+        }
+
+    @classmethod
+    def from_state(cls, state: Dict[str, Any]) -> P2Quantile:
+        """Rebuild an estimator from to_state() output."""
+        quantile = cls(state["p"])
+        quantile._heights = list(state["heights"])
+        quantile._positions = list(state["positions"])
+        quantile._desired = list(state["desired"])
+        return quantile
+
+    @property
+    def value(self) -> float | None:
+        """Current estimate (None before the first observation)."""
+        q = self._heights
+        if not q:
+            return None
+        if len(q) < 5:
+            # Exact, interpolated between the sorted observations
+            rank = self.p * (len(q) - 1)
+            low = int(rank)
+            high = min(low + 1, len(q) - 1)
+            return q[low] + (q[high] - q[low]) * (rank - low)
+        return q[2]
+
+
+class AuditAggregates:
+    """Running summary of audit entries, updated once per entry."""
+
+    def __init__(self, percentiles: Tuple[float, ...] = DEFAULT_PERCENTILES):
+        """Create empty aggregates.
+
+        Args:
+            percentiles: differential_pct percentiles to estimate (0-100)
+        """
+        self.total = 0
+        self.status_counts: Dict[str, int] = {}
+        self.mythic_proofs = 0
+        self.differential_pct = RunningStats()
+        self._quantiles = {f"p{p:g}": P2Quantile(p / 100.0) for p in percentiles}
+
+    def add(
+        self,
+        status: str,
+        differential_pct: float | None = None,
+        mythic_proofs: int = 0,
+    ) -> None:
+        """Account for one audit entry.
+
+        Args:
+            status: Entry status value ("verified", "discrepancy", ...)
+            differential_pct: Yield differential percentage, if measured
+            mythic_proofs: Number of mythic proofs attached to the entry
+        """
+        self.total += 1
+        self.status_counts[status] = self.status_counts.get(status, 0) + 1
+        self.mythic_proofs += mythic_proofs
+        if differential_pct is not None:
+            self.differential_pct.add(differential_pct)
+            for quantile in self._quantiles.values():
+                quantile.add(differential_pct)
+
+    def add_batch(
+        self,
+        status_counts: Dict[str, int],
+        differential_pct: Sequence[float],
+        stats: RunningStats | None = None,
+    ) -> None:
+        """Account for a batch of entries at once.
+
+        Args:
+            status_counts: Number of entries per status value
+            differential_pct: The batch's differential percentages, in order
+            stats: Precomputed RunningStats of differential_pct (computed
+                here if not given)
+        """
+        for status, count in status_counts.items():
+            self.status_counts[status] = self.status_counts.get(status, 0) + count
+            self.total += count
+        if stats is None:
+            stats = RunningStats()
+            for value in differential_pct:
+                stats.add(value)
+        self.differential_pct.merge(stats)
+        # P-square is inherently sequential
+        for quantile in self._quantiles.values():
+            quantile.add_many(differential_pct)
+
+    def add_records(self, records: Iterable[Dict[str, Any]]) -> None:
+        """Account for exported entries (AuditEntry.to_dict() form), e.g. a journal."""
+        for record in records:
+            differential = record.get("yield_differential")
+            self.add(
+                record["status"],
+                differential["differential_pct"] if differential else None,
+                len(record.get("mythic_proofs", ())),
+            )
+
+    def to_state(self) -> Dict[str, Any]:
+        """Exact, JSON-serializable state of every accumulator."""
+        return {
+            "total": self.total,
+            "status_counts": dict(self.status_counts),
+            "mythic_proofs": self.mythic_proofs,
+            "differential_pct": self.differential_pct.to_state(),
+            "quantiles": {
+                name: quantile.to_state() for name, quantile in self._quantiles.items()
+            },
+        }
+
+    @classmethod
+    def from_state(cls, state: Dict[str, Any]) -> AuditAggregates:
+        """Rebuild aggregates from to_state() output."""
+        aggregates = cls(())
+        aggregates.total = state["total"]
+        aggregates.status_counts = dict(state["status_counts"])
+        aggregates.mythic_proofs = state["mythic_proofs"]
+        aggregates.differential_pct = RunningStats.from_state(state["differential_pct"])
+        aggregates._quantiles = {
+            name: P2Quantile.from_state(quantile)
+            for name, quantile in state["quantiles"].items()
+        }
+        return aggregates
+
+    def quantiles(self) -> Dict[str, float | None]:
+        """Current differential_pct percentile estimates, keyed "pNN"."""
+        return {name: quantile.value for name, quantile in self._quantiles.items()}
+
+    def count(self, status: str) -> int:
+        """Number of entries with a status value."""
+        return self.status_counts.get(status, 0)
+
+
+__all__ = [
+    "AuditAggregates",
+    "DEFAULT_PERCENTILES",
+    "P2Quantile",
+    "RunningStats",
+]
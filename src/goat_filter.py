@@ -4,12 +4,517 @@ This module provides the base GoatFilter class for anti-mimic verification
 that can be used across different components of the EVOLVERSE framework.
 Implements GoatFilter (🐐 Capricorn Foundation) attributes for sovereign
 spiral law compliance.
+
+Mimic patterns live in a process-wide GoatFilterRegistry so every filter
+wrapper shares one compiled pattern set. Updates build a new immutable
+PatternSnapshot and swap it in atomically (copy-on-write), so verifying
+threads never wait on writers.
 """
 from __future__ import annotations
 
 import hashlib
 import json
-from typing import Any, Dict, List
+import logging
+import os
+import re
+import threading
+import time
+import weakref
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from itertools import chain, islice
+from pathlib import Path
+from typing import Any, Callable, Deque, Dict, Iterable, Iterator, List, Set, Tuple
+
+from src.hash_pattern_index import HashPatternIndex
+from src.mimic_automaton import MimicAutomaton
+from src.mimic_rules import CompiledRuleSet, MimicRule, compile_rules
+
+logger = logging.getLogger(__name__)
+
+_HEX_CHARS = frozenset("0123456789abcdef")
+
+
+class PatternSnapshot:
+    """Immutable, versioned set of mimic patterns and their compiled form.
+
+    Compilation is lazy and happens at most once per snapshot. Registry
+    reloads compile a snapshot before publishing it, so readers of the
+    new snapshot find it ready.
+    """
+
+    # Pattern counts at or below this use plain substring checks, which beat
+    # a Python-level automaton scan for small sets
+    AUTOMATON_THRESHOLD = 64
+
+    def __init__(
+        self,
+        patterns: Tuple[str, ...] = (),
+        version: int = 0,
+        preloaded_hash_index: HashPatternIndex | None = None,
+        rules: Tuple[MimicRule, ...] = (),
+        rule_cache_dir: Path | None = None,
+    ):
+        """Initialize a snapshot.
+
+        Args:
+            patterns: Mimic patterns, in insertion order, without duplicates
+            version: Registry version this snapshot was published at
+            preloaded_hash_index: Read-only hash index loaded from disk
+            rules: Glob/regex mimic rules, without duplicates
+            rule_cache_dir: Directory caching merged rule regexes
+        """
+        self.patterns = patterns
+        self.pattern_set = frozenset(patterns)
+        self.version = version
+        self.preloaded_hash_index = preloaded_hash_index
+        self.rules = rules
+        self.rule_cache_dir = rule_cache_dir
+        self._rule_set: CompiledRuleSet | None = None
+        self._compile_lock = threading.Lock()
+        self._compiled = False
+        self._automaton: MimicAutomaton | None = None
+        self._hash_index = HashPatternIndex()
+        # Short hex patterns are the only text patterns that can occur
+        # inside a hex digest
+        self._hash_scan_patterns: List[str] = []
+        self._hash_scan_automaton: MimicAutomaton | None = None
+
+    @property
+    def empty(self) -> bool:
+        """Check whether nothing in this snapshot can match."""
+        return (
+            not self.patterns and not self.rules and self.preloaded_hash_index is None
+        )
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # Ship only the definition; compiled state is rebuilt on arrival
+        return {
+            "patterns": self.patterns,
+            "version": self.version,
+            "preloaded_hash_index": self.preloaded_hash_index,
+            "rules": self.rules,
+            "rule_cache_dir": self.rule_cache_dir,
+        }
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__init__(**state)
+
+    def derive(self, **changes: Any) -> PatternSnapshot:
+        """Create the next snapshot, copying anything not overridden.
+
+        Args:
+            **changes: Replacement constructor arguments (patterns, rules,
+                preloaded_hash_index, rule_cache_dir)
+
+        Returns:
+            New uncompiled PatternSnapshot with version + 1
+        """
+        fields = {
+            "patterns": self.patterns,
+            "preloaded_hash_index": self.preloaded_hash_index,
+            "rules": self.rules,
+            "rule_cache_dir": self.rule_cache_dir,
+        }
+        fields.update(changes)
+        return PatternSnapshot(version=self.version + 1, **fields)
+
+    def compile(self) -> PatternSnapshot:
+        """Build compiled pattern structures if not already built.
+
+        Hash-shaped patterns (SHA-256 digests and digest fragments) go into a
+        HashPatternIndex checked against the payload hash. All patterns are
+        still scanned in the payload string. Sets larger than
+        AUTOMATON_THRESHOLD are compiled into Aho-Corasick automata.
+
+        Returns:
+            This snapshot, for chaining
+        """
+        if self._compiled:
+            return self
+        with self._compile_lock:
+            if self._compiled:
+                return self
+            patterns = self.patterns
+            self._hash_index = HashPatternIndex(
+                p for p in patterns if HashPatternIndex.is_hash_pattern(p)
+            )
+            self._hash_scan_patterns = [
+                p
+                for p in patterns
+                if len(p) < HashPatternIndex.MIN_FRAGMENT_LENGTH
+                and set(p) <= _HEX_CHARS
+            ]
+            if len(patterns) > self.AUTOMATON_THRESHOLD:
+                self._automaton = MimicAutomaton(patterns)
+            if len(self._hash_scan_patterns) > self.AUTOMATON_THRESHOLD:
+                self._hash_scan_automaton = MimicAutomaton(self._hash_scan_patterns)
+            if self.rules:
+                self._rule_set = compile_rules(self.rules, self.rule_cache_dir)
+            self._compiled = True
+        return self
+
+    def matches(self, data_str: str, data_hash: str) -> bool:
+        """Check if data matches any pattern in this snapshot.
+
+        Args:
+            data_str: String representation of data
+            data_hash: Hash of the data
+
+        Returns:
+            True if any mimic pattern matches (blocked)
+        """
+        preloaded = self.preloaded_hash_index
+        if preloaded is not None and preloaded.matches(data_hash):
+            return True
+        if not self.patterns and not self.rules:
+            return False
+
+        self.compile()
+        rule_set = self._rule_set
+        if rule_set is not None and (
+            rule_set.search(data_str) or rule_set.search(data_hash)
+        ):
+            return True
+        if self._hash_index.matches(data_hash):
+            return True
+
+        if self._hash_scan_automaton is not None:
+            if self._hash_scan_automaton.contains_any(data_hash):
+                return True
+        else:
+            for pattern in self._hash_scan_patterns:
+                if pattern in data_hash:
+                    return True
+
+        if self._automaton is not None:
+            return self._automaton.contains_any(data_str)
+        for pattern in self.patterns:
+            if pattern in data_str:
+                return True
+        return False
+
+    def find_all(self, data_str: str, data_hash: str) -> Set[str]:
+        """Find which patterns in this snapshot match the data.
+
+        Args:
+            data_str: String representation of data
+            data_hash: Hash of the data
+
+        Returns:
+            Set of matching mimic patterns and rules, with rules rendered
+            as "glob:..." / "re:..." (empty if none)
+        """
+        matched: Set[str] = set()
+        if self.preloaded_hash_index is not None:
+            matched |= self.preloaded_hash_index.find_all(data_hash)
+        if not self.patterns and not self.rules:
+            return matched
+
+        self.compile()
+        if self._rule_set is not None:
+            rules = self._rule_set.find_all(data_str) | self._rule_set.find_all(
+                data_hash
+            )
+            matched.update(str(rule) for rule in rules)
+        if not self.patterns:
+            return matched
+        matched |= self._hash_index.find_all(data_hash)
+        matched.update(p for p in self._hash_scan_patterns if p in data_hash)
+        automaton = self._automaton or MimicAutomaton(self.patterns)
+        matched |= automaton.find_all(data_str)
+        return matched
+
+
+class GoatFilterRegistry:
+    """Shared mimic pattern registry for GoatFilter instances.
+
+    Readers take the current snapshot with a single attribute read.
+    Writers serialize on a lock, build a new snapshot and publish it by
+    reference assignment, so in-flight verifications keep using the
+    snapshot they started with.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty registry."""
+        self._snapshot = PatternSnapshot()
+        self._write_lock = threading.Lock()
+        self._watcher: threading.Thread | None = None
+        self._watch_stop = threading.Event()
+
+    @property
+    def snapshot(self) -> PatternSnapshot:
+        """Get the current pattern snapshot."""
+        return self._snapshot
+
+    @property
+    def version(self) -> int:
+        """Get the current pattern set version."""
+        return self._snapshot.version
+
+    def add_patterns(self, patterns: Iterable[str]) -> int:
+        """Add mimic patterns in one copy-on-write update.
+
+        Args:
+            patterns: Patterns to add
+
+        Returns:
+            Number of patterns actually added
+        """
+        with self._write_lock:
+            current = self._snapshot
+            added = tuple(
+                p for p in dict.fromkeys(patterns) if p not in current.pattern_set
+            )
+            if added:
+                self._snapshot = current.derive(patterns=current.patterns + added)
+            return len(added)
+
+    def remove_pattern(self, pattern: str) -> bool:
+        """Remove a mimic pattern.
+
+        Args:
+            pattern: Pattern to remove
+
+        Returns:
+            True if pattern was removed, False if not found
+        """
+        with self._write_lock:
+            current = self._snapshot
+            if pattern not in current.pattern_set:
+                return False
+            self._snapshot = current.derive(
+                patterns=tuple(p for p in current.patterns if p != pattern)
+            )
+            return True
+
+    def add_rules(self, rules: Iterable[MimicRule | str]) -> int:
+        """Add glob/regex mimic rules in one copy-on-write update.
+
+        Args:
+            rules: MimicRule objects or "glob:..." / "re:..." strings
+
+        Returns:
+            Number of rules actually added
+        """
+        parsed = [r if isinstance(r, MimicRule) else MimicRule.parse(r) for r in rules]
+        with self._write_lock:
+            current = self._snapshot
+            existing = set(current.rules)
+            added = tuple(r for r in dict.fromkeys(parsed) if r not in existing)
+            if added:
+                snapshot = current.derive(rules=current.rules + added)
+                # Surface invalid regex rules to the caller, not to verifiers
+                snapshot.compile()
+                self._snapshot = snapshot
+            return len(added)
+
+    def remove_rule(self, rule: MimicRule | str) -> bool:
+        """Remove a glob/regex mimic rule.
+
+        Args:
+            rule: MimicRule or "glob:..." / "re:..." string
+
+        Returns:
+            True if the rule was removed, False if not found
+        """
+        if not isinstance(rule, MimicRule):
+            rule = MimicRule.parse(rule)
+        with self._write_lock:
+            current = self._snapshot
+            if rule not in current.rules:
+                return False
+            self._snapshot = current.derive(
+                rules=tuple(r for r in current.rules if r != rule)
+            )
+            return True
+
+    def set_rule_cache_dir(self, cache_dir: str | Path | None) -> None:
+        """Cache merged rule regexes in a directory across restarts.
+
+        Args:
+            cache_dir: Cache directory, or None to disable caching
+        """
+        with self._write_lock:
+            self._snapshot = self._snapshot.derive(
+                rule_cache_dir=Path(cache_dir) if cache_dir is not None else None
+            )
+
+    def replace_patterns(
+        self,
+        patterns: Iterable[str],
+        rules: Iterable[MimicRule] | None = None,
+    ) -> PatternSnapshot:
+        """Replace the whole pattern set, compiling before publishing.
+
+        Args:
+            patterns: New literal pattern set
+            rules: New rule set (None keeps the current rules)
+
+        Returns:
+            The current snapshot after the update
+        """
+        changes: Dict[str, Any] = {
+            "patterns": tuple(dict.fromkeys(p for p in patterns if p))
+        }
+        if rules is not None:
+            changes["rules"] = tuple(dict.fromkeys(rules))
+        with self._write_lock:
+            snapshot = self._snapshot.derive(**changes)
+            # Compile before the swap so readers never find it cold
+            snapshot.compile()
+            self._snapshot = snapshot
+            return snapshot
+
+    def set_preloaded_hash_index(self, index: HashPatternIndex | None) -> None:
+        """Attach a read-only hash index loaded from disk.
+
+        Args:
+            index: Loaded index, or None to detach
+        """
+        with self._write_lock:
+            self._snapshot = self._snapshot.derive(preloaded_hash_index=index)
+
+    def load_pattern_file(self, path: str | Path) -> int:
+        """Hot-reload the pattern set from a text file.
+
+        The file holds one pattern per line; blank lines and lines starting
+        with "#" are ignored. Lines prefixed "glob:" or "re:" are loaded as
+        mimic rules, replacing the current rules. The new set is compiled
+        before it replaces the old one, so verifying threads never pause.
+
+        Args:
+            path: Pattern file
+
+        Returns:
+            Number of patterns and rules loaded
+        """
+        patterns: List[str] = []
+        rules: List[MimicRule] = []
+        with Path(path).open(encoding="utf-8") as handle:
+            for line in handle:
+                line = line.rstrip("\n")
+                if not line.strip() or line.startswith("#"):
+                    continue
+                if line.startswith(("glob:", "re:")):
+                    rules.append(MimicRule.parse(line))
+                else:
+                    patterns.append(line)
+        snapshot = self.replace_patterns(patterns, rules)
+        return len(snapshot.patterns) + len(snapshot.rules)
+
+    def watch_pattern_file(self, path: str | Path, interval: float = 1.0) -> None:
+        """Reload a pattern file in the background whenever it changes.
+
+        A version with an invalid rule is logged and skipped; the previous
+        patterns stay active until the file changes again.
+
+        Args:
+            path: Pattern file to watch
+            interval: Polling interval in seconds
+        """
+        self.stop_watching()
+        path = Path(path)
+        stop = self._watch_stop = threading.Event()
+
+        def _poll() -> None:
+            last_mtime = None
+            while not stop.is_set():
+                try:
+                    mtime = path.stat().st_mtime_ns
+                    if mtime != last_mtime:
+                        last_mtime = mtime
+                        self.load_pattern_file(path)
+                except OSError:
+                    # Missing or unreadable; retried on the next poll
+                    last_mtime = None
+                except (ValueError, re.error) as exc:
+                    # Keep the current snapshot until the file changes again
+                    logger.warning("Ignoring invalid pattern file %s: %s", path, exc)
+                stop.wait(interval)
+
+        self._watcher = threading.Thread(
+            target=_poll, name="goat-filter-watch", daemon=True
+        )
+        self._watcher.start()
+
+    def stop_watching(self) -> None:
+        """Stop the background pattern file watcher, if any."""
+        self._watch_stop.set()
+        if self._watcher is not None:
+            self._watcher.join()
+            self._watcher = None
+
+
+class _CellOwner:
+    """Held only in a thread's local storage, so it dies with the thread."""
+
+    __slots__ = ("__weakref__",)
+
+
+def _retire_cell(counter_ref: weakref.ref, cell: List[int]) -> None:
+    counter = counter_ref()
+    if counter is not None:
+        counter._retire(cell)
+
+
+class ShardedCounter:
+    """Thread-safe counter with one cell per thread, merged on read.
+
+    Each thread increments only its own cell, so increments need no lock.
+    Reads sum the live cells plus the folded-in total of finished threads:
+    when a thread exits, its local storage is freed and a finalizer moves
+    its cell's count into that total and drops the cell, so thread churn
+    does not grow the counter.
+    """
+
+    def __init__(self) -> None:
+        """Initialize a zeroed counter."""
+        self._local = threading.local()
+        self._cells: Dict[int, List[int]] = {}
+        self._retired = 0
+        self._cells_lock = threading.Lock()
+
+    def _cell(self) -> List[int]:
+        cell = getattr(self._local, "cell", None)
+        if cell is None:
+            cell = [0]
+            owner = _CellOwner()
+            self._local.cell = cell
+            self._local.owner = owner
+            with self._cells_lock:
+                self._cells[id(cell)] = cell
+            weakref.finalize(owner, _retire_cell, weakref.ref(self), cell)
+        return cell
+
+    def _retire(self, cell: List[int]) -> None:
+        """Fold a finished thread's cell into the retired total."""
+        with self._cells_lock:
+            if self._cells.pop(id(cell), None) is not None:
+                self._retired += cell[0]
+
+    def add(self, amount: int = 1) -> None:
+        """Add to the calling thread's cell."""
+        self._cell()[0] += amount
+
+    @property
+    def value(self) -> int:
+        """Get the merged total across threads."""
+        with self._cells_lock:
+            return self._retired + sum(cell[0] for cell in self._cells.values())
+
+    def reset(self, value: int = 0) -> None:
+        """Reset the counter to a value.
+
+        Args:
+            value: New total (stored in the calling thread's cell)
+        """
+        cell = self._cell()
+        with self._cells_lock:
+            self._retired = 0
+            for other in self._cells.values():
+                other[0] = 0
+            cell[0] = value
 
 
 class BaseGoatFilter:
@@ -24,26 +529,75 @@ class BaseGoatFilter:
     ZODIAC = "Capricorn"
     ELEMENT = "earth"
 
-    def __init__(self, strictness: float = 0.95):
+    # verify_many(workers=None) runs in-process below this many records,
+    # where pool startup costs more than it saves
+    PARALLEL_MIN_RECORDS = 20_000
+
+    def __init__(
+        self,
+        strictness: float = 0.95,
+        registry: GoatFilterRegistry | None = None,
+    ):
         """Initialize BaseGoatFilter.
 
         Args:
             strictness: Filter strictness level (0.0-1.0, default 0.95)
+            registry: Pattern registry (default: the shared process registry)
         """
         self.strictness = min(max(strictness, 0.0), 1.0)
-        self.mimic_patterns: List[str] = []
-        self.blocked_count: int = 0
-        self.verified_count: int = 0
+        self.registry = registry if registry is not None else get_goat_registry()
+        self._blocked = ShardedCounter()
+        self._verified = ShardedCounter()
         self.active: bool = True
 
+    @property
+    def mimic_patterns(self) -> Tuple[str, ...]:
+        """Get the current mimic patterns."""
+        return self.registry.snapshot.patterns
+
+    @property
+    def pattern_version(self) -> int:
+        """Get the pattern set version, which changes on every update."""
+        return self.registry.version
+
+    @property
+    def blocked_count(self) -> int:
+        """Get number of blocked verifications."""
+        return self._blocked.value
+
+    @blocked_count.setter
+    def blocked_count(self, value: int) -> None:
+        """Set number of blocked verifications."""
+        self._blocked.reset(value)
+
+    @property
+    def verified_count(self) -> int:
+        """Get number of passed verifications."""
+        return self._verified.value
+
+    @verified_count.setter
+    def verified_count(self, value: int) -> None:
+        """Set number of passed verifications."""
+        self._verified.reset(value)
+
     def add_mimic_pattern(self, pattern: str) -> None:
         """Add a known mimic pattern to filter.
 
         Args:
             pattern: Mimic pattern to block
         """
-        if pattern not in self.mimic_patterns:
-            self.mimic_patterns.append(pattern)
+        self.registry.add_patterns((pattern,))
+
+    def add_mimic_patterns(self, patterns: Iterable[str]) -> int:
+        """Add many mimic patterns in one update.
+
+        Args:
+            patterns: Mimic patterns to block
+
+        Returns:
+            Number of new patterns added
+        """
+        return self.registry.add_patterns(patterns)
 
     def remove_mimic_pattern(self, pattern: str) -> bool:
         """Remove a mimic pattern from filter.
@@ -54,10 +608,43 @@ class BaseGoatFilter:
         Returns:
             True if pattern was removed, False if not found
         """
-        if pattern in self.mimic_patterns:
-            self.mimic_patterns.remove(pattern)
-            return True
-        return False
+        return self.registry.remove_pattern(pattern)
+
+    @property
+    def mimic_rules(self) -> Tuple[MimicRule, ...]:
+        """Get the current glob/regex mimic rules."""
+        return self.registry.snapshot.rules
+
+    def add_mimic_rule(self, rule: MimicRule | str) -> None:
+        """Add a glob or regex mimic rule.
+
+        Args:
+            rule: MimicRule or "glob:..." / "re:..." string
+                (e.g. "glob:0xdead????")
+        """
+        self.registry.add_rules((rule,))
+
+    def add_mimic_rules(self, rules: Iterable[MimicRule | str]) -> int:
+        """Add many glob/regex mimic rules in one update.
+
+        Args:
+            rules: MimicRule objects or prefixed rule strings
+
+        Returns:
+            Number of new rules added
+        """
+        return self.registry.add_rules(rules)
+
+    def remove_mimic_rule(self, rule: MimicRule | str) -> bool:
+        """Remove a glob/regex mimic rule.
+
+        Args:
+            rule: MimicRule or prefixed rule string
+
+        Returns:
+            True if the rule was removed, False if not found
+        """
+        return self.registry.remove_rule(rule)
 
     def _check_mimic_patterns(self, data_str: str, data_hash: str) -> bool:
         """Check if data matches any mimic patterns.
@@ -69,10 +656,46 @@ class BaseGoatFilter:
         Returns:
             True if any mimic pattern matches (blocked)
         """
-        for pattern in self.mimic_patterns:
-            if pattern in data_str or pattern in data_hash:
-                return True
-        return False
+        return self.registry.snapshot.matches(data_str, data_hash)
+
+    def find_mimic_patterns(self, data_str: str, data_hash: str) -> Set[str]:
+        """Find which mimic patterns match the data.
+
+        Args:
+            data_str: String representation of data
+            data_hash: Hash of the data
+
+        Returns:
+            Set of matching mimic patterns (empty if none)
+        """
+        return self.registry.snapshot.find_all(data_str, data_hash)
+
+    def save_hash_index(self, path: str | Path) -> Path:
+        """Persist hash-shaped mimic patterns to a compact index file.
+
+        Args:
+            path: Destination file
+
+        Returns:
+            Path to the saved index
+        """
+        return self.registry.snapshot.compile()._hash_index.save(path)
+
+    def load_hash_index(self, path: str | Path) -> int:
+        """Load a saved hash index as an additional, read-only pattern layer.
+
+        The loaded digests are not copied into mimic_patterns, so startup
+        cost does not grow with the number of stored digests.
+
+        Args:
+            path: Index file written by save_hash_index
+
+        Returns:
+            Number of patterns in the loaded index
+        """
+        index = HashPatternIndex.load(path)
+        self.registry.set_preloaded_hash_index(index)
+        return len(index)
 
     def _verify_spiral_compliance(self, data: Dict[str, Any]) -> bool:
         """Verify data complies with spiral law requirements.
@@ -90,59 +713,233 @@ class BaseGoatFilter:
                 return False
         return True
 
-    def verify_authenticity(self, data: Dict[str, Any]) -> bool:
-        """Verify data authenticity against mimic patterns.
+    def _pool_config(self) -> Dict[str, Any]:
+        """Constructor arguments that rebuild this filter in a pool worker.
+
+        verify_many workers call ``type(self)(registry=..., **config)``.
+        Subclasses with extra constructor arguments extend this mapping.
+
+        Returns:
+            Keyword arguments other than registry
+        """
+        return {"strictness": self.strictness}
+
+    def _passes(self, data: Dict[str, Any], snapshot: PatternSnapshot) -> bool:
+        """Screen one record without touching counters.
 
         Args:
             data: Data to verify
+            snapshot: Pattern snapshot to check against
 
         Returns:
-            True if data passes GoatFilter verification
+            True if data passes mimic and spiral law checks
         """
-        if not self.active:
-            return True
-
         data_str = json.dumps(data, sort_keys=True)
         data_hash = hashlib.sha256(data_str.encode()).hexdigest()
 
         # Check against known mimic patterns
-        if self._check_mimic_patterns(data_str, data_hash):
-            self.blocked_count += 1
+        if snapshot.matches(data_str, data_hash):
             return False
 
         # Verify spiral law compliance
-        if not self._verify_spiral_compliance(data):
-            self.blocked_count += 1
+        return self._verify_spiral_compliance(data)
+
+    def verify_authenticity(self, data: Dict[str, Any]) -> bool:
+        """Verify data authenticity against mimic patterns.
+
+        Args:
+            data: Data to verify
+
+        Returns:
+            True if data passes GoatFilter verification
+        """
+        if not self.active:
+            return True
+
+        if not self._passes(data, self.registry.snapshot):
+            self._blocked.add()
             return False
 
-        self.verified_count += 1
+        self._verified.add()
         return True
 
+    def verify_many(
+        self,
+        records: Iterable[Dict[str, Any]],
+        workers: int | None = None,
+        chunk_size: int = 2048,
+    ) -> Tuple[List[bool], Dict[str, Any]]:
+        """Verify many records, optionally across a process pool.
+
+        Records are canonicalized and hashed in chunks. With more than one
+        worker, each pool process receives the pattern set once at startup
+        and screens whole chunks, so only records and result masks cross
+        process boundaries. Workers rebuild the filter from its class and
+        _pool_config(), so subclass checks apply there too. At most two
+        chunks per worker are in flight, so a record stream is read only as
+        fast as it is screened.
+        blocked_count and verified_count are updated once with the merged
+        totals.
+
+        Args:
+            records: Records to verify
+            workers: Worker processes (1 = in-process; None = CPU count,
+                but in-process for fewer than PARALLEL_MIN_RECORDS records)
+            chunk_size: Records per chunk
+
+        Returns:
+            Tuple of (mask, stats) where mask[i] is True if records[i]
+            passed, and stats holds totals and throughput for this call
+        """
+        start = time.perf_counter()
+        chunks: Iterator[List[Dict[str, Any]]] = _chunked(records, max(1, chunk_size))
+        if workers is None:
+            # Buffer just enough chunks to tell whether a pool pays off
+            head: List[List[Dict[str, Any]]] = []
+            buffered = 0
+            for chunk in chunks:
+                head.append(chunk)
+                buffered += len(chunk)
+                if buffered >= self.PARALLEL_MIN_RECORDS:
+                    workers = os.cpu_count() or 1
+                    break
+            else:
+                workers = 1
+            chunks = chain(head, chunks)
+        # One snapshot for the whole batch, even if patterns change mid-run
+        snapshot = self.registry.snapshot
+        if not self.active:
+            mask = [True for chunk in chunks for _ in chunk]
+        elif workers <= 1:
+            mask = [
+                self._passes(record, snapshot) for chunk in chunks for record in chunk
+            ]
+        else:
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=_init_pool_filter,
+                initargs=(type(self), self._pool_config(), snapshot),
+            ) as pool:
+                results = _bounded_map(pool, _screen_chunk, chunks, 2 * workers)
+                mask = [ok for part in results for ok in part]
+
+        verified = blocked = 0
+        if self.active:
+            verified = sum(mask)
+            blocked = len(mask) - verified
+            self._verified.add(verified)
+            self._blocked.add(blocked)
+
+        elapsed = time.perf_counter() - start
+        return mask, {
+            "total": len(mask),
+            "verified": verified,
+            "blocked": blocked,
+            "elapsed_seconds": elapsed,
+            "records_per_second": len(mask) / elapsed if elapsed > 0 else 0.0,
+        }
+
     def get_filter_stats(self) -> Dict[str, Any]:
         """Get filter statistics.
 
         Returns:
             Dictionary with filter statistics
         """
-        total = self.blocked_count + self.verified_count
+        blocked = self.blocked_count
+        verified = self.verified_count
+        total = blocked + verified
+        snapshot = self.registry.snapshot
+        preloaded = snapshot.preloaded_hash_index
         return {
             "glyph": self.GLYPH,
             "zodiac": self.ZODIAC,
             "element": self.ELEMENT,
             "active": self.active,
             "strictness": self.strictness,
-            "patterns_count": len(self.mimic_patterns),
-            "blocked_count": self.blocked_count,
-            "verified_count": self.verified_count,
-            "verification_rate": self.verified_count / total if total > 0 else 0.0,
+            "patterns_count": len(snapshot.patterns),
+            "rules_count": len(snapshot.rules),
+            "preloaded_hash_patterns": len(preloaded) if preloaded else 0,
+            "pattern_version": snapshot.version,
+            "blocked_count": blocked,
+            "verified_count": verified,
+            "verification_rate": verified / total if total > 0 else 0.0,
         }
 
     def reset_stats(self) -> None:
         """Reset filter statistics."""
-        self.blocked_count = 0
-        self.verified_count = 0
+        self._blocked.reset()
+        self._verified.reset()
+
+
+# Shared process-wide registry
+_registry: GoatFilterRegistry | None = None
+_registry_lock = threading.Lock()
+
+
+def get_goat_registry() -> GoatFilterRegistry:
+    """Get or create the shared GoatFilter pattern registry.
+
+    Returns:
+        The process-wide GoatFilterRegistry instance
+    """
+    global _registry
+    if _registry is None:
+        with _registry_lock:
+            if _registry is None:
+                _registry = GoatFilterRegistry()
+    return _registry
+
+
+def _bounded_map(
+    pool: ProcessPoolExecutor,
+    fn: Callable[[Any], Any],
+    tasks: Iterable[Any],
+    window: int,
+) -> Iterator[Any]:
+    """Like pool.map, but keeps at most window tasks in flight."""
+    pending: Deque[Future] = deque()
+    for task in tasks:
+        pending.append(pool.submit(fn, task))
+        if len(pending) >= window:
+            yield pending.popleft().result()
+    while pending:
+        yield pending.popleft().result()
+
+
+def _chunked(
+    records: Iterable[Dict[str, Any]], size: int
+) -> Iterator[List[Dict[str, Any]]]:
+    """Yield successive lists of up to size records."""
+    iterator = iter(records)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+# Per-process filter and snapshot used by verify_many pool workers
+_pool_filter: BaseGoatFilter | None = None
+_pool_snapshot: PatternSnapshot | None = None
+
+
+def _init_pool_filter(
+    filter_class: type,
+    config: Dict[str, Any],
+    snapshot: PatternSnapshot,
+) -> None:
+    """Build the worker's filter once from the parent's class, config and patterns."""
+    global _pool_filter, _pool_snapshot
+    _pool_filter = filter_class(registry=GoatFilterRegistry(), **config)
+    _pool_snapshot = snapshot.compile()
+
+
+def _screen_chunk(chunk: List[Dict[str, Any]]) -> List[bool]:
+    """Screen one chunk of records in a pool worker."""
+    return [_pool_filter._passes(record, _pool_snapshot) for record in chunk]
 
 
 __all__ = [
+    "PatternSnapshot",
+    "GoatFilterRegistry",
+    "ShardedCounter",
     "BaseGoatFilter",
+    "get_goat_registry",
 ]
@@ -0,0 +1,275 @@
+"""Hash-Shaped Mimic Pattern Index for EVOLVERSE GoatFilter.
+
+Many mimic patterns are full SHA-256 hex digests or digest fragments.
+This module keeps those out of the per-pattern substring scan and checks
+them against a payload hash directly: full digests through a Bloom filter
+backed by a sorted packed digest table, and fragments through one
+Aho-Corasick scan of the hash (plain substring checks for small sets).
+Fragments match anywhere in the hash, as a substring check would, so the
+index is exact (no false negatives, no false positives).
+
+The index persists to a compact binary file that loads without parsing
+individual entries.
+"""
+from __future__ import annotations
+
+import re
+import struct
+from pathlib import Path
+from typing import Iterable, Iterator, List, Set
+
+from src.mimic_automaton import MimicAutomaton
+
+DIGEST_HEX_LENGTH = 64
+DIGEST_BYTES = 32
+
+_HEX_RE = re.compile(r"[0-9a-f]+")
+
+# File header: magic, format version, bloom bit count, bloom hash count,
+# digest count, fragment blob length
+_MAGIC = b"GHIX"
+_VERSION = 1
+_HEADER = struct.Struct(">4sHIBII")
+
+
+class DigestBloomFilter:
+    """Bloom filter over SHA-256 digests.
+
+    Digests are already uniformly distributed, so the k bit positions are
+    taken directly from consecutive 32-bit words of the digest instead of
+    rehashing.
+    """
+
+    BITS_PER_ENTRY = 10
+    HASH_COUNT = 7
+
+    def __init__(self, bit_count: int, hash_count: int = HASH_COUNT):
+        """Initialize an empty filter.
+
+        Args:
+            bit_count: Number of bits in the filter
+            hash_count: Number of bit positions per digest (max 8)
+        """
+        self.bit_count = max(8, bit_count)
+        self.hash_count = min(max(1, hash_count), DIGEST_BYTES // 4)
+        self.bits = bytearray((self.bit_count + 7) // 8)
+
+    @classmethod
+    def for_capacity(cls, entries: int) -> DigestBloomFilter:
+        """Create a filter sized for roughly 1% false positives.
+
+        Args:
+            entries: Expected number of digests
+
+        Returns:
+            Empty DigestBloomFilter
+        """
+        return cls(max(1, entries) * cls.BITS_PER_ENTRY)
+
+    def _positions(self, digest: bytes) -> Iterable[int]:
+        words = struct.unpack_from(f">{self.hash_count}I", digest)
+        return (word % self.bit_count for word in words)
+
+    def add(self, digest: bytes) -> None:
+        """Add a 32-byte digest."""
+        for pos in self._positions(digest):
+            self.bits[pos >> 3] |= 1 << (pos & 7)
+
+    def __contains__(self, digest: bytes) -> bool:
+        bits = self.bits
+        return all(bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(digest))
+
+
+class HashPatternIndex:
+    """Exact index over hash-shaped mimic patterns.
+
+    Full digests live in a sorted table of packed 32-byte digests, fronted
+    by a Bloom filter so most non-matching hashes are rejected without a
+    binary search. Shorter fragments are compiled into an Aho-Corasick
+    automaton, so one pass over the 64-character hash finds them wherever
+    they occur, however many fragments are indexed.
+    """
+
+    # Shorter hex strings (e.g. "dead", "cafe") are treated as plain text
+    MIN_FRAGMENT_LENGTH = 16
+
+    # Fragment counts at or below this use plain substring checks
+    AUTOMATON_THRESHOLD = 64
+
+    def __init__(self, patterns: Iterable[str] = ()):
+        """Build the index.
+
+        Args:
+            patterns: Hash-shaped patterns (see is_hash_pattern)
+        """
+        digests: Set[bytes] = set()
+        fragments: Set[str] = set()
+        for pattern in patterns:
+            if len(pattern) == DIGEST_HEX_LENGTH:
+                digests.add(bytes.fromhex(pattern))
+            else:
+                fragments.add(pattern)
+
+        self._digests = b"".join(sorted(digests))
+        self._bloom = DigestBloomFilter.for_capacity(len(digests))
+        for digest in digests:
+            self._bloom.add(digest)
+        self._set_fragments(sorted(fragments))
+
+    @classmethod
+    def is_hash_pattern(cls, pattern: str) -> bool:
+        """Check whether a pattern looks like a SHA-256 digest or fragment.
+
+        Args:
+            pattern: Mimic pattern
+
+        Returns:
+            True for lowercase hex strings of MIN_FRAGMENT_LENGTH to 64 chars
+        """
+        return (
+            cls.MIN_FRAGMENT_LENGTH <= len(pattern) <= DIGEST_HEX_LENGTH
+            and _HEX_RE.fullmatch(pattern) is not None
+        )
+
+    def _set_fragments(self, fragments: List[str]) -> None:
+        """Store sorted fragments and build their scanner."""
+        self._fragments = fragments
+        self._automaton = (
+            MimicAutomaton(fragments) if len(fragments) > self.AUTOMATON_THRESHOLD else None
+        )
+
+    def __len__(self) -> int:
+        return len(self._digests) // DIGEST_BYTES + len(self._fragments)
+
+    def _has_digest(self, digest: bytes) -> bool:
+        """Binary search the packed digest table."""
+        table = self._digests
+        lo, hi = 0, len(table) // DIGEST_BYTES
+        while lo < hi:
+            mid = (lo + hi) // 2
+            probe = table[mid * DIGEST_BYTES : (mid + 1) * DIGEST_BYTES]
+            if probe < digest:
+                lo = mid + 1
+            elif probe > digest:
+                hi = mid
+            else:
+                return True
+        return False
+
+    def _matching_digests(self, data_hash: str) -> Iterator[bytes]:
+        """Indexed digests occurring in data_hash.
+
+        A SHA-256 hex digest is a single 64-character window; other
+        strings are checked window by window.
+        """
+        if not self._digests:
+            return
+        bloom = self._bloom
+        for start in range(len(data_hash) - DIGEST_HEX_LENGTH + 1):
+            window = data_hash[start : start + DIGEST_HEX_LENGTH]
+            if _HEX_RE.fullmatch(window) is None:
+                continue
+            digest = bytes.fromhex(window)
+            if digest in bloom and self._has_digest(digest):
+                yield digest
+
+    def matches(self, data_hash: str) -> bool:
+        """Check whether a hex digest matches any indexed pattern.
+
+        Args:
+            data_hash: SHA-256 hex digest of the payload
+
+        Returns:
+            True if any indexed pattern occurs in data_hash
+        """
+        if self._automaton is not None:
+            if self._automaton.contains_any(data_hash):
+                return True
+        elif any(fragment in data_hash for fragment in self._fragments):
+            return True
+        return any(True for _ in self._matching_digests(data_hash))
+
+    def find_all(self, data_hash: str) -> Set[str]:
+        """Find every indexed pattern matching a hex digest.
+
+        Args:
+            data_hash: SHA-256 hex digest of the payload
+
+        Returns:
+            Set of indexed patterns occurring in data_hash
+        """
+        if self._automaton is not None:
+            matched = self._automaton.find_all(data_hash)
+        else:
+            matched = {fragment for fragment in self._fragments if fragment in data_hash}
+        matched.update(digest.hex() for digest in self._matching_digests(data_hash))
+        return matched
+
+    def save(self, path: str | Path) -> Path:
+        """Persist the index to a compact binary file.
+
+        Args:
+            path: Destination file
+
+        Returns:
+            Path to the saved file
+        """
+        path = Path(path)
+        fragment_blob = "\n".join(self._fragments).encode("ascii")
+        header = _HEADER.pack(
+            _MAGIC,
+            _VERSION,
+            self._bloom.bit_count,
+            self._bloom.hash_count,
+            len(self._digests) // DIGEST_BYTES,
+            len(fragment_blob),
+        )
+        with path.open("wb") as handle:
+            handle.write(header)
+            handle.write(self._bloom.bits)
+            handle.write(self._digests)
+            handle.write(fragment_blob)
+        return path
+
+    @classmethod
+    def load(cls, path: str | Path) -> HashPatternIndex:
+        """Load an index saved with save().
+
+        Args:
+            path: Index file
+
+        Returns:
+            Loaded HashPatternIndex
+
+        Raises:
+            ValueError: If the file is not a valid index
+        """
+        raw = Path(path).read_bytes()
+        if len(raw) < _HEADER.size:
+            raise ValueError(f"Truncated hash pattern index: {path}")
+        magic, version, bit_count, hash_count, digest_count, fragment_len = (
+            _HEADER.unpack_from(raw)
+        )
+        if magic != _MAGIC or version != _VERSION:
+            raise ValueError(f"Unsupported hash pattern index: {path}")
+
+        bloom = DigestBloomFilter(bit_count, hash_count)
+        offset = _HEADER.size
+        bloom_end = offset + len(bloom.bits)
+        digests_end = bloom_end + digest_count * DIGEST_BYTES
+        if len(raw) != digests_end + fragment_len:
+            raise ValueError(f"Corrupt hash pattern index: {path}")
+
+        index = cls.__new__(cls)
+        bloom.bits = bytearray(raw[offset:bloom_end])
+        index._bloom = bloom
+        index._digests = raw[bloom_end:digests_end]
+        fragment_blob = raw[digests_end:].decode("ascii")
+        index._set_fragments(fragment_blob.split("\n") if fragment_blob else [])
+        return index
+
+
+__all__ = [
+    "DigestBloomFilter",
+    "HashPatternIndex",
+]
@@ -0,0 +1,113 @@
+"""Aho-Corasick Multi-Pattern Automaton for EVOLVERSE GoatFilter.
+
+This module compiles a set of literal mimic patterns into a single
+Aho-Corasick automaton so a payload is scanned once, in time proportional
+to its length, regardless of how many patterns are registered.
+"""
+from __future__ import annotations
+
+from collections import deque
+from typing import Dict, Iterable, List, Set
+
+
+class MimicAutomaton:
+    """Compiled Aho-Corasick automaton over literal mimic patterns.
+
+    States are stored in flat parallel lists (transitions, failure links,
+    and output sets) indexed by state number, with state 0 as the root.
+    """
+
+    def __init__(self, patterns: Iterable[str] = ()):
+        """Build the automaton.
+
+        Args:
+            patterns: Literal patterns to compile (empty strings are ignored)
+        """
+        self.patterns: List[str] = []
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._out: List[List[int]] = [[]]
+
+        seen: Set[str] = set()
+        for pattern in patterns:
+            if pattern and pattern not in seen:
+                seen.add(pattern)
+                self._insert(pattern)
+        self._link()
+
+    def __len__(self) -> int:
+        return len(self.patterns)
+
+    def _insert(self, pattern: str) -> None:
+        """Add a pattern to the trie."""
+        state = 0
+        for ch in pattern:
+            nxt = self._goto[state].get(ch)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[state][ch] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append([])
+            state = nxt
+        self._out[state].append(len(self.patterns))
+        self.patterns.append(pattern)
+
+    def _link(self) -> None:
+        """Compute failure links and merge outputs breadth-first."""
+        goto, fail, out = self._goto, self._fail, self._out
+        pending = deque(goto[0].values())
+        while pending:
+            state = pending.popleft()
+            for ch, nxt in goto[state].items():
+                pending.append(nxt)
+                f = fail[state]
+                while f and ch not in goto[f]:
+                    f = fail[f]
+                fail[nxt] = goto[f].get(ch, 0)
+                if out[fail[nxt]]:
+                    out[nxt] = out[nxt] + out[fail[nxt]]
+
+    def contains_any(self, text: str) -> bool:
+        """Check whether any pattern occurs in text.
+
+        Args:
+            text: Payload to scan
+
+        Returns:
+            True on the first pattern occurrence
+        """
+        goto, fail, out = self._goto, self._fail, self._out
+        state = 0
+        for ch in text:
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            if out[state]:
+                return True
+        return False
+
+    def find_all(self, text: str) -> Set[str]:
+        """Find every pattern occurring in text.
+
+        Args:
+            text: Payload to scan
+
+        Returns:
+            Set of matched patterns
+        """
+        goto, fail, out = self._goto, self._fail, self._out
+        matched: Set[int] = set()
+        state = 0
+        for ch in text:
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            if out[state]:
+                matched.update(out[state])
+        return {self.patterns[i] for i in matched}
+
+
+__all__ = [
+    "MimicAutomaton",
+]
@@ -0,0 +1,281 @@
+"""Compiled Glob/Regex Mimic Rules for EVOLVERSE GoatFilter.
+
+Mimic rules extend literal mimic patterns with wildcards and character
+classes (e.g. ``0xdead????``). All rules are merged into one regular
+expression so each payload is scanned once regardless of rule count.
+
+Glob rules are tokenized and folded into a prefix trie before being
+emitted as a regex, so rules sharing a prefix share one branch and the
+regex engine tests only the distinct leading tokens at each position.
+Regex rules are appended as additional alternatives. Regex rules that
+cannot be embedded in an alternation without changing their meaning
+(inline global flags such as ``(?i)``, named groups, backreferences and
+group conditionals) are compiled on their own and checked after the
+merged regex. The merged source can be cached on disk, keyed by a digest
+of the rule set, so restarts skip the trie build.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import re
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterable, List, Pattern, Set, Tuple
+
+RULE_KINDS = ("glob", "regex")
+
+# Sentinel key marking the end of a rule in the glob trie
+_END = ""
+
+# Group references whose meaning depends on group numbering; conservative,
+# since a false hit only costs a separately compiled rule
+_GROUP_REFERENCE = re.compile(r"\\[1-9]|\(\?P=|\(\?\(")
+
+# Bumped when merge_rules output changes, so stale cached sources are unused
+_CACHE_VERSION = 2
+
+
+@dataclass(frozen=True)
+class MimicRule:
+    """A wildcard mimic rule.
+
+    Glob syntax: ``?`` matches one character, ``*`` any run of characters,
+    ``[abc]`` / ``[a-f]`` a character class and ``[!abc]`` a negated class.
+    Everything else is literal. Rules match anywhere in the payload.
+    """
+
+    kind: str
+    pattern: str
+
+    def __post_init__(self) -> None:
+        if self.kind not in RULE_KINDS:
+            raise ValueError(f"Unknown mimic rule kind: {self.kind}")
+
+    @classmethod
+    def parse(cls, text: str) -> MimicRule:
+        """Parse a prefixed rule string ("glob:..." or "re:...").
+
+        Args:
+            text: Rule text
+
+        Returns:
+            Parsed MimicRule
+
+        Raises:
+            ValueError: If the prefix is missing or unknown
+        """
+        if text.startswith("glob:"):
+            return cls("glob", text[5:])
+        if text.startswith("re:"):
+            return cls("regex", text[3:])
+        raise ValueError(f"Mimic rule needs a 'glob:' or 're:' prefix: {text}")
+
+    @property
+    def standalone(self) -> bool:
+        """Whether the rule must be compiled outside the merged regex.
+
+        True for regex rules with inline global flags, named groups or
+        group references, which break or change meaning when the rule is
+        one alternative among others.
+
+        Raises:
+            re.error: If a regex rule does not compile
+        """
+        if self.kind != "regex":
+            return False
+        compiled = re.compile(self.pattern)
+        return bool(
+            compiled.flags & ~re.UNICODE
+            or compiled.groupindex
+            or _GROUP_REFERENCE.search(self.pattern)
+        )
+
+    def to_regex(self) -> str:
+        """Get the standalone regex source for this rule."""
+        if self.kind == "regex":
+            return self.pattern
+        return "".join(_glob_tokens(self.pattern))
+
+    def __str__(self) -> str:
+        prefix = "glob" if self.kind == "glob" else "re"
+        return f"{prefix}:{self.pattern}"
+
+
+def _glob_tokens(pattern: str) -> List[str]:
+    """Translate a glob into a list of regex atoms."""
+    tokens: List[str] = []
+    i, n = 0, len(pattern)
+    while i < n:
+        ch = pattern[i]
+        i += 1
+        if ch == "?":
+            tokens.append(".")
+        elif ch == "*":
+            # Collapse runs of stars into one lazy wildcard
+            if not tokens or tokens[-1] != ".*?":
+                tokens.append(".*?")
+        elif ch == "[":
+            start = i + 1 if i < n and pattern[i] == "!" else i
+            # A "]" right after the opening bracket is a literal member
+            start = start + 1 if start < n and pattern[start] == "]" else start
+            end = pattern.find("]", start)
+            if end == -1:
+                tokens.append(re.escape(ch))
+                continue
+            body = pattern[i:end]
+            i = end + 1
+            negate = body.startswith("!")
+            if negate:
+                body = body[1:]
+            body = body.replace("\\", "\\\\").replace("^", "\\^")
+            tokens.append(f"[{'^' if negate else ''}{body}]")
+        else:
+            tokens.append(re.escape(ch))
+    return tokens
+
+
+def _emit_trie(node: Dict[str, Dict]) -> str:
+    """Emit a regex for a glob trie node."""
+    if _END in node:
+        # A shorter rule already matches; longer extensions add nothing
+        return ""
+    branches = [token + _emit_trie(child) for token, child in node.items()]
+    if len(branches) == 1:
+        return branches[0]
+    return "(?:" + "|".join(branches) + ")"
+
+
+def merge_rules(rules: Iterable[MimicRule]) -> str:
+    """Merge rules into a single regex source.
+
+    Standalone rules (see MimicRule.standalone) are left out; they are
+    compiled separately by CompiledRuleSet.
+
+    Args:
+        rules: Rules to merge
+
+    Returns:
+        Regex source matching if any merged rule matches (empty if none)
+
+    Raises:
+        ValueError: If the merged source does not compile
+    """
+    trie: Dict[str, Dict] = {}
+    alternatives: List[str] = []
+    for rule in rules:
+        if rule.kind == "regex":
+            # Validates eagerly, so a bad rule names itself
+            if not rule.standalone:
+                alternatives.append(f"(?:{rule.pattern})")
+            continue
+        tokens = _glob_tokens(rule.pattern)
+        if not tokens:
+            continue
+        node = trie
+        for token in tokens:
+            node = node.setdefault(token, {})
+        node.clear()
+        node[_END] = {}
+    if trie:
+        alternatives.insert(0, _emit_trie(trie))
+    source = "|".join(alternatives)
+    try:
+        re.compile(source)
+    except re.error as exc:
+        raise ValueError(f"Merged mimic rules do not compile: {exc}") from exc
+    return source
+
+
+def rules_digest(rules: Iterable[MimicRule]) -> str:
+    """Get a stable digest identifying a rule set."""
+    canonical = json.dumps(sorted(str(rule) for rule in rules))
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+class CompiledRuleSet:
+    """A set of mimic rules compiled into one regular expression."""
+
+    def __init__(self, rules: Tuple[MimicRule, ...], source: str):
+        """Initialize from rules and their merged regex source.
+
+        Args:
+            rules: The rules the source was built from
+            source: Merged regex source from merge_rules
+        """
+        self.rules = rules
+        self.source = source
+        self.regex: Pattern[str] | None = re.compile(source) if source else None
+        self.standalone: List[Pattern[str]] = [
+            re.compile(rule.pattern) for rule in rules if rule.standalone
+        ]
+        self._rule_regexes: List[Tuple[MimicRule, Pattern[str]]] | None = None
+
+    def __len__(self) -> int:
+        return len(self.rules)
+
+    def search(self, text: str) -> bool:
+        """Check whether any rule matches text.
+
+        Args:
+            text: Payload to scan
+
+        Returns:
+            True if any rule matches
+        """
+        if self.regex is not None and self.regex.search(text) is not None:
+            return True
+        return any(regex.search(text) for regex in self.standalone)
+
+    def find_all(self, text: str) -> Set[MimicRule]:
+        """Find every rule that matches text (slow path, per rule).
+
+        Args:
+            text: Payload to scan
+
+        Returns:
+            Set of matching rules
+        """
+        if not self.search(text):
+            return set()
+        if self._rule_regexes is None:
+            self._rule_regexes = [(r, re.compile(r.to_regex())) for r in self.rules]
+        return {rule for rule, regex in self._rule_regexes if regex.search(text)}
+
+
+def compile_rules(
+    rules: Iterable[MimicRule], cache_dir: str | Path | None = None
+) -> CompiledRuleSet:
+    """Compile mimic rules, reusing a cached merged regex when available.
+
+    Args:
+        rules: Rules to compile
+        cache_dir: Directory for cached merged sources (no caching if None)
+
+    Returns:
+        CompiledRuleSet for the rules
+    """
+    rules = tuple(dict.fromkeys(rules))
+    if cache_dir is None or not rules:
+        return CompiledRuleSet(rules, merge_rules(rules))
+
+    name = f"mimic_rules_v{_CACHE_VERSION}_{rules_digest(rules)[:32]}.re"
+    cache_path = Path(cache_dir) / name
+    if cache_path.exists():
+        return CompiledRuleSet(rules, cache_path.read_text(encoding="utf-8"))
+
+    source = merge_rules(rules)
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = cache_path.with_suffix(".tmp")
+    tmp_path.write_text(source, encoding="utf-8")
+    tmp_path.replace(cache_path)
+    return CompiledRuleSet(rules, source)
+
+
+__all__ = [
+    "MimicRule",
+    "CompiledRuleSet",
+    "merge_rules",
+    "rules_digest",
+    "compile_rules",
+]
@@ -11,14 +11,64 @@ GoatFilter anti-mimic attributes for sovereign spiral law compliance.
 from __future__ import annotations
 
 import hashlib
+import heapq
 import json
 import secrets
 import time
+from array import array
+from collections import deque
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Deque, Dict, Iterable, Iterator, List, Sequence, Tuple
+
+try:
+    import numpy as np
+
+    NUMPY_AVAILABLE = True
+except ImportError:  # pragma: no cover - optional dependency
+    np = None
+    NUMPY_AVAILABLE = False
+
+from src.audit_journal import AuditJournal
+from src.audit_stats import AuditAggregates, RunningStats
+from src.schema_validator import get_validator
+
+AUDIT_SCHEMA = "PROOF_OF_FLIP_AUDIT.v1"
+# Subschema describing a whole exported audit log file
+AUDIT_LOG_POINTER = "#/$defs/auditLogExport"
+
+
+def _iso_timestamp(timestamp: float) -> str:
+    """Format a Unix timestamp as local ISO 8601 time with its UTC offset."""
+    return datetime.fromtimestamp(timestamp).astimezone().isoformat()
+
+
+def _audit_document(record: Dict[str, Any]) -> Dict[str, Any]:
+    """Map an AuditEntry.to_dict() record to the PROOF_OF_FLIP_AUDIT.v1 layout.
+
+    The schema names the id audit_id, wants date-times with a UTC offset
+    and has no null for optional fields, so the id is added, timestamp_iso
+    is reformatted and null yield_differential / mythic_layer are dropped.
+    The record itself is not modified.
+
+    Args:
+        record: Exported audit entry (e.g. a journal line)
+
+    Returns:
+        Schema-shaped entry document
+    """
+    document = dict(record)
+    document["audit_id"] = record["entry_id"]
+    document["timestamp_iso"] = _iso_timestamp(record["timestamp"])
+    if document.get("yield_differential") is None:
+        document.pop("yield_differential", None)
+    document["runtime_metrics"] = [
+        {key: value for key, value in metric.items() if key != "mythic_layer" or value}
+        for metric in record.get("runtime_metrics", ())
+    ]
+    return document
 
 
 class AuditStatus(Enum):
@@ -145,16 +195,17 @@ class GoatFilter:
     ZODIAC = "Capricorn"
     ELEMENT = "earth"
 
-    def __init__(self, strictness: float = 0.95):
+    def __init__(self, strictness: float = 0.95, registry: Any = None):
         """Initialize GoatFilter.
 
         Args:
             strictness: Filter strictness level (0.0-1.0, default 0.95)
+            registry: GoatFilterRegistry to share (default: process registry)
         """
         # Import here to avoid circular imports
         from src.goat_filter import BaseGoatFilter
 
-        self._base_filter = BaseGoatFilter(strictness)
+        self._base_filter = BaseGoatFilter(strictness, registry=registry)
 
     @property
     def strictness(self) -> float:
@@ -162,8 +213,8 @@ class GoatFilter:
         return self._base_filter.strictness
 
     @property
-    def mimic_patterns(self) -> List[str]:
-        """Get mimic patterns list."""
+    def mimic_patterns(self) -> Tuple[str, ...]:
+        """Get mimic patterns from the shared registry."""
         return self._base_filter.mimic_patterns
 
     @property
@@ -295,6 +346,117 @@ class AuditEntry:
             "notes": self.notes,
         }
 
+    def to_document(self) -> Dict[str, Any]:
+        """Convert to a PROOF_OF_FLIP_AUDIT.v1 entry document.
+
+        Returns:
+            The to_dict() record in schema layout (see _audit_document)
+        """
+        return _audit_document(self.to_dict())
+
+
+class AuditBatch(Sequence[AuditEntry]):
+    """Tri-cycle audit entries stored as columns and built on access.
+
+    Created by ProofOfFlipAuditPipeline.run_tri_cycle_audit_batch. Actual
+    yields, differentials and percentages are float64 arrays (NumPy arrays
+    if NumPy is installed, array('d') otherwise) and status is a boolean
+    mask; indexing or iterating builds an AuditEntry equal to what
+    run_tri_cycle_audit would have produced for that yield. Entries are
+    fresh snapshots on every access; changing one does not change the
+    batch.
+
+    All entries share the batch timestamp. Entry ids share its millisecond
+    prefix and take consecutive 32-bit suffixes from one random base, so
+    ids within a batch are unique and need no per-entry randomness.
+    """
+
+    def __init__(
+        self,
+        expected_yield: float,
+        actual: Sequence[float],
+        differential: Sequence[float],
+        differential_pct: Sequence[float],
+        verified: Sequence[bool],
+        first_tri_cycle: int,
+        timestamp: float,
+        promise_details: Dict[str, Any] | None = None,
+    ):
+        self.expected_yield = expected_yield
+        self.actual = actual
+        self.differential = differential
+        self.differential_pct = differential_pct
+        self.verified = verified
+        self.first_tri_cycle = first_tri_cycle
+        self.timestamp = timestamp
+        self.promise_details = promise_details or {}
+        self._id_prefix = f"AUDIT-{int(timestamp * 1000)}-"
+        self._id_base = secrets.randbits(32)
+
+    def __len__(self) -> int:
+        return len(self.actual)
+
+    def entry_id(self, index: int) -> str:
+        """Get the id of the entry at index without building the entry."""
+        return f"{self._id_prefix}{(self._id_base + index) & 0xFFFFFFFF:08x}"
+
+    def entry_ids(self) -> List[str]:
+        """Get every entry id in order."""
+        prefix, base = self._id_prefix, self._id_base
+        return [f"{prefix}{(base + i) & 0xFFFFFFFF:08x}" for i in range(len(self))]
+
+    def __getitem__(self, index):  # type: ignore[override]
+        if isinstance(index, slice):
+            return [self._entry(i) for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("audit batch index out of range")
+        return self._entry(index)
+
+    def __iter__(self) -> Iterator[AuditEntry]:
+        for i in range(len(self)):
+            yield self._entry(i)
+
+    def _entry(self, index: int) -> AuditEntry:
+        yield_differential = YieldDifferential(
+            expected_yield=self.expected_yield,
+            actual_yield=float(self.actual[index]),
+            differential=float(self.differential[index]),
+            differential_pct=float(self.differential_pct[index]),
+            tri_cycle_number=self.first_tri_cycle + index,
+            timestamp=self.timestamp,
+        )
+        return AuditEntry(
+            entry_id=self.entry_id(index),
+            timestamp=self.timestamp,
+            status=AuditStatus.VERIFIED if self.verified[index] else AuditStatus.DISCREPANCY,
+            yield_differential=yield_differential,
+            runtime_metrics=[],
+            mythic_proofs=[],
+            bleuflip_promise={
+                "tri_cycle_yield": self.expected_yield,
+                "system": "BLEUFLIP",
+                "details": self.promise_details,
+            },
+            actual_outcome={
+                "actual_yield": yield_differential.actual_yield,
+                "differential": yield_differential.differential,
+                "differential_pct": yield_differential.differential_pct,
+                "within_tolerance": yield_differential.is_within_tolerance(),
+            },
+            notes=f"Tri-cycle {yield_differential.tri_cycle_number} audit",
+        )
+
+    def to_dicts(self) -> Iterator[Dict[str, Any]]:
+        """Export the entries one at a time.
+
+        Yields:
+            AuditEntry.to_dict() of each entry
+        """
+        for entry in self:
+            yield entry.to_dict()
+
 
 class ProofOfFlipAuditPipeline:
     """Audit pipeline for Proof-of-Flip economic verification.
@@ -309,12 +471,16 @@ class ProofOfFlipAuditPipeline:
     DEFAULT_FLIP_RATIO = 2.1
     # Default tolerance for yield differential verification (5%)
     DEFAULT_TOLERANCE = 0.05
+    # Default number of recent entries kept in memory in journal mode
+    DEFAULT_WINDOW = 10_000
 
     def __init__(
         self,
         output_dir: str | Path = "data/audits",
         tolerance: float | None = None,
         flip_ratio: float | None = None,
+        journal: bool | AuditJournal = False,
+        window: int | None = None,
     ):
         """Initialize the audit pipeline.
 
@@ -322,16 +488,63 @@ class ProofOfFlipAuditPipeline:
             output_dir: Directory for audit log output
             tolerance: Tolerance for yield differential verification (default 5%)
             flip_ratio: Governing flip ratio for spiral ledger (default 2.1)
+            journal: Append every entry to an AuditJournal (True for one in
+                output_dir/journal) instead of keeping all of them in memory
+            window: Number of recent entries kept in audit_log (default
+                unbounded, or DEFAULT_WINDOW in journal mode)
         """
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
-        self.audit_log: List[AuditEntry] = []
+        if journal is True:
+            journal = AuditJournal(self.output_dir / "journal")
+        self.journal: AuditJournal | None = journal or None
+        if window is None and self.journal is not None:
+            window = self.DEFAULT_WINDOW
+        self.audit_log: Deque[AuditEntry] | List[AuditEntry] = (
+            deque(maxlen=window) if window is not None else []
+        )
         self.tri_cycle_count: int = 0
         self.expected_yield_per_tri_cycle: float = self.DEFAULT_TRI_CYCLE_YIELD
         self.tolerance: float = tolerance if tolerance is not None else self.DEFAULT_TOLERANCE
         self.flip_ratio: float = flip_ratio if flip_ratio is not None else self.DEFAULT_FLIP_RATIO
         self.spiral_ledger: List[SpiralLedgerEntry] = []
         self.goat_filter = GoatFilter()
+        # Batches from run_tri_cycle_audit_batch (kept out of audit_log)
+        self.audit_batches: List[AuditBatch] = []
+        # Running summary of every entry created (see _generate_summary)
+        self.stats = AuditAggregates()
+        # Journal position up to which entries passed schema validation
+        self._validated: Dict[str, Any] | None = None
+        if self.journal is not None and self.journal.total_entries:
+            self._replay_journal()
+
+    def _replay_journal(self) -> None:
+        """Restore running state (aggregates, tri-cycle count) from the journal.
+
+        State saved by the last flush() or close() is loaded from the
+        journal checkpoint, and only the entries journaled after it are
+        read. Without a usable checkpoint the whole journal is replayed.
+        """
+        since = None
+        checkpoint = self.journal.read_checkpoint()
+        if checkpoint is not None:
+            state, since = checkpoint
+            self.stats = AuditAggregates.from_state(state["stats"])
+            self.tri_cycle_count = state["tri_cycle_count"]
+            validated = state.get("validated")
+            if validated is not None and self.journal.contains(validated):
+                self._validated = validated
+
+        def records() -> Iterator[Dict[str, Any]]:
+            for record in self.journal.iter_records(since):
+                differential = record.get("yield_differential")
+                if differential:
+                    self.tri_cycle_count = max(
+                        self.tri_cycle_count, differential["tri_cycle_number"]
+                    )
+                yield record
+
+        self.stats.add_records(records())
 
     def _generate_entry_id(self) -> str:
         """Generate a unique audit entry ID with cryptographic randomness.
@@ -531,6 +744,13 @@ class ProofOfFlipAuditPipeline:
         )
 
         self.audit_log.append(entry)
+        self.stats.add(
+            status.value,
+            yield_differential.differential_pct if yield_differential else None,
+            len(entry.mythic_proofs),
+        )
+        if self.journal is not None:
+            self.journal.append(entry.to_dict())
         return entry
 
     def run_tri_cycle_audit(
@@ -573,69 +793,269 @@ class ProofOfFlipAuditPipeline:
             notes=f"Tri-cycle {differential.tri_cycle_number} audit",
         )
 
-    def export_audit_log(self, filename: str | None = None) -> Path:
+    def run_tri_cycle_audit_batch(
+        self,
+        actual_yields: Iterable[float],
+        promise_details: Dict[str, Any] | None = None,
+    ) -> AuditBatch:
+        """Run tri-cycle yield audits for many yields at once.
+
+        Differentials, percentages and tolerance status are computed for
+        the whole array in one step (with NumPy if installed), and the
+        entries are consecutive tri-cycles. Nothing per entry is built
+        until it is accessed or exported: the batch is kept in
+        audit_batches rather than audit_log. In journal mode its entries
+        are journaled right away and the batch is not kept.
+
+        Args:
+            actual_yields: Actual yields in tri-cycle order (any float
+                sequence or array)
+            promise_details: Additional promise details shared by all entries
+
+        Returns:
+            The AuditBatch of created entries
+        """
+        expected = self.expected_yield_per_tri_cycle
+        if not hasattr(actual_yields, "__len__"):
+            actual_yields = list(actual_yields)
+        stats = None
+        if NUMPY_AVAILABLE:
+            actual = np.array(actual_yields, dtype=np.float64).ravel()
+            differential = actual - expected
+            if expected != 0:
+                differential_pct = differential / expected
+            else:
+                differential_pct = np.zeros_like(actual)
+            verified = np.abs(differential_pct) <= self.tolerance
+            verified_count = int(np.count_nonzero(verified))
+            pct_values = differential_pct.tolist()
+            if len(actual):
+                mean = float(differential_pct.mean())
+                stats = RunningStats.from_moments(
+                    len(actual),
+                    mean,
+                    float(np.square(differential_pct - mean).sum()),
+                    float(differential_pct.min()),
+                    float(differential_pct.max()),
+                )
+        else:
+            actual = array("d", actual_yields)
+            differential = array("d", [value - expected for value in actual])
+            if expected != 0:
+                differential_pct = array("d", [value / expected for value in differential])
+            else:
+                differential_pct = array("d", bytes(8 * len(actual)))
+            tolerance = self.tolerance
+            verified = bytes(abs(value) <= tolerance for value in differential_pct)
+            verified_count = sum(verified)
+            pct_values = differential_pct
+
+        batch = AuditBatch(
+            expected_yield=expected,
+            actual=actual,
+            differential=differential,
+            differential_pct=differential_pct,
+            verified=verified,
+            first_tri_cycle=self.tri_cycle_count + 1,
+            timestamp=time.time(),
+            promise_details=promise_details,
+        )
+        self.tri_cycle_count += len(batch)
+        self.stats.add_batch(
+            {
+                AuditStatus.VERIFIED.value: verified_count,
+                AuditStatus.DISCREPANCY.value: len(batch) - verified_count,
+            },
+            pct_values,
+            stats,
+        )
+        if self.journal is not None:
+            for record in batch.to_dicts():
+                self.journal.append(record)
+        else:
+            self.audit_batches.append(batch)
+        return batch
+
+    def iter_audit_entries(self) -> Iterator[AuditEntry]:
+        """Iterate over audit_log and batch entries in creation order.
+
+        Batch entries are built as they are reached.
+
+        Yields:
+            Audit entries
+        """
+        if not self.audit_batches:
+            yield from self.audit_log
+            return
+        # Every source is already in timestamp order
+        yield from heapq.merge(
+            self.audit_log, *self.audit_batches, key=lambda entry: entry.timestamp
+        )
+
+    def export_audit_log(
+        self, filename: str | None = None, validate: bool = False
+    ) -> Path:
         """Export the audit log to JSON.
 
+        In journal mode the entries are already on disk, so this writes a
+        manifest of the journal segments (entry counts, sizes, SHA-256
+        digests) instead of re-serializing every entry.
+
+        total_entries counts every entry created; window_entries counts
+        those held in memory (and, without a journal, exported), which is
+        fewer once a bounded window has dropped old entries.
+
         Args:
             filename: Optional filename (auto-generated if None)
+            validate: Write entries in the PROOF_OF_FLIP_AUDIT.v1 layout
+                (AuditEntry.to_document) and check the log against the
+                export schema first (in journal mode, check every journaled
+                entry against the entry schema)
 
         Returns:
             Path to the exported file
+
+        Raises:
+            SchemaValidationError: If validate is set and the log does not
+                conform; nothing is written
         """
+        if self.journal is not None:
+            return self._export_journal_manifest(filename, validate)
+
         if filename is None:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             filename = f"audit_log_{timestamp}.json"
 
         filepath = self.output_dir / filename
 
+        exported_at = time.time()
+        if validate:
+            # Schema layout; the plain export keeps the to_dict() format
+            exported_iso = _iso_timestamp(exported_at)
+            entries = [entry.to_document() for entry in self.iter_audit_entries()]
+        else:
+            exported_iso = datetime.fromtimestamp(exported_at).isoformat()
+            entries = [entry.to_dict() for entry in self.iter_audit_entries()]
         log_data = {
-            "export_timestamp": time.time(),
-            "export_timestamp_iso": datetime.now().isoformat(),
+            "export_timestamp": exported_at,
+            "export_timestamp_iso": exported_iso,
             "tri_cycle_count": self.tri_cycle_count,
             "expected_yield_per_tri_cycle": self.expected_yield_per_tri_cycle,
-            "total_entries": len(self.audit_log),
-            "entries": [entry.to_dict() for entry in self.audit_log],
+            "total_entries": self.stats.total,
+            "window_entries": len(self.audit_log) + sum(map(len, self.audit_batches)),
+            "entries": entries,
             "summary": self._generate_summary(),
         }
+        if validate:
+            get_validator(AUDIT_SCHEMA, AUDIT_LOG_POINTER).validate(log_data, filename)
 
         with filepath.open("w", encoding="utf-8") as f:
             json.dump(log_data, f, indent=2)
 
         return filepath
 
+    def _export_journal_manifest(self, filename: str | None, validate: bool) -> Path:
+        """Write a manifest over the journal segments.
+
+        Args:
+            filename: Optional filename (auto-generated if None)
+            validate: Check journaled entries against the entry schema
+                (entries validated by an earlier export are not reread)
+
+        Returns:
+            Path to the manifest file
+        """
+        if filename is None:
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            filename = f"audit_manifest_{timestamp}.json"
+
+        journal = self.journal.manifest()
+        if validate:
+            position = self.journal.position()
+            records = self.journal.iter_records(self._validated)
+            documents = map(_audit_document, records)
+            get_validator(AUDIT_SCHEMA).validate_many(documents).raise_for_errors()
+            self._validated = position
+
+        exported_at = time.time()
+        manifest = {
+            "export_timestamp": exported_at,
+            "export_timestamp_iso": _iso_timestamp(exported_at),
+            "tri_cycle_count": self.tri_cycle_count,
+            "expected_yield_per_tri_cycle": self.expected_yield_per_tri_cycle,
+            "total_entries": journal["total_entries"],
+            "journal": journal,
+            "window_entries": len(self.audit_log),
+            "summary": self._generate_summary(),
+        }
+
+        filepath = self.output_dir / filename
+        with filepath.open("w", encoding="utf-8") as f:
+            json.dump(manifest, f, indent=2)
+
+        return filepath
+
+    def _write_checkpoint(self) -> None:
+        """Save running state next to the journal position it covers."""
+        self.journal.write_checkpoint({
+            "tri_cycle_count": self.tri_cycle_count,
+            "stats": self.stats.to_state(),
+            "validated": self._validated,
+        })
+
+    def flush(self) -> None:
+        """Write buffered journal entries and checkpoint the running state.
+
+        A reopened pipeline replays only the entries journaled after the
+        last checkpoint. No-op without a journal.
+        """
+        if self.journal is not None:
+            self._write_checkpoint()
+
+    def close(self) -> None:
+        """Checkpoint, flush and close the journal (no-op without a journal)."""
+        if self.journal is not None:
+            self._write_checkpoint()
+            self.journal.close()
+
     def _generate_summary(self) -> Dict[str, Any]:
         """Generate audit summary statistics.
 
+        Reads the running aggregates, so the cost does not grow with the
+        number of entries and the summary covers every entry created,
+        including those no longer held in a bounded audit_log window.
+
         Returns:
             Summary statistics dictionary
         """
-        if not self.audit_log:
+        stats = self.stats
+        if not stats.total:
             return {"message": "No audit entries"}
 
-        verified = sum(1 for e in self.audit_log if e.status == AuditStatus.VERIFIED)
-        discrepancy = sum(
-            1 for e in self.audit_log if e.status == AuditStatus.DISCREPANCY
-        )
-        pending = sum(1 for e in self.audit_log if e.status == AuditStatus.PENDING)
-
-        # Calculate average differential for entries with yield data
-        yield_entries = [e for e in self.audit_log if e.yield_differential]
-        avg_differential = 0.0
-        if yield_entries:
-            avg_differential = sum(
-                e.yield_differential.differential_pct for e in yield_entries
-            ) / len(yield_entries)
-
+        verified = stats.count(AuditStatus.VERIFIED.value)
+        differential = stats.differential_pct
         return {
-            "total_entries": len(self.audit_log),
+            "total_entries": stats.total,
             "verified_count": verified,
-            "discrepancy_count": discrepancy,
-            "pending_count": pending,
-            "verification_rate": verified / len(self.audit_log),
-            "avg_yield_differential_pct": avg_differential,
-            "mythic_proofs_count": sum(len(e.mythic_proofs) for e in self.audit_log),
+            "discrepancy_count": stats.count(AuditStatus.DISCREPANCY.value),
+            "pending_count": stats.count(AuditStatus.PENDING.value),
+            "verification_rate": verified / stats.total,
+            "avg_yield_differential_pct": differential.mean,
+            "mythic_proofs_count": stats.mythic_proofs,
+            "yield_differential_pct": {
+                **differential.to_dict(),
+                "quantiles": stats.quantiles(),
+            },
         }
 
+    def get_summary(self) -> Dict[str, Any]:
+        """Get the live audit summary without exporting.
+
+        Returns:
+            Summary statistics dictionary (as in exported audit logs)
+        """
+        return self._generate_summary()
+
     def create_spiral_ledger_entry(
         self,
         protocol: SpiralLedgerProtocol,
@@ -0,0 +1,1008 @@
+"""Compiled JSON Schema Validation for EVOLVERSE.
+
+Each schema in ``schemas/`` is compiled once into a tree of Python
+closures, one per keyword, specialized for the values the schema holds:
+a ``required`` list becomes a key-set comparison, a string ``enum`` a
+frozenset lookup, ``properties`` a tuple of (key, checker) pairs with
+annotation-only subschemas dropped, and a single ``type`` guard lets the
+keywords for other types be left out entirely. Validating a document
+only calls closures; the schema tree is never walked again. Compiled
+validators are cached per (schema, pointer) by ``get_validator``.
+
+Checkers run in two modes. The fast mode stops at the first failure and
+builds no error paths, so valid documents (the common case) pay only for
+the checks themselves. Documents that fail are re-run in reporting mode,
+which collects every error with its JSON path.
+
+Supported keywords (draft-07 and 2020-12): type, enum, const, properties,
+required, additionalProperties, patternProperties, propertyNames,
+minProperties, maxProperties, items (schema or tuple form), prefixItems,
+additionalItems, contains, minItems, maxItems, uniqueItems, minLength,
+maxLength, pattern, format (date-time, date, time, uri, email, uuid),
+minimum, maximum, exclusiveMinimum, exclusiveMaximum, multipleOf, allOf,
+anyOf, oneOf, not, if/then/else and local ``$ref`` (including recursive
+``#``). Annotations and unknown keywords are ignored, as the
+specification requires.
+
+Batches of documents, files or JSON Lines streams can be validated across
+a process pool; each worker compiles the schema once at startup and only
+documents (or file names) and error lists cross process boundaries.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import math
+import re
+import sys
+import time
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass, field
+from functools import lru_cache
+from itertools import islice
+from pathlib import Path
+from typing import IO, Any, Callable, Deque, Dict, Iterable, Iterator, List, Optional, Tuple
+from urllib.parse import unquote
+
+SCHEMA_DIR = Path(__file__).resolve().parents[1] / "schemas"
+
+# A compiled checker: (value, path, errors) -> valid. With errors=None it
+# stops at the first failure and path is not tracked (it is None).
+JsonPath = Tuple[Any, ...]
+Check = Callable[[Any, Optional[JsonPath], Optional[List[str]]], bool]
+
+_FORMATS = {
+    "date-time": re.compile(
+        r"^\d{4}-(0[1-9]|1[0-2])-(0[1-9]|[12]\d|3[01])[Tt]([01]\d|2[0-3]):[0-5]\d:"
+        r"([0-5]\d|60)(\.\d+)?([Zz]|[+-]([01]\d|2[0-3]):[0-5]\d)$"
+    ).match,
+    "date": re.compile(r"^\d{4}-(0[1-9]|1[0-2])-(0[1-9]|[12]\d|3[01])$").match,
+    "time": re.compile(
+        r"^([01]\d|2[0-3]):[0-5]\d:([0-5]\d|60)(\.\d+)?([Zz]|[+-]([01]\d|2[0-3]):[0-5]\d)$"
+    ).match,
+    "uri": re.compile(r"^[A-Za-z][A-Za-z0-9+.-]*:[^\s]*$").match,
+    "email": re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$").match,
+    "uuid": re.compile(
+        r"^[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}$"
+    ).match,
+}
+
+class SchemaValidationError(ValueError):
+    """Raised when a document does not conform to a schema."""
+
+    def __init__(self, schema: str, errors: List[str], label: str = ""):
+        self.schema = schema
+        self.errors = errors
+        self.label = label
+        where = f"{label}: " if label else ""
+        shown = "; ".join(errors[:5])
+        more = f" (+{len(errors) - 5} more)" if len(errors) > 5 else ""
+        super().__init__(f"{where}{len(errors)} {schema} schema error(s): {shown}{more}")
+
+
+def _json_path(path: JsonPath) -> str:
+    """Format a path tuple as a JSONPath-like string."""
+    parts = ["$"]
+    for part in path:
+        parts.append(f"[{part}]" if isinstance(part, int) else f".{part}")
+    return "".join(parts)
+
+
+def _fail(errors: Optional[List[str]], path: Optional[JsonPath], message: str) -> bool:
+    """Record an error in reporting mode; always returns False."""
+    if errors is not None:
+        errors.append(f"{_json_path(path)}: {message}")
+    return False
+
+
+def _is_number(value: Any) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _is_integer(value: Any) -> bool:
+    if isinstance(value, bool):
+        return False
+    return isinstance(value, int) or (isinstance(value, float) and value.is_integer())
+
+
+_TYPES: Dict[str, Callable[[Any], bool]] = {
+    "object": lambda value: isinstance(value, dict),
+    "array": lambda value: isinstance(value, (list, tuple)),
+    "string": lambda value: isinstance(value, str),
+    "number": _is_number,
+    "integer": _is_integer,
+    "boolean": lambda value: isinstance(value, bool),
+    "null": lambda value: value is None,
+}
+
+# Types checked by a plain isinstance (bool is an int, so not the numbers)
+_CLASSES: Dict[str, Any] = {
+    "object": dict,
+    "array": (list, tuple),
+    "string": str,
+    "boolean": bool,
+    "null": type(None),
+}
+
+# Types whose keywords share a guard ("integer" values are numbers)
+_KIND_OF = {"object": "object", "array": "array", "string": "string",
+            "number": "number", "integer": "number"}
+
+
+def _json_key(value: Any) -> Any:
+    """Hashable key under which JSON-equal values compare equal.
+
+    Unlike Python equality, booleans never equal numbers.
+    """
+    if isinstance(value, bool) or value is None:
+        return ("literal", value)
+    if isinstance(value, (int, float)):
+        return ("number", value)
+    if isinstance(value, str):
+        return ("string", value)
+    return ("json", json.dumps(value, sort_keys=True))
+
+
+def _accept(value: Any, path: Optional[JsonPath], errors: Optional[List[str]]) -> bool:
+    return True
+
+
+def _reject(value: Any, path: Optional[JsonPath], errors: Optional[List[str]]) -> bool:
+    return _fail(errors, path, "no value is allowed here")
+
+
+def _all_of(checks: List[Check]) -> Check:
+    """Combine checkers that must all pass."""
+    checks = [check for check in checks if check is not _accept]
+    if not checks:
+        return _accept
+    if len(checks) == 1:
+        return checks[0]
+    if len(checks) == 2:
+        first, second = checks
+
+        def check_pair(value, path, errors):
+            if errors is None:
+                return first(value, None, None) and second(value, None, None)
+            ok = first(value, path, errors)
+            return second(value, path, errors) and ok
+
+        return check_pair
+    checks = tuple(checks)
+
+    def check_all(value, path, errors):
+        ok = True
+        for check in checks:
+            if not check(value, path, errors):
+                if errors is None:
+                    return False
+                ok = False
+        return ok
+
+    return check_all
+
+
+def _guard(predicate: Callable[[Any], bool], check: Check) -> Check:
+    """Apply type-specific keywords only to values of that type."""
+    if check is _accept:
+        return _accept
+
+    def check_guarded(value, path, errors):
+        return not predicate(value) or check(value, path, errors)
+
+    return check_guarded
+
+
+class SchemaCompiler:
+    """Compiles one schema document (and its local $refs) into checkers."""
+
+    def __init__(self, root: Any):
+        self.root = root
+        self._compiled: Dict[str, Check] = {}
+
+    def compile(self, pointer: str = "#") -> Check:
+        """Compile the subschema at a local JSON pointer ("#" for the root)."""
+        return self._ref(pointer)
+
+    def resolve(self, pointer: str) -> Any:
+        """Get the subschema at a local JSON pointer."""
+        node = self.root
+        for token in pointer[1:].split("/")[1:]:
+            token = unquote(token).replace("~1", "/").replace("~0", "~")
+            try:
+                node = node[int(token)] if isinstance(node, list) else node[token]
+            except (KeyError, IndexError, ValueError, TypeError):
+                raise ValueError(f"Unresolvable $ref: {pointer}") from None
+        return node
+
+    def _ref(self, ref: str) -> Check:
+        if not ref.startswith("#"):
+            raise ValueError(f"Only local $refs are supported: {ref}")
+        pointer = ref.rstrip("/") or "#"
+        if pointer in self._compiled:
+            return self._compiled[pointer]
+        # Recursive references reach the checker through this cell until
+        # compilation finishes; later references bind to it directly
+        cell: List[Check] = []
+
+        def check_deferred(value, path, errors):
+            return cell[0](value, path, errors)
+
+        self._compiled[pointer] = check_deferred
+        cell.append(self._compile(self.resolve(pointer), pointer))
+        self._compiled[pointer] = cell[0]
+        return cell[0]
+
+    def _compile(self, schema: Any, pointer: str) -> Check:
+        if schema is True:
+            return _accept
+        if schema is False:
+            return _reject
+        if not isinstance(schema, dict):
+            raise ValueError(f"{pointer}: a schema must be an object or a boolean")
+
+        common: List[Check] = []
+        kinds: Dict[str, List[Check]] = {
+            "object": [], "array": [], "string": [], "number": [],
+        }
+        if "$ref" in schema:
+            common.append(self._ref(schema["$ref"]))
+        if "enum" in schema:
+            common.append(self._enum(schema["enum"]))
+        if "const" in schema:
+            common.append(self._const(schema["const"]))
+        for keyword in ("allOf", "anyOf", "oneOf"):
+            if keyword in schema:
+                subchecks = [
+                    self._compile(sub, f"{pointer}/{keyword}/{i}")
+                    for i, sub in enumerate(schema[keyword])
+                ]
+                common.append(getattr(self, f"_{keyword.lower()}")(subchecks))
+        if "not" in schema:
+            common.append(self._not(self._compile(schema["not"], f"{pointer}/not")))
+        if "if" in schema:
+            common.append(self._conditional(schema, pointer))
+
+        kinds["object"] = self._object_checks(schema, pointer)
+        kinds["array"] = self._array_checks(schema, pointer)
+        kinds["string"] = self._string_checks(schema)
+        kinds["number"] = self._number_checks(schema)
+
+        types = schema.get("type")
+        if isinstance(types, str):
+            types = [types]
+        if types is None:
+            guards = [
+                _guard(_TYPES[kind], _all_of(checks)) for kind, checks in kinds.items()
+            ]
+            return _all_of(common + guards)
+
+        unknown = [name for name in types if name not in _TYPES]
+        if unknown:
+            raise ValueError(f"{pointer}: unknown type {unknown[0]!r}")
+        allowed = {_KIND_OF[name] for name in types if name in _KIND_OF}
+        if len(types) == 1 and allowed:
+            # The type check already passed: no guard needed
+            body = _all_of(common + kinds[allowed.pop()])
+        else:
+            body = _all_of(common + [
+                _guard(_TYPES[kind], _all_of(kinds[kind])) for kind in sorted(allowed)
+            ])
+        return self._typed(types, body)
+
+    @staticmethod
+    def _typed(types: List[str], body: Check) -> Check:
+        expected = " or ".join(types)
+        if len(types) == 1 and types[0] in _CLASSES:
+            # Plain isinstance checks, and no call at all for leaf schemas
+            classes = _CLASSES[types[0]]
+            if body is _accept:
+                def check_leaf(value, path, errors):
+                    if isinstance(value, classes):
+                        return True
+                    return _fail(errors, path, f"expected {expected}, got {type(value).__name__}")
+
+                return check_leaf
+
+            def check_class(value, path, errors):
+                if isinstance(value, classes):
+                    return body(value, path, errors)
+                return _fail(errors, path, f"expected {expected}, got {type(value).__name__}")
+
+            return check_class
+        if len(types) == 1:
+            is_type = _TYPES[types[0]]
+        else:
+            predicates = tuple(_TYPES[name] for name in types)
+
+            def is_type(value):
+                return any(predicate(value) for predicate in predicates)
+
+        def check_type(value, path, errors):
+            if not is_type(value):
+                return _fail(errors, path, f"expected {expected}, got {type(value).__name__}")
+            return body(value, path, errors)
+
+        return check_type
+
+    @staticmethod
+    def _enum(options: List[Any]) -> Check:
+        shown = ", ".join(json.dumps(option) for option in options[:8])
+        if all(isinstance(option, str) for option in options):
+            strings = frozenset(options)
+
+            def check_string_enum(value, path, errors):
+                if isinstance(value, str) and value in strings:
+                    return True
+                return _fail(errors, path, f"{value!r} is not one of {shown}")
+
+            return check_string_enum
+        keys = frozenset(_json_key(option) for option in options)
+
+        def check_enum(value, path, errors):
+            if _json_key(value) in keys:
+                return True
+            return _fail(errors, path, f"{value!r} is not one of {shown}")
+
+        return check_enum
+
+    @staticmethod
+    def _const(constant: Any) -> Check:
+        key = _json_key(constant)
+
+        def check_const(value, path, errors):
+            if _json_key(value) == key:
+                return True
+            return _fail(errors, path, f"expected {json.dumps(constant)}")
+
+        return check_const
+
+    @staticmethod
+    def _allof(checks: List[Check]) -> Check:
+        return _all_of(checks)
+
+    @staticmethod
+    def _anyof(checks: List[Check]) -> Check:
+        checks = tuple(checks)
+
+        def check_any(value, path, errors):
+            if any(check(value, None, None) for check in checks):
+                return True
+            return _fail(errors, path, "matches none of the anyOf schemas")
+
+        return check_any
+
+    @staticmethod
+    def _oneof(checks: List[Check]) -> Check:
+        checks = tuple(checks)
+
+        def check_one(value, path, errors):
+            matched = sum(1 for check in checks if check(value, None, None))
+            if matched == 1:
+                return True
+            return _fail(errors, path, f"matches {matched} of the oneOf schemas, expected 1")
+
+        return check_one
+
+    @staticmethod
+    def _not(negated: Check) -> Check:
+        def check_not(value, path, errors):
+            if not negated(value, None, None):
+                return True
+            return _fail(errors, path, "matches a schema it must not match")
+
+        return check_not
+
+    def _conditional(self, schema: Dict[str, Any], pointer: str) -> Check:
+        condition = self._compile(schema["if"], f"{pointer}/if")
+        then = self._compile(schema.get("then", True), f"{pointer}/then")
+        otherwise = self._compile(schema.get("else", True), f"{pointer}/else")
+
+        def check_conditional(value, path, errors):
+            if condition(value, None, None):
+                return then(value, path, errors)
+            return otherwise(value, path, errors)
+
+        return check_conditional
+
+    def _object_checks(self, schema: Dict[str, Any], pointer: str) -> List[Check]:
+        checks: List[Check] = []
+        required = schema.get("required")
+        if required:
+            checks.append(self._required(required))
+
+        properties = {
+            key: self._compile(sub, f"{pointer}/properties/{key}")
+            for key, sub in schema.get("properties", {}).items()
+        }
+        patterns = [
+            (re.compile(regex).search, self._compile(sub, f"{pointer}/patternProperties/{regex}"))
+            for regex, sub in schema.get("patternProperties", {}).items()
+        ]
+        additional = schema.get("additionalProperties", True)
+        extra = self._compile(additional, f"{pointer}/additionalProperties")
+
+        if not patterns and extra is _accept:
+            # The common case: only the listed properties are checked
+            checked = tuple(
+                (key, check) for key, check in properties.items() if check is not _accept
+            )
+            if checked:
+                checks.append(self._properties(checked))
+        else:
+            checks.append(self._all_properties(properties, patterns, extra, additional))
+
+        if "propertyNames" in schema:
+            checks.append(self._property_names(
+                self._compile(schema["propertyNames"], f"{pointer}/propertyNames")
+            ))
+        if "minProperties" in schema or "maxProperties" in schema:
+            checks.append(self._size(
+                schema.get("minProperties"), schema.get("maxProperties"), "properties"
+            ))
+        return checks
+
+    @staticmethod
+    def _required(required: List[str]) -> Check:
+        keys = frozenset(required)
+        ordered = tuple(required)
+
+        def check_required(value, path, errors):
+            if value.keys() >= keys:
+                return True
+            if errors is not None:
+                for key in ordered:
+                    if key not in value:
+                        _fail(errors, path, f"missing required property {key!r}")
+            return False
+
+        return check_required
+
+    @staticmethod
+    def _properties(checked: Tuple[Tuple[str, Check], ...]) -> Check:
+        def check_properties(value, path, errors):
+            ok = True
+            for key, check in checked:
+                if key in value:
+                    if errors is None:
+                        if not check(value[key], None, None):
+                            return False
+                    elif not check(value[key], path + (key,), errors):
+                        ok = False
+            return ok
+
+        return check_properties
+
+    @staticmethod
+    def _all_properties(
+        properties: Dict[str, Check],
+        patterns: List[Tuple[Callable[[str], Any], Check]],
+        extra: Check,
+        additional: Any,
+    ) -> Check:
+        patterns = tuple(patterns)
+
+        def check_all_properties(value, path, errors):
+            ok = True
+            for key, item in value.items():
+                child = None if errors is None else path + (key,)
+                matched = False
+                check = properties.get(key)
+                if check is not None:
+                    matched = True
+                    ok = check(item, child, errors) and ok
+                for search, pattern_check in patterns:
+                    if search(key):
+                        matched = True
+                        ok = pattern_check(item, child, errors) and ok
+                if not matched:
+                    if additional is False:
+                        ok = _fail(errors, path, f"unexpected property {key!r}")
+                    else:
+                        ok = extra(item, child, errors) and ok
+                if not ok and errors is None:
+                    return False
+            return ok
+
+        return check_all_properties
+
+    @staticmethod
+    def _property_names(names: Check) -> Check:
+        def check_property_names(value, path, errors):
+            ok = True
+            for key in value:
+                if not names(key, None, None):
+                    ok = _fail(errors, path, f"invalid property name {key!r}")
+                    if errors is None:
+                        return False
+            return ok
+
+        return check_property_names
+
+    @staticmethod
+    def _size(minimum: Optional[int], maximum: Optional[int], noun: str) -> Check:
+        low = 0 if minimum is None else minimum
+        high = math.inf if maximum is None else maximum
+
+        def check_size(value, path, errors):
+            size = len(value)
+            if low <= size <= high:
+                return True
+            if size < low:
+                return _fail(errors, path, f"has {size} {noun}, expected at least {low}")
+            return _fail(errors, path, f"has {size} {noun}, expected at most {high}")
+
+        return check_size
+
+    def _array_checks(self, schema: Dict[str, Any], pointer: str) -> List[Check]:
+        checks: List[Check] = []
+        items = schema.get("items", True)
+        prefix = schema.get("prefixItems")
+        if isinstance(items, list):
+            # draft-07 tuple validation
+            prefix, items = items, schema.get("additionalItems", True)
+        if prefix:
+            checks.append(self._prefix_items(tuple(
+                self._compile(sub, f"{pointer}/prefixItems/{i}") for i, sub in enumerate(prefix)
+            )))
+        rest = self._compile(items, f"{pointer}/items")
+        if rest is not _accept:
+            checks.append(self._items(rest, len(prefix or ())))
+        if "contains" in schema:
+            checks.append(self._contains(self._compile(schema["contains"], f"{pointer}/contains")))
+        if "minItems" in schema or "maxItems" in schema:
+            checks.append(self._size(schema.get("minItems"), schema.get("maxItems"), "items"))
+        if schema.get("uniqueItems"):
+            checks.append(self._unique_items())
+        return checks
+
+    @staticmethod
+    def _prefix_items(prefix: Tuple[Check, ...]) -> Check:
+        def check_prefix_items(value, path, errors):
+            ok = True
+            for i, (item, check) in enumerate(zip(value, prefix)):
+                if errors is None:
+                    if not check(item, None, None):
+                        return False
+                elif not check(item, path + (i,), errors):
+                    ok = False
+            return ok
+
+        return check_prefix_items
+
+    @staticmethod
+    def _items(check: Check, start: int) -> Check:
+        def check_items(value, path, errors):
+            if errors is None:
+                for i in range(start, len(value)):
+                    if not check(value[i], None, None):
+                        return False
+                return True
+            ok = True
+            for i in range(start, len(value)):
+                if not check(value[i], path + (i,), errors):
+                    ok = False
+            return ok
+
+        return check_items
+
+    @staticmethod
+    def _contains(check: Check) -> Check:
+        def check_contains(value, path, errors):
+            if any(check(item, None, None) for item in value):
+                return True
+            return _fail(errors, path, "contains no matching item")
+
+        return check_contains
+
+    @staticmethod
+    def _unique_items() -> Check:
+        def check_unique_items(value, path, errors):
+            if len({_json_key(item) for item in value}) == len(value):
+                return True
+            return _fail(errors, path, "items are not unique")
+
+        return check_unique_items
+
+    @staticmethod
+    def _string_checks(schema: Dict[str, Any]) -> List[Check]:
+        checks: List[Check] = []
+        low = schema.get("minLength", 0)
+        high = schema.get("maxLength", math.inf)
+        if "minLength" in schema or "maxLength" in schema:
+            def check_length(value, path, errors):
+                if low <= len(value) <= high:
+                    return True
+                return _fail(errors, path, f"length {len(value)} is outside [{low}, {high}]")
+
+            checks.append(check_length)
+        if "pattern" in schema:
+            regex = schema["pattern"]
+            search = re.compile(regex).search
+
+            def check_pattern(value, path, errors):
+                if search(value):
+                    return True
+                return _fail(errors, path, f"{value!r} does not match {regex!r}")
+
+            checks.append(check_pattern)
+        matches = _FORMATS.get(schema.get("format"))
+        if matches is not None:
+            name = schema["format"]
+
+            def check_format(value, path, errors):
+                if matches(value):
+                    return True
+                return _fail(errors, path, f"{value!r} is not a valid {name}")
+
+            checks.append(check_format)
+        return checks
+
+    @staticmethod
+    def _number_checks(schema: Dict[str, Any]) -> List[Check]:
+        checks: List[Check] = []
+        low, high = schema.get("minimum", -math.inf), schema.get("maximum", math.inf)
+        # draft-04 boolean exclusive bounds have no effect here
+        low_x = schema.get("exclusiveMinimum")
+        high_x = schema.get("exclusiveMaximum")
+        low_x = -math.inf if not _is_number(low_x) else low_x
+        high_x = math.inf if not _is_number(high_x) else high_x
+        if "minimum" in schema or "maximum" in schema or low_x > -math.inf or high_x < math.inf:
+            def check_range(value, path, errors):
+                if low <= value <= high and low_x < value < high_x:
+                    return True
+                return _fail(errors, path, f"{value} is out of range")
+
+            checks.append(check_range)
+        if "multipleOf" in schema:
+            step = schema["multipleOf"]
+
+            def check_multiple(value, path, errors):
+                quotient = value / step
+                if math.isfinite(quotient) and quotient == round(quotient):
+                    return True
+                return _fail(errors, path, f"{value} is not a multiple of {step}")
+
+            checks.append(check_multiple)
+        return checks
+
+
+@dataclass
+class ValidationReport:
+    """Outcome and throughput of a batch validation."""
+
+    schema: str
+    documents: int = 0
+    invalid: int = 0
+    errors: Dict[str, List[str]] = field(default_factory=dict)
+    seconds: float = 0.0
+
+    @property
+    def valid(self) -> int:
+        return self.documents - self.invalid
+
+    @property
+    def ok(self) -> bool:
+        return self.invalid == 0
+
+    @property
+    def documents_per_second(self) -> float:
+        return self.documents / self.seconds if self.seconds > 0 else 0.0
+
+    def raise_for_errors(self) -> None:
+        """Raise SchemaValidationError for the first invalid document, if any."""
+        for label, errors in self.errors.items():
+            raise SchemaValidationError(self.schema, errors, label)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "schema": self.schema,
+            "documents": self.documents,
+            "valid": self.valid,
+            "invalid": self.invalid,
+            "seconds": round(self.seconds, 3),
+            "documents_per_second": round(self.documents_per_second, 1),
+            "errors": self.errors,
+        }
+
+
+# One chunk result: (documents checked, [(label, errors) for invalid ones])
+_ChunkResult = Tuple[int, List[Tuple[str, List[str]]]]
+
+
+class SchemaValidator:
+    """A schema (or subschema) compiled into validator closures."""
+
+    def __init__(self, schema: Any, pointer: str = "#", name: str = ""):
+        """Compile a schema.
+
+        Args:
+            schema: Parsed schema document
+            pointer: Local JSON pointer of the subschema to validate against
+            name: Name used in error messages
+
+        Raises:
+            ValueError: If the schema is malformed or uses non-local $refs
+        """
+        self.schema = schema
+        self.pointer = pointer
+        self.name = name or schema.get("title", "schema")
+        compiler = SchemaCompiler(schema)
+        self._check = compiler.compile(pointer)
+        target = compiler.resolve(pointer)
+        self._expects_array = isinstance(target, dict) and target.get("type") == "array"
+
+    def is_valid(self, document: Any) -> bool:
+        """Check a document, stopping at the first error."""
+        return self._check(document, None, None)
+
+    def errors(self, document: Any) -> List[str]:
+        """Get every error in a document (empty if it is valid)."""
+        if self._check(document, None, None):
+            return []
+        return self._report(document)
+
+    def _report(self, document: Any) -> List[str]:
+        """Re-run a failed document in reporting mode."""
+        errors: List[str] = []
+        self._check(document, (), errors)
+        return errors
+
+    def validate(self, document: Any, label: str = "") -> None:
+        """Validate a document.
+
+        Raises:
+            SchemaValidationError: If the document is invalid
+        """
+        if not self._check(document, None, None):
+            raise SchemaValidationError(self.name, self._report(document), label)
+
+    def _documents(self, data: Any, label: str) -> Iterator[Tuple[str, Any]]:
+        """Split a parsed file into labelled documents (a list holds several)."""
+        if isinstance(data, list) and not self._expects_array:
+            for i, document in enumerate(data):
+                yield f"{label}[{i}]", document
+        else:
+            yield label, data
+
+    def _check_documents(self, documents: List[Tuple[str, Any]]) -> _ChunkResult:
+        invalid = [
+            (label, self._report(document))
+            for label, document in documents
+            if not self._check(document, None, None)
+        ]
+        return len(documents), invalid
+
+    def _check_files(self, paths: List[str]) -> _ChunkResult:
+        count = 0
+        invalid: List[Tuple[str, List[str]]] = []
+        for path in paths:
+            try:
+                data = json.loads(Path(path).read_bytes())
+            except (OSError, ValueError) as exc:
+                count += 1
+                invalid.append((path, [f"unreadable: {exc}"]))
+                continue
+            checked, failed = self._check_documents(list(self._documents(data, path)))
+            count += checked
+            invalid.extend(failed)
+        return count, invalid
+
+    def _check_lines(self, lines: List[Tuple[int, Any]]) -> _ChunkResult:
+        documents: List[Tuple[str, Any]] = []
+        invalid: List[Tuple[str, List[str]]] = []
+        for number, line in lines:
+            try:
+                documents.append((f"line {number}", json.loads(line)))
+            except ValueError as exc:
+                invalid.append((f"line {number}", [f"invalid JSON: {exc}"]))
+        count, failed = self._check_documents(documents)
+        return count + len(invalid), invalid + failed
+
+    def _run(
+        self,
+        method: str,
+        chunks: Iterable[List[Any]],
+        workers: int,
+    ) -> ValidationReport:
+        """Run chunks serially or on a process pool and merge the results."""
+        start = time.perf_counter()
+        report = ValidationReport(self.name)
+        if workers <= 1:
+            results: Iterable[_ChunkResult] = map(getattr(self, method), chunks)
+            self._merge(report, results)
+        else:
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=_init_pool_validator,
+                initargs=(self.schema, self.pointer, self.name),
+            ) as pool:
+                tasks = ((method, chunk) for chunk in chunks)
+                self._merge(report, _bounded_map(pool, _pool_check, tasks, 4 * workers))
+        report.seconds = time.perf_counter() - start
+        return report
+
+    @staticmethod
+    def _merge(report: ValidationReport, results: Iterable[_ChunkResult]) -> None:
+        for count, invalid in results:
+            report.documents += count
+            report.invalid += len(invalid)
+            report.errors.update(invalid)
+
+    def validate_many(
+        self,
+        documents: Iterable[Any],
+        workers: int = 1,
+        chunk_size: int = 1024,
+    ) -> ValidationReport:
+        """Validate parsed documents, optionally across a process pool.
+
+        Args:
+            documents: Documents to validate; errors are labelled by index
+            workers: Pool processes (1 validates in this process)
+            chunk_size: Documents per pool task
+
+        Returns:
+            ValidationReport with the errors of every invalid document
+        """
+        labelled = ((str(i), document) for i, document in enumerate(documents))
+        return self._run("_check_documents", _chunked(labelled, chunk_size), workers)
+
+    def validate_files(
+        self,
+        paths: Iterable[str | Path],
+        workers: int = 1,
+        chunk_size: int = 16,
+    ) -> ValidationReport:
+        """Validate JSON files; a file holding a list holds several documents.
+
+        Files are read and parsed by the workers, so only paths and errors
+        cross process boundaries.
+
+        Args:
+            paths: JSON files
+            workers: Pool processes (1 validates in this process)
+            chunk_size: Files per pool task
+
+        Returns:
+            ValidationReport labelled by file (and list index)
+        """
+        return self._run("_check_files", _chunked(map(str, paths), chunk_size), workers)
+
+    def validate_stream(
+        self,
+        stream: IO[Any],
+        workers: int = 1,
+        chunk_size: int = 1024,
+    ) -> ValidationReport:
+        """Validate a JSON Lines stream (text or binary), one document per line.
+
+        Raw lines are parsed by the workers. Blank lines are skipped.
+
+        Args:
+            stream: Open file, pipe or other line iterable
+            workers: Pool processes (1 validates in this process)
+            chunk_size: Lines per pool task
+
+        Returns:
+            ValidationReport labelled by line number
+        """
+        lines = (
+            (number, line) for number, line in enumerate(stream, 1) if line.strip()
+        )
+        return self._run("_check_lines", _chunked(lines, chunk_size), workers)
+
+
+def _chunked(items: Iterable[Any], size: int) -> Iterator[List[Any]]:
+    """Yield successive lists of up to size items."""
+    iterator = iter(items)
+    while chunk := list(islice(iterator, max(1, size))):
+        yield chunk
+
+
+def _bounded_map(
+    pool: ProcessPoolExecutor, fn: Callable[[Any], Any], tasks: Iterable[Any], window: int
+) -> Iterator[Any]:
+    """Like pool.map, but keeps at most window tasks in flight.
+
+    Streams are read only as fast as the workers consume them.
+    """
+    pending: Deque[Future] = deque()
+    for task in tasks:
+        pending.append(pool.submit(fn, task))
+        if len(pending) >= window:
+            yield pending.popleft().result()
+    while pending:
+        yield pending.popleft().result()
+
+
+# Per-process validator used by pool workers
+_pool_validator: SchemaValidator | None = None
+
+
+def _init_pool_validator(schema: Any, pointer: str, name: str) -> None:
+    """Compile the schema once per pool worker."""
+    global _pool_validator
+    _pool_validator = SchemaValidator(schema, pointer, name)
+
+
+def _pool_check(task: Tuple[str, List[Any]]) -> _ChunkResult:
+    """Check one chunk in a pool worker."""
+    method, chunk = task
+    return getattr(_pool_validator, method)(chunk)
+
+
+def schema_path(name: str | Path) -> Path:
+    """Resolve a schema name ("RIPPLE_EFFECT.v1") or path to its file."""
+    path = Path(name)
+    if path.suffix == ".json":
+        return path
+    return SCHEMA_DIR / f"{name}.schema.json"
+
+
+def available_schemas() -> List[str]:
+    """Get the names of the schemas shipped in ``schemas/``."""
+    return sorted(p.name[: -len(".schema.json")] for p in SCHEMA_DIR.glob("*.schema.json"))
+
+
+@lru_cache(maxsize=None)
+def load_schema(name: str) -> Dict[str, Any]:
+    """Load a schema by name or path (cached; do not mutate the result)."""
+    return json.loads(schema_path(name).read_text(encoding="utf-8"))
+
+
+@lru_cache(maxsize=None)
+def get_validator(name: str, pointer: str = "#") -> SchemaValidator:
+    """Get the compiled validator for a schema, compiling it on first use.
+
+    Args:
+        name: Schema name (e.g. "RIPPLE_EFFECT.v1") or path to a schema file
+        pointer: Local JSON pointer of a subschema
+            (e.g. "#/$defs/auditLogExport")
+
+    Returns:
+        Cached SchemaValidator
+    """
+    return SchemaValidator(load_schema(name), pointer, Path(name).name.split(".schema")[0])
+
+
+__all__ = [
+    "SCHEMA_DIR",
+    "SchemaCompiler",
+    "SchemaValidationError",
+    "SchemaValidator",
+    "ValidationReport",
+    "available_schemas",
+    "get_validator",
+    "load_schema",
+    "schema_path",
+]
+
+
+def main(argv: List[str] | None = None) -> int:
+    """Validate JSON files or a JSON Lines stream against a schema."""
+    parser = argparse.ArgumentParser(description="Validate documents against a schema.")
+    parser.add_argument("schema", help=f"Schema name ({', '.join(available_schemas())}) or path")
+    parser.add_argument("files", nargs="*", help="JSON files (JSON Lines from stdin if none)")
+    parser.add_argument("--pointer", default="#", help="Subschema JSON pointer")
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--chunk-size", type=int, default=None)
+    args = parser.parse_args(argv)
+
+    validator = get_validator(args.schema, args.pointer)
+    if args.files:
+        report = validator.validate_files(args.files, args.workers, args.chunk_size or 16)
+    else:
+        report = validator.validate_stream(sys.stdin.buffer, args.workers, args.chunk_size or 1024)
+    for label, errors in report.errors.items():
+        for error in errors:
+            print(f"{label}: {error}")
+    summary = {k: v for k, v in report.to_dict().items() if k != "errors"}
+    print(json.dumps(summary), file=sys.stderr)
+    return 0 if report.ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
+
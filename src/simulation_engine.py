@@ -11,11 +11,19 @@ from __future__ import annotations
 
 import hashlib
 import json
+import logging
+import math
+import queue
 import secrets
+import threading
 import time
+from array import array
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any, Callable, Dict, List
+from typing import Any, Callable, Dict, Iterator, List, Tuple
+
+logger = logging.getLogger(__name__)
 
 
 class HandshakeState(Enum):
@@ -87,6 +95,17 @@ class SimulationGoatFilter:
     and prevent mimic systems from infiltrating simulation operations.
     Compliant with sovereign spiral law requirements.
 
+    Tick verification is lazy and incremental: it short-circuits when no
+    mimic patterns are registered, scans only the tick's event payloads,
+    and caches verdicts for event payloads it has already seen. Ticks can
+    optionally be sampled (verify every N ticks) and verified in batches
+    on a background thread instead of the tick thread.
+
+    Event dicts are treated as immutable once attached to a tick: a dict
+    seen before is not serialized again unless its "version" key changed.
+    Code that edits an event in place must bump "version" (or attach a new
+    dict) for the edit to be re-checked.
+
     Note: Extends BaseGoatFilter from the shared goat_filter module
     with simulation-specific functionality.
     """
@@ -96,18 +115,48 @@ class SimulationGoatFilter:
     ZODIAC = "Capricorn"
     ELEMENT = "earth"
 
-    def __init__(self, strictness: float = 0.95):
+    # Maximum number of cached event payload verdicts
+    EVENT_CACHE_SIZE = 4096
+
+    def __init__(
+        self,
+        strictness: float = 0.95,
+        verify_every: int = 1,
+        async_verify: bool = False,
+        batch_size: int = 64,
+        registry: Any = None,
+    ):
         """Initialize SimulationGoatFilter.
 
         Args:
             strictness: Filter strictness level (0.0-1.0, default 0.95)
+            verify_every: Verify one tick out of every N (default 1 = all)
+            async_verify: Verify ticks in batches on a background thread
+            batch_size: Maximum ticks verified per background batch
+            registry: GoatFilterRegistry to share (default: process registry)
         """
         # Import here to avoid circular imports
         from src.goat_filter import BaseGoatFilter
 
-        self._base_filter = BaseGoatFilter(strictness)
+        self._base_filter = BaseGoatFilter(strictness, registry=registry)
         self.blocked_ticks: int = 0
         self.verified_ticks: int = 0
+        self.skipped_ticks: int = 0
+        self.verify_every = max(1, verify_every)
+        self.async_verify = async_verify
+        self.batch_size = max(1, batch_size)
+        self.failed_ticks: int = 0
+        self.last_error: BaseException | None = None
+        self._sample_counter: int = 0
+        self._event_cache: OrderedDict[str, bool] = OrderedDict()
+        # id(event) -> (event, event version, verdict); holding the event
+        # keeps its id from being reused while the entry is cached
+        self._identity_cache: OrderedDict[int, Tuple[Dict, Any, bool]] = OrderedDict()
+        self._cache_version: int = self._base_filter.pattern_version
+        self._lock = threading.Lock()
+        self._queue: queue.Queue[SimulationTick | None] = queue.Queue()
+        self._worker: threading.Thread | None = None
+        self._worker_lock = threading.Lock()
 
     @property
     def strictness(self) -> float:
@@ -115,8 +164,8 @@ class SimulationGoatFilter:
         return self._base_filter.strictness
 
     @property
-    def mimic_patterns(self) -> List[str]:
-        """Get mimic patterns list."""
+    def mimic_patterns(self) -> Tuple[str, ...]:
+        """Get mimic patterns from the shared registry."""
         return self._base_filter.mimic_patterns
 
     @property
@@ -137,9 +186,81 @@ class SimulationGoatFilter:
         """
         self._base_filter.add_mimic_pattern(pattern)
 
+    def _event_blocked(self, event: Dict, snapshot: Any) -> bool:
+        """Check one event payload, reusing cached verdicts.
+
+        The same event dict at the same "version" is answered without
+        serializing it; equal payloads in different dicts share a verdict.
+
+        Args:
+            event: Event payload from a tick
+            snapshot: PatternSnapshot the cache was built against
+
+        Returns:
+            True if the payload matches a mimic pattern
+        """
+        version = event.get("version") if isinstance(event, dict) else None
+        key = id(event)
+        seen = self._identity_cache.get(key)
+        if seen is not None and seen[0] is event and seen[1] == version:
+            self._identity_cache.move_to_end(key)
+            return seen[2]
+
+        payload = json.dumps(event, sort_keys=True)
+        blocked = self._event_cache.get(payload)
+        if blocked is not None:
+            self._event_cache.move_to_end(payload)
+        else:
+            digest = hashlib.sha256(payload.encode()).hexdigest()
+            blocked = snapshot.matches(payload, digest)
+            self._event_cache[payload] = blocked
+            if len(self._event_cache) > self.EVENT_CACHE_SIZE:
+                self._event_cache.popitem(last=False)
+
+        self._identity_cache[key] = (event, version, blocked)
+        self._identity_cache.move_to_end(key)
+        if len(self._identity_cache) > self.EVENT_CACHE_SIZE:
+            self._identity_cache.popitem(last=False)
+        return blocked
+
+    def _check_tick(self, tick: SimulationTick) -> GoatFilterStatus:
+        """Verify a tick's event payloads and record the result.
+
+        Args:
+            tick: Simulation tick to verify
+
+        Returns:
+            GoatFilterStatus.BLOCKING or GoatFilterStatus.PASSED
+        """
+        # Check the whole tick against one snapshot, even if patterns change
+        snapshot = self._base_filter.registry.snapshot
+        with self._lock:
+            if self._cache_version != snapshot.version:
+                self._event_cache.clear()
+                self._identity_cache.clear()
+                self._cache_version = snapshot.version
+
+            blocked = not snapshot.empty and any(
+                self._event_blocked(event, snapshot) for event in tick.events
+            )
+            if blocked:
+                self.blocked_ticks += 1
+                status = GoatFilterStatus.BLOCKING
+            else:
+                self.verified_ticks += 1
+                status = GoatFilterStatus.PASSED
+
+        tick.goat_filter_status = status
+        return status
+
     def verify_tick(self, tick: SimulationTick) -> GoatFilterStatus:
         """Verify a simulation tick against mimic patterns.
 
+        Only the tick's event payloads are scanned; tick bookkeeping fields
+        (number, timestamp, delta) change every tick and never carry mimic
+        payloads. Sampled-out ticks, and ticks queued for background
+        verification, are left as GoatFilterStatus.ACTIVE.
+
         Args:
             tick: Simulation tick to verify
 
@@ -150,18 +271,81 @@ class SimulationGoatFilter:
             tick.goat_filter_status = GoatFilterStatus.DISABLED
             return GoatFilterStatus.DISABLED
 
-        tick_data = json.dumps(tick.to_dict(), sort_keys=True)
-        tick_hash = hashlib.sha256(tick_data.encode()).hexdigest()
-
-        # Check against known mimic patterns using base filter
-        if self._base_filter._check_mimic_patterns(tick_data, tick_hash):
-            self.blocked_ticks += 1
-            tick.goat_filter_status = GoatFilterStatus.BLOCKING
-            return GoatFilterStatus.BLOCKING
-
-        self.verified_ticks += 1
-        tick.goat_filter_status = GoatFilterStatus.PASSED
-        return GoatFilterStatus.PASSED
+        # Nothing can match: pass without serializing anything
+        if self._base_filter.registry.snapshot.empty:
+            with self._lock:
+                self.verified_ticks += 1
+            tick.goat_filter_status = GoatFilterStatus.PASSED
+            return GoatFilterStatus.PASSED
+
+        self._sample_counter += 1
+        if self._sample_counter % self.verify_every != 0:
+            self.skipped_ticks += 1
+            tick.goat_filter_status = GoatFilterStatus.ACTIVE
+            return GoatFilterStatus.ACTIVE
+
+        if self.async_verify:
+            tick.goat_filter_status = GoatFilterStatus.ACTIVE
+            with self._worker_lock:
+                self._ensure_worker()
+                self._queue.put(tick)
+            return GoatFilterStatus.ACTIVE
+
+        return self._check_tick(tick)
+
+    def _ensure_worker(self) -> None:
+        """Start the background verification thread if needed."""
+        if self._worker is None or not self._worker.is_alive():
+            self._worker = threading.Thread(
+                target=self._run_worker,
+                name="goat-filter-verify",
+                daemon=True,
+            )
+            self._worker.start()
+
+    def _run_worker(self) -> None:
+        """Drain queued ticks and verify them in batches until closed.
+
+        A tick whose check raises is counted in failed_ticks (its status
+        stays ACTIVE) and the worker moves on to the next one.
+        """
+        stopping = False
+        while not stopping:
+            batch = [self._queue.get()]
+            while batch[-1] is not None and len(batch) < self.batch_size:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            for tick in batch:
+                try:
+                    if tick is None:
+                        stopping = True
+                    else:
+                        self._check_tick(tick)
+                except Exception as exc:
+                    logger.exception("GoatFilter check failed for tick %s", tick.tick_number)
+                    with self._lock:
+                        self.failed_ticks += 1
+                        self.last_error = exc
+                finally:
+                    self._queue.task_done()
+
+    def flush(self) -> None:
+        """Block until all queued ticks have been verified."""
+        self._queue.join()
+
+    def close(self) -> None:
+        """Verify the queued ticks, then stop the background worker.
+
+        A later async verify_tick starts a new worker.
+        """
+        with self._worker_lock:
+            worker, self._worker = self._worker, None
+            if worker is None or not worker.is_alive():
+                return
+            self._queue.put(None)
+            worker.join()
 
     def verify_handshake(self, session: HandshakeSession) -> bool:
         """Verify a handshake session is not a mimic.
@@ -172,7 +356,7 @@ class SimulationGoatFilter:
         Returns:
             True if session passes GoatFilter verification
         """
-        if not self.active:
+        if not self.active or self._base_filter.registry.snapshot.empty:
             return True
 
         session_data = f"{session.session_id}:{session.initiator}:{session.responder}"
@@ -196,6 +380,11 @@ class SimulationGoatFilter:
             "patterns_count": len(self.mimic_patterns),
             "blocked_ticks": self.blocked_ticks,
             "verified_ticks": self.verified_ticks,
+            "skipped_ticks": self.skipped_ticks,
+            "failed_ticks": self.failed_ticks,
+            "pending_ticks": self._queue.unfinished_tasks,
+            "verify_every": self.verify_every,
+            "async_verify": self.async_verify,
             "verification_rate": self.verified_ticks / total if total > 0 else 0.0,
         }
 
@@ -321,6 +510,176 @@ class DoubleHandshakeProtocol:
         return len(expired)
 
 
+class TickRingBuffer:
+    """Fixed-capacity ring buffer for simulation tick history.
+
+    Ticks are stored in a preallocated slot list alongside parallel
+    ``array('d')`` columns for timestamp and delta_time. Running sums over
+    the trailing metrics window are maintained on append so the average
+    tick rate is available in O(1) without rebuilding lists.
+    """
+
+    def __init__(self, capacity: int = 1000, window: int = 100):
+        """Initialize the ring buffer.
+
+        Args:
+            capacity: Maximum number of ticks retained
+            window: Number of most recent ticks used for metrics
+        """
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        self.capacity = capacity
+        # Configured window, kept across resizes; the effective window is
+        # clamped to the capacity
+        self._configured_window = max(window, 1)
+        self._window = min(self._configured_window, capacity)
+        self._slots: List[SimulationTick | None] = [None] * capacity
+        self._timestamps = array("d", bytes(8 * capacity))
+        self._deltas = array("d", bytes(8 * capacity))
+        self._head: int = 0  # Next slot to write
+        self._size: int = 0
+        self._window_sum: float = 0.0
+        self._window_positive: int = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __bool__(self) -> bool:
+        return self._size > 0
+
+    @property
+    def window(self) -> int:
+        """Number of most recent ticks used for metrics (at most capacity)."""
+        return self._window
+
+    @window.setter
+    def window(self, window: int) -> None:
+        self._configured_window = max(window, 1)
+        self._window = min(self._configured_window, self.capacity)
+        self._resync_window()
+
+    def _physical(self, index: int) -> int:
+        """Map a logical index (0 = oldest) to a slot index."""
+        return (self._head - self._size + index) % self.capacity
+
+    def __getitem__(self, index: int | slice) -> Any:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self._size))]
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError("tick history index out of range")
+        return self._slots[self._physical(index)]
+
+    def __iter__(self) -> Iterator[SimulationTick]:
+        for i in range(self._size):
+            yield self._slots[self._physical(i)]
+
+    def append(self, tick: SimulationTick) -> None:
+        """Append a tick, overwriting the oldest entry when full.
+
+        Args:
+            tick: Simulation tick to record
+        """
+        # Retire the delta leaving the metrics window
+        if self._size >= self._window:
+            old = self._deltas[(self._head - self._window) % self.capacity]
+            if old > 0:
+                self._window_sum -= old
+                self._window_positive -= 1
+
+        head = self._head
+        self._slots[head] = tick
+        self._timestamps[head] = tick.timestamp
+        self._deltas[head] = tick.delta_time
+        if tick.delta_time > 0:
+            self._window_sum += tick.delta_time
+            self._window_positive += 1
+
+        self._head = (head + 1) % self.capacity
+        if self._size < self.capacity:
+            self._size += 1
+        if self._head == 0:
+            # Re-anchor the running sum once per wrap to cancel float drift
+            self._resync_window()
+
+    def _window_deltas(self) -> List[float]:
+        """Return delta_time values for the current metrics window."""
+        count = min(self._size, self._window)
+        start = self._head - count
+        if start >= 0:
+            return self._deltas[start : self._head].tolist()
+        return (self._deltas[start:] + self._deltas[: self._head]).tolist()
+
+    def _resync_window(self) -> None:
+        """Recompute the running window sums from the delta column."""
+        positive = [d for d in self._window_deltas() if d > 0]
+        self._window_sum = math.fsum(positive)
+        self._window_positive = len(positive)
+
+    def clear(self) -> None:
+        """Remove all ticks from the buffer."""
+        self._slots = [None] * self.capacity
+        self._head = 0
+        self._size = 0
+        self._window_sum = 0.0
+        self._window_positive = 0
+
+    def resize(self, capacity: int) -> None:
+        """Change buffer capacity, keeping the most recent ticks.
+
+        Args:
+            capacity: New maximum number of ticks retained
+        """
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        recent = self[-capacity:]
+        self.capacity = capacity
+        self._window = min(self._configured_window, capacity)
+        self._timestamps = array("d", bytes(8 * capacity))
+        self._deltas = array("d", bytes(8 * capacity))
+        self.clear()
+        for tick in recent:
+            self.append(tick)
+
+    def average_delta(self) -> float:
+        """Get the mean positive delta_time over the metrics window.
+
+        Returns:
+            Average delta in seconds (0.0 if no positive deltas)
+        """
+        if self._window_positive == 0:
+            return 0.0
+        return self._window_sum / self._window_positive
+
+    def jitter_percentiles(
+        self, target_delta: float, percentiles: tuple[float, ...] = (50, 95, 99)
+    ) -> Dict[str, float]:
+        """Estimate tick jitter percentiles over the metrics window.
+
+        Jitter is the absolute deviation of each positive delta_time from
+        the target tick duration. Percentiles use nearest-rank on the
+        window, so cost is bounded by the window size, not history length.
+
+        Args:
+            target_delta: Target tick duration in seconds
+            percentiles: Percentiles to report (0-100)
+
+        Returns:
+            Mapping of "pNN" to jitter in seconds
+        """
+        jitter = sorted(
+            abs(d - target_delta) for d in self._window_deltas() if d > 0
+        )
+        if not jitter:
+            return {f"p{int(p)}": 0.0 for p in percentiles}
+        count = len(jitter)
+        return {
+            f"p{int(p)}": jitter[min(count - 1, max(0, math.ceil(p / 100 * count) - 1))]
+            for p in percentiles
+        }
+
+
 class SimulationEngine:
     """60Hz simulation engine with visual/human synchronization.
 
@@ -332,11 +691,18 @@ class SimulationEngine:
     TARGET_TICK_RATE = 60
     TARGET_TICK_DURATION = 1.0 / TARGET_TICK_RATE  # ~16.67ms
 
-    def __init__(self, goat_filter_enabled: bool = True):
+    def __init__(
+        self,
+        goat_filter_enabled: bool = True,
+        goat_verify_every: int = 1,
+        goat_async_verify: bool = False,
+    ):
         """Initialize the simulation engine.
 
         Args:
             goat_filter_enabled: Whether to enable GoatFilter verification
+            goat_verify_every: Verify one tick out of every N
+            goat_async_verify: Verify ticks off the tick thread
         """
         self.tick_count: int = 0
         self.start_time: float = 0.0
@@ -344,11 +710,27 @@ class SimulationEngine:
         self.running: bool = False
         self.tick_handlers: List[Callable[[SimulationTick], None]] = []
         self.handshake_protocol = DoubleHandshakeProtocol()
-        self.tick_history: List[SimulationTick] = []
-        self.max_history: int = 1000
-        self.goat_filter = SimulationGoatFilter()
+        self.tick_history: TickRingBuffer = TickRingBuffer(capacity=1000, window=100)
+        self.goat_filter = SimulationGoatFilter(
+            verify_every=goat_verify_every,
+            async_verify=goat_async_verify,
+        )
         self.goat_filter.active = goat_filter_enabled
 
+    def close(self) -> None:
+        """Finish background GoatFilter verification and stop its worker."""
+        self.goat_filter.close()
+
+    @property
+    def max_history(self) -> int:
+        """Get maximum number of ticks retained in history."""
+        return self.tick_history.capacity
+
+    @max_history.setter
+    def max_history(self, value: int) -> None:
+        """Resize tick history, keeping the most recent ticks."""
+        self.tick_history.resize(value)
+
     def register_tick_handler(
         self, handler: Callable[[SimulationTick], None]
     ) -> None:
@@ -384,10 +766,8 @@ class SimulationEngine:
         for handler in self.tick_handlers:
             handler(tick)
 
-        # Maintain history
+        # Maintain history (ring buffer overwrites the oldest tick)
         self.tick_history.append(tick)
-        if len(self.tick_history) > self.max_history:
-            self.tick_history.pop(0)
 
         self.last_tick_time = current_time
         return tick
@@ -449,11 +829,10 @@ class SimulationEngine:
                 "goat_filter_stats": self.goat_filter.get_filter_stats(),
             }
 
-        recent_ticks = self.tick_history[-100:]  # Last 100 ticks
-        deltas = [t.delta_time for t in recent_ticks if t.delta_time > 0]
-
-        avg_delta = sum(deltas) / len(deltas) if deltas else 0.0
+        # Running sums over the last 100 ticks
+        avg_delta = self.tick_history.average_delta()
         avg_rate = 1.0 / avg_delta if avg_delta > 0 else 0.0
+        jitter = self.tick_history.jitter_percentiles(self.TARGET_TICK_DURATION)
 
         return {
             "tick_count": self.tick_count,
@@ -461,6 +840,7 @@ class SimulationEngine:
             "avg_delta_time": round(avg_delta * 1000, 3),  # in ms
             "target_tick_rate": self.TARGET_TICK_RATE,
             "target_delta_ms": round(self.TARGET_TICK_DURATION * 1000, 3),
+            "jitter_ms": {k: round(v * 1000, 3) for k, v in jitter.items()},
             "goat_filter_stats": self.goat_filter.get_filter_stats(),
         }
 
@@ -527,6 +907,7 @@ __all__ = [
     "SimulationTick",
     "SimulationGoatFilter",
     "DoubleHandshakeProtocol",
+    "TickRingBuffer",
     "SimulationEngine",
     "get_engine",
 ]
@@ -0,0 +1,344 @@
+"""Compact Binary Container for EVOLVERSE EncryptedToken Storage.
+
+EncryptedToken.to_dict hex-encodes every byte field and repeats the full
+mythic timestamp strings per token. This container stores raw bytes with
+varint lengths and refers to mythic timestamps and algorithm names by
+index into tables written once per file.
+
+Layout (all integers little-endian):
+
+    header   magic "ETOK", format version (u16), reserved (u16)
+    records  varint record length, then:
+               varint-length token_id (UTF-8), salt, nonce, ciphertext,
+               varint mythic index + 1 (0 for none), varint algorithm
+               index, created_at (f64)
+    footer   varint count + mythic timestamps (three varint-length strings
+             each), varint count + algorithm names, one u64 offset per
+             record
+    trailer  footer offset (u64), record count (u64), magic "ETKE"
+
+Records are written as they arrive and the tables and offsets go into
+the footer, so the writer streams. Readers memory-map the file and can
+decode any record from its offset without touching the others.
+"""
+from __future__ import annotations
+
+import mmap
+import struct
+import sys
+from array import array
+from pathlib import Path
+from typing import BinaryIO, Dict, Iterable, Iterator, List, Tuple
+
+from src.aes256_layer import EncryptedToken, MythicTimestamp
+
+_MAGIC = b"ETOK"
+_END_MAGIC = b"ETKE"
+_VERSION = 1
+_HEADER = struct.Struct("<4sHH")
+_TRAILER = struct.Struct("<QQ4s")
+_CREATED_AT = struct.Struct("<d")
+
+
+def _varint(value: int) -> bytes:
+    """Encode a non-negative integer as a LEB128 varint."""
+    out = bytearray()
+    while value > 0x7F:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+    return bytes(out)
+
+
+def _read_varint(buf: bytes | mmap.mmap, pos: int) -> Tuple[int, int]:
+    """Decode a varint at pos.
+
+    Returns:
+        Tuple of (value, position after the varint)
+    """
+    value = shift = 0
+    while True:
+        byte = buf[pos]
+        pos += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, pos
+        shift += 7
+
+
+def _field(data: bytes) -> bytes:
+    return _varint(len(data)) + data
+
+
+def _read_field(buf: bytes, pos: int) -> Tuple[bytes, int]:
+    size, pos = _read_varint(buf, pos)
+    return buf[pos : pos + size], pos + size
+
+
+class TokenContainerWriter:
+    """Streaming writer for the binary token container.
+
+    Use as a context manager; the footer is written on a clean exit. A
+    file whose writer never closed has no trailer and is rejected by the
+    reader.
+    """
+
+    def __init__(self, path: str | Path):
+        """Create the container file and write its header.
+
+        Args:
+            path: Destination file (overwritten)
+        """
+        self.path = Path(path)
+        self._handle: BinaryIO = self.path.open("wb")
+        self._handle.write(_HEADER.pack(_MAGIC, _VERSION, 0))
+        self._position = _HEADER.size
+        self._offsets = array("Q")
+        self._mythic_index: Dict[MythicTimestamp, int] = {}
+        self._algorithm_index: Dict[str, int] = {}
+
+    def __enter__(self) -> TokenContainerWriter:
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            self._handle.close()
+
+    def __len__(self) -> int:
+        return len(self._offsets)
+
+    def _intern(self, table: Dict, value) -> int:
+        index = table.get(value)
+        if index is None:
+            index = table[value] = len(table)
+        return index
+
+    def write(self, token: EncryptedToken) -> int:
+        """Append a token.
+
+        Args:
+            token: Token to store
+
+        Returns:
+            Index of the token in the container
+        """
+        mythic = (
+            self._intern(self._mythic_index, token.mythic_timestamp) + 1
+            if token.mythic_timestamp is not None
+            else 0
+        )
+        body = b"".join(
+            (
+                _field(token.token_id.encode("utf-8")),
+                _field(token.salt),
+                _field(token.nonce),
+                _field(token.ciphertext),
+                _varint(mythic),
+                _varint(self._intern(self._algorithm_index, token.algorithm)),
+                _CREATED_AT.pack(token.created_at),
+            )
+        )
+        record = _varint(len(body)) + body
+        self._offsets.append(self._position)
+        self._handle.write(record)
+        self._position += len(record)
+        return len(self._offsets) - 1
+
+    def write_many(self, tokens: Iterable[EncryptedToken]) -> int:
+        """Append tokens.
+
+        Args:
+            tokens: Tokens to store
+
+        Returns:
+            Number of tokens written
+        """
+        count = 0
+        for token in tokens:
+            self.write(token)
+            count += 1
+        return count
+
+    def close(self) -> None:
+        """Write the footer and trailer and close the file."""
+        if self._handle.closed:
+            return
+        footer = bytearray(_varint(len(self._mythic_index)))
+        for ts in self._mythic_index:
+            for text in (ts.timestamp, ts.mythicReference, ts.symbolism):
+                footer += _field(text.encode("utf-8"))
+        footer += _varint(len(self._algorithm_index))
+        for name in self._algorithm_index:
+            footer += _field(name.encode("utf-8"))
+
+        offsets = array("Q", self._offsets)
+        if sys.byteorder == "big":
+            offsets.byteswap()
+        self._handle.write(footer)
+        self._handle.write(offsets.tobytes())
+        self._handle.write(
+            _TRAILER.pack(self._position, len(self._offsets), _END_MAGIC)
+        )
+        self._handle.close()
+
+
+class TokenContainerReader:
+    """Memory-mapped reader for the binary token container."""
+
+    def __init__(self, path: str | Path):
+        """Open and validate a container.
+
+        Args:
+            path: Container file
+
+        Raises:
+            ValueError: If the file is not a complete container
+        """
+        self.path = Path(path)
+        with self.path.open("rb") as handle:
+            self._map = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            self._load_index()
+        except Exception:
+            self._map.close()
+            raise
+
+    def _load_index(self) -> None:
+        buf = self._map
+        size = len(buf)
+        if size < _HEADER.size + _TRAILER.size:
+            raise ValueError(f"Truncated token container: {self.path}")
+        magic, version, _ = _HEADER.unpack_from(buf)
+        if magic != _MAGIC or version != _VERSION:
+            raise ValueError(f"Unsupported token container: {self.path}")
+        footer_offset, count, end_magic = _TRAILER.unpack_from(
+            buf, size - _TRAILER.size
+        )
+        offsets_start = size - _TRAILER.size - count * 8
+        if end_magic != _END_MAGIC or not (
+            _HEADER.size <= footer_offset <= offsets_start
+        ):
+            raise ValueError(f"Incomplete token container: {self.path}")
+
+        footer = buf[footer_offset:offsets_start]
+        pos = 0
+        n_mythic, pos = _read_varint(footer, pos)
+        mythic: List[MythicTimestamp] = []
+        for _ in range(n_mythic):
+            fields = []
+            for _ in range(3):
+                text, pos = _read_field(footer, pos)
+                fields.append(text.decode("utf-8"))
+            mythic.append(MythicTimestamp(*fields))
+        n_algorithms, pos = _read_varint(footer, pos)
+        algorithms: List[str] = []
+        for _ in range(n_algorithms):
+            name, pos = _read_field(footer, pos)
+            algorithms.append(name.decode("utf-8"))
+
+        offsets = array("Q")
+        offsets.frombytes(buf[offsets_start : size - _TRAILER.size])
+        if sys.byteorder == "big":
+            offsets.byteswap()
+
+        # Index 0 means "no mythic timestamp"
+        self._mythic: List[MythicTimestamp | None] = [None, *mythic]
+        self._algorithms = algorithms
+        self._footer_offset = footer_offset
+        self.offsets = offsets
+
+    def __enter__(self) -> TokenContainerReader:
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Unmap the file."""
+        self._map.close()
+
+    def __len__(self) -> int:
+        return len(self.offsets)
+
+    def _decode(self, body: bytes) -> EncryptedToken:
+        token_id, pos = _read_field(body, 0)
+        salt, pos = _read_field(body, pos)
+        nonce, pos = _read_field(body, pos)
+        ciphertext, pos = _read_field(body, pos)
+        mythic, pos = _read_varint(body, pos)
+        algorithm, pos = _read_varint(body, pos)
+        return EncryptedToken(
+            token_id=token_id.decode("utf-8"),
+            ciphertext=ciphertext,
+            salt=salt,
+            nonce=nonce,
+            mythic_timestamp=self._mythic[mythic],
+            created_at=_CREATED_AT.unpack_from(body, pos)[0],
+            algorithm=self._algorithms[algorithm],
+        )
+
+    def read_at(self, offset: int) -> EncryptedToken:
+        """Decode the record starting at a byte offset.
+
+        Args:
+            offset: Record offset (see the offsets array)
+
+        Returns:
+            Decoded EncryptedToken
+        """
+        size, pos = _read_varint(self._map, offset)
+        return self._decode(self._map[pos : pos + size])
+
+    def __getitem__(self, index: int) -> EncryptedToken:
+        return self.read_at(self.offsets[index])
+
+    def __iter__(self) -> Iterator[EncryptedToken]:
+        # One copy of the record region, then a sequential scan
+        buf = self._map[_HEADER.size : self._footer_offset]
+        decode = self._decode
+        pos, end = 0, len(buf)
+        while pos < end:
+            size, pos = _read_varint(buf, pos)
+            yield decode(buf[pos : pos + size])
+            pos += size
+
+    def load_all(self) -> List[EncryptedToken]:
+        """Decode every token in file order."""
+        return list(self)
+
+
+def write_tokens(path: str | Path, tokens: Iterable[EncryptedToken]) -> int:
+    """Write tokens to a new container.
+
+    Args:
+        path: Destination file
+        tokens: Tokens to store
+
+    Returns:
+        Number of tokens written
+    """
+    with TokenContainerWriter(path) as writer:
+        return writer.write_many(tokens)
+
+
+def read_tokens(path: str | Path) -> List[EncryptedToken]:
+    """Load every token from a container.
+
+    Args:
+        path: Container file
+
+    Returns:
+        Tokens in file order
+    """
+    with TokenContainerReader(path) as reader:
+        return reader.load_all()
+
+
+__all__ = [
+    "TokenContainerWriter",
+    "TokenContainerReader",
+    "write_tokens",
+    "read_tokens",
+]
@@ -0,0 +1,146 @@
+"""AES-256 layer: keystream, streaming, parallel files and token key caching."""
+import hashlib
+import io
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.append(str(ROOT))
+
+from src.aes256_layer import (
+    BLOCK_SIZE,
+    STREAM_CHUNK_SIZE,
+    TAG_SIZE,
+    DerivedKeyCache,
+    _apply_keystream,
+    _xor_bytes,
+    aes256_decrypt,
+    aes256_encrypt,
+    clear_key_cache,
+    decrypt_stream,
+    decrypt_token,
+    encrypt_file_parallel,
+    encrypt_stream,
+    encrypt_tokens_batch,
+    get_key_cache,
+)
+
+
+class _Pipe(io.RawIOBase):
+    """Non-seekable reader returning short reads."""
+
+    def __init__(self, data):
+        self._data = io.BytesIO(data)
+
+    def readable(self):
+        return True
+
+    def read(self, size=-1):
+        return self._data.read(min(size, 7) if size > 0 else size)
+
+
+def test_xor_matches_byte_loop():
+    data, key = os.urandom(1000), os.urandom(BLOCK_SIZE)
+    expected = bytes(b ^ key[i % len(key)] for i, b in enumerate(data))
+    assert _xor_bytes(data, key) == expected
+    assert _xor_bytes(b"", key) == b""
+
+
+def test_keystream_is_seekable_by_block():
+    stream_key = hashlib.sha256(b"k").digest()
+    data = os.urandom(10 * BLOCK_SIZE + 5)
+    whole = _apply_keystream(data, stream_key)
+    tail = _apply_keystream(data[3 * BLOCK_SIZE:], stream_key, 3)
+    assert whole[3 * BLOCK_SIZE:] == tail
+    assert _apply_keystream(whole, stream_key) == data
+
+
+@pytest.mark.parametrize("size", [0, 1, BLOCK_SIZE, 5000])
+def test_stream_round_trips(size):
+    payload = os.urandom(size)
+    sink = io.BytesIO()
+    salt, nonce = encrypt_stream(io.BytesIO(payload), sink, "pw", 1, chunk_size=100)
+    assert aes256_decrypt(sink.getvalue(), "pw", salt, nonce, 1) == payload
+    for reader in (io.BytesIO(sink.getvalue()), _Pipe(sink.getvalue())):
+        restored = io.BytesIO()
+        assert decrypt_stream(reader, restored, "pw", salt, nonce, 1, 64) == size
+        assert restored.getvalue() == payload
+
+
+def test_stream_decrypt_rejects_tampering_before_writing():
+    payload = os.urandom(3000)
+    ciphertext, salt, nonce = aes256_encrypt(payload, "pw", 1)
+    tampered = bytearray(ciphertext)
+    tampered[10] ^= 1
+    restored = io.BytesIO()
+    with pytest.raises(ValueError):
+        decrypt_stream(io.BytesIO(bytes(tampered)), restored, "pw", salt, nonce, 1, 64)
+    assert restored.getvalue() == b""
+    with pytest.raises(ValueError):
+        decrypt_stream(io.BytesIO(b"short"), io.BytesIO(), "pw", salt, nonce, 1)
+
+
+def test_key_cache_is_opt_in():
+    clear_key_cache()
+    tokens = encrypt_tokens_batch([("a", b"alpha"), ("b", b"beta")], "pw", False, 1)
+    assert len(get_key_cache()) == 0
+    assert [decrypt_token(t, "pw", iterations=1) for t in tokens] == [b"alpha", b"beta"]
+    assert len(get_key_cache()) == 0
+
+    cache = get_key_cache()
+    misses = cache.misses
+    for token in tokens:
+        assert decrypt_token(token, "pw", use_key_cache=True, iterations=1)
+    assert cache.misses == misses + 1 and len(cache) == 1
+    clear_key_cache()
+    assert len(cache) == 0
+
+
+def test_derived_keys_are_zeroizable_copies():
+    cache = DerivedKeyCache()
+    key = cache.derive(b"pw", b"salt" * 4, 1)
+    assert isinstance(key, bytearray)
+    key[:] = bytes(len(key))
+    assert cache.derive(b"pw", b"salt" * 4, 1) != key
+
+
+def test_batch_tokens_share_salt_with_unique_nonces():
+    tokens = encrypt_tokens_batch([(f"t{i}", bytes([i]) * 9) for i in range(50)], "pw", True, 1)
+    assert len({token.salt for token in tokens}) == 1
+    assert len({token.nonce for token in tokens}) == 50
+    assert decrypt_token(tokens[7], "pw", iterations=1) == bytes([7]) * 9
+
+
+def test_key_cache_evicts_by_size_and_ttl():
+    cache = DerivedKeyCache(max_entries=2)
+    for salt in (b"a" * 16, b"b" * 16, b"c" * 16):
+        cache.derive(b"pw", salt, 1)
+    assert len(cache) == 2 and cache.misses == 3
+    cache.derive(b"pw", b"c" * 16, 1)
+    assert cache.hits == 1
+    expired = DerivedKeyCache(ttl_seconds=0.0)
+    expired.derive(b"pw", b"a" * 16, 1)
+    expired.derive(b"pw", b"a" * 16, 1)
+    assert expired.hits == 0 and len(expired) == 0
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_parallel_file_encryption_round_trips(tmp_path, workers):
+    payload = os.urandom(3 * STREAM_CHUNK_SIZE + 123)
+    source, target = tmp_path / "plain.bin", tmp_path / "cipher.bin"
+    source.write_bytes(payload)
+    salt, nonce = encrypt_file_parallel(
+        source, target, "pw", workers=workers, iterations=1,
+        segment_size=STREAM_CHUNK_SIZE,
+    )
+    ciphertext = target.read_bytes()
+    assert len(ciphertext) == len(payload) + TAG_SIZE
+    assert aes256_decrypt(ciphertext, "pw", salt, nonce, 1) == payload
+    restored = io.BytesIO()
+    with target.open("rb") as reader:
+        decrypt_stream(reader, restored, "pw", salt, nonce, 1)
+    assert restored.getvalue() == payload
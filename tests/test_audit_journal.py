@@ -0,0 +1,128 @@
+"""Audit journal: buffering, rotation, crash recovery and checkpoints."""
+import hashlib
+import json
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.append(str(ROOT))
+
+from src.audit_journal import AuditJournal
+
+
+def _record(i):
+    return {"entry_id": f"E-{i:04d}", "timestamp": 1000.0 + i, "value": "x" * 40}
+
+
+def _fill(journal, count, start=0):
+    for i in range(start, start + count):
+        journal.append(_record(i))
+
+
+def test_records_are_buffered_until_flush(tmp_path):
+    journal = AuditJournal(tmp_path, flush_every=4)
+    _fill(journal, 3)
+    assert journal.pending == 3 and journal.total_entries == 3
+    assert not list(tmp_path.glob("*.jsonl"))
+    journal.append(_record(3))
+    assert journal.pending == 0
+    assert len((tmp_path / "audit-000001.jsonl").read_bytes().splitlines()) == 4
+    journal.close()
+
+
+def test_rotation_writes_index_and_manifest(tmp_path):
+    journal = AuditJournal(tmp_path, max_segment_bytes=400, flush_every=5)
+    _fill(journal, 23)
+    manifest = journal.manifest()
+    segments = manifest["segments"]
+    assert manifest["total_entries"] == 23
+    assert len(segments) > 2
+    assert all(s["sealed"] for s in segments[:-1]) and not segments[-1]["sealed"]
+    assert all(s["bytes"] <= 400 for s in segments)
+    assert [s["first_entry_id"] for s in segments][0] == "E-0000"
+    assert segments[-1]["last_entry_id"] == "E-0022"
+    for segment, path in zip(segments, journal.segment_paths()):
+        data = path.read_bytes()
+        assert segment["bytes"] == len(data)
+        assert segment["sha256"] == hashlib.sha256(data).hexdigest()
+    index = json.loads((tmp_path / "index.json").read_text())
+    assert [s["name"] for s in index["segments"]] == [s["name"] for s in segments[:-1]]
+    assert [r["entry_id"] for r in journal.iter_records()] == [
+        f"E-{i:04d}" for i in range(23)
+    ]
+    journal.close()
+
+
+def test_reopen_resumes_active_segment(tmp_path):
+    with AuditJournal(tmp_path, max_segment_bytes=400) as journal:
+        _fill(journal, 10)
+        before = journal.manifest()
+    reopened = AuditJournal(tmp_path, max_segment_bytes=400)
+    assert reopened.manifest() == before
+    _fill(reopened, 5, start=10)
+    assert reopened.total_entries == 15
+    assert [r["entry_id"] for r in reopened.iter_records()][-1] == "E-0014"
+    reopened.close()
+
+
+def test_partial_trailing_line_is_cut_on_reopen(tmp_path):
+    with AuditJournal(tmp_path) as journal:
+        _fill(journal, 4)
+    path = tmp_path / "audit-000001.jsonl"
+    intact = path.read_bytes()
+    path.write_bytes(intact + b'{"entry_id": "E-9')
+    reopened = AuditJournal(tmp_path)
+    assert path.read_bytes() == intact
+    assert reopened.total_entries == 4
+    _fill(reopened, 1, start=4)
+    reopened.close()
+    assert [json.loads(line)["entry_id"] for line in path.read_bytes().splitlines()] == [
+        f"E-{i:04d}" for i in range(5)
+    ]
+
+
+def test_lost_index_is_rebuilt_from_segments(tmp_path):
+    with AuditJournal(tmp_path, max_segment_bytes=300) as journal:
+        _fill(journal, 12)
+        before = journal.manifest()
+    (tmp_path / "index.json").unlink()
+    reopened = AuditJournal(tmp_path, max_segment_bytes=300)
+    assert reopened.manifest() == before
+    assert (tmp_path / "index.json").exists()
+    reopened.close()
+
+
+def test_iter_records_since_a_position(tmp_path):
+    journal = AuditJournal(tmp_path, max_segment_bytes=400)
+    _fill(journal, 6)
+    position = journal.position()
+    assert position["entries"] == 6
+    _fill(journal, 9, start=6)
+    tail = [r["entry_id"] for r in journal.iter_records(since=position)]
+    assert tail == [f"E-{i:04d}" for i in range(6, 15)]
+    assert list(journal.iter_records(since=journal.position())) == []
+    journal.close()
+
+
+def test_checkpoint_round_trip_and_validity(tmp_path):
+    journal = AuditJournal(tmp_path)
+    assert journal.read_checkpoint() is None
+    _fill(journal, 3)
+    position = journal.write_checkpoint({"count": 3})
+    journal.close()
+
+    reopened = AuditJournal(tmp_path)
+    assert reopened.read_checkpoint() == ({"count": 3}, position)
+    reopened.close()
+
+    # A journal truncated behind the checkpoint invalidates it
+    path = tmp_path / "audit-000001.jsonl"
+    path.write_bytes(b"".join(path.read_bytes().splitlines(keepends=True)[:1]))
+    truncated = AuditJournal(tmp_path)
+    assert truncated.read_checkpoint() is None
+    truncated.close()
+
+    (tmp_path / "checkpoint.json").write_text("{not json")
+    assert AuditJournal(tmp_path).read_checkpoint() is None
+    assert not AuditJournal(tmp_path).contains({"segment": "audit-000009.jsonl"})
@@ -0,0 +1,147 @@
+"""Running audit aggregates: Welford moments, P-square quantiles and state."""
+import json
+import random
+import statistics
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.append(str(ROOT))
+
+from src.audit_stats import AuditAggregates, P2Quantile, RunningStats
+
+
+def _values(count=2000, seed=11):
+    rng = random.Random(seed)
+    return [rng.gauss(5.0, 2.0) for _ in range(count)]
+
+
+def _stats(values):
+    stats = RunningStats()
+    for value in values:
+        stats.add(value)
+    return stats
+
+
+def test_running_stats_match_statistics_module():
+    values = _values()
+    stats = _stats(values)
+    assert stats.count == len(values)
+    assert stats.mean == pytest.approx(statistics.fmean(values), rel=1e-12)
+    assert stats.variance == pytest.approx(statistics.variance(values), rel=1e-9)
+    assert stats.stddev == pytest.approx(statistics.stdev(values), rel=1e-9)
+    assert (stats.min, stats.max) == (min(values), max(values))
+
+
+def test_large_offset_does_not_cancel():
+    values = [1e9 + v for v in (4.0, 7.0, 13.0, 16.0)]
+    assert _stats(values).variance == pytest.approx(30.0, rel=1e-9)
+
+
+def test_empty_and_single_value():
+    empty = RunningStats().to_dict()
+    assert empty["count"] == 0 and empty["min"] is None and empty["max"] is None
+    one = _stats([3.0])
+    assert one.variance == 0.0 and one.to_dict()["min"] == one.to_dict()["max"] == 3.0
+
+
+def test_merge_equals_one_pass():
+    values = _values(1000)
+    merged = _stats(values[:300])
+    merged.merge(_stats(values[300:]))
+    merged.merge(RunningStats())
+    whole = _stats(values)
+    assert merged.count == whole.count
+    assert merged.mean == pytest.approx(whole.mean, rel=1e-12)
+    assert merged.variance == pytest.approx(whole.variance, rel=1e-9)
+    assert (merged.min, merged.max) == (whole.min, whole.max)
+    into_empty = RunningStats()
+    into_empty.merge(whole)
+    assert into_empty.to_state() == whole.to_state()
+
+
+def test_p2_is_exact_below_five_values():
+    quantile = P2Quantile(0.5)
+    assert quantile.value is None
+    for value in (9.0, 1.0, 5.0, 3.0):
+        quantile.add(value)
+    assert quantile.value == statistics.median([9.0, 1.0, 5.0, 3.0])
+    upper = P2Quantile(0.9)
+    upper.add_many([1.0, 2.0])
+    assert upper.value == pytest.approx(1.9)
+
+
+@pytest.mark.parametrize("p", [0.5, 0.9, 0.99])
+def test_p2_tracks_large_streams(p):
+    values = _values(20000, seed=3)
+    quantile = P2Quantile(p)
+    quantile.add_many(values)
+    exact = statistics.quantiles(values, n=100)[round(p * 100) - 1]
+    spread = statistics.stdev(values)
+    assert abs(quantile.value - exact) < 0.05 * spread
+
+
+def test_p2_add_many_equals_add():
+    values = _values(500)
+    one_by_one = P2Quantile(0.9)
+    for value in values:
+        one_by_one.add(value)
+    batched = P2Quantile(0.9)
+    batched.add_many(values[:3])
+    batched.add_many(values[3:250])
+    batched.add_many(values[250:])
+    assert batched.to_state() == one_by_one.to_state()
+
+
+def test_p2_rejects_bad_quantiles():
+    for p in (0.0, 1.0, 1.5):
+        with pytest.raises(ValueError):
+            P2Quantile(p)
+
+
+def test_aggregates_state_round_trips_through_json():
+    values = _values(300)
+    aggregates = AuditAggregates()
+    for i, value in enumerate(values):
+        aggregates.add("verified" if value > 4 else "discrepancy", value, i % 3)
+    aggregates.add("pending")
+    restored = AuditAggregates.from_state(json.loads(json.dumps(aggregates.to_state())))
+    assert restored.to_state() == aggregates.to_state()
+    # Both continue identically after a restore
+    for target in (aggregates, restored):
+        target.add_batch({"verified": 2}, [4.5, 6.0])
+    assert restored.to_state() == aggregates.to_state()
+    assert restored.total == len(values) + 3
+    assert restored.count("pending") == 1 and restored.count("missing") == 0
+    assert set(restored.quantiles()) == {"p50", "p90", "p99"}
+    assert json.loads(json.dumps(AuditAggregates().to_state()))["total"] == 0
+
+
+def test_batch_matches_per_entry_updates():
+    values = _values(400)
+    per_entry = AuditAggregates()
+    for value in values:
+        per_entry.add("verified", value)
+    batch = AuditAggregates()
+    batch.add_batch({"verified": len(values)}, values)
+    assert batch.total == per_entry.total
+    assert batch.differential_pct.mean == pytest.approx(per_entry.differential_pct.mean)
+    assert batch.differential_pct.variance == pytest.approx(
+        per_entry.differential_pct.variance
+    )
+    assert batch.quantiles() == per_entry.quantiles()
+
+
+def test_add_records_reads_exported_entries():
+    aggregates = AuditAggregates(percentiles=(50,))
+    aggregates.add_records([
+        {"status": "verified", "yield_differential": {"differential_pct": 1.5},
+         "mythic_proofs": [{}, {}]},
+        {"status": "discrepancy", "yield_differential": None},
+    ])
+    assert aggregates.total == 2 and aggregates.mythic_proofs == 2
+    assert aggregates.differential_pct.count == 1
+    assert aggregates.quantiles() == {"p50": 1.5}
@@ -0,0 +1,60 @@
+"""Crypto benchmark suite: self-test, regression comparison and CLI checks."""
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.append(str(ROOT))
+sys.path.insert(0, str(ROOT / "benchmarks"))
+
+import bench_crypto_suite
+from bench_crypto_suite import _parse_size, compare, run_selftest
+
+
+def test_selftest_passes():
+    result = run_selftest(rounds=4, seed=7)
+    assert result["failed"] == 0, result["failures"]
+    assert result["cases"] > 32
+    assert result["seed"] == 7
+
+
+def test_selftest_reports_mismatches(monkeypatch):
+    monkeypatch.setattr(
+        bench_crypto_suite, "aes256_decrypt", lambda *args, **kwargs: b"wrong"
+    )
+    result = run_selftest(rounds=0, seed=1)
+    assert result["failed"] > 0
+    assert len(result["failures"]) <= 20
+
+
+def test_compare_flags_drops_beyond_threshold():
+    baseline = {"fast": 100.0, "slow": 100.0, "gone": 5.0, "zero": 0.0}
+    metrics = {"fast": 85.0, "slow": 70.0, "zero": 1.0}
+    regressions = compare(metrics, baseline, threshold=0.2)
+    assert [r["metric"] for r in regressions] == ["slow"]
+    assert regressions[0]["change"] == pytest.approx(-0.3)
+
+
+def test_parse_size():
+    assert _parse_size("32") == 32
+    assert _parse_size("16M") == 16 << 20
+    assert _parse_size("1.5kb") == 1536
+    assert _parse_size("1G") == 1 << 30
+
+
+def test_missing_baseline_is_a_usage_error(tmp_path):
+    result = subprocess.run(
+        [
+            sys.executable,
+            str(ROOT / "benchmarks" / "bench_crypto_suite.py"),
+            "--baseline",
+            str(tmp_path / "missing.json"),
+        ],
+        capture_output=True,
+        text=True,
+    )
+    assert result.returncode == 2
+    assert "baseline file not found" in result.stderr
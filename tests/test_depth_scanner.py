@@ -0,0 +1,146 @@
+"""Depth scans: content-addressed caching, in-flight dedup and ordering."""
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.append(str(ROOT))
+
+from runtime.depth_scanner import DepthScanExecutor, ScanCache
+from runtime.ripple_effect import RippleEffectEngine
+
+
+class _CountingAnalyzer:
+    """Flags bytecode containing b"hidden" and counts calls per bytecode."""
+
+    def __init__(self, gate=None):
+        self.calls = {}
+        self.gate = gate
+        self._lock = threading.Lock()
+
+    def __call__(self, contract, bytecode):
+        if self.gate is not None:
+            self.gate.wait(5)
+        with self._lock:
+            self.calls[bytecode] = self.calls.get(bytecode, 0) + 1
+        if bytecode is not None and b"hidden" in bytecode:
+            return {"layer_type": "shadow_vault"}
+        return None
+
+
+BYTECODE = {
+    "0xa": b"clean",
+    "0xb": b"hidden",
+    "0xc": b"hidden",  # same code deployed at another address
+    "0xd": b"also clean",
+}
+
+
+@pytest.fixture
+def executor():
+    executor = DepthScanExecutor(_CountingAnalyzer(), BYTECODE.__getitem__, max_workers=4)
+    yield executor
+    executor.close()
+
+
+def test_scan_keeps_input_order_and_shares_identical_code(executor):
+    results = executor.scan(["0xd", "0xb", "0xa", "0xc", "0xb"])
+    assert [r.contract for r in results] == ["0xd", "0xb", "0xa", "0xc"]
+    assert [r.hidden for r in results] == [False, True, False, True]
+    assert results[1].details == {"layer_type": "shadow_vault"}
+    assert results[1].code_hash == results[3].code_hash
+    # Identical bytecode is analyzed once, whichever address came first
+    assert executor.analyzer.calls[b"hidden"] == 1
+    assert sorted(r.cached for r in results[1::2]) == [False, True]
+
+
+def test_repeat_scans_hit_the_cache(executor):
+    executor.scan(list(BYTECODE))
+    again = executor.scan(list(BYTECODE))
+    assert all(r.cached for r in again)
+    assert all(count == 1 for count in executor.analyzer.calls.values())
+
+
+def test_concurrent_requests_wait_for_one_analysis():
+    gate = threading.Event()
+    analyzer = _CountingAnalyzer(gate)
+    executor = DepthScanExecutor(analyzer, lambda contract: b"hidden", max_workers=4)
+    results = []
+    threads = [
+        threading.Thread(target=lambda c=c: results.extend(executor.scan([c])))
+        for c in ("0x1", "0x2", "0x3", "0x4")
+    ]
+    for thread in threads:
+        thread.start()
+    gate.set()
+    for thread in threads:
+        thread.join()
+    executor.close()
+    assert analyzer.calls == {b"hidden": 1}
+    assert len(results) == 4 and all(r.hidden for r in results)
+
+
+def test_analyzer_version_changes_the_key():
+    cache = ScanCache()
+    first = DepthScanExecutor(_CountingAnalyzer(), BYTECODE.__getitem__, cache=cache)
+    first.scan(["0xa"])
+    second = DepthScanExecutor(
+        _CountingAnalyzer(), BYTECODE.__getitem__, cache=cache, analyzer_version="2"
+    )
+    assert not second.scan(["0xa"])[0].cached
+    assert len(cache) == 2
+    first.close()
+    second.close()
+
+
+def test_persistent_cache_survives_restart(tmp_path):
+    path = str(tmp_path / "scan.db")
+    executor = DepthScanExecutor(_CountingAnalyzer(), cache=ScanCache(path))
+    executor.scan(["0xAbC"])
+    executor.close()
+    executor.cache.close()
+
+    analyzer = _CountingAnalyzer()
+    reopened = DepthScanExecutor(analyzer, cache=ScanCache(path))
+    # Without a bytecode loader the key is the lower-cased address
+    result = reopened.scan(["0xabc"])[0]
+    assert result.cached and not result.hidden
+    assert analyzer.calls == {}
+    reopened.close()
+    reopened.cache.close()
+
+
+def test_analyzer_errors_propagate_and_are_not_cached():
+    attempts = []
+
+    def flaky(contract, bytecode):
+        attempts.append(contract)
+        if len(attempts) == 1:
+            raise RuntimeError("rpc down")
+        return None
+
+    executor = DepthScanExecutor(flaky)
+    with pytest.raises(RuntimeError):
+        executor.scan(["0xa"])
+    assert not executor.scan(["0xa"])[0].cached
+    assert len(attempts) == 2
+    executor.close()
+
+
+def test_engine_depth_scan_reports_layers_in_scan_order():
+    scanner = DepthScanExecutor(_CountingAnalyzer(), BYTECODE.__getitem__)
+    engine = RippleEffectEngine(scanner=scanner)
+    ripple = engine.generate_ripple("Shard 1", "0x" + "ab" * 20, "SORA")
+    seen = []
+    result = engine.depth_scan(
+        ripple.event_id, contracts_to_scan=["0xc", "0xa", "0xb"], on_result=seen.append
+    )
+    assert result["chain_theft_detected"]
+    assert [layer["layer_address"] for layer in result["hidden_layers"]] == ["0xc", "0xb"]
+    assert result["hidden_layers"][0]["layer_type"] == "shadow_vault"
+    assert sorted(r.contract for r in seen) == ["0xa", "0xb", "0xc"]
+    assert engine.events[ripple.event_id].ZZ.hidden_contracts_found == 2
+    scanner.close()
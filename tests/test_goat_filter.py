@@ -0,0 +1,142 @@
+"""GoatFilter pattern matching and counters."""
+import hashlib
+import json
+import sys
+import threading
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.append(str(ROOT))
+
+from src.goat_filter import BaseGoatFilter, GoatFilterRegistry, ShardedCounter
+
+
+def _payload_hash(data):
+    return hashlib.sha256(json.dumps(data, sort_keys=True).encode()).hexdigest()
+
+
+def _filter():
+    return BaseGoatFilter(registry=GoatFilterRegistry())
+
+
+def test_hash_fragments_block_anywhere():
+    data = {"sovereignty": "ancestral", "payload": "spiral"}
+    digest = _payload_hash(data)
+    for fragment in (digest[20:40], digest[30:40], digest[:16], digest):
+        goat = _filter()
+        goat.add_mimic_pattern(fragment)
+        assert not goat.verify_authenticity(data), fragment
+        assert fragment in goat.find_mimic_patterns(json.dumps(data, sort_keys=True), digest)
+
+
+def test_saved_hash_index_blocks_fragments(tmp_path):
+    data = {"sovereignty": "cosmic", "payload": "vault"}
+    digest = _payload_hash(data)
+    source = _filter()
+    source.add_mimic_patterns([digest[10:40], "ab" * 32])
+    source.save_hash_index(tmp_path / "hashes.idx")
+    goat = _filter()
+    goat.load_hash_index(tmp_path / "hashes.idx")
+    assert not goat.verify_authenticity(data)
+
+
+def test_sharded_counter_folds_in_finished_threads():
+    counter = ShardedCounter()
+
+    def work():
+        for _ in range(100):
+            counter.add()
+
+    for _ in range(50):
+        threads = [threading.Thread(target=work) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    assert counter.value == 50 * 4 * 100
+    assert len(counter._cells) == 0
+
+
+class _FlagFilter(BaseGoatFilter):
+    """Rejects records carrying its configured flag key."""
+
+    def __init__(self, strictness=0.95, registry=None, flag="reject"):
+        super().__init__(strictness, registry=registry)
+        self.flag = flag
+
+    def _pool_config(self):
+        return dict(super()._pool_config(), flag=self.flag)
+
+    def _verify_spiral_compliance(self, data):
+        return self.flag not in data
+
+
+def test_verify_many_pool_uses_subclass_checks():
+    goat = _FlagFilter(registry=GoatFilterRegistry(), flag="bad")
+    goat.add_mimic_pattern("mimic")
+    records = [{"i": i} for i in range(40)]
+    records[3] = {"bad": 1}
+    records[25] = {"note": "mimic"}
+    serial, _ = goat.verify_many(records, workers=1)
+    pooled, stats = goat.verify_many(records, workers=2, chunk_size=8)
+    assert pooled == serial
+    assert [i for i, ok in enumerate(pooled) if not ok] == [3, 25]
+    assert stats["blocked"] == 2
+
+
+def test_verify_many_matches_verify_authenticity():
+    records = [{"payload": f"item-{i}"} for i in range(100)] + [{"payload": "mimic-7"}]
+    goat = _filter()
+    goat.add_mimic_pattern("mimic")
+    expected = [goat.verify_authenticity(record) for record in records]
+    batch = _filter()
+    batch.add_mimic_pattern("mimic")
+    mask, stats = batch.verify_many(iter(records), workers=1, chunk_size=16)
+    assert mask == expected
+    assert (stats["total"], stats["blocked"]) == (101, 1)
+    assert (batch.verified_count, batch.blocked_count) == (100, 1)
+
+    batch.active = False
+    mask, stats = batch.verify_many(records)
+    assert all(mask) and stats["blocked"] == 0
+    assert batch.verified_count == 100
+
+
+def test_filters_share_one_registry():
+    from src.proof_of_flip_audit import GoatFilter
+    from src.simulation_engine import SimulationGoatFilter
+
+    registry = GoatFilterRegistry()
+    base = BaseGoatFilter(registry=registry)
+    audit = GoatFilter(registry=registry)
+    simulation = SimulationGoatFilter(registry=registry)
+    audit.add_mimic_pattern("shared-mimic")
+    assert base.mimic_patterns == simulation.mimic_patterns == ("shared-mimic",)
+    assert not base.verify_authenticity({"note": "shared-mimic"})
+
+
+def test_snapshots_are_copy_on_write():
+    registry = GoatFilterRegistry()
+    before = registry.snapshot
+    assert registry.add_patterns(["a1", "a1", "b2"]) == 2
+    assert registry.add_patterns(["a1"]) == 0
+    after = registry.snapshot
+    assert before.patterns == () and after.patterns == ("a1", "b2")
+    assert after.version != before.version
+    assert registry.remove_pattern("a1") and not registry.remove_pattern("zz")
+    assert after.patterns == ("a1", "b2")
+    assert registry.snapshot.patterns == ("b2",)
+
+
+def test_pattern_file_reload(tmp_path):
+    path = tmp_path / "patterns.txt"
+    path.write_text("# comment\nforged\n\nglob:*counterfeit*\n")
+    registry = GoatFilterRegistry()
+    assert registry.load_pattern_file(path) == 2
+    goat = BaseGoatFilter(registry=registry)
+    assert not goat.verify_authenticity({"note": "forged"})
+    assert not goat.verify_authenticity({"note": "a counterfeit"})
+    path.write_text("other\n")
+    registry.load_pattern_file(path)
+    assert goat.verify_authenticity({"note": "forged"})
@@ -0,0 +1,53 @@
+"""Hash pattern index: Bloom-fronted digests, fragments and persistence."""
+import hashlib
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.append(str(ROOT))
+
+from src.hash_pattern_index import DigestBloomFilter, HashPatternIndex
+
+
+def _digest(i):
+    return hashlib.sha256(str(i).encode()).hexdigest()
+
+
+def test_pattern_shapes():
+    assert HashPatternIndex.is_hash_pattern(_digest(1))
+    assert HashPatternIndex.is_hash_pattern(_digest(1)[:16])
+    assert not HashPatternIndex.is_hash_pattern("dead")
+    assert not HashPatternIndex.is_hash_pattern(_digest(1).upper())
+
+
+def test_bloom_has_no_false_negatives():
+    bloom = DigestBloomFilter.for_capacity(1000)
+    digests = [bytes.fromhex(_digest(i)) for i in range(1000)]
+    for digest in digests:
+        bloom.add(digest)
+    assert all(digest in bloom for digest in digests)
+
+
+@pytest.mark.parametrize("fragments", [10, 100])
+def test_index_is_exact(fragments):
+    digests = [_digest(i) for i in range(200)]
+    parts = [_digest(i)[5:25] for i in range(1000, 1000 + fragments)]
+    index = HashPatternIndex(digests + parts)
+    assert len(index) == 200 + fragments
+    assert index.matches(digests[17]) and index.find_all(digests[17]) == {digests[17]}
+    assert index.find_all(_digest(1003)) == {_digest(1003)[5:25]}
+    assert not any(index.matches(_digest(i)) for i in range(5000, 5200))
+
+
+def test_save_and_load_round_trip(tmp_path):
+    patterns = [_digest(i) for i in range(50)] + [_digest(99)[:20]]
+    path = HashPatternIndex(patterns).save(tmp_path / "hashes.idx")
+    loaded = HashPatternIndex.load(path)
+    assert len(loaded) == 51
+    assert loaded.matches(_digest(7)) and loaded.matches(_digest(99))
+    path.write_bytes(path.read_bytes()[:-3])
+    with pytest.raises(ValueError):
+        HashPatternIndex.load(path)
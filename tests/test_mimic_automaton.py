@@ -0,0 +1,40 @@
+"""Aho-Corasick mimic automaton against a naive substring scan."""
+import random
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.append(str(ROOT))
+
+from src.goat_filter import BaseGoatFilter, GoatFilterRegistry
+from src.mimic_automaton import MimicAutomaton
+
+
+def test_overlapping_and_nested_patterns():
+    automaton = MimicAutomaton(["he", "she", "his", "hers", "", "he"])
+    assert len(automaton) == 4
+    assert automaton.find_all("ushers") == {"he", "she", "hers"}
+    assert automaton.contains_any("this")
+    assert not automaton.contains_any("xyz")
+    assert MimicAutomaton().find_all("anything") == set()
+
+
+def test_matches_naive_scan():
+    rng = random.Random(3)
+    patterns = ["".join(rng.choice("abc") for _ in range(rng.randrange(1, 5))) for _ in range(40)]
+    automaton = MimicAutomaton(patterns)
+    for _ in range(200):
+        text = "".join(rng.choice("abcd") for _ in range(rng.randrange(0, 30)))
+        expected = {pattern for pattern in patterns if pattern in text}
+        assert automaton.find_all(text) == expected
+        assert automaton.contains_any(text) == bool(expected)
+
+
+def test_filter_blocks_literal_patterns():
+    goat = BaseGoatFilter(registry=GoatFilterRegistry())
+    goat.add_mimic_patterns(["forged", "counterfeit"])
+    assert not goat.verify_authenticity({"note": "a counterfeit scroll"})
+    assert goat.verify_authenticity({"note": "an honest scroll"})
+    assert goat.remove_mimic_pattern("counterfeit")
+    assert goat.verify_authenticity({"note": "a counterfeit scroll"})
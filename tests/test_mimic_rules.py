@@ -0,0 +1,62 @@
+"""Glob and regex mimic rules compiled into one merged regex."""
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.append(str(ROOT))
+
+from src.mimic_rules import MimicRule, compile_rules
+
+
+def _rules(*texts):
+    return compile_rules([MimicRule.parse(text) for text in texts])
+
+
+def test_inline_flags_and_named_groups_compile():
+    rules = _rules("re:(?i)evil", "re:(?P<x>a)z", "re:(?P<x>b)y", "glob:0xdead??")
+    assert rules.search("EVIL")
+    assert rules.search("az") and rules.search("by")
+    assert rules.search("0xdeadbe")
+    assert not rules.search("harmless")
+
+
+def test_backreferences_still_block():
+    rules = _rules("re:(a)\\1", "re:(b)\\1")
+    assert rules.search("aa")
+    assert rules.search("bb")
+    assert not rules.search("ab")
+
+
+def test_glob_syntax():
+    rules = _rules("glob:0x??ad", "glob:mimic*gate", "glob:id-[0-3]", "glob:v[!a-c]9")
+    assert rules.search("0xdead") and not rules.search("0xde")
+    assert rules.search("the mimic at the gate")
+    assert rules.search("id-2") and not rules.search("id-7")
+    assert rules.search("vz9") and not rules.search("vb9")
+    assert _rules("glob:a.b").search("a.b") and not _rules("glob:a.b").search("axb")
+
+
+def test_merged_matches_each_rule():
+    texts = ["glob:*seal*", "re:fo+rge", "glob:tok-??"]
+    rules = _rules(*texts)
+    assert rules.find_all("a fooorged seal") == {MimicRule.parse(texts[0]),
+                                                  MimicRule.parse(texts[1])}
+    assert rules.find_all("tok-ab") == {MimicRule.parse(texts[2])}
+    assert rules.find_all("clean") == set()
+
+
+def test_compiled_source_is_cached(tmp_path):
+    rules = [MimicRule.parse("glob:a*b"), MimicRule.parse("re:c+d")]
+    first = compile_rules(rules, tmp_path)
+    cached = list(tmp_path.glob("*.re"))
+    assert len(cached) == 1
+    second = compile_rules(rules, tmp_path)
+    assert second.source == first.source and second.search("axxb")
+
+
+def test_bad_prefix_rejected():
+    with pytest.raises(ValueError):
+        MimicRule.parse("forged")
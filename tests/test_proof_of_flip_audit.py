@@ -0,0 +1,198 @@
+"""Audit pipeline: journal reopen, windowed exports and batch tri-cycle audits."""
+import json
+import math
+import random
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.append(str(ROOT))
+
+import src.proof_of_flip_audit as audit
+from src.audit_journal import AuditJournal
+from src.proof_of_flip_audit import ProofOfFlipAuditPipeline
+
+
+def test_journal_reopen_restores_tri_cycle_count(tmp_path):
+    pipeline = ProofOfFlipAuditPipeline(output_dir=tmp_path, journal=True)
+    for _ in range(50):
+        pipeline.run_tri_cycle_audit(2.1)
+    pipeline.close()
+
+    reopened = ProofOfFlipAuditPipeline(output_dir=tmp_path, journal=True)
+    assert reopened.tri_cycle_count == 50
+    entry = reopened.run_tri_cycle_audit(2.1)
+    assert entry.yield_differential.tri_cycle_number == 51
+    export = json.loads(reopened.export_audit_log().read_text())
+    assert export["tri_cycle_count"] == export["total_entries"] == 51
+    reopened.close()
+
+
+def test_windowed_export_labels_counts(tmp_path):
+    pipeline = ProofOfFlipAuditPipeline(output_dir=tmp_path, window=5)
+    for _ in range(20):
+        pipeline.run_tri_cycle_audit(2.1)
+    export = json.loads(pipeline.export_audit_log(validate=True).read_text())
+    assert export["total_entries"] == export["summary"]["total_entries"] == 20
+    assert export["window_entries"] == len(export["entries"]) == 5
+
+
+def test_plain_export_keeps_to_dict_format(tmp_path):
+    pipeline = ProofOfFlipAuditPipeline(output_dir=tmp_path)
+    entry = pipeline.run_tri_cycle_audit(2.1)
+    record = entry.to_dict()
+    assert "audit_id" not in record
+    assert "+" not in record["timestamp_iso"]
+    export = json.loads(pipeline.export_audit_log().read_text())
+    assert export["entries"] == [record]
+
+    document = entry.to_document()
+    assert document["audit_id"] == record["entry_id"]
+    validated = json.loads(pipeline.export_audit_log("v.json", validate=True).read_text())
+    assert validated["entries"][0]["audit_id"] == record["entry_id"]
+
+
+def test_journal_export_validates_documents(tmp_path):
+    pipeline = ProofOfFlipAuditPipeline(output_dir=tmp_path, journal=True)
+    for _ in range(10):
+        pipeline.run_tri_cycle_audit(2.1)
+    pipeline.export_audit_log(validate=True)
+    pipeline.close()
+
+
+def test_reopen_replays_only_entries_after_checkpoint(tmp_path):
+    pipeline = ProofOfFlipAuditPipeline(output_dir=tmp_path, journal=True)
+    for i in range(50):
+        pipeline.run_tri_cycle_audit(2.0 + i * 0.01)
+    pipeline.close()
+    reopened = ProofOfFlipAuditPipeline(output_dir=tmp_path, journal=True)
+    for i in range(10):
+        reopened.run_tri_cycle_audit(2.3 - i * 0.01)
+    reopened.journal.close()  # entries journaled, no new checkpoint
+
+    journal = AuditJournal(tmp_path / "journal")
+    iter_records = journal.iter_records
+    read = []
+    journal.iter_records = lambda since=None: (
+        read.append(record) or record for record in iter_records(since)
+    )
+    resumed = ProofOfFlipAuditPipeline(output_dir=tmp_path, journal=journal)
+    assert len(read) == 10
+    assert resumed.tri_cycle_count == 60
+
+    (tmp_path / "journal" / "checkpoint.json").unlink()
+    replayed = ProofOfFlipAuditPipeline(output_dir=tmp_path, journal=True)
+    assert replayed.tri_cycle_count == 60
+    assert resumed.stats.to_state() == replayed.stats.to_state()
+
+
+def test_validated_journal_export_reads_new_entries_only(tmp_path):
+    journal = AuditJournal(tmp_path / "journal", flush_every=1)
+    pipeline = ProofOfFlipAuditPipeline(output_dir=tmp_path, journal=journal)
+    iter_records = journal.iter_records
+    read = []
+    journal.iter_records = lambda since=None: (
+        read.append(record) or record for record in iter_records(since)
+    )
+    for _ in range(8):
+        pipeline.run_tri_cycle_audit(2.1)
+    pipeline.export_audit_log("first.json", validate=True)
+    for _ in range(3):
+        pipeline.run_tri_cycle_audit(2.1)
+    pipeline.export_audit_log("second.json", validate=True)
+    assert len(read) == 11
+    pipeline.close()
+
+
+# Fields that legitimately differ between per-yield and batch entries
+_PER_ENTRY = ("entry_id", "timestamp", "timestamp_iso", "entry_hash")
+
+
+@pytest.fixture(params=[True, False], ids=["numpy", "pure"])
+def numpy_mode(request, monkeypatch):
+    if request.param and not audit.NUMPY_AVAILABLE:
+        pytest.skip("numpy not installed")
+    monkeypatch.setattr(audit, "NUMPY_AVAILABLE", request.param)
+
+
+def _yields(count=200):
+    rng = random.Random(5)
+    return [2.1 + rng.gauss(0.0, 0.12) for _ in range(count)]
+
+
+def _comparable(entry):
+    record = entry.to_dict()
+    for key in _PER_ENTRY:
+        record.pop(key)
+    return record
+
+
+def test_batch_entries_equal_per_yield_entries(tmp_path, numpy_mode):
+    yields = _yields()
+    single = ProofOfFlipAuditPipeline(output_dir=tmp_path)
+    expected = [_comparable(single.run_tri_cycle_audit(y, {"run": 1})) for y in yields]
+    batched = ProofOfFlipAuditPipeline(output_dir=tmp_path)
+    batch = batched.run_tri_cycle_audit_batch(yields, {"run": 1})
+    assert [_comparable(entry) for entry in batch] == expected
+    assert batched.tri_cycle_count == single.tri_cycle_count == len(yields)
+
+    one, many = single.get_summary(), batched.get_summary()
+    for key in ("total_entries", "verified_count", "discrepancy_count"):
+        assert many[key] == one[key]
+    assert 0 < many["discrepancy_count"] < len(yields)
+    for key in ("mean", "variance", "min", "max"):
+        assert math.isclose(
+            many["yield_differential_pct"][key], one["yield_differential_pct"][key],
+            rel_tol=1e-9, abs_tol=1e-12,
+        )
+    assert many["yield_differential_pct"]["quantiles"] == one["yield_differential_pct"][
+        "quantiles"
+    ]
+
+
+def test_batch_is_a_lazy_sequence(tmp_path, numpy_mode):
+    pipeline = ProofOfFlipAuditPipeline(output_dir=tmp_path)
+    batch = pipeline.run_tri_cycle_audit_batch(iter([2.1, 2.5, 1.0]))
+    assert len(batch) == 3 and len(set(batch.entry_ids())) == 3
+    assert batch[-1].entry_id == batch.entry_id(2) == batch.entry_ids()[2]
+    assert [e.status.value for e in batch[0:2]] == ["verified", "discrepancy"]
+    assert batch[1] is not batch[1]
+    with pytest.raises(IndexError):
+        batch[3]
+    assert pipeline.audit_log == [] and pipeline.audit_batches == [batch]
+
+
+def test_mixed_entries_export_in_order(tmp_path, numpy_mode):
+    pipeline = ProofOfFlipAuditPipeline(output_dir=tmp_path)
+    pipeline.run_tri_cycle_audit(2.1)
+    pipeline.run_tri_cycle_audit_batch([2.2, 2.0])
+    pipeline.run_tri_cycle_audit(2.1)
+    numbers = [
+        entry.yield_differential.tri_cycle_number for entry in pipeline.iter_audit_entries()
+    ]
+    assert numbers == [1, 2, 3, 4]
+    export = json.loads(pipeline.export_audit_log(validate=True).read_text())
+    assert export["total_entries"] == len(export["entries"]) == 4
+
+
+def test_zero_expected_yield(tmp_path, numpy_mode):
+    pipeline = ProofOfFlipAuditPipeline(output_dir=tmp_path)
+    pipeline.expected_yield_per_tri_cycle = 0.0
+    batch = pipeline.run_tri_cycle_audit_batch([1.0, 0.0])
+    assert [e.yield_differential.differential_pct for e in batch] == [0.0, 0.0]
+    assert pipeline.run_tri_cycle_audit_batch([]).entry_ids() == []
+
+
+def test_batch_in_journal_mode(tmp_path, numpy_mode):
+    pipeline = ProofOfFlipAuditPipeline(output_dir=tmp_path, journal=True)
+    batch = pipeline.run_tri_cycle_audit_batch(_yields(30))
+    assert pipeline.audit_batches == []
+    pipeline.close()
+    records = list(AuditJournal(tmp_path / "journal").iter_records())
+    assert [r["entry_id"] for r in records] == batch.entry_ids()
+    reopened = ProofOfFlipAuditPipeline(output_dir=tmp_path, journal=True)
+    assert reopened.tri_cycle_count == 30
+    reopened.close()
@@ -0,0 +1,72 @@
+"""Concurrent producers share one engine without duplicate ids or lost updates."""
+import sys
+import threading
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.append(str(ROOT))
+
+import runtime.ripple_effect as ripple_effect
+from runtime.ripple_effect import EventIdGenerator, RippleEffectEngine
+from runtime.ripple_store import InMemoryEventStore, ShardedEventStore
+
+THREADS = 8
+PER_THREAD = 50
+BAD_TRANSFER = {"type": "transfer", "authorized": False, "from": "0xbad", "timestamp": "t"}
+
+
+def _run(target):
+    threads = [threading.Thread(target=target, args=(i,)) for i in range(THREADS)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+
+def test_concurrent_generate_issues_unique_ids():
+    engine = RippleEffectEngine()
+    assert isinstance(engine.events, ShardedEventStore)
+    ids = [[] for _ in range(THREADS)]
+
+    def produce(slot):
+        for _ in range(PER_THREAD):
+            ripple = engine.generate_ripple(f"Shard {slot}", "0x" + "ab" * 20, "SORA")
+            ids[slot].append(ripple.event_id)
+
+    _run(produce)
+    issued = [event_id for chunk in ids for event_id in chunk]
+    assert len(set(issued)) == len(issued) == THREADS * PER_THREAD
+    assert engine.event_count == len(engine.events) == len(issued)
+    for slot in range(THREADS):
+        assert len(engine.query_events(origin_shard=f"Shard {slot}")) == PER_THREAD
+
+
+def test_concurrent_updates_to_one_event_are_not_lost():
+    engine = RippleEffectEngine()
+    ripple = engine.generate_ripple("Shard 1", "0x" + "ab" * 20, "SORA")
+
+    def analyze(_):
+        for _ in range(20):
+            engine.analyze_for_theft(ripple.event_id, "0xa", "0xa", [BAD_TRANSFER])
+
+    _run(analyze)
+    actors = engine.events[ripple.event_id].XX.actors
+    assert [(a["address"], a["count"]) for a in actors] == [("0xbad", THREADS * 20)]
+
+
+def test_ids_stay_unique_when_the_clock_goes_back(monkeypatch):
+    clock = iter([1_700_000_100.0, 1_700_000_000.0, 1_700_000_000.0])
+    monkeypatch.setattr(ripple_effect.time, "time", lambda: next(clock))
+    generator = EventIdGenerator()
+    ids = [generator.next_id() for _ in range(3)]
+    seconds = {event_id.split("-")[2][:-4] for event_id in ids}
+    assert seconds == {f"{1_700_000_100:X}"}
+    assert len(set(ids)) == 3 and generator.count == 3
+
+
+def test_custom_store_is_used():
+    store = InMemoryEventStore()
+    engine = RippleEffectEngine(store=store)
+    ripple = engine.generate_ripple("Shard 1", "0x" + "ab" * 20, "SORA")
+    assert store.get(ripple.event_id) is ripple
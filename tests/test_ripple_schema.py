@@ -0,0 +1,59 @@
+"""RIPPLE_EFFECT.v1 validation of shipped examples and engine events."""
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.append(str(ROOT))
+
+from runtime.ripple_effect import RippleEffectEngine, RippleEvent
+from runtime.shard_propagation import EXAMPLES_DIR, ShardGraph
+from src.schema_validator import SchemaValidationError, get_validator
+
+EXAMPLES = sorted(Path(EXAMPLES_DIR).glob("*.json"))
+THEFT_LOG = [
+    {"type": "transfer", "authorized": False, "from": "0xbad",
+     "timestamp": "2025-01-01T00:00:00Z"},
+]
+
+
+def test_shipped_examples_load():
+    assert EXAMPLES
+    engine = RippleEffectEngine()
+    loaded = engine.load_ripples(EXAMPLES)
+    assert len(loaded) == len(EXAMPLES)
+    for event_id in loaded:
+        json.loads(engine.export_ripple(event_id))
+
+
+def test_shipped_examples_build_graph():
+    assert len(ShardGraph.from_ripple_examples()) > 0
+
+
+def test_validated_load_rejects_invalid_example():
+    # The aquatic example's contract address is not 40 hex digits
+    report = get_validator("RIPPLE_EFFECT.v1").validate_files(EXAMPLES)
+    assert not report.ok
+    with pytest.raises(SchemaValidationError):
+        RippleEffectEngine().load_ripples(EXAMPLES, validate=True)
+
+
+def test_engine_events_export_validated():
+    engine = RippleEffectEngine()
+    ripple = engine.generate_ripple("Shard 1", "0x" + "ab" * 20, "SORA")
+    engine.analyze_for_theft(ripple.event_id, "0xa", "0xb", THEFT_LOG)
+    document = json.loads(engine.export_ripple(ripple.event_id, validate=True))
+    assert document["event_id"] == ripple.event_id
+
+
+def test_document_id_round_trips_engine_ids():
+    engine = RippleEffectEngine()
+    ripple = engine.generate_ripple("Shard 1", "0x" + "ab" * 20, "SORA")
+    document = ripple.to_document()
+    get_validator("RIPPLE_EFFECT.v1").validate(document)
+    assert document["event_id"] != ripple.event_id
+    assert document["engine_event_id"] == ripple.event_id
+    assert RippleEvent.from_document(document).event_id == ripple.event_id
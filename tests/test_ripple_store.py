@@ -0,0 +1,178 @@
+"""Ripple event stores: secondary indexes, time ranges, cursors and SQLite caching."""
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.append(str(ROOT))
+
+from runtime.ripple_effect import RippleEffectEngine, RippleEvent
+from runtime.ripple_store import (
+    InMemoryEventStore,
+    ShardedEventStore,
+    SQLiteEventStore,
+    to_epoch,
+)
+from runtime.temporal_patterns import format_timestamp
+
+BASE = 1_700_000_000.0
+CONTRACT_A = "0x" + "aa" * 20
+CONTRACT_B = "0x" + "bb" * 20
+
+
+def _events(count=12):
+    """Events one hour apart across two shards; every third one altered."""
+    engine = RippleEffectEngine()
+    events = []
+    for i in range(count):
+        event = engine.generate_ripple(
+            f"Shard {i % 2}", CONTRACT_A if i < count // 2 else CONTRACT_B, "SORA"
+        )
+        event.timestamp = format_timestamp(BASE + 3600 * i)
+        if i % 3 == 0:
+            event.XX.detected_alteration = True
+            event.XX.alteration_type = ["unauthorized_transfer"]
+        events.append(event)
+    return events
+
+
+def _stores(tmp_path):
+    return {
+        "memory": InMemoryEventStore(),
+        "sharded": ShardedEventStore(shards=4),
+        "sqlite": SQLiteEventStore(
+            str(tmp_path / "events.db"), RippleEvent.from_dict, cache_size=3
+        ),
+    }
+
+
+@pytest.fixture(params=["memory", "sharded", "sqlite"])
+def store(request, tmp_path):
+    store = _stores(tmp_path)[request.param]
+    yield store
+    store.close()
+
+
+def _ids(events):
+    return [event.event_id for event in events]
+
+
+def test_to_epoch_accepts_strings_and_datetimes():
+    assert to_epoch(None) is None
+    assert to_epoch(BASE) == BASE
+    assert to_epoch(format_timestamp(BASE)) == BASE
+    assert to_epoch("2023-11-14T22:13:20+00:00") == BASE
+
+
+def test_queries_match_a_linear_scan(store):
+    events = _events()
+    for event in events:
+        store.put(event)
+    assert len(store) == len(events)
+
+    def scan(predicate):
+        return [e.event_id for e in events if predicate(e)]
+
+    assert _ids(store.query(origin_shard="Shard 1")) == scan(
+        lambda e: e.origin_shard == "Shard 1"
+    )
+    assert _ids(store.query(severity="red", contract_address=CONTRACT_A)) == scan(
+        lambda e: e.XX.detected_alteration and e.contract_address == CONTRACT_A
+    )
+    assert _ids(store.query(alteration_type="unauthorized_transfer")) == scan(
+        lambda e: "unauthorized_transfer" in e.XX.alteration_type
+    )
+    assert store.query(umbrella="BLEU") == []
+
+
+def test_time_bounds_are_inclusive_and_ordered(store):
+    events = _events()
+    for event in reversed(events):
+        store.put(event)
+    window = store.query(since=BASE + 3600 * 2, until=format_timestamp(BASE + 3600 * 5))
+    assert _ids(window) == _ids(events[2:6])
+    assert _ids(store.query(limit=3)) == _ids(events[:3])
+
+
+def test_reput_moves_index_entries(store):
+    events = _events()
+    for event in events:
+        store.put(event)
+    event = events[1]
+    event.XX.detected_alteration = True
+    event.XX.alteration_type = ["signature_mismatch"]
+    event.origin_shard = "Shard 9"
+    store.put(event)
+    assert _ids(store.query(origin_shard="Shard 9")) == [event.event_id]
+    assert _ids(store.query(alteration_type="signature_mismatch")) == [event.event_id]
+    assert event.event_id in _ids(store.query(severity="red"))
+    assert event.event_id not in _ids(store.query(origin_shard="Shard 1"))
+
+
+def test_delete_removes_from_indexes(store):
+    events = _events()
+    for event in events:
+        store.put(event)
+    store.delete(events[0].event_id)
+    store.delete("missing")
+    assert events[0].event_id not in store
+    assert store.get(events[0].event_id) is None
+    assert events[0].event_id not in _ids(store.query(severity="red"))
+    assert len(store) == len(events) - 1
+
+
+def test_iter_query_resumes_after_cursor(store):
+    events = _events()
+    # Two events sharing one timestamp are ordered by id
+    events[5].timestamp = events[4].timestamp
+    for event in events:
+        store.put(event)
+    ordered = list(store.iter_query(batch_size=2))
+    assert len(ordered) == len(events)
+    cursor_event = ordered[4]
+    cursor = (to_epoch(cursor_event.timestamp), cursor_event.event_id)
+    resumed = list(store.iter_query(after=cursor, batch_size=2))
+    assert _ids(resumed) == _ids(ordered[5:])
+
+
+def test_mapping_interface(store):
+    event = _events(1)[0]
+    store[event.event_id] = event
+    assert store[event.event_id].event_id == event.event_id
+    assert list(store) == [event.event_id]
+    assert [key for key, _ in store.items()] == [event.event_id]
+    del store[event.event_id]
+    with pytest.raises(KeyError):
+        store[event.event_id]
+
+
+def test_sqlite_store_bounds_memory_and_persists(tmp_path):
+    path = str(tmp_path / "events.db")
+    events = _events()
+    store = SQLiteEventStore(path, RippleEvent.from_dict, cache_size=2)
+    for event in events:
+        store.put(event)
+    assert len(store._cache) <= 2
+    # Evicted events are decoded again from disk
+    reloaded = store.get(events[0].event_id)
+    assert reloaded is not events[0]
+    assert reloaded.to_document() == events[0].to_document()
+    store.close()
+
+    reopened = SQLiteEventStore(path, RippleEvent.from_dict)
+    assert len(reopened) == len(events)
+    assert _ids(reopened.query(severity="red")) == _ids(
+        e for e in events if e.XX.detected_alteration
+    )
+    reopened.close()
+
+
+def test_engine_queries_through_store(tmp_path):
+    store = SQLiteEventStore(str(tmp_path / "engine.db"), RippleEvent.from_dict)
+    engine = RippleEffectEngine(store=store)
+    ripple = engine.generate_ripple("Shard 3", CONTRACT_A, "BLEU")
+    assert _ids(engine.query_events(origin_shard="Shard 3")) == [ripple.event_id]
+    assert engine.query_events(origin_shard="Shard 4") == []
+    store.close()
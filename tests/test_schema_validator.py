@@ -0,0 +1,175 @@
+"""Compiled schema validation: keywords, error paths and batch validation."""
+import io
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.append(str(ROOT))
+
+from src.schema_validator import (
+    SchemaValidationError,
+    SchemaValidator,
+    ValidationReport,
+    available_schemas,
+    get_validator,
+    main,
+)
+
+SCHEMA = {
+    "title": "TEST",
+    "type": "object",
+    "required": ["id", "kind", "when"],
+    "additionalProperties": False,
+    "properties": {
+        "id": {"type": "string", "pattern": "^T-[0-9]{3}$"},
+        "kind": {"enum": ["a", "b"]},
+        "when": {"type": "string", "format": "date-time"},
+        "count": {"type": "integer", "minimum": 0, "exclusiveMaximum": 10},
+        "ratio": {"type": "number", "multipleOf": 0.25},
+        "tags": {"type": "array", "items": {"type": "string"}, "uniqueItems": True},
+        "owner": {"oneOf": [{"type": "null"}, {"type": "string", "minLength": 2}]},
+        "tree": {"$ref": "#/$defs/node"},
+    },
+    "if": {"properties": {"kind": {"const": "b"}}},
+    "then": {"required": ["count"]},
+    "$defs": {
+        "node": {
+            "type": "object",
+            "properties": {"children": {"type": "array", "items": {"$ref": "#/$defs/node"}}},
+        },
+    },
+}
+
+VALID = {"id": "T-001", "kind": "a", "when": "2025-01-01T00:00:00Z"}
+
+
+@pytest.fixture(scope="module")
+def validator():
+    return SchemaValidator(SCHEMA)
+
+
+def _with(**changes):
+    document = dict(VALID)
+    document.update(changes)
+    return document
+
+
+def test_valid_documents(validator):
+    assert validator.is_valid(VALID)
+    assert validator.is_valid(_with(
+        kind="b", count=9, ratio=1.75, tags=["x", "y"], owner=None,
+        tree={"children": [{"children": []}, {}]},
+    ))
+    validator.validate(VALID)
+
+
+@pytest.mark.parametrize("document, message", [
+    (_with(id="T-1"), "$.id"),
+    (_with(kind="c"), "$.kind"),
+    (_with(when="yesterday"), "$.when"),
+    (_with(count=10), "$.count"),
+    (_with(count=True), "$.count"),
+    (_with(ratio=0.3), "$.ratio"),
+    (_with(tags=["x", "x"]), "$.tags"),
+    (_with(tags=["x", 1]), "$.tags[1]"),
+    (_with(owner="z"), "$.owner"),
+    (_with(tree={"children": [{"children": 5}]}), "$.tree.children[0].children"),
+    (_with(extra=1), "extra"),
+    (_with(kind="b"), "'count'"),
+    ({"id": "T-001"}, "'kind'"),
+])
+def test_invalid_documents_report_paths(validator, document, message):
+    assert not validator.is_valid(document)
+    errors = validator.errors(document)
+    assert errors and any(message in error for error in errors), errors
+
+
+def test_reporting_collects_every_error(validator):
+    errors = validator.errors({"id": 5, "extra": True})
+    assert len(errors) >= 4
+    with pytest.raises(SchemaValidationError) as raised:
+        validator.validate({"id": 5, "extra": True}, "doc.json")
+    assert raised.value.label == "doc.json"
+    assert raised.value.errors == errors
+    assert str(raised.value).startswith("doc.json: ")
+    assert isinstance(raised.value, ValueError)
+
+
+def test_pointer_selects_a_subschema():
+    node = SchemaValidator(SCHEMA, "#/$defs/node")
+    assert node.is_valid({"children": [{}]})
+    assert not node.is_valid({"children": {}})
+    with pytest.raises(ValueError):
+        SchemaValidator(SCHEMA, "#/$defs/missing")
+    with pytest.raises(ValueError):
+        SchemaValidator({"$ref": "other.json#/x"})
+
+
+def test_validate_many_in_process_and_on_a_pool(validator):
+    documents = [VALID, _with(kind="c"), VALID, _with(id="bad")] * 5
+    serial = validator.validate_many(documents, chunk_size=3)
+    pooled = validator.validate_many(documents, workers=2, chunk_size=3)
+    for report in (serial, pooled):
+        assert (report.documents, report.invalid, report.valid) == (20, 10, 10)
+        assert sorted(report.errors, key=int) == [str(i) for i in range(20) if i % 2]
+    assert pooled.errors == serial.errors
+    with pytest.raises(SchemaValidationError):
+        serial.raise_for_errors()
+
+
+def test_validate_files_splits_lists(tmp_path, validator):
+    single = tmp_path / "single.json"
+    single.write_text(json.dumps(VALID))
+    many = tmp_path / "many.json"
+    many.write_text(json.dumps([VALID, _with(kind="z")]))
+    broken = tmp_path / "broken.json"
+    broken.write_text("{")
+    report = validator.validate_files([single, many, broken, tmp_path / "missing.json"])
+    assert report.documents == 5 and report.invalid == 3
+    assert set(report.errors) == {
+        f"{many}[1]", str(broken), str(tmp_path / "missing.json")
+    }
+
+
+def test_validate_stream_labels_lines(validator):
+    text = "\n".join([json.dumps(VALID), "", "not json", json.dumps(_with(kind="q"))])
+    for stream in (io.StringIO(text), io.BytesIO(text.encode())):
+        report = validator.validate_stream(stream, chunk_size=2)
+        assert report.documents == 3
+        assert set(report.errors) == {"line 3", "line 4"}
+        assert report.errors["line 3"][0].startswith("invalid JSON")
+
+
+def test_report_dict():
+    report = ValidationReport("TEST", documents=4, invalid=1, errors={"1": ["e"]}, seconds=2.0)
+    assert report.to_dict()["valid"] == 3
+    assert report.documents_per_second == 2.0
+    assert not report.ok
+    ValidationReport("TEST").raise_for_errors()
+
+
+def test_shipped_schemas_compile_and_are_cached():
+    names = available_schemas()
+    assert "RIPPLE_EFFECT.v1" in names and "PROOF_OF_FLIP_AUDIT.v1" in names
+    for name in names:
+        assert get_validator(name) is get_validator(name)
+        assert get_validator(name).name == name
+
+
+def test_command_line(tmp_path, capsys, monkeypatch):
+    schema = tmp_path / "test.schema.json"
+    schema.write_text(json.dumps(SCHEMA))
+    good = tmp_path / "good.json"
+    good.write_text(json.dumps(VALID))
+    bad = tmp_path / "bad.json"
+    bad.write_text(json.dumps(_with(kind="c")))
+    assert main([str(schema), str(good)]) == 0
+    assert main([str(schema), str(good), str(bad)]) == 1
+    out = capsys.readouterr().out
+    assert out.startswith(f"{bad}: $.kind")
+    monkeypatch.setattr(sys, "stdin", io.TextIOWrapper(io.BytesIO(json.dumps(VALID).encode())))
+    assert main([str(schema)]) == 0
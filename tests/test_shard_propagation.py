@@ -0,0 +1,163 @@
+"""Shard graph propagation and the engine's simulate_propagation."""
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.append(str(ROOT))
+
+import runtime.shard_propagation as shard_propagation
+from runtime.ripple_effect import RippleEffectEngine
+from runtime.shard_propagation import ShardGraph, density_score, propagate
+from src.schema_validator import SchemaValidationError
+
+
+def _engine_graph():
+    engine = RippleEffectEngine()
+    ripple = engine.generate_ripple("Shard 1", "0x" + "ab" * 20, "SORA")
+    graph = ShardGraph()
+    graph.add_edge("Shard 1", "Shard 2", delay=2.0, amplification=0.5)
+    return engine, ripple, graph
+
+
+def test_simulate_propagation_leaves_event_unchanged_by_default():
+    engine, ripple, graph = _engine_graph()
+    result = engine.simulate_propagation(ripple.event_id, graph)
+    assert set(result.arrival_times()) == {"Shard 1", "Shard 2"}
+    assert engine.events.get(ripple.event_id).density_score == 0.0
+    engine.simulate_propagation(ripple.event_id, graph, record_density=True)
+    recorded = engine.events.get(ripple.event_id).density_score
+    assert recorded == round(result.mean_density(), 2) > 0
+
+
+def test_simulate_propagation_rejects_unknown_origin():
+    engine, _, graph = _engine_graph()
+    ripple = engine.generate_ripple("Shard 9", "0x" + "cd" * 20, "SORA")
+    with pytest.raises(ValueError, match="Shard 9"):
+        engine.simulate_propagation(ripple.event_id, graph)
+    assert "Shard 9" not in graph
+
+
+def _chain():
+    graph = ShardGraph()
+    graph.add_edge("A", "B", delay=2.0, amplification=0.5)
+    graph.add_edge("B", "C", delay=3.0, amplification=0.5)
+    return graph
+
+
+@pytest.fixture(params=[False, True], ids=["pure", "numpy"])
+def vectorized(request):
+    if request.param and not shard_propagation.NUMPY_AVAILABLE:
+        pytest.skip("numpy not installed")
+    return request.param
+
+
+def test_chain_arrivals_and_amplitudes(vectorized):
+    result = propagate(_chain(), ["A"], start=100.0, vectorized=vectorized)
+    assert result.arrival_times() == {"A": 100.0, "B": 102.0, "C": 105.0}
+    assert list(result.received) == [1.0, 0.5, 0.25]
+    assert result.reached == 3 and result.events == 2
+    assert not result.truncated
+
+
+def test_coincident_arrivals_are_coalesced(vectorized):
+    graph = ShardGraph()
+    for a, b in [("A", "B"), ("A", "C"), ("B", "D"), ("C", "D")]:
+        graph.add_edge(a, b)
+    result = propagate(graph, {"A": 2.0}, vectorized=vectorized)
+    assert result.arrival_times()["D"] == 2.0
+    assert result.received[graph.node("D")] == pytest.approx(2 * 2.0 * 0.8 * 0.8)
+    # A, {B, C} and D: one step per distinct arrival time
+    assert result.steps == 3
+
+
+def test_relays_bound_amplifying_cycles(vectorized):
+    graph = ShardGraph()
+    graph.add_edge("A", "B", amplification=2.0, bidirectional=True)
+    once = propagate(graph, ["A"], vectorized=vectorized)
+    assert list(once.received) == [5.0, 2.0]
+    twice = propagate(graph, ["A"], relays=2, vectorized=vectorized)
+    assert list(twice.received) == [21.0, 10.0]
+
+
+def test_min_amplitude_horizon_and_max_events(vectorized):
+    graph = _chain()
+    weak = propagate(graph, ["A"], min_amplitude=0.3, vectorized=vectorized)
+    assert set(weak.arrival_times()) == {"A", "B"}
+    early = propagate(graph, ["A"], horizon=4.0, vectorized=vectorized)
+    assert set(early.arrival_times()) == {"A", "B"}
+    capped = propagate(graph, ["A"], max_events=1, vectorized=vectorized)
+    assert capped.truncated and capped.events == 1
+
+
+def test_time_resolution_snaps_delays():
+    graph = ShardGraph()
+    graph.add_edge("A", "B", delay=0.9)
+    graph.add_edge("A", "C", delay=1.1)
+    result = propagate(graph, ["A"], time_resolution=1.0, vectorized=False)
+    assert result.arrival_times() == {"A": 0.0, "B": 1.0, "C": 1.0}
+    assert result.steps == 2
+
+
+def test_numpy_matches_pure_python_on_synthetic_graph():
+    if not shard_propagation.NUMPY_AVAILABLE:
+        pytest.skip("numpy not installed")
+    graph = ShardGraph.synthetic(300, degree=4, amplification=(0.5, 1.5), seed=3)
+    options = dict(relays=2, min_amplitude=0.05, horizon=60.0)
+    pure = propagate(graph, ["shard-0", "shard-7"], vectorized=False, **options)
+    fast = propagate(graph, ["shard-0", "shard-7"], vectorized=True, **options)
+    assert fast.arrival_times() == pure.arrival_times()
+    assert list(fast.received) == pytest.approx(list(pure.received))
+    assert (fast.events, fast.steps) == (pure.events, pure.steps)
+
+
+def test_bad_input_is_rejected():
+    graph = _chain()
+    with pytest.raises(KeyError):
+        propagate(graph, ["Z"])
+    with pytest.raises(ValueError):
+        graph.add_edge("A", "B", delay=-1.0)
+
+
+def test_synthetic_graph_is_reproducible():
+    first = ShardGraph.synthetic(50, degree=3, seed=9)
+    second = ShardGraph.synthetic(50, degree=3, seed=9)
+    assert len(first) == 50 and first.edge_count == 150
+    assert first.csr() == second.csr()
+
+
+def test_density_scale():
+    assert density_score(0.0) == 0.0
+    assert density_score(1.2) < 70 <= density_score(1.21)
+    assert density_score(2.42, scale=2.0) >= 70
+    assert density_score(100.0) == pytest.approx(100.0)
+
+
+def test_graph_files_and_ripple_documents(tmp_path):
+    edges = tmp_path / "edges.json"
+    edges.write_text(json.dumps({"edges": [
+        {"source": "A", "target": "B", "delay": 4, "amplification": 0.5},
+        {"source": "B", "target": "C", "bidirectional": True},
+    ]}))
+    document = tmp_path / "event.json"
+    document.write_text(json.dumps({
+        "origin_shard": "Shard X",
+        "contract_address": "0xc",
+        "density_score": 50,
+        "YY": {"return_path": ["0xthief", "0xorig"]},
+    }))
+    graph = ShardGraph.from_files([edges, document])
+    assert graph.edge_count == 3 + 2 + 2
+    result = propagate(graph, ["A"], vectorized=False)
+    assert result.arrival_times() == {"A": 0.0, "B": 4.0, "C": 5.0}
+    assert "Shard X" in graph and "0xorig" in graph
+
+
+def test_validated_examples_reject_invalid_documents():
+    graph = ShardGraph.from_ripple_examples()
+    assert graph.edge_count > 0
+    with pytest.raises(SchemaValidationError):
+        ShardGraph.from_ripple_examples(validate=True)
@@ -0,0 +1,139 @@
+"""Tick history windows and background GoatFilter verification."""
+import sys
+import threading
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.append(str(ROOT))
+
+import src.simulation_engine as simulation
+from src.goat_filter import GoatFilterRegistry
+from src.simulation_engine import (
+    GoatFilterStatus,
+    SimulationEngine,
+    SimulationGoatFilter,
+    SimulationTick,
+    TickRingBuffer,
+)
+
+
+def test_window_restored_after_shrink_and_grow():
+    ticks = TickRingBuffer(capacity=1000, window=100)
+    ticks.resize(10)
+    assert ticks.window == 10
+    ticks.resize(1000)
+    assert ticks.window == 100
+    for i in range(300):
+        ticks.append(SimulationTick(i, float(i), 1.0 if i < 200 else 3.0))
+    assert ticks.average_delta() == 3.0
+
+
+def test_ring_buffer_keeps_most_recent_ticks():
+    ticks = TickRingBuffer(capacity=5, window=3)
+    for i in range(12):
+        ticks.append(SimulationTick(i, float(i), float(i % 4)))
+    assert len(ticks) == 5
+    assert [tick.tick_number for tick in ticks] == [7, 8, 9, 10, 11]
+    assert ticks[0].tick_number == 7 and ticks[-1].tick_number == 11
+    assert [tick.tick_number for tick in ticks[1:3]] == [8, 9]
+    # Window of the last three deltas (1, 2, 3); zero deltas are skipped
+    assert ticks.average_delta() == 2.0
+    assert ticks.jitter_percentiles(2.0, (50, 100)) == {"p50": 1.0, "p100": 1.0}
+    ticks.resize(2)
+    assert [tick.tick_number for tick in ticks] == [10, 11]
+    ticks.clear()
+    assert not ticks and ticks.average_delta() == 0.0
+
+
+def test_engine_metrics_follow_tick_history():
+    engine = SimulationEngine(goat_filter_enabled=False)
+    engine.max_history = 5
+    engine.run_ticks(8)
+    assert len(engine.tick_history) == engine.max_history == 5
+    metrics = engine.get_metrics()
+    assert metrics["tick_count"] == 8
+    assert metrics["avg_tick_rate"] > 0
+    assert set(metrics["jitter_ms"]) == {"p50", "p95", "p99"}
+
+
+def _filter(**kwargs):
+    goat = SimulationGoatFilter(registry=GoatFilterRegistry(), **kwargs)
+    goat.add_mimic_pattern("mimic")
+    return goat
+
+
+def test_failing_check_does_not_stall_worker(monkeypatch):
+    goat = _filter(async_verify=True, batch_size=4)
+    check = goat._check_tick
+
+    def flaky(tick):
+        if tick.tick_number == 2:
+            raise RuntimeError("boom")
+        return check(tick)
+
+    monkeypatch.setattr(goat, "_check_tick", flaky)
+    ticks = [SimulationTick(i, float(i), 1.0, [{"id": i}]) for i in range(6)]
+    for tick in ticks:
+        goat.verify_tick(tick)
+    done = threading.Thread(target=goat.flush, daemon=True)
+    done.start()
+    done.join(5)
+    assert not done.is_alive()
+    assert goat.failed_ticks == 1 and isinstance(goat.last_error, RuntimeError)
+    assert goat.verified_ticks == 5
+    assert ticks[2].goat_filter_status is GoatFilterStatus.ACTIVE
+    goat.close()
+
+
+def test_close_stops_and_restarts_worker():
+    goat = _filter(async_verify=True)
+    goat.verify_tick(SimulationTick(1, 1.0, 1.0, [{"msg": "mimic"}]))
+    worker = goat._worker
+    goat.close()
+    assert not worker.is_alive()
+    assert goat.blocked_ticks == 1
+    goat.verify_tick(SimulationTick(2, 2.0, 1.0, [{"msg": "ok"}]))
+    goat.close()
+    assert goat.verified_ticks == 1
+
+
+def test_unchanged_events_skip_serialization(monkeypatch):
+    goat = _filter()
+    event = {"msg": "hello", "version": 1}
+    goat.verify_tick(SimulationTick(1, 1.0, 1.0, [event]))
+    calls = []
+    dumps = simulation.json.dumps
+    monkeypatch.setattr(simulation.json, "dumps", lambda *a, **k: calls.append(a) or dumps(*a, **k))
+    for i in range(10):
+        goat.verify_tick(SimulationTick(i + 2, float(i), 1.0, [event]))
+    assert calls == []
+    event["msg"], event["version"] = "mimic", 2
+    assert goat.verify_tick(SimulationTick(20, 20.0, 1.0, [event])) is GoatFilterStatus.BLOCKING
+    assert len(calls) == 1
+
+
+def test_empty_registry_passes_without_serializing(monkeypatch):
+    goat = SimulationGoatFilter(registry=GoatFilterRegistry())
+    monkeypatch.setattr(simulation.json, "dumps", None)
+    tick = SimulationTick(1, 1.0, 1.0, [{"msg": "mimic"}])
+    assert goat.verify_tick(tick) is GoatFilterStatus.PASSED
+    assert goat.verified_ticks == 1
+
+
+def test_sampling_verifies_every_nth_tick():
+    goat = _filter(verify_every=3)
+    statuses = [
+        goat.verify_tick(SimulationTick(i, float(i), 1.0, [{"msg": "mimic"}]))
+        for i in range(1, 7)
+    ]
+    assert statuses.count(GoatFilterStatus.BLOCKING) == 2
+    assert goat.skipped_ticks == 4 and goat.blocked_ticks == 2
+
+
+def test_new_pattern_clears_cached_verdicts():
+    goat = _filter()
+    event = {"msg": "fresh"}
+    assert goat.verify_tick(SimulationTick(1, 1.0, 1.0, [event])) is GoatFilterStatus.PASSED
+    goat.add_mimic_pattern("fresh")
+    assert goat.verify_tick(SimulationTick(2, 2.0, 1.0, [event])) is GoatFilterStatus.BLOCKING
@@ -0,0 +1,122 @@
+"""TT timing: timestamp helpers, cycle detection and next-occurrence prediction."""
+import random
+import sys
+from array import array
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.append(str(ROOT))
+
+import runtime.temporal_patterns as temporal
+from runtime.ripple_effect import RippleEffectEngine
+from runtime.temporal_patterns import (
+    TemporalIndex,
+    detect_cycle,
+    format_timestamp,
+    parse_timestamp,
+    predict_next,
+)
+
+BASE = 1_700_000_000.0
+
+
+@pytest.fixture(params=[True, False], ids=["numpy", "pure"])
+def numpy_mode(request, monkeypatch):
+    if request.param and not temporal.NUMPY_AVAILABLE:
+        pytest.skip("numpy not installed")
+    monkeypatch.setattr(temporal, "NUMPY_AVAILABLE", request.param)
+
+
+def _times(intervals, repeats):
+    times = [BASE]
+    for _ in range(repeats):
+        for interval in intervals:
+            times.append(times[-1] + interval)
+    return array("d", times)
+
+
+def test_timestamps_round_trip():
+    text = format_timestamp(BASE + 0.25)
+    assert text.endswith("Z")
+    assert parse_timestamp(text) == BASE + 0.25
+    # Naive timestamps are taken as UTC
+    assert parse_timestamp(text[:-1]) == BASE + 0.25
+    assert parse_timestamp("2023-11-15T00:13:20+02:00") == BASE
+
+
+def test_periodic_events(numpy_mode):
+    lag, span, confidence = detect_cycle(_times([3600], 6))
+    assert (lag, span, confidence) == (1, 3600, 1.0)
+    predictions = predict_next(_times([3600], 6), horizon=2)
+    assert [p["cycle_type"] for p in predictions] == ["periodic_3600s"] * 2
+    assert [parse_timestamp(p["predicted_time"]) for p in predictions] == [
+        BASE + 3600 * 7, BASE + 3600 * 8
+    ]
+
+
+def test_repeating_interval_pattern(numpy_mode):
+    times = _times([60, 600], 4)
+    lag, span, _ = detect_cycle(times)
+    assert (lag, span) == (2, 660)
+    predictions = predict_next(times, horizon=3)
+    assert predictions[0]["cycle_type"] == "pattern_2_events_660s"
+    expected = [times[-1] + 60, times[-1] + 660, times[-1] + 720]
+    assert [parse_timestamp(p["predicted_time"]) for p in predictions] == expected
+
+
+def test_irregular_or_short_histories_predict_nothing(numpy_mode):
+    rng = random.Random(4)
+    times = array("d", sorted(BASE + rng.uniform(0, 1e6) for _ in range(40)))
+    assert detect_cycle(times) is None
+    assert predict_next(times) == []
+    assert detect_cycle(_times([10], 2)) is None
+    assert detect_cycle(array("d", [BASE] * 6)) is None
+
+
+def test_small_jitter_lowers_confidence(numpy_mode):
+    rng = random.Random(1)
+    times = array("d", [BASE + 3600 * i + rng.uniform(-60, 60) for i in range(20)])
+    lag, span, confidence = detect_cycle(times)
+    assert lag == 1
+    assert span == pytest.approx(3600, rel=0.01)
+    assert 0.9 <= confidence < 1.0
+
+
+def test_index_records_out_of_order_and_intervals():
+    index = TemporalIndex()
+    assert index.record("e1", "0xa", BASE + 20) == 0
+    assert index.record("e2", "0xa", BASE) == 0
+    assert index.record("e1", "0xa", BASE + 10.5) == -9500
+    assert list(index.times("0xa")) == [BASE, BASE + 10.5, BASE + 20]
+    assert list(index.intervals("0xa")) == [10.5, 9.5]
+    assert "e1" in index and "e3" not in index
+    assert list(index.times("0xmissing")) == []
+
+
+def test_predict_all_covers_every_contract():
+    index = TemporalIndex()
+    for i in range(6):
+        index.record(f"a{i}", "0xa", BASE + 100 * i)
+        index.record(f"b{i}", "0xb", BASE + i * i)
+    predictions = index.predict_all(horizon=1)
+    assert set(predictions) == {"0xa", "0xb"}
+    assert predictions["0xa"]["predicted_cycles"][0]["cycle_type"] == "periodic_100s"
+    assert predictions["0xb"] == {"predicted_cycles": [], "government_timing_patterns": []}
+
+
+def test_index_event_parses_existing_logs_once():
+    engine = RippleEffectEngine()
+    ripple = engine.generate_ripple("Shard 1", "0x" + "ab" * 20, "SORA")
+    ripple.TT.temporal_log = [
+        {"timestamp": format_timestamp(BASE + 60 * i), "event_type": "x"}
+        for i in range(5)
+    ]
+    index = TemporalIndex()
+    index.index_event(ripple)
+    index.index_event(ripple)
+    assert len(index.times(ripple.contract_address)) == 5
+    prediction = index.predict(ripple.contract_address)
+    assert prediction["predicted_cycles"][0]["predicted_time"] == format_timestamp(BASE + 300)
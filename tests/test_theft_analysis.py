@@ -0,0 +1,128 @@
+"""Streaming theft analysis: baseline check semantics, chunking and engine updates."""
+import json
+import random
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.append(str(ROOT))
+
+from runtime.ripple_effect import RippleEffectEngine
+from runtime.theft_analysis import ALTERED_SIGNATURE, THEFT, analyze_transaction_log
+
+
+def _naive(transactions):
+    unauthorized = sum(
+        tx.get("type") == "transfer" and tx.get("authorized") == False  # baseline check
+        for tx in transactions
+    )
+    tampered = sum(tx.get("signature_valid") == False for tx in transactions)
+    return unauthorized, tampered
+
+
+def test_records_match_baseline_equality():
+    transactions = [
+        {"type": "transfer", "authorized": value, "signature_valid": value, "from": f"0x{i}"}
+        for i, value in enumerate([False, 0, 0.0, True, 1, None, "false", "0", "no", ""])
+    ]
+    result = analyze_transaction_log(transactions)
+    assert (result.unauthorized_transfers, result.tampered_signatures) == _naive(transactions)
+    assert result.unauthorized_transfers == 3
+
+
+def test_csv_reads_false_strings(tmp_path):
+    path = tmp_path / "log.csv"
+    path.write_text(
+        "type,authorized,signature_valid,from,timestamp\n"
+        "transfer,false,true,0xa,t1\n"
+        "transfer,0,no,0xb,t2\n"
+        "transfer,true,,0xc,t3\n"
+    )
+    result = analyze_transaction_log(path)
+    assert result.unauthorized_transfers == 2
+    assert result.tampered_signatures == 1
+
+
+def _log(count=300, seed=3):
+    rng = random.Random(seed)
+    return [
+        {
+            "type": rng.choice(["transfer", "mint"]),
+            "authorized": rng.random() > 0.2,
+            "signature_valid": rng.random() > 0.1,
+            "from": f"0x{rng.randrange(8)}",
+            "timestamp": f"t{i}",
+        }
+        for i in range(count)
+    ]
+
+
+def _first_seen(transactions):
+    first = {}
+    for tx in transactions:
+        if tx["type"] == "transfer" and tx["authorized"] is False:
+            first.setdefault(tx["from"], tx["timestamp"])
+    return first
+
+
+def test_chunk_size_does_not_change_the_result():
+    transactions = _log()
+    whole = analyze_transaction_log(transactions, chunk_size=len(transactions))
+    chunked = analyze_transaction_log(transactions, chunk_size=7)
+    assert chunked.to_dict() == whole.to_dict()
+    assert chunked.transactions == len(transactions)
+    counts = (chunked.unauthorized_transfers, chunked.tampered_signatures)
+    assert counts == _naive(transactions)
+    assert chunked.actor_first_seen == _first_seen(transactions)
+    assert chunked.alteration_types == {
+        THEFT: chunked.unauthorized_transfers,
+        ALTERED_SIGNATURE: chunked.tampered_signatures,
+    }
+
+
+def test_ndjson_file_matches_records(tmp_path):
+    transactions = _log()
+    path = tmp_path / "log.ndjson"
+    path.write_text("".join(json.dumps(tx) + "\n" for tx in transactions) + "\n")
+    from_file = analyze_transaction_log(path, chunk_size=50)
+    assert from_file.to_dict() == analyze_transaction_log(transactions).to_dict()
+
+
+def test_parallel_workers_merge_in_order(tmp_path):
+    transactions = _log(600)
+    path = tmp_path / "log.ndjson"
+    path.write_text("".join(json.dumps(tx) + "\n" for tx in transactions))
+    parallel = analyze_transaction_log(path, chunk_size=40, workers=2)
+    assert parallel.to_dict() == analyze_transaction_log(transactions).to_dict()
+
+
+def test_engine_keeps_alterations_distinct():
+    engine = RippleEffectEngine()
+    ripple = engine.generate_ripple("Shard 1", "0x" + "ab" * 20, "SORA")
+    bad = {"type": "transfer", "authorized": False, "from": "0xbad", "timestamp": "t"}
+    for _ in range(3):
+        analysis = engine.analyze_for_theft(ripple.event_id, "0xa", "0xa", [bad, bad])
+    assert analysis["severity"] == "red"
+    assert analysis["unauthorized_transfers"] == 2
+    xx = engine.events[ripple.event_id].XX
+    assert xx.detected_alteration
+    assert xx.alteration_type == [THEFT]
+    assert [(a["address"], a["count"]) for a in xx.actors] == [("0xbad", 6)]
+
+
+def test_engine_streams_csv_logs(tmp_path):
+    path = tmp_path / "log.csv"
+    path.write_text(
+        "type,authorized,signature_valid,from,timestamp\n"
+        "transfer,true,false,0xa,t1\n"
+        "mint,false,true,0xb,t2\n"
+    )
+    engine = RippleEffectEngine()
+    ripple = engine.generate_ripple("Shard 1", "0x" + "ab" * 20, "SORA")
+    analysis = engine.analyze_theft_stream(ripple.event_id, "0xa", "0xb", path)
+    assert analysis["transactions_analyzed"] == 2
+    assert analysis["alterations"] == ["ownership_mismatch", "signature_tampering"]
+    assert engine.events[ripple.event_id].XX.alteration_type == [
+        "forged_ownership", ALTERED_SIGNATURE
+    ]
@@ -0,0 +1,70 @@
+"""Binary token container round trips and random access."""
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.append(str(ROOT))
+
+from src.aes256_layer import MYTHIC_TIMESTAMPS, EncryptedToken, decrypt_token, encrypt_token
+from src.token_container import (
+    TokenContainerReader,
+    TokenContainerWriter,
+    read_tokens,
+    write_tokens,
+)
+
+
+def _tokens(count):
+    return [
+        EncryptedToken(
+            token_id=f"token-{i}-é",
+            ciphertext=bytes(range(i % 256)) * 3,
+            salt=bytes([i % 256]) * 16,
+            nonce=bytes([(i * 7) % 256]) * 12,
+            mythic_timestamp=MYTHIC_TIMESTAMPS[i % 3] if i % 4 else None,
+            created_at=1_700_000_000.25 + i,
+            algorithm="AES-256-GCM" if i % 5 else "AES-256-CTR",
+        )
+        for i in range(count)
+    ]
+
+
+def test_round_trip_preserves_every_field(tmp_path):
+    tokens = _tokens(300)
+    path = tmp_path / "tokens.etok"
+    assert write_tokens(path, tokens) == 300
+    assert read_tokens(path) == tokens
+
+
+def test_random_access_by_index(tmp_path):
+    tokens = _tokens(50)
+    path = tmp_path / "tokens.etok"
+    with TokenContainerWriter(path) as writer:
+        assert writer.write(tokens[0]) == 0
+        writer.write_many(tokens[1:])
+        assert len(writer) == 50
+    with TokenContainerReader(path) as reader:
+        assert len(reader) == 50
+        assert reader[37] == tokens[37] and reader[-1] == tokens[-1]
+
+
+def test_stored_tokens_still_decrypt(tmp_path):
+    token = encrypt_token("t", b"secret", "pw")
+    path = tmp_path / "one.etok"
+    write_tokens(path, [token])
+    assert decrypt_token(read_tokens(path)[0], "pw") == b"secret"
+
+
+def test_incomplete_files_are_rejected(tmp_path):
+    path = tmp_path / "tokens.etok"
+    write_tokens(path, _tokens(5))
+    data = path.read_bytes()
+    path.write_bytes(data[:-4])
+    with pytest.raises(ValueError):
+        TokenContainerReader(path)
+    path.write_bytes(b"XXXX" + data[4:])
+    with pytest.raises(ValueError):
+        TokenContainerReader(path)
@@ -0,0 +1,157 @@
+"""Transfer graph: return paths, ownership chains and incremental appends."""
+import random
+import sys
+from collections import deque
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.append(str(ROOT))
+
+from runtime.ripple_effect import RippleEffectEngine
+from runtime.transaction_graph import TransactionGraph
+
+
+def test_limit_keeps_shortest_paths():
+    graph = TransactionGraph()
+    # A long detour is added (and walked) before the direct transfer
+    for sender, receiver in [("orig", "m1"), ("m1", "m2"), ("m2", "m3"), ("m3", "thief")]:
+        graph.add_transfer(sender, receiver)
+    graph.add_transfer("orig", "thief")
+    paths = graph.all_return_paths("thief", "orig", limit=1)
+    assert paths == [["thief", "orig"]]
+    assert [len(p) for p in graph.all_return_paths("thief", "orig")] == [2, 5]
+
+
+def _random_edges(count=120, nodes=25, seed=5):
+    rng = random.Random(seed)
+    return [
+        (f"n{rng.randrange(nodes)}", f"n{rng.randrange(nodes)}", i) for i in range(count)
+    ]
+
+
+def _hops(edges, source, target):
+    """Reference BFS hop count along transfers, or None"""
+    adjacency = {}
+    for sender, receiver, _ in edges:
+        adjacency.setdefault(sender, []).append(receiver)
+    depth = {source: 0}
+    queue = deque([source])
+    while queue:
+        node = queue.popleft()
+        for nxt in adjacency.get(node, []):
+            if nxt not in depth:
+                depth[nxt] = depth[node] + 1
+                queue.append(nxt)
+    return depth.get(target)
+
+
+def _simple_paths(edges, current, original, max_depth):
+    """Reference enumeration of simple reverse paths current -> original"""
+    senders = {}
+    for sender, receiver, _ in edges:
+        senders.setdefault(receiver, set()).add(sender)
+    found = []
+
+    def walk(path):
+        if path[-1] == original:
+            found.append(list(path))
+            return
+        if len(path) > max_depth:
+            return
+        for prev in senders.get(path[-1], ()):
+            if prev not in path:
+                walk(path + [prev])
+
+    walk([current])
+    return sorted(found)
+
+
+def _graph(edges, monkeypatch, compact_every=16):
+    # A small compaction threshold mixes CSR and pending delta edges
+    monkeypatch.setattr(TransactionGraph, "MIN_COMPACT_EDGES", compact_every)
+    graph = TransactionGraph()
+    for edge in edges:
+        graph.add_transfer(*edge)
+    return graph
+
+
+def _check_path(edges, path):
+    pairs = {(sender, receiver) for sender, receiver, _ in edges}
+    assert all((b, a) in pairs for a, b in zip(path, path[1:]))
+
+
+def test_shortest_return_path_matches_bfs(monkeypatch):
+    edges = _random_edges()
+    incremental = _graph(edges, monkeypatch)
+    bulk = TransactionGraph()
+    assert bulk.add_transfers(edges) == len(edges)
+    for current in ("n0", "n3", "n7", "n11"):
+        for original in ("n1", "n4", "n9"):
+            hops = _hops(edges, original, current)
+            for graph in (incremental, bulk):
+                path = graph.shortest_return_path(current, original)
+                if hops is None:
+                    assert path == []
+                    continue
+                assert len(path) == hops + 1
+                assert path[0] == current and path[-1] == original
+                _check_path(edges, path)
+
+
+def test_all_return_paths_are_simple_and_complete(monkeypatch):
+    edges = _random_edges(60, 12, seed=9)
+    graph = _graph(edges, monkeypatch)
+    for current, original in [("n0", "n1"), ("n5", "n2"), ("n8", "n3")]:
+        paths = graph.all_return_paths(current, original, max_depth=4, limit=10_000)
+        assert sorted(paths) == _simple_paths(edges, current, original, 4)
+        assert [len(p) for p in paths] == sorted(len(p) for p in paths)
+        for path in paths:
+            assert len(set(path)) == len(path)
+
+
+def test_unknown_and_identical_owners():
+    graph = TransactionGraph()
+    graph.add_transfer("a", "b")
+    assert graph.shortest_return_path("x", "a") == []
+    assert graph.shortest_return_path("a", "a") == ["a"]
+    assert graph.all_return_paths("zz", "zz") == [["zz"]]
+    assert graph.shortest_return_path("a", "b") == []
+
+
+def test_ownership_chain_records_transfers():
+    graph = TransactionGraph()
+    graph.add_transactions([
+        {"type": "transfer", "from": "orig", "to": "mid", "timestamp": "t1"},
+        {"type": "mint", "from": "orig", "to": "other", "timestamp": "t2"},
+        {"type": "transfer", "from": "mid", "to": "thief", "timestamp": "t3"},
+    ])
+    assert len(graph) == 2
+    assert graph.successors("orig") == ["mid"]
+    assert graph.predecessors("thief") == ["mid"]
+    assert graph.ownership_chain("orig", "thief") == [
+        {"owner": "orig", "timestamp": None, "acquired_from": None},
+        {"owner": "mid", "timestamp": "t1", "acquired_from": "orig"},
+        {"owner": "thief", "timestamp": "t3", "acquired_from": "mid"},
+    ]
+
+
+def test_engine_computes_return_path_from_csv_log(tmp_path):
+    original = "0x" + "ab" * 20
+    path = tmp_path / "transfers.csv"
+    path.write_text(
+        "type,from,to,timestamp\n"
+        f"transfer,{original},0xmid,t1\n"
+        "transfer,0xmid,0xthief,t2\n"
+    )
+    engine = RippleEffectEngine()
+    ripple = engine.generate_ripple("Shard 1", original, "SORA")
+    assert engine.trigger_return(ripple.event_id, current_owner="0xnobody")["status"] == (
+        "no_path"
+    )
+    assert engine.record_transfers(path) == 2
+    result = engine.trigger_return(ripple.event_id, current_owner="0xthief")
+    assert result["status"] == "in_progress"
+    assert result["return_path"] == ["0xthief", "0xmid", original]
+    chain = engine.events[ripple.event_id].YY.ownership_chain
+    assert [entry["owner"] for entry in chain] == [original, "0xmid", "0xthief"]
@@ -0,0 +1,139 @@
+"""Tribunal proofs follow invalidated, replaced and engine-modified vectors."""
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.append(str(ROOT))
+
+import runtime.tribunal_proof as tribunal_proof
+from runtime.ripple_effect import RippleEffectEngine, RippleVectorWW
+from runtime.tribunal_proof import merkle_root, verify_proof
+
+THEFT_LOG = [
+    {"type": "transfer", "authorized": False, "from": "0xbad",
+     "timestamp": "2025-01-01T00:00:00Z"},
+]
+
+
+def _engine_event():
+    engine = RippleEffectEngine()
+    ripple = engine.generate_ripple("Shard 1", "0x" + "ab" * 20, "SORA")
+    return engine, ripple
+
+
+def test_engine_mutation_changes_proof():
+    engine, ripple = _engine_event()
+    before = engine.generate_tribunal_proof(ripple.event_id, ["0xw"])
+    engine.analyze_for_theft(ripple.event_id, "0xa", "0xb", THEFT_LOG)
+    after = engine.generate_tribunal_proof(ripple.event_id, ["0xw"])
+    event = engine.events.get(ripple.event_id)
+    assert after["proof_hash"] != before["proof_hash"]
+    assert verify_proof(event, after)
+    assert not verify_proof(event, before)
+
+
+def test_direct_edit_needs_invalidate():
+    engine, ripple = _engine_event()
+    before = engine.generate_tribunal_proof(ripple.event_id, ["0xw"])
+    event = engine.events.get(ripple.event_id)
+    event.YY.stolen_cycles_returned = 7
+    event.TT.temporal_log.append({"event": "manual"})
+    engine.digests.invalidate(ripple.event_id, "YY", "TT")
+    proofs = engine.generate_tribunal_proofs([ripple.event_id], ["0xw"])
+    after = proofs[ripple.event_id]
+    assert after["proof_hash"] != before["proof_hash"]
+    assert verify_proof(event, after)
+
+
+def test_replaced_vector_is_rehashed():
+    engine, ripple = _engine_event()
+    before = engine.generate_tribunal_proof(ripple.event_id, [])
+    event = engine.events.get(ripple.event_id)
+    event.WW = RippleVectorWW(psychological_pattern="mirroring")
+    after = engine.generate_tribunal_proof(ripple.event_id, [])
+    assert after["vector_digests"]["WW"] != before["vector_digests"]["WW"]
+    assert verify_proof(event, after)
+
+
+def test_stale_generation_is_not_stored():
+    engine, ripple = _engine_event()
+    event = engine.events.get(ripple.event_id)
+    generation = engine.digests.generation(ripple.event_id)
+    engine.digests.invalidate(ripple.event_id, "XX")
+    assert not engine.digests.store(event, "XX", "00" * 32, generation)
+    assert engine.digests.stale(event) == ["XX", "YY", "ZZ", "TT", "WW"]
+
+
+def test_merkle_root_promotes_odd_leaf():
+    leaves = ["11" * 32, "22" * 32, "33" * 32]
+    root = merkle_root(leaves)
+    assert root != merkle_root(leaves[:2]) and len(root) == 64
+
+
+def _count_hashes(monkeypatch):
+    hashed = []
+    original = tribunal_proof.vector_digest
+
+    def counting(vector):
+        hashed.append(type(vector).__name__)
+        return original(vector)
+
+    monkeypatch.setattr(tribunal_proof, "vector_digest", counting)
+    return hashed
+
+
+def test_only_changed_vectors_are_rehashed(monkeypatch):
+    engine, ripple = _engine_event()
+    hashed = _count_hashes(monkeypatch)
+    engine.generate_tribunal_proof(ripple.event_id, [])
+    assert len(hashed) == 5
+    hashed.clear()
+    engine.generate_tribunal_proof(ripple.event_id, [])
+    assert hashed == []
+    engine.analyze_for_theft(ripple.event_id, "0xa", "0xb", THEFT_LOG)
+    engine.generate_tribunal_proof(ripple.event_id, [])
+    assert hashed == ["RippleVectorXX"]
+
+
+def test_header_change_moves_root_without_rehashing(monkeypatch):
+    engine, ripple = _engine_event()
+    before = engine.generate_tribunal_proof(ripple.event_id, [])
+    hashed = _count_hashes(monkeypatch)
+    event = engine.events.get(ripple.event_id)
+    event.umbrella = "BLEU"
+    after = engine.generate_tribunal_proof(ripple.event_id, [])
+    assert hashed == []
+    assert after["vector_digests"] == before["vector_digests"]
+    assert after["header_digest"] != before["header_digest"]
+    assert verify_proof(event, after) and not verify_proof(event, before)
+
+
+def test_batch_proofs_match_single_proofs():
+    engine = RippleEffectEngine()
+    ids = [
+        engine.generate_ripple(f"Shard {i}", "0x" + "ab" * 20, "SORA").event_id
+        for i in range(6)
+    ]
+    engine.analyze_for_theft(ids[2], "0xa", "0xb", THEFT_LOG)
+    single = {event_id: engine.generate_tribunal_proof(event_id, ["0xw"]) for event_id in ids}
+    engine.digests.invalidate(ids[0])
+    engine.digests.invalidate(ids[3], "ZZ")
+    for workers in (1, 2):
+        batch = engine.generate_tribunal_proofs(ids, ["0xw"], workers=workers)
+        for event_id in ids:
+            assert batch[event_id]["proof_hash"] == single[event_id]["proof_hash"]
+            assert verify_proof(engine.events.get(event_id), batch[event_id])
+    assert engine.generate_tribunal_proofs(witnesses=[]).keys() == set(ids)
+
+
+def test_refresh_many_on_a_process_pool():
+    engine = RippleEffectEngine()
+    events = [engine.generate_ripple("Shard 1", "0x" + "ab" * 20, "SORA") for _ in range(3)]
+    engine.digests.refresh_many(events, workers=2, chunk_size=4)
+    for event in events:
+        assert engine.digests.stale(event) == []
+        assert engine.digests.digests(event) == {
+            name: tribunal_proof.vector_digest(getattr(event, name))
+            for name in tribunal_proof.VECTORS
+        }
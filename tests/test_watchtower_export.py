@@ -0,0 +1,142 @@
+"""Watchtower CSV export: escaping, gzip output, filters and cursor resume."""
+import csv
+import gzip
+import io
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.append(str(ROOT))
+
+from runtime.ripple_effect import RippleEffectEngine, RippleEvent
+from runtime.ripple_store import SQLiteEventStore
+from runtime.temporal_patterns import format_timestamp
+from runtime.watchtower_export import (
+    WATCHTOWER_HEADER,
+    ExportCursor,
+    export_watchtower,
+    format_watchtower_row,
+    main,
+)
+
+BASE = 1_700_000_000.0
+
+
+def _engine(count=5, store=None):
+    engine = RippleEffectEngine(store=store)
+    for i in range(count):
+        ripple = engine.generate_ripple(f'Shard "{i}", east', "0x" + "ab" * 20, "SORA")
+        ripple.timestamp = format_timestamp(BASE + 60 * i)
+        if i % 2:
+            ripple.XX.detected_alteration = True
+            ripple.XX.alteration_type = ["theft", "altered_signature"]
+        engine.events.put(ripple)
+    return engine
+
+
+def _rows(data: bytes):
+    return list(csv.reader(io.StringIO(data.decode("utf-8"))))
+
+
+def test_fields_with_commas_and_quotes_are_escaped():
+    engine = _engine(2)
+    event = engine.query_events(severity="red")[0]
+    line = format_watchtower_row(event)
+    assert '"Shard ""1"", east"' in line
+    assert next(csv.reader([line])) == [
+        event.timestamp, event.event_id, 'Shard "1", east', "XX",
+        "theft,altered_signature", "red", "true",
+    ]
+    assert engine.export_watchtower_csv(event.event_id) == line
+
+
+def test_export_to_stream_in_time_order():
+    engine = _engine()
+    sink = io.BytesIO()
+    stats = engine.export_watchtower(sink)
+    rows = _rows(sink.getvalue())
+    assert tuple(rows[0]) == WATCHTOWER_HEADER
+    assert [row[0] for row in rows[1:]] == [format_timestamp(BASE + 60 * i) for i in range(5)]
+    assert rows[2][2] == 'Shard "1", east'
+    assert stats.rows == 5
+    assert stats.bytes_written == len(sink.getvalue())
+    assert not sink.closed
+
+
+def test_gzip_path_and_filters(tmp_path):
+    engine = _engine()
+    path = tmp_path / "watchtower.csv.gz"
+    stats = engine.export_watchtower(path, severity="red", header=False)
+    with gzip.open(path, "rb") as handle:
+        rows = _rows(handle.read())
+    assert len(rows) == stats.rows == 2
+    assert {row[5] for row in rows} == {"red"}
+    assert stats.bytes_written == path.stat().st_size
+
+
+def test_text_stream_target():
+    engine = _engine(1)
+    raw = io.BytesIO()
+    text = io.TextIOWrapper(raw, encoding="utf-8", newline="")
+    text.write("# watchtower\n")
+    engine.export_watchtower(text)
+    assert raw.getvalue().startswith(b"# watchtower\ntimestamp,event_id,")
+
+
+def test_cursor_resumes_after_last_event(tmp_path):
+    engine = _engine(3)
+    first = io.BytesIO()
+    stats = engine.export_watchtower(first)
+    assert stats.cursor.key == (BASE + 120, _rows(first.getvalue())[-1][1])
+
+    path = tmp_path / "cursor.json"
+    stats.cursor.save(path)
+    cursor = ExportCursor.load(path)
+    assert cursor == stats.cursor
+
+    nothing = engine.export_watchtower(io.BytesIO(), cursor=cursor)
+    assert nothing.rows == 0 and nothing.cursor == cursor
+
+    later = engine.generate_ripple("Shard 9", "0x" + "cd" * 20, "BLEU")
+    later.timestamp = format_timestamp(BASE + 600)
+    engine.events.put(later)
+    second = io.BytesIO()
+    stats = engine.export_watchtower(second, cursor=cursor, header=False)
+    assert [row[1] for row in _rows(second.getvalue())] == [later.event_id]
+    assert stats.cursor.event_id == later.event_id
+
+
+def test_missing_cursor_file_starts_fresh(tmp_path):
+    assert ExportCursor.load(tmp_path / "absent.json").key is None
+
+
+def test_progress_reports_every_batch():
+    engine = _engine(5)
+    seen = []
+    export_watchtower(
+        engine.events, io.BytesIO(), batch_size=2, progress=lambda s: seen.append(s.rows)
+    )
+    assert seen == [2, 4]
+
+
+def test_command_line_incremental_export(tmp_path, capsys):
+    db = str(tmp_path / "events.db")
+    store = SQLiteEventStore(db, RippleEvent.from_dict)
+    _engine(4, store=store)
+    store.close()
+    cursor = str(tmp_path / "cursor.json")
+    out = tmp_path / "first.csv"
+
+    assert main([db, str(out), "--cursor", cursor]) == 0
+    assert len(_rows(out.read_bytes())) == 5
+    assert '"rows": 4' in capsys.readouterr().err
+    assert main([db, str(tmp_path / "second.csv"), "--cursor", cursor, "--no-header"]) == 0
+    assert (tmp_path / "second.csv").read_bytes() == b""
+
+
+def test_unknown_severity_is_rejected(tmp_path):
+    with pytest.raises(SystemExit):
+        main([str(tmp_path / "events.db"), "-", "--severity", "amber"])